@@ -21,4 +21,7 @@ from dfdatetime import systemtime
 from dfdatetime import time_elements
 from dfdatetime import uuid_time
 
+from dfdatetime.conversion import Convert
+from dfdatetime.conversion import ConvertTimestamps
+
 __version__ = '20200824'
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import posix_time
@@ -20,6 +21,23 @@ class APFSTime(posix_time.PosixTimeInNanoseconds):
     is_local_time (bool): True if the date and time value is in local time.
   """
 
+  _TIMESTAMP_MINIMUM = -(1 << 63)
+  _TIMESTAMP_MAXIMUM = (1 << 63) - 1
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and nanoseconds or None if the timestamp is
+          missing or invalid.
+    """
+    if (self._timestamp is None or self._timestamp < self._INT64_MIN or
+        self._timestamp > self._INT64_MAX):
+      return None
+
+    return super(APFSTime, self)._GetDateTimeValues()
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -38,6 +56,21 @@ class APFSTime(posix_time.PosixTimeInNanoseconds):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if (self._timestamp is None or self._timestamp < self._INT64_MIN or
+        self._timestamp > self._INT64_MAX):
+      return None
+
+    return self._timestamp
+
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a APFS timestamp from a date and time string.
 
@@ -59,18 +92,5 @@ class APFSTime(posix_time.PosixTimeInNanoseconds):
         self._timestamp > self._INT64_MAX):
       raise ValueError('Date time value not supported.')
 
-  def CopyToDateTimeString(self):
-    """Copies the APFS timestamp to a date and time string.
-
-    Returns:
-      str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.#########" or
-          None if the timestamp is missing or invalid.
-    """
-    if (self._timestamp is None or self._timestamp < self._INT64_MIN or
-        self._timestamp > self._INT64_MAX):
-      return None
-
-    return super(APFSTime, self)._CopyToDateTimeString()
-
 
 factory.Factory.RegisterDateTimeValues(APFSTime)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""Apache Arrow columns of date and time values.
+
+Date and time values are stored in 3 columns:
+* a timestamp column, with UTC timestamps in the unit that preserves
+  the precision of the date and time values, either "s", "ms", "us" or "ns";
+* a type column, with the name of the date and time values type;
+* a status column, with the semantic representation, such as "Never" or
+  "Not set", of date and time values without a timestamp, "Out of range" if
+  the timestamp cannot be represented in the unit, or None otherwise.
+
+The timestamps are determined from the normalized timestamp in nanoseconds
+using only integer arithmetic. The resulting Arrow table can be written to
+Parquet with pyarrow.parquet.write_table.
+
+The local time flag and time zone offset are not preserved. Types that have
+an integer timestamp, such as FILETIME, are restored exactly if the unit
+preserves their precision, other types are restored as POSIX time in
+the unit.
+"""
+
+from __future__ import unicode_literals
+
+try:
+  import pyarrow
+except ImportError:
+  pyarrow = None
+
+from dfdatetime import conversion
+from dfdatetime import definitions
+from dfdatetime import factory
+from dfdatetime import interface
+from dfdatetime import semantic_time
+
+
+STATUS_NOT_SET = 'Not set'
+STATUS_OUT_OF_RANGE = 'Out of range'
+
+# pylint: disable=protected-access
+_INT64_MIN = interface.DateTimeValues._INT64_MIN
+_INT64_MAX = interface.DateTimeValues._INT64_MAX
+
+
+def _CheckPyArrow():
+  """Checks if pyarrow is available.
+
+  Raises:
+    RuntimeError: if pyarrow is not available.
+  """
+  if not pyarrow:
+    raise RuntimeError('Missing optional dependency: pyarrow.')
+
+
+def _CheckUnit(unit):
+  """Checks if a unit is supported.
+
+  Args:
+    unit (str): unit.
+
+  Raises:
+    ValueError: if the unit is not supported.
+  """
+  if unit not in definitions.NANOSECONDS_PER_TIMESTAMP_UNIT:
+    raise ValueError('Unsupported unit: {0!s}.'.format(unit))
+
+
+def CopyFromColumns(timestamps, unit, type_names, statuses):
+  """Copies date and time values from columns.
+
+  Args:
+    timestamps (Sequence[int]): UTC timestamps in the unit.
+    unit (str): unit of the timestamps, either "s", "ms", "us" or "ns".
+    type_names (Sequence[str]): names of the date and time values types.
+    statuses (Sequence[str]): statuses.
+
+  Returns:
+    list[DateTimeValues]: date and time values.
+
+  Raises:
+    KeyError: if a date and time values type is not registered.
+    ValueError: if the unit is not supported or the number of values in
+        the columns differ.
+  """
+  _CheckUnit(unit)
+
+  number_of_values = len(timestamps)
+  if len(type_names) != number_of_values or len(statuses) != number_of_values:
+    raise ValueError('Number of values in columns differ.')
+
+  posix_time_type = conversion.POSIX_TIME_TYPES_PER_TIMESTAMP_UNIT[unit]
+
+  date_time_values_list = [None] * number_of_values
+  indexes_per_type = {}
+
+  for index, type_name in enumerate(type_names):
+    date_time_values_type = factory.Factory.GetDateTimeValuesType(type_name)
+
+    timestamp = timestamps[index]
+    status = statuses[index]
+    if timestamp is not None and status is None:
+      indexes_per_type.setdefault(date_time_values_type, []).append(index)
+
+    elif date_time_values_type is semantic_time.SemanticTime:
+      date_time_values_list[index] = semantic_time.SemanticTime(string=status)
+
+    else:
+      date_time_values_list[index] = date_time_values_type()
+
+  for date_time_values_type, indexes in indexes_per_type.items():
+    if (date_time_values_type is posix_time_type or
+        not conversion._HasIntegerTimestamp(date_time_values_type)):
+      date_time_values_type = posix_time_type
+      converted_timestamps = [timestamps[index] for index in indexes]
+    else:
+      converted_timestamps = conversion.ConvertTimestamps(
+          [timestamps[index] for index in indexes], posix_time_type,
+          date_time_values_type)
+
+    for index, timestamp in zip(indexes, converted_timestamps):
+      date_time_values_list[index] = date_time_values_type(timestamp=timestamp)
+
+  return date_time_values_list
+
+
+def CopyFromTable(table, name='timestamp'):
+  """Copies date and time values from an Arrow table.
+
+  Args:
+    table (pyarrow.Table): Arrow table, as created by CopyToTable.
+    name (Optional[str]): name of the timestamp column, where the names of
+        the type and status columns are suffixed with "_type" and "_status".
+
+  Returns:
+    list[DateTimeValues]: date and time values.
+
+  Raises:
+    KeyError: if a date and time values type is not registered.
+    RuntimeError: if pyarrow is not available.
+    ValueError: if the unit of the timestamp column is not supported.
+  """
+  _CheckPyArrow()
+
+  column = table.column(name)
+  unit = column.type.unit
+
+  timestamps = column.cast(pyarrow.int64()).to_pylist()
+  type_names = table.column('{0:s}_type'.format(name)).to_pylist()
+  statuses = table.column('{0:s}_status'.format(name)).to_pylist()
+
+  return CopyFromColumns(timestamps, unit, type_names, statuses)
+
+
+def CopyToColumns(date_time_values_list, unit=None):
+  """Copies date and time values to columns.
+
+  Args:
+    date_time_values_list (Sequence[DateTimeValues]): date and time values.
+    unit (Optional[str]): unit of the timestamps, either "s", "ms", "us" or
+        "ns", where None represents the unit that preserves the precision
+        of all date and time values.
+
+  Returns:
+    tuple[list[int], str, list[str], list[str]]: UTC timestamps in the unit,
+        unit, names of the date and time values types and statuses.
+
+  Raises:
+    ValueError: if the unit is not supported.
+  """
+  if unit is None:
+    unit = conversion.GetTimestampUnit(date_time_values_list)
+
+  _CheckUnit(unit)
+
+  nanoseconds_per_unit = definitions.NANOSECONDS_PER_TIMESTAMP_UNIT[unit]
+
+  timestamps = []
+  type_names = []
+  statuses = []
+
+  for date_time_values in date_time_values_list:
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())
+
+    timestamp = None
+    status = None
+
+    if normalized_timestamp is not None:
+      timestamp = normalized_timestamp // nanoseconds_per_unit
+      if timestamp < _INT64_MIN or timestamp > _INT64_MAX:
+        timestamp = None
+        status = STATUS_OUT_OF_RANGE
+
+    elif isinstance(date_time_values, semantic_time.SemanticTime):
+      status = date_time_values.string
+
+    else:
+      status = STATUS_NOT_SET
+
+    timestamps.append(timestamp)
+    type_names.append(type(date_time_values).__name__)
+    statuses.append(status)
+
+  return timestamps, unit, type_names, statuses
+
+
+def CopyToTable(date_time_values_list, name='timestamp', unit=None):
+  """Copies date and time values to an Arrow table.
+
+  Args:
+    date_time_values_list (Sequence[DateTimeValues]): date and time values.
+    name (Optional[str]): name of the timestamp column, where the names of
+        the type and status columns are suffixed with "_type" and "_status".
+    unit (Optional[str]): unit of the timestamps, either "s", "ms", "us" or
+        "ns", where None represents the unit that preserves the precision
+        of all date and time values.
+
+  Returns:
+    pyarrow.Table: Arrow table.
+
+  Raises:
+    RuntimeError: if pyarrow is not available.
+    ValueError: if the unit is not supported.
+  """
+  _CheckPyArrow()
+
+  timestamps, unit, type_names, statuses = CopyToColumns(
+      date_time_values_list, unit=unit)
+
+  return pyarrow.table({
+      name: pyarrow.array(timestamps, type=pyarrow.timestamp(unit, tz='UTC')),
+      '{0:s}_type'.format(name): pyarrow.array(
+          type_names, type=pyarrow.string()).dictionary_encode(),
+      '{0:s}_status'.format(name): pyarrow.array(
+          statuses, type=pyarrow.string()).dictionary_encode()})
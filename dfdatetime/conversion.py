@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+"""Conversion of date and time values between representations."""
+
+from __future__ import unicode_literals
+
+import decimal
+
+from dfdatetime import definitions
+from dfdatetime import interface
+from dfdatetime import posix_time
+
+
+# pylint: disable=protected-access
+
+POSIX_TIME_TYPES_PER_TIMESTAMP_UNIT = {
+    definitions.TIMESTAMP_UNIT_SECONDS: posix_time.PosixTime,
+    definitions.TIMESTAMP_UNIT_MILLISECONDS: posix_time.PosixTimeInMilliseconds,
+    definitions.TIMESTAMP_UNIT_MICROSECONDS: posix_time.PosixTimeInMicroseconds,
+    definitions.TIMESTAMP_UNIT_NANOSECONDS: posix_time.PosixTimeInNanoseconds}
+
+_SUPPORTED_ROUNDING_MODES = (
+    interface.DateTimeValues._SUPPORTED_ROUNDING_MODES)
+
+
+def _CheckRounding(rounding):
+  """Checks if a rounding mode is supported.
+
+  Args:
+    rounding (str): rounding mode.
+
+  Raises:
+    ValueError: if the rounding mode is not supported.
+  """
+  if rounding not in _SUPPORTED_ROUNDING_MODES:
+    raise ValueError('Unsupported rounding mode: {0!s}.'.format(rounding))
+
+
+def _Divide(numerator, denominator, rounding):
+  """Divides two integers with a specific rounding mode.
+
+  Args:
+    numerator (int): numerator.
+    denominator (int): denominator, which must be positive.
+    rounding (str): rounding mode, either decimal.ROUND_CEILING,
+        decimal.ROUND_DOWN, decimal.ROUND_FLOOR or decimal.ROUND_HALF_UP.
+
+  Returns:
+    int: quotient rounded according to the rounding mode.
+  """
+  if rounding == decimal.ROUND_FLOOR:
+    return numerator // denominator
+
+  if rounding == decimal.ROUND_CEILING:
+    return -(-numerator // denominator)
+
+  if rounding == decimal.ROUND_DOWN:
+    quotient = abs(numerator) // denominator
+  else:
+    quotient = ((abs(numerator) * 2) + denominator) // (denominator * 2)
+
+  if numerator < 0:
+    return -quotient
+  return quotient
+
+
+def _GetIntegerTimestampDefinition(date_time_values_type):
+  """Retrieves the integer timestamp definition of a date and time values type.
+
+  The integer timestamp definition is retrieved from the class attributes of
+  the date and time values type.
+
+  Args:
+    date_time_values_type (type): date and time values type.
+
+  Returns:
+    tuple[int, int, int, int]: number of nanoseconds per timestamp unit, number
+        of nanoseconds between the epoch of the timestamp and the POSIX epoch,
+        and the minimum and maximum supported timestamp or None if not bounded.
+
+  Raises:
+    ValueError: if the date and time values type is not supported.
+  """
+  if not _HasIntegerTimestamp(date_time_values_type):
+    raise ValueError(
+        'Unsupported date and time values type: {0!s}.'.format(
+            getattr(date_time_values_type, '__name__', date_time_values_type)))
+
+  return (
+      date_time_values_type._TIMESTAMP_NANOSECONDS_PER_UNIT,
+      date_time_values_type._TIMESTAMP_EPOCH_OFFSET,
+      date_time_values_type._TIMESTAMP_MINIMUM,
+      date_time_values_type._TIMESTAMP_MAXIMUM)
+
+
+def _HasIntegerTimestamp(date_time_values_type):
+  """Determines if a date and time values type has an integer timestamp.
+
+  Args:
+    date_time_values_type (type): date and time values type.
+
+  Returns:
+    bool: True if the date and time values type has an integer timestamp.
+  """
+  return bool(getattr(
+      date_time_values_type, '_TIMESTAMP_NANOSECONDS_PER_UNIT', None))
+
+
+def AddDurationToTimestamps(timestamps, date_time_values_type, duration):
+  """Adds a duration to an array of timestamps.
+
+  The duration is added to the timestamps using only integer arithmetic,
+  in the timestamp unit of the date and time values type.
+
+  Args:
+    timestamps (Iterable[int]): timestamps of the date and time values type.
+    date_time_values_type (type): date and time values type of the timestamps,
+        for example filetime.Filetime.
+    duration (Duration): duration to add, which can be negative.
+
+  Returns:
+    list[int]: timestamps with the duration added, where a timestamp is None if
+        it, or the resulting timestamp, is missing or out of bounds.
+
+  Raises:
+    ValueError: if the date and time values type is not supported or
+        the duration is not a multiple of the timestamp unit.
+  """
+  nanoseconds_per_unit, _, minimum_timestamp, maximum_timestamp = (
+      _GetIntegerTimestampDefinition(date_time_values_type))
+
+  number_of_units, remainder = divmod(
+      duration.nanoseconds, nanoseconds_per_unit)
+  if remainder:
+    raise ValueError((
+        'Duration: {0:d} ns is not a multiple of the timestamp unit of '
+        '{1:s}.').format(duration.nanoseconds, date_time_values_type.__name__))
+
+  result_timestamps = []
+  for timestamp in timestamps:
+    if timestamp is not None:
+      timestamp += number_of_units
+
+      if ((minimum_timestamp is not None and timestamp < minimum_timestamp) or
+          (maximum_timestamp is not None and timestamp > maximum_timestamp)):
+        timestamp = None
+
+    result_timestamps.append(timestamp)
+
+  return result_timestamps
+
+
+def Convert(date_time_values, date_time_values_type, rounding=None):
+  """Converts date and time values into another representation.
+
+  The conversion uses the number of nanoseconds since the POSIX epoch and
+  integer epoch offsets and unit scaling, without a Decimal normalized
+  timestamp or date and time string.
+
+  Args:
+    date_time_values (DateTimeValues): date and time values to convert.
+    date_time_values_type (type): date and time values type to convert to,
+        for example filetime.Filetime or posix_time.PosixTimeInMicroseconds.
+    rounding (Optional[str]): rounding mode used when the target has a lower
+        precision than the date and time values, either decimal.ROUND_CEILING,
+        decimal.ROUND_DOWN (truncate), decimal.ROUND_FLOOR or
+        decimal.ROUND_HALF_UP, where None represents decimal.ROUND_FLOOR.
+
+  Returns:
+    DateTimeValues: converted date and time values or None if the date and
+        time values do not have a timestamp.
+
+  Raises:
+    ValueError: if the date and time values type or rounding mode is not
+        supported or the converted timestamp is out of bounds.
+  """
+  rounding = rounding or decimal.ROUND_FLOOR
+  _CheckRounding(rounding)
+
+  nanoseconds_per_unit, epoch_offset, minimum_timestamp, maximum_timestamp = (
+      _GetIntegerTimestampDefinition(date_time_values_type))
+
+  normalized_timestamp = date_time_values._GetNormalizedTimestampInNanoseconds()
+  if normalized_timestamp is None:
+    return None
+
+  timestamp = _Divide(
+      normalized_timestamp + epoch_offset, nanoseconds_per_unit, rounding)
+
+  if ((minimum_timestamp is not None and timestamp < minimum_timestamp) or
+      (maximum_timestamp is not None and timestamp > maximum_timestamp)):
+    raise ValueError('Timestamp: {0:d} out of bounds of {1:s}.'.format(
+        timestamp, date_time_values_type.__name__))
+
+  converted_date_time_values = date_time_values_type(timestamp=timestamp)
+  converted_date_time_values.is_local_time = date_time_values.is_local_time
+  return converted_date_time_values
+
+
+def ConvertTimestamps(
+    timestamps, date_time_values_type, target_date_time_values_type,
+    rounding=None):
+  """Converts an array of timestamps into timestamps of another representation.
+
+  Args:
+    timestamps (Iterable[int]): timestamps of the date and time values type.
+    date_time_values_type (type): date and time values type of the timestamps,
+        for example filetime.Filetime.
+    target_date_time_values_type (type): date and time values type to convert
+        to, for example posix_time.PosixTimeInMicroseconds.
+    rounding (Optional[str]): rounding mode used when the target has a lower
+        precision, either decimal.ROUND_CEILING, decimal.ROUND_DOWN (truncate),
+        decimal.ROUND_FLOOR or decimal.ROUND_HALF_UP, where None represents
+        decimal.ROUND_FLOOR.
+
+  Returns:
+    list[int]: converted timestamps, where a timestamp is None if it, or its
+        converted value, is missing or out of bounds.
+
+  Raises:
+    ValueError: if one of the date and time values types or the rounding mode
+        is not supported.
+  """
+  rounding = rounding or decimal.ROUND_FLOOR
+  _CheckRounding(rounding)
+
+  (source_nanoseconds_per_unit, source_epoch_offset, source_minimum_timestamp,
+   source_maximum_timestamp) = _GetIntegerTimestampDefinition(
+       date_time_values_type)
+
+  (nanoseconds_per_unit, epoch_offset, minimum_timestamp,
+   maximum_timestamp) = _GetIntegerTimestampDefinition(
+       target_date_time_values_type)
+
+  # Both epoch offsets are combined so that each timestamp only requires
+  # a single multiplication, addition and division.
+  epoch_offset -= source_epoch_offset
+
+  converted_timestamps = []
+  for timestamp in timestamps:
+    if (timestamp is None or (
+        source_minimum_timestamp is not None and
+        timestamp < source_minimum_timestamp) or (
+            source_maximum_timestamp is not None and
+            timestamp > source_maximum_timestamp)):
+      converted_timestamps.append(None)
+      continue
+
+    timestamp = _Divide(
+        (timestamp * source_nanoseconds_per_unit) + epoch_offset,
+        nanoseconds_per_unit, rounding)
+
+    if ((minimum_timestamp is not None and timestamp < minimum_timestamp) or
+        (maximum_timestamp is not None and timestamp > maximum_timestamp)):
+      timestamp = None
+
+    converted_timestamps.append(timestamp)
+
+  return converted_timestamps
+
+
+def GetPlasoTimestamps(timestamps, date_time_values_type):
+  """Retrieves timestamps that are compatible with plaso from an array.
+
+  The plaso timestamps are determined using only integer arithmetic, with
+  the same rounding as DateTimeValues.GetPlasoTimestamp.
+
+  Args:
+    timestamps (Iterable[int]): timestamps of the date and time values type.
+    date_time_values_type (type): date and time values type of the timestamps,
+        for example filetime.Filetime.
+
+  Returns:
+    list[int]: POSIX timestamps in microseconds, where a timestamp is None if
+        it is missing or out of bounds.
+
+  Raises:
+    ValueError: if the date and time values type is not supported.
+  """
+  return ConvertTimestamps(
+      timestamps, date_time_values_type, posix_time.PosixTimeInMicroseconds,
+      rounding=decimal.ROUND_HALF_UP)
+
+
+def GetTimestampUnit(date_time_values_list):
+  """Determines the timestamp unit that preserves the precision of values.
+
+  Args:
+    date_time_values_list (Iterable[DateTimeValues]): date and time values.
+
+  Returns:
+    str: the coarsest timestamp unit that preserves the precision of all date
+        and time values, either "s", "ms", "us" or "ns".
+  """
+  unit_index = 0
+  for date_time_values in date_time_values_list:
+    unit = definitions.TIMESTAMP_UNITS_PER_PRECISION.get(
+        date_time_values.precision, None)
+    if unit:
+      unit_index = max(unit_index, definitions.TIMESTAMP_UNITS.index(unit))
+
+  return definitions.TIMESTAMP_UNITS[unit_index]
+
+
+def RoundTimestamps(
+    timestamps, date_time_values_type, precision, rounding=None):
+  """Rounds an array of timestamps to a precision.
+
+  The timestamps are rounded using only integer arithmetic, in number of
+  nanoseconds since the POSIX epoch, so that for example FILETIME timestamps
+  can be truncated to the minute or rounded to microseconds.
+
+  Args:
+    timestamps (Iterable[int]): timestamps of the date and time values type.
+    date_time_values_type (type): date and time values type of the timestamps,
+        for example filetime.Filetime.
+    precision (str): precision to round to, for example
+        definitions.PRECISION_1_SECOND.
+    rounding (Optional[str]): rounding mode, either decimal.ROUND_CEILING,
+        decimal.ROUND_DOWN (truncate), decimal.ROUND_FLOOR or
+        decimal.ROUND_HALF_UP, where None represents decimal.ROUND_FLOOR.
+
+  Returns:
+    list[int]: rounded timestamps of the date and time values type, where
+        a timestamp is None if it, or the rounded timestamp, is missing or out
+        of bounds.
+
+  Raises:
+    ValueError: if the date and time values type, precision or rounding mode
+        is not supported.
+  """
+  rounding = rounding or decimal.ROUND_FLOOR
+  _CheckRounding(rounding)
+
+  nanoseconds_per_unit, epoch_offset, minimum_timestamp, maximum_timestamp = (
+      _GetIntegerTimestampDefinition(date_time_values_type))
+
+  nanoseconds_per_precision = definitions.NANOSECONDS_PER_PRECISION.get(
+      precision, None)
+  if not nanoseconds_per_precision:
+    raise ValueError('Unsupported precision: {0!s}.'.format(precision))
+
+  rounded_timestamps = []
+  for timestamp in timestamps:
+    if (timestamp is None or (
+        minimum_timestamp is not None and timestamp < minimum_timestamp) or (
+            maximum_timestamp is not None and timestamp > maximum_timestamp)):
+      rounded_timestamps.append(None)
+      continue
+
+    normalized_timestamp = (timestamp * nanoseconds_per_unit) - epoch_offset
+    normalized_timestamp = _Divide(
+        normalized_timestamp, nanoseconds_per_precision,
+        rounding) * nanoseconds_per_precision
+
+    timestamp = (normalized_timestamp + epoch_offset) // nanoseconds_per_unit
+
+    if ((minimum_timestamp is not None and timestamp < minimum_timestamp) or
+        (maximum_timestamp is not None and timestamp > maximum_timestamp)):
+      timestamp = None
+
+    rounded_timestamps.append(timestamp)
+
+  return rounded_timestamps
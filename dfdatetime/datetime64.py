@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""NumPy datetime64 arrays of date and time values.
+
+The datetime64 values are determined from the normalized timestamp in
+nanoseconds using only integer arithmetic, where the unit is the coarsest
+unit, either "s", "ms", "us" or "ns", that preserves the precision of the date
+and time values. Date and time values without a timestamp or with a timestamp
+that is out of the range of the unit are represented as NaT.
+
+The arrays can be converted into pandas with pandas.DatetimeIndex or
+pandas.Series.
+"""
+
+from __future__ import unicode_literals
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+from dfdatetime import conversion
+from dfdatetime import definitions
+from dfdatetime import interface
+
+
+# pylint: disable=protected-access
+
+# The smallest signed 64-bit integer represents NaT.
+NAT = interface.DateTimeValues._INT64_MIN
+
+_INT64_MAX = interface.DateTimeValues._INT64_MAX
+
+# NumPy datetime64 units that are coarser than seconds.
+_COARSE_DATETIME64_UNITS = frozenset(['Y', 'M', 'W', 'D', 'h', 'm'])
+
+
+def _CheckNumPy():
+  """Checks if numpy is available.
+
+  Raises:
+    RuntimeError: if numpy is not available.
+  """
+  if not numpy:
+    raise RuntimeError('Missing optional dependency: numpy.')
+
+
+def CopyFromTimestamps(timestamps, unit, date_time_values_type):
+  """Copies date and time values from timestamps in a specific unit.
+
+  Args:
+    timestamps (Iterable[int]): timestamps in number of units since the POSIX
+        epoch, where NaT or None represents a missing timestamp.
+    unit (str): timestamp unit, either "s", "ms", "us" or "ns".
+    date_time_values_type (type): date and time values type to create, which
+        must have an integer timestamp, for example filetime.Filetime.
+
+  Returns:
+    list[DateTimeValues]: date and time values, without a timestamp if
+        the timestamp is missing or out of bounds of the date and time values
+        type.
+
+  Raises:
+    ValueError: if the unit or date and time values type is not supported.
+  """
+  posix_time_type = conversion.POSIX_TIME_TYPES_PER_TIMESTAMP_UNIT.get(
+      unit, None)
+  if not posix_time_type:
+    raise ValueError('Unsupported unit: {0!s}.'.format(unit))
+
+  timestamps = [
+      None if timestamp == NAT else timestamp for timestamp in timestamps]
+
+  if date_time_values_type is not posix_time_type:
+    timestamps = conversion.ConvertTimestamps(
+        timestamps, posix_time_type, date_time_values_type)
+
+  return [
+      date_time_values_type(timestamp=timestamp) for timestamp in timestamps]
+
+
+def CopyToTimestamps(date_time_values_list, unit=None):
+  """Copies date and time values to timestamps in a specific unit.
+
+  Args:
+    date_time_values_list (Sequence[DateTimeValues]): date and time values.
+    unit (Optional[str]): timestamp unit, either "s", "ms", "us" or "ns",
+        where None represents the coarsest unit that preserves the precision
+        of all date and time values.
+
+  Returns:
+    tuple[list[int], str]: timestamps in number of units since the POSIX epoch,
+        where NaT represents a missing or out of range timestamp, and the unit.
+
+  Raises:
+    ValueError: if the unit is not supported.
+  """
+  if unit is None:
+    unit = conversion.GetTimestampUnit(date_time_values_list)
+
+  nanoseconds_per_unit = definitions.NANOSECONDS_PER_TIMESTAMP_UNIT.get(
+      unit, None)
+  if not nanoseconds_per_unit:
+    raise ValueError('Unsupported unit: {0!s}.'.format(unit))
+
+  timestamps = []
+  for date_time_values in date_time_values_list:
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())
+
+    timestamp = NAT
+    if normalized_timestamp is not None:
+      timestamp = normalized_timestamp // nanoseconds_per_unit
+      if timestamp <= NAT or timestamp > _INT64_MAX:
+        timestamp = NAT
+
+    timestamps.append(timestamp)
+
+  return timestamps, unit
+
+
+def FromDatetime64Array(array, date_time_values_type):
+  """Copies date and time values from a NumPy datetime64 array.
+
+  Args:
+    array (numpy.ndarray): NumPy datetime64 array, where arrays with a unit
+        coarser than seconds are converted to seconds and arrays with
+        a multiple of a unit, such as "10ms", to the unit.
+    date_time_values_type (type): date and time values type to create, which
+        must have an integer timestamp, for example filetime.Filetime.
+
+  Returns:
+    list[DateTimeValues]: date and time values, without a timestamp if
+        the value is NaT or out of bounds of the date and time values type.
+
+  Raises:
+    RuntimeError: if numpy is not available.
+    ValueError: if the array is not a datetime64 array or the unit or
+        the date and time values type is not supported.
+  """
+  _CheckNumPy()
+
+  if array.dtype.kind != 'M':
+    raise ValueError('Unsupported array type: {0!s}.'.format(array.dtype))
+
+  unit, number_of_units = numpy.datetime_data(array.dtype)
+  if unit in _COARSE_DATETIME64_UNITS:
+    unit = definitions.TIMESTAMP_UNIT_SECONDS
+    number_of_units = 0
+
+  if number_of_units != 1:
+    array = array.astype('datetime64[{0:s}]'.format(unit))
+
+  timestamps = array.view(numpy.int64).tolist()
+  return CopyFromTimestamps(timestamps, unit, date_time_values_type)
+
+
+def ToDatetime64Array(date_time_values_list, unit=None):
+  """Copies date and time values to a NumPy datetime64 array.
+
+  Args:
+    date_time_values_list (Sequence[DateTimeValues]): date and time values.
+    unit (Optional[str]): timestamp unit, either "s", "ms", "us" or "ns",
+        where None represents the coarsest unit that preserves the precision
+        of all date and time values.
+
+  Returns:
+    numpy.ndarray: NumPy datetime64 array, where NaT represents a missing or
+        out of range timestamp.
+
+  Raises:
+    RuntimeError: if numpy is not available.
+    ValueError: if the unit is not supported.
+  """
+  _CheckNumPy()
+
+  timestamps, unit = CopyToTimestamps(date_time_values_list, unit=unit)
+
+  array = numpy.array(timestamps, dtype=numpy.int64)
+  return array.view('datetime64[{0:s}]'.format(unit))
@@ -21,3 +21,23 @@ def deprecated(function):  # pylint: disable=invalid-name
   IssueDeprecationWarning.__doc__ = function.__doc__
   IssueDeprecationWarning.__dict__.update(function.__dict__)
   return IssueDeprecationWarning
+
+
+def not_frozen(function):  # pylint: disable=invalid-name
+  """Decorator to mark methods that change date and time values.
+
+  Frozen date and time values cannot be changed, hence calling such a method
+  on frozen date and time values raises a ValueError.
+  """
+
+  def CheckNotFrozen(self, *args, **kwargs):
+    """Checks that the date and time values are not frozen."""
+    if self._is_frozen:  # pylint: disable=protected-access
+      raise ValueError('Unable to change frozen date and time values.')
+
+    return function(self, *args, **kwargs)
+
+  CheckNotFrozen.__name__ = function.__name__
+  CheckNotFrozen.__doc__ = function.__doc__
+  CheckNotFrozen.__dict__.update(function.__dict__)
+  return CheckNotFrozen
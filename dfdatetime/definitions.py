@@ -22,6 +22,14 @@ MICROSECONDS_PER_DECISECOND = 100000
 MICROSECONDS_PER_MILLISECOND = 1000
 
 NANOSECONDS_PER_SECOND = 1000000000
+NANOSECONDS_PER_DECISECOND = 100000000
+NANOSECONDS_PER_MICROSECOND = 1000
+NANOSECONDS_PER_MILLISECOND = 1000000
+NANOSECONDS_PER_100NS = 100
+
+LOCAL_TIME_AMBIGUOUS = 'ambiguous'
+LOCAL_TIME_NONEXISTENT = 'nonexistent'
+LOCAL_TIME_VALID = 'valid'
 
 PRECISION_1_DAY = '1d'
 PRECISION_1_HOUR = '1h'
@@ -45,3 +53,47 @@ PRECISION_VALUES = frozenset([
     PRECISION_1_MINUTE,
     PRECISION_1_SECOND,
     PRECISION_2_SECONDS])
+
+TIMESTAMP_UNIT_SECONDS = 's'
+TIMESTAMP_UNIT_MILLISECONDS = 'ms'
+TIMESTAMP_UNIT_MICROSECONDS = 'us'
+TIMESTAMP_UNIT_NANOSECONDS = 'ns'
+
+# Timestamp units ordered from coarse to fine.
+TIMESTAMP_UNITS = (
+    TIMESTAMP_UNIT_SECONDS,
+    TIMESTAMP_UNIT_MILLISECONDS,
+    TIMESTAMP_UNIT_MICROSECONDS,
+    TIMESTAMP_UNIT_NANOSECONDS)
+
+NANOSECONDS_PER_TIMESTAMP_UNIT = {
+    TIMESTAMP_UNIT_SECONDS: NANOSECONDS_PER_SECOND,
+    TIMESTAMP_UNIT_MILLISECONDS: NANOSECONDS_PER_MILLISECOND,
+    TIMESTAMP_UNIT_MICROSECONDS: NANOSECONDS_PER_MICROSECOND,
+    TIMESTAMP_UNIT_NANOSECONDS: 1}
+
+# The duration of the precision in number of nanoseconds.
+NANOSECONDS_PER_PRECISION = {
+    PRECISION_1_DAY: SECONDS_PER_DAY * NANOSECONDS_PER_SECOND,
+    PRECISION_1_HOUR: 60 * 60 * NANOSECONDS_PER_SECOND,
+    PRECISION_1_MINUTE: 60 * NANOSECONDS_PER_SECOND,
+    PRECISION_2_SECONDS: 2 * NANOSECONDS_PER_SECOND,
+    PRECISION_1_SECOND: NANOSECONDS_PER_SECOND,
+    PRECISION_100_MILLISECONDS: NANOSECONDS_PER_DECISECOND,
+    PRECISION_1_MILLISECOND: NANOSECONDS_PER_MILLISECOND,
+    PRECISION_1_MICROSECOND: NANOSECONDS_PER_MICROSECOND,
+    PRECISION_100_NANOSECONDS: NANOSECONDS_PER_100NS,
+    PRECISION_1_NANOSECOND: 1}
+
+# The coarsest timestamp unit that preserves the precision.
+TIMESTAMP_UNITS_PER_PRECISION = {
+    PRECISION_1_DAY: TIMESTAMP_UNIT_SECONDS,
+    PRECISION_1_HOUR: TIMESTAMP_UNIT_SECONDS,
+    PRECISION_1_MINUTE: TIMESTAMP_UNIT_SECONDS,
+    PRECISION_2_SECONDS: TIMESTAMP_UNIT_SECONDS,
+    PRECISION_1_SECOND: TIMESTAMP_UNIT_SECONDS,
+    PRECISION_100_MILLISECONDS: TIMESTAMP_UNIT_MILLISECONDS,
+    PRECISION_1_MILLISECOND: TIMESTAMP_UNIT_MILLISECONDS,
+    PRECISION_1_MICROSECOND: TIMESTAMP_UNIT_MICROSECONDS,
+    PRECISION_100_NANOSECONDS: TIMESTAMP_UNIT_NANOSECONDS,
+    PRECISION_1_NANOSECOND: TIMESTAMP_UNIT_NANOSECONDS}
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -39,6 +40,8 @@ class DelphiDateTime(interface.DateTimeValues):
 
   _EPOCH = DelphiDateTimeEpoch()
 
+  _SERIALIZED_ATTRIBUTES = ('_timestamp', )
+
   def __init__(self, timestamp=None):
     """Initializes a Delphi TDateTime timestamp.
 
@@ -54,6 +57,37 @@ class DelphiDateTime(interface.DateTimeValues):
     """float: Delphi TDateTime timestamp or None if timestamp is not set."""
     return self._timestamp
 
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and microseconds or None if the timestamp is
+          missing.
+    """
+    if self._timestamp is None:
+      return None
+
+    # Note that divmod rounds down, which is needed for negative timestamps.
+    number_of_seconds, fraction_of_second = divmod(
+        self._timestamp * definitions.SECONDS_PER_DAY, 1)
+
+    # The date values are determined relative to the POSIX epoch, since
+    # determining date values before an epoch that does not start on January 1
+    # is not supported.
+    number_of_seconds = int(number_of_seconds) - (
+        self._DELPHI_TO_POSIX_BASE * definitions.SECONDS_PER_DAY)
+
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(
+        number_of_seconds)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH_NORMALIZED_TIME)
+
+    microseconds = int(fraction_of_second * definitions.MICROSECONDS_PER_SECOND)
+
+    return year, month, day_of_month, hours, minutes, seconds, microseconds
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -71,6 +105,7 @@ class DelphiDateTime(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a Delphi TDateTime timestamp from a string.
 
@@ -108,33 +143,27 @@ class DelphiDateTime(interface.DateTimeValues):
     if microseconds is not None:
       timestamp += float(microseconds) / definitions.MICROSECONDS_PER_DAY
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._timestamp = timestamp
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the Delphi TDateTime timestamp to a date and time string.
 
     Returns:
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.######" or
           None if the timestamp is missing.
     """
-    if self._timestamp is None:
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    number_of_seconds = self._timestamp * definitions.SECONDS_PER_DAY
-
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(
-        int(number_of_seconds))
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
-
-    microseconds = int(
-        (number_of_seconds % 1) * definitions.MICROSECONDS_PER_SECOND)
+    year, month, day_of_month, hours, minutes, seconds, microseconds = (
+        date_time_values)
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:06d}'.format(
-        year, month, day_of_month, hours, minutes, seconds, microseconds)
+    date_time_string = self._FormatDateTimeString(
+        year, month, day_of_month, hours, minutes, seconds)
+    return '{0:s}.{1:06d}'.format(date_time_string, microseconds)
 
 
 factory.Factory.RegisterDateTimeValues(DelphiDateTime)
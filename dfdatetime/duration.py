@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""Duration in number of nanoseconds.
+
+A duration is the exact difference between 2 date and time values, which is
+represented as an integer number of nanoseconds, so that adding a duration to
+date and time values and subtracting date and time values do not lose
+precision.
+"""
+
+from __future__ import unicode_literals
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+from dfdatetime import definitions
+
+
+class Duration(object):
+  """Duration in number of nanoseconds."""
+
+  _NANOSECONDS_PER_MINUTE = 60 * definitions.NANOSECONDS_PER_SECOND
+  _NANOSECONDS_PER_HOUR = 60 * _NANOSECONDS_PER_MINUTE
+  _NANOSECONDS_PER_DAY = 24 * _NANOSECONDS_PER_HOUR
+
+  def __init__(
+      self, days=0, hours=0, minutes=0, seconds=0, milliseconds=0,
+      microseconds=0, nanoseconds=0):
+    """Initializes a duration.
+
+    The duration is the sum of all the arguments, which can be negative.
+
+    Args:
+      days (Optional[int]): number of days.
+      hours (Optional[int]): number of hours.
+      minutes (Optional[int]): number of minutes.
+      seconds (Optional[int]): number of seconds.
+      milliseconds (Optional[int]): number of milliseconds.
+      microseconds (Optional[int]): number of microseconds.
+      nanoseconds (Optional[int]): number of nanoseconds.
+
+    Raises:
+      ValueError: if an argument is not an integer.
+    """
+    values = (days, hours, minutes, seconds, milliseconds, microseconds,
+              nanoseconds)
+    for value in values:
+      if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError('Unsupported duration value: {0!s}.'.format(value))
+
+    super(Duration, self).__init__()
+    self._nanoseconds = (
+        (days * self._NANOSECONDS_PER_DAY) +
+        (hours * self._NANOSECONDS_PER_HOUR) +
+        (minutes * self._NANOSECONDS_PER_MINUTE) +
+        (seconds * definitions.NANOSECONDS_PER_SECOND) +
+        (milliseconds * definitions.NANOSECONDS_PER_MILLISECOND) +
+        (microseconds * definitions.NANOSECONDS_PER_MICROSECOND) +
+        nanoseconds)
+
+  @property
+  def nanoseconds(self):
+    """int: number of nanoseconds."""
+    return self._nanoseconds
+
+  def __abs__(self):
+    """Retrieves the absolute duration.
+
+    Returns:
+      Duration: absolute duration.
+    """
+    return Duration(nanoseconds=abs(self._nanoseconds))
+
+  def __add__(self, other):
+    """Adds a duration to the duration.
+
+    Args:
+      other (Duration): duration to add.
+
+    Returns:
+      Duration: sum of the durations.
+
+    Raises:
+      ValueError: if other is not an instance of Duration.
+    """
+    if not isinstance(other, Duration):
+      raise ValueError('Other not an instance of Duration')
+
+    return Duration(nanoseconds=self._nanoseconds + other.nanoseconds)
+
+  def __eq__(self, other):
+    """Determines if the duration is equal to other.
+
+    Args:
+      other (Duration): duration to compare against.
+
+    Returns:
+      bool: True if the duration is equal to other.
+    """
+    if not isinstance(other, Duration):
+      return False
+
+    return self._nanoseconds == other.nanoseconds
+
+  def __ge__(self, other):
+    """Determines if the duration is greater than or equal to other.
+
+    Args:
+      other (Duration): duration to compare against.
+
+    Returns:
+      bool: True if the duration is greater than or equal to other.
+
+    Raises:
+      ValueError: if other is not an instance of Duration.
+    """
+    if not isinstance(other, Duration):
+      raise ValueError('Other not an instance of Duration')
+
+    return self._nanoseconds >= other.nanoseconds
+
+  def __gt__(self, other):
+    """Determines if the duration is greater than other.
+
+    Args:
+      other (Duration): duration to compare against.
+
+    Returns:
+      bool: True if the duration is greater than other.
+
+    Raises:
+      ValueError: if other is not an instance of Duration.
+    """
+    if not isinstance(other, Duration):
+      raise ValueError('Other not an instance of Duration')
+
+    return self._nanoseconds > other.nanoseconds
+
+  def __hash__(self):
+    """Retrieves a hash of the duration.
+
+    Returns:
+      int: hash of the duration.
+    """
+    return hash(self._nanoseconds)
+
+  def __le__(self, other):
+    """Determines if the duration is less than or equal to other.
+
+    Args:
+      other (Duration): duration to compare against.
+
+    Returns:
+      bool: True if the duration is less than or equal to other.
+
+    Raises:
+      ValueError: if other is not an instance of Duration.
+    """
+    if not isinstance(other, Duration):
+      raise ValueError('Other not an instance of Duration')
+
+    return self._nanoseconds <= other.nanoseconds
+
+  def __lt__(self, other):
+    """Determines if the duration is less than other.
+
+    Args:
+      other (Duration): duration to compare against.
+
+    Returns:
+      bool: True if the duration is less than other.
+
+    Raises:
+      ValueError: if other is not an instance of Duration.
+    """
+    if not isinstance(other, Duration):
+      raise ValueError('Other not an instance of Duration')
+
+    return self._nanoseconds < other.nanoseconds
+
+  def __ne__(self, other):
+    """Determines if the duration is not equal to other.
+
+    Args:
+      other (Duration): duration to compare against.
+
+    Returns:
+      bool: True if the duration is not equal to other.
+    """
+    if not isinstance(other, Duration):
+      return True
+
+    return self._nanoseconds != other.nanoseconds
+
+  def __neg__(self):
+    """Retrieves the negated duration.
+
+    Returns:
+      Duration: negated duration.
+    """
+    return Duration(nanoseconds=-self._nanoseconds)
+
+  def __repr__(self):
+    """Retrieves a string representation of the duration.
+
+    Returns:
+      str: string representation of the duration.
+    """
+    return 'Duration(nanoseconds={0:d})'.format(self._nanoseconds)
+
+  def __sub__(self, other):
+    """Subtracts a duration from the duration.
+
+    Args:
+      other (Duration): duration to subtract.
+
+    Returns:
+      Duration: difference of the durations.
+
+    Raises:
+      ValueError: if other is not an instance of Duration.
+    """
+    if not isinstance(other, Duration):
+      raise ValueError('Other not an instance of Duration')
+
+    return Duration(nanoseconds=self._nanoseconds - other.nanoseconds)
+
+  def CopyToNumPyTimedelta64(self):
+    """Copies the duration to a NumPy timedelta64 value.
+
+    Returns:
+      numpy.timedelta64: NumPy timedelta64 value in nanoseconds.
+
+    Raises:
+      RuntimeError: if numpy is not available.
+      ValueError: if the duration is out of the range of a NumPy timedelta64
+          value in nanoseconds.
+    """
+    if not numpy:
+      raise RuntimeError('Missing optional dependency: numpy.')
+
+    # The smallest signed 64-bit integer represents NaT.
+    if not -(1 << 63) < self._nanoseconds < (1 << 63):
+      raise ValueError('Duration: {0:d} out of range of unit: ns.'.format(
+          self._nanoseconds))
+
+    return numpy.timedelta64(self._nanoseconds, 'ns')
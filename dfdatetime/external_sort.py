@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""External merge sort of date and time values.
+
+Entries, pairs of date and time values and an optional payload, are sorted by
+the sort key of the date and time values, which consists of the normalized
+timestamp in nanoseconds and the semantic order of date and time values
+without a timestamp. Entries that do not fit in memory are sorted in chunks,
+which are spilled as sorted runs to temporary files and merged afterwards.
+
+A run consists of blocks, where a block consists of:
+* the size of the packed date and time values, 32-bit big-endian integer;
+* the size of the payloads, 32-bit big-endian integer;
+* the packed date and time values, as created by serializer.PackMany;
+* per entry the size of the payload plus 1, as varint, where 0 represents
+  no payload, followed by the payload.
+"""
+
+from __future__ import unicode_literals
+
+import collections
+import heapq
+import itertools
+import multiprocessing
+import os
+import shutil
+import struct
+import tempfile
+
+from dfdatetime import serializer
+
+
+_BLOCK_HEADER = struct.Struct('>II')
+
+# The number of entries per block.
+_BLOCK_SIZE = 4096
+
+# The maximum number of runs that are merged at once, which limits the number
+# of open files and the memory used by the blocks that are read.
+_MAXIMUM_NUMBER_OF_RUNS_PER_MERGE = 128
+
+
+def _GetSortKey(entry):
+  """Retrieves the sort key of an entry.
+
+  Args:
+    entry (tuple[DateTimeValues, bytes]): entry.
+
+  Returns:
+    tuple[int, int]: sort key.
+  """
+  return entry[0].GetSortKey()
+
+
+def _MergeRuns(paths):
+  """Merges sorted runs.
+
+  Args:
+    paths (list[str]): paths of the runs, where entries with the same sort key
+        are retrieved in the order of the runs.
+
+  Returns:
+    generator[tuple[DateTimeValues, bytes]]: sorted entries.
+  """
+  runs = [_ReadRun(path) for path in paths]
+  return heapq.merge(*runs, key=_GetSortKey)
+
+
+def _ReadRun(path):
+  """Reads the entries of a run.
+
+  Args:
+    path (str): path of the run.
+
+  Yields:
+    tuple[DateTimeValues, bytes]: entry.
+
+  Raises:
+    ValueError: if the run is truncated or not supported.
+  """
+  # pylint: disable=protected-access
+  with open(path, 'rb') as file_object:
+    while True:
+      block_header = file_object.read(_BLOCK_HEADER.size)
+      if not block_header:
+        break
+
+      if len(block_header) != _BLOCK_HEADER.size:
+        raise ValueError('Truncated block header in run: {0:s}.'.format(path))
+
+      values_data_size, payloads_data_size = _BLOCK_HEADER.unpack(
+          block_header)
+
+      values_data = file_object.read(values_data_size)
+      payloads_data = file_object.read(payloads_data_size)
+      if (len(values_data) != values_data_size or
+          len(payloads_data) != payloads_data_size):
+        raise ValueError('Truncated block in run: {0:s}.'.format(path))
+
+      payload_offset = 0
+      for date_time_values in serializer.UnpackMany(values_data):
+        payload_size, payload_offset = serializer._ReadVarint(
+            payloads_data, payload_offset)
+
+        payload = None
+        if payload_size > 0:
+          payload_end_offset = payload_offset + payload_size - 1
+          payload = payloads_data[payload_offset:payload_end_offset]
+          payload_offset = payload_end_offset
+
+        yield date_time_values, payload
+
+
+def _SortEntries(
+    entries, maximum_number_of_entries, number_of_processes,
+    temporary_directory):
+  """Sorts entries.
+
+  Args:
+    entries (Iterable[tuple[DateTimeValues, bytes]]): entries.
+    maximum_number_of_entries (int): maximum number of entries to sort in
+        memory per chunk.
+    number_of_processes (int): number of processes that sort chunks.
+    temporary_directory (str): path of the directory in which the directory
+        for the runs is created, where None represents the default temporary
+        directory.
+
+  Yields:
+    tuple[DateTimeValues, bytes]: sorted entries.
+  """
+  entries = iter(entries)
+  chunk = list(itertools.islice(entries, maximum_number_of_entries))
+
+  if len(chunk) < maximum_number_of_entries:
+    chunk.sort(key=_GetSortKey)
+    yield from chunk
+    return
+
+  runs_directory = tempfile.mkdtemp(
+      prefix='dfdatetime-', dir=temporary_directory)
+
+  try:
+    if number_of_processes > 1:
+      paths = _WriteRunsInParallel(
+          chunk, entries, maximum_number_of_entries, number_of_processes,
+          runs_directory)
+    else:
+      paths = []
+      while chunk:
+        paths.append(_WriteSortedRun(chunk, runs_directory))
+        chunk = list(itertools.islice(entries, maximum_number_of_entries))
+
+    chunk = None
+
+    while len(paths) > _MAXIMUM_NUMBER_OF_RUNS_PER_MERGE:
+      merged_paths = []
+      for index in range(0, len(paths), _MAXIMUM_NUMBER_OF_RUNS_PER_MERGE):
+        group_paths = paths[index:index + _MAXIMUM_NUMBER_OF_RUNS_PER_MERGE]
+        merged_paths.append(
+            _WriteRun(_MergeRuns(group_paths), runs_directory))
+
+        for path in group_paths:
+          os.remove(path)
+
+      paths = merged_paths
+
+    yield from _MergeRuns(paths)
+
+  finally:
+    shutil.rmtree(runs_directory, ignore_errors=True)
+
+
+def _WriteRun(entries, runs_directory):
+  """Writes entries to a run.
+
+  Args:
+    entries (Iterable[tuple[DateTimeValues, bytes]]): sorted entries.
+    runs_directory (str): path of the directory of the runs.
+
+  Returns:
+    str: path of the run.
+
+  Raises:
+    ValueError: if a payload is not supported.
+  """
+  # pylint: disable=protected-access
+  file_descriptor, path = tempfile.mkstemp(suffix='.run', dir=runs_directory)
+
+  with os.fdopen(file_descriptor, 'wb') as file_object:
+    entries = iter(entries)
+    while True:
+      block = list(itertools.islice(entries, _BLOCK_SIZE))
+      if not block:
+        break
+
+      values_data = serializer.PackMany(
+          date_time_values for date_time_values, _ in block)
+
+      payloads_data = bytearray()
+      for _, payload in block:
+        if payload is None:
+          serializer._WriteVarint(payloads_data, 0)
+          continue
+
+        if not isinstance(payload, bytes):
+          raise ValueError('Unsupported payload type: {0!s}.'.format(
+              type(payload)))
+
+        serializer._WriteVarint(payloads_data, len(payload) + 1)
+        payloads_data.extend(payload)
+
+      file_object.write(_BLOCK_HEADER.pack(
+          len(values_data), len(payloads_data)))
+      file_object.write(values_data)
+      file_object.write(payloads_data)
+
+  return path
+
+
+def _WriteRunsInParallel(
+    chunk, entries, maximum_number_of_entries, number_of_processes,
+    runs_directory):
+  """Sorts chunks of entries and writes them to runs in parallel.
+
+  Args:
+    chunk (list[tuple[DateTimeValues, bytes]]): first chunk of entries.
+    entries (Iterator[tuple[DateTimeValues, bytes]]): remaining entries.
+    maximum_number_of_entries (int): maximum number of entries per chunk.
+    number_of_processes (int): number of processes that sort chunks.
+    runs_directory (str): path of the directory of the runs.
+
+  Returns:
+    list[str]: paths of the runs, in the order of the chunks.
+  """
+  paths = []
+  pending_results = collections.deque()
+
+  # All results have been retrieved when the pool is terminated on exit unless
+  # an error occurred, in which case the pending chunks are discarded.
+  with multiprocessing.Pool(processes=number_of_processes) as pool:
+    while chunk:
+      # Wait for the oldest chunk to be written, so that at most 1 chunk per
+      # process is kept in memory.
+      if len(pending_results) >= number_of_processes:
+        paths.append(pending_results.popleft().get())
+
+      pending_results.append(pool.apply_async(
+          _WriteSortedRun, (chunk, runs_directory)))
+
+      chunk = list(itertools.islice(entries, maximum_number_of_entries))
+
+    while pending_results:
+      paths.append(pending_results.popleft().get())
+
+  return paths
+
+
+def _WriteSortedRun(chunk, runs_directory):
+  """Sorts a chunk of entries and writes it to a run.
+
+  Args:
+    chunk (list[tuple[DateTimeValues, bytes]]): entries.
+    runs_directory (str): path of the directory of the runs.
+
+  Returns:
+    str: path of the run.
+
+  Raises:
+    ValueError: if a payload is not supported.
+  """
+  chunk.sort(key=_GetSortKey)
+  return _WriteRun(chunk, runs_directory)
+
+
+def SortEntries(
+    entries, maximum_number_of_entries=1000000, number_of_processes=1,
+    temporary_directory=None):
+  """Sorts entries that might not fit in memory.
+
+  The sort is stable, entries with the same sort key are retrieved in
+  the order in which they were provided. Only if there are more entries than
+  the maximum number of entries, sorted runs are written to temporary files.
+  The temporary files are removed after all entries were retrieved or when
+  the generator is closed.
+
+  Args:
+    entries (Iterable[tuple[DateTimeValues, bytes]]): entries, pairs of date
+        and time values and a payload, where None represents no payload.
+    maximum_number_of_entries (Optional[int]): maximum number of entries to
+        sort in memory per chunk, where every process that sorts chunks keeps
+        1 chunk in memory.
+    number_of_processes (Optional[int]): number of processes that sort
+        chunks, where 1 represents that chunks are sorted by the current
+        process.
+    temporary_directory (Optional[str]): path of the directory in which
+        the directory for the runs is created, where None represents
+        the default temporary directory.
+
+  Returns:
+    generator[tuple[DateTimeValues, bytes]]: sorted entries.
+
+  Raises:
+    ValueError: if the maximum number of entries or number of processes is
+        not supported.
+  """
+  if maximum_number_of_entries < 1:
+    raise ValueError('Unsupported maximum number of entries: {0:d}.'.format(
+        maximum_number_of_entries))
+
+  if number_of_processes < 1:
+    raise ValueError('Unsupported number of processes: {0:d}.'.format(
+        number_of_processes))
+
+  return _SortEntries(
+      entries, maximum_number_of_entries, number_of_processes,
+      temporary_directory)
@@ -26,6 +26,35 @@ class Factory(object):
 
     del cls._date_time_values_types[class_name]
 
+  @classmethod
+  def GetDateTimeValuesType(cls, class_name):
+    """Retrieves a date and time values type.
+
+    Args:
+      class_name (str): type indicator.
+
+    Returns:
+      type: date and time values type.
+
+    Raises:
+      KeyError: if date and time values is not registered.
+    """
+    date_time_values_type = cls._date_time_values_types.get(class_name, None)
+    if not date_time_values_type:
+      raise KeyError('Date and time values type: {0:s} not set.'.format(
+          class_name))
+
+    return date_time_values_type
+
+  @classmethod
+  def GetDateTimeValuesTypes(cls):
+    """Retrieves the registered date and time values types.
+
+    Returns:
+      list[type]: date and time values types.
+    """
+    return list(cls._date_time_values_types.values())
+
   @classmethod
   def NewDateTimeValues(cls, class_name, **kwargs):
     """Creates a new date and time values for the specific type indicator.
@@ -47,6 +76,28 @@ class Factory(object):
     date_time_values_type = cls._date_time_values_types[class_name]
     return date_time_values_type(**kwargs)
 
+  @classmethod
+  def NewDateTimeValuesFromDict(cls, date_time_values_dict):
+    """Creates new date and time values from a dictionary.
+
+    Args:
+      date_time_values_dict (dict[str, object]): date and time values, as
+          created by DateTimeValues.CopyToDict.
+
+    Returns:
+      DateTimeValues: date and time values.
+
+    Raises:
+      KeyError: if date and time values is not registered.
+      ValueError: if the dictionary contains an unsupported value.
+    """
+    class_name = date_time_values_dict.get('__class_name__', None) or ''
+    date_time_values_type = cls.GetDateTimeValuesType(class_name)
+
+    date_time_values = date_time_values_type()
+    date_time_values.CopyFromDict(date_time_values_dict)
+    return date_time_values
+
   @classmethod
   def RegisterDateTimeValues(cls, date_time_values_type):
     """Registers a date and time values type.
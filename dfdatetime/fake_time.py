@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 import decimal
 import time
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import interface
 from dfdatetime import posix_time
@@ -23,6 +24,8 @@ class FakeTime(interface.DateTimeValues):
 
   _EPOCH = posix_time.PosixTimeEpoch()
 
+  _SERIALIZED_ATTRIBUTES = ('_microseconds', '_number_of_seconds')
+
   def __init__(self):
     """Initializes a fake timestamp."""
     # Note that time.time() and divmod return floating point values.
@@ -34,6 +37,26 @@ class FakeTime(interface.DateTimeValues):
     self._number_of_seconds = int(timestamp)
     self._precision = definitions.PRECISION_1_MICROSECOND
 
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and microseconds or None if the number of
+          seconds is missing.
+    """
+    if self._number_of_seconds is None:
+      return None
+
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(
+        self._number_of_seconds)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH)
+
+    return (
+        year, month, day_of_month, hours, minutes, seconds, self._microseconds)
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -52,6 +75,7 @@ class FakeTime(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a fake timestamp from a date and time string.
 
@@ -74,13 +98,13 @@ class FakeTime(interface.DateTimeValues):
     seconds = date_time_values.get('seconds', 0)
     time_zone_offset = date_time_values.get('time_zone_offset', 0)
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._number_of_seconds = self._GetNumberOfSecondsFromElements(
         year, month, day_of_month, hours, minutes, seconds, time_zone_offset)
     self._microseconds = date_time_values.get('microseconds', None)
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the fake timestamp to a date and time string.
 
     Returns:
@@ -88,19 +112,17 @@ class FakeTime(interface.DateTimeValues):
           "YYYY-MM-DD hh:mm:ss.######" or None if the number of seconds
           is missing.
     """
-    if self._number_of_seconds is None:
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(
-        self._number_of_seconds)
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
+    year, month, day_of_month, hours, minutes, seconds, microseconds = (
+        date_time_values)
 
-    if self._microseconds is None:
-      return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}'.format(
+    if microseconds is None:
+      return self._FormatDateTimeString(
           year, month, day_of_month, hours, minutes, seconds)
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:06d}'.format(
-        year, month, day_of_month, hours, minutes, seconds,
-        self._microseconds)
+    date_time_string = self._FormatDateTimeString(
+        year, month, day_of_month, hours, minutes, seconds)
+    return '{0:s}.{1:06d}'.format(date_time_string, microseconds)
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -45,6 +46,10 @@ class FATDateTime(interface.DateTimeValues):
   # The difference between January 1, 1980 and January 1, 1970 in seconds.
   _FAT_DATE_TO_POSIX_BASE = 315532800
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
+  _SERIALIZED_ATTRIBUTES = ('_number_of_seconds', )
+
   def __init__(self, fat_date_time=None):
     """Initializes a FAT date time.
 
@@ -59,6 +64,62 @@ class FATDateTime(interface.DateTimeValues):
     self._precision = definitions.PRECISION_2_SECONDS
     self._number_of_seconds = number_of_seconds
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a FAT date time from a normalized timestamp.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      FATDateTime: FAT date time.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the precision or the year is out of bounds.
+    """
+    number_of_seconds, remainder = divmod(
+        normalized_timestamp, 2 * definitions.NANOSECONDS_PER_SECOND)
+    if remainder:
+      raise ValueError((
+          'Normalized timestamp: {0:d} ns is not a multiple of the precision '
+          'of {1:s}.').format(normalized_timestamp, type(self).__name__))
+
+    number_of_seconds *= 2
+
+    year, _, _, _, _, _ = self._GetTimeElementsFromNumberOfSeconds(
+        number_of_seconds, None)
+    if year < 1980 or year > 1980 + 0x7f:
+      raise ValueError('Year value out of bounds.')
+
+    # The FAT date time value is not reconstructed, only the number of seconds
+    # it represents.
+    fat_date_time = type(self)()
+    fat_date_time._number_of_seconds = (  # pylint: disable=protected-access
+        number_of_seconds - self._FAT_DATE_TO_POSIX_BASE)
+    fat_date_time._time_zone_offset = (  # pylint: disable=protected-access
+        self._time_zone_offset)
+    return fat_date_time
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, None]: year, month, day of month,
+          hours, minutes and seconds, where the fraction of second is None, or
+          None if number of seconds is missing.
+    """
+    if self._number_of_seconds is None:
+      return None
+
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(
+        self._number_of_seconds)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH)
+
+    return year, month, day_of_month, hours, minutes, seconds, None
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -76,6 +137,20 @@ class FATDateTime(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if self._number_of_seconds is None or self._number_of_seconds < 0:
+      return None
+
+    number_of_seconds = self._number_of_seconds + self._FAT_DATE_TO_POSIX_BASE
+    return number_of_seconds * definitions.NANOSECONDS_PER_SECOND
+
   def _GetNumberOfSeconds(self, fat_date_time):
     """Retrieves the number of seconds from a FAT date time.
 
@@ -121,6 +196,7 @@ class FATDateTime(interface.DateTimeValues):
     number_of_seconds += number_of_days * definitions.SECONDS_PER_DAY
     return number_of_seconds
 
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a FAT date time from a date and time string.
 
@@ -149,29 +225,26 @@ class FATDateTime(interface.DateTimeValues):
     if year < 1980 or year > (1980 + 0x7f):
       raise ValueError('Year value not supported: {0!s}.'.format(year))
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._number_of_seconds = self._GetNumberOfSecondsFromElements(
         year, month, day_of_month, hours, minutes, seconds, time_zone_offset)
     self._number_of_seconds -= self._FAT_DATE_TO_POSIX_BASE
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the FAT date time to a date and time string.
 
     Returns:
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss" or None
           if number of seconds is missing.
     """
-    if self._number_of_seconds is None:
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(
-        self._number_of_seconds)
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
+    year, month, day_of_month, hours, minutes, seconds, _ = date_time_values
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}'.format(
+    return self._FormatDateTimeString(
         year, month, day_of_month, hours, minutes, seconds)
 
 
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -33,6 +34,16 @@ class HFSTime(interface.DateTimeValues):
   # The difference between Jan 1, 1904 and Jan 1, 1970 in seconds.
   _HFS_TO_POSIX_BASE = 2082844800
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
+  _TIMESTAMP_NANOSECONDS_PER_UNIT = definitions.NANOSECONDS_PER_SECOND
+  _TIMESTAMP_EPOCH_OFFSET = (
+      _HFS_TO_POSIX_BASE * definitions.NANOSECONDS_PER_SECOND)
+  _TIMESTAMP_MINIMUM = 0
+  _TIMESTAMP_MAXIMUM = (1 << 32) - 1
+
+  _SERIALIZED_ATTRIBUTES = ('_timestamp', )
+
   def __init__(self, timestamp=None):
     """Initializes a HFS timestamp.
 
@@ -48,6 +59,43 @@ class HFSTime(interface.DateTimeValues):
     """int: HFS timestamp or None if timestamp is not set."""
     return self._timestamp
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a HFS timestamp from a normalized timestamp.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      HFSTime: HFS timestamp.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the timestamp unit or the timestamp is out of bounds.
+    """
+    timestamp = self._GetTimestampFromNormalizedTimestamp(normalized_timestamp)
+    return type(self)(timestamp=timestamp)
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, None]: year, month, day of month,
+          hours, minutes and seconds, where the fraction of second is None, or
+          None if the timestamp is missing or invalid.
+    """
+    if (self._timestamp is None or self._timestamp < 0 or
+        self._timestamp > self._UINT32_MAX):
+      return None
+
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(
+        self._timestamp)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH)
+
+    return year, month, day_of_month, hours, minutes, seconds, None
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -65,6 +113,22 @@ class HFSTime(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if (self._timestamp is None or self._timestamp < 0 or
+        self._timestamp > self._UINT32_MAX):
+      return None
+
+    timestamp = self._timestamp - self._HFS_TO_POSIX_BASE
+    return timestamp * definitions.NANOSECONDS_PER_SECOND
+
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a HFS timestamp from a date and time string.
 
@@ -93,30 +157,26 @@ class HFSTime(interface.DateTimeValues):
     if year < 1904 or year > 2040:
       raise ValueError('Year value not supported.')
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._timestamp = self._GetNumberOfSecondsFromElements(
         year, month, day_of_month, hours, minutes, seconds, time_zone_offset)
     self._timestamp += self._HFS_TO_POSIX_BASE
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the HFS timestamp to a date and time string.
 
     Returns:
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss" or None
           if the timestamp is missing or invalid.
     """
-    if (self._timestamp is None or self._timestamp < 0 or
-        self._timestamp > self._UINT32_MAX):
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(
-        self._timestamp)
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
+    year, month, day_of_month, hours, minutes, seconds, _ = date_time_values
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}'.format(
+    return self._FormatDateTimeString(
         year, month, day_of_month, hours, minutes, seconds)
 
 
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""Counts of date and time values per time bucket.
+
+The bucket of a date and time value is determined from its normalized
+timestamp in nanoseconds, in UTC or in the local time of a time zone, using
+only integer arithmetic. The year and month are determined with a civil date
+conversion that consists only of arithmetic operations, so that it can be
+applied to a NumPy array of normalized timestamps at once.
+
+A bucket is either a fixed width in number of nanoseconds or a calendar unit:
+* "minute", "hour" and "day", represented as a tuple of year, month, day of
+  month and if applicable hours and minutes;
+* "month", represented as a tuple of year and month;
+* "year", represented as the year;
+* "hour_of_day", represented as the hours, 0 through 23;
+* "weekday", represented as the day of the week, where 0 represents Monday.
+"""
+
+from __future__ import unicode_literals
+
+import collections
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+from dfdatetime import definitions
+from dfdatetime import interface
+
+
+BUCKET_DAY = 'day'
+BUCKET_HOUR = 'hour'
+BUCKET_HOUR_OF_DAY = 'hour_of_day'
+BUCKET_MINUTE = 'minute'
+BUCKET_MONTH = 'month'
+BUCKET_WEEKDAY = 'weekday'
+BUCKET_YEAR = 'year'
+
+BUCKETS = frozenset([
+    BUCKET_DAY,
+    BUCKET_HOUR,
+    BUCKET_HOUR_OF_DAY,
+    BUCKET_MINUTE,
+    BUCKET_MONTH,
+    BUCKET_WEEKDAY,
+    BUCKET_YEAR])
+
+# The smallest signed 64-bit integer represents NaT.
+_NAT = interface.DateTimeValues._INT64_MIN  # pylint: disable=protected-access
+
+_NANOSECONDS_PER_MINUTE = 60 * definitions.NANOSECONDS_PER_SECOND
+_NANOSECONDS_PER_HOUR = 60 * _NANOSECONDS_PER_MINUTE
+_NANOSECONDS_PER_DAY = 24 * _NANOSECONDS_PER_HOUR
+
+# Number of days from 0000-03-01 to 1970-01-01.
+_DAYS_FROM_CIVIL_EPOCH = 719468
+
+# Number of days per 400-year era.
+_DAYS_PER_ERA = 146097
+
+
+def _CheckBucket(bucket):
+  """Checks if a bucket is supported.
+
+  Args:
+    bucket (int or str): width of the bucket in number of nanoseconds or
+        calendar unit.
+
+  Raises:
+    ValueError: if the bucket is not supported.
+  """
+  if isinstance(bucket, bool) or (
+      not isinstance(bucket, int) and bucket not in BUCKETS):
+    raise ValueError('Unsupported bucket: {0!s}.'.format(bucket))
+
+  if isinstance(bucket, int) and bucket <= 0:
+    raise ValueError('Unsupported bucket width: {0:d}.'.format(bucket))
+
+
+def _GetBucket(key, bucket):
+  """Retrieves a bucket from its integer key.
+
+  Args:
+    key (int): integer key of the bucket.
+    bucket (int or str): width of the bucket in number of nanoseconds or
+        calendar unit.
+
+  Returns:
+    int|tuple[int, ...]: start of the bucket in number of nanoseconds since
+        1970-01-01 00:00:00 or the calendar representation of the bucket.
+  """
+  if bucket in (BUCKET_HOUR_OF_DAY, BUCKET_WEEKDAY, BUCKET_YEAR):
+    return key
+
+  if bucket == BUCKET_MONTH:
+    year, month = divmod(key, 12)
+    return year, month + 1
+
+  if bucket == BUCKET_DAY:
+    return _GetCivilDate(key)
+
+  if bucket == BUCKET_HOUR:
+    number_of_days, hours = divmod(key, 24)
+    return _GetCivilDate(number_of_days) + (hours, )
+
+  if bucket == BUCKET_MINUTE:
+    number_of_hours, minutes = divmod(key, 60)
+    number_of_days, hours = divmod(number_of_hours, 24)
+    return _GetCivilDate(number_of_days) + (hours, minutes)
+
+  return key * bucket
+
+
+def _GetBucketKey(timestamp, bucket):
+  """Retrieves the integer key of the bucket of a timestamp.
+
+  Args:
+    timestamp (int or numpy.ndarray): timestamp or timestamps in number of
+        nanoseconds since 1970-01-01 00:00:00.
+    bucket (int or str): width of the bucket in number of nanoseconds or
+        calendar unit.
+
+  Returns:
+    int|numpy.ndarray: integer key or keys of the bucket.
+  """
+  if bucket == BUCKET_MINUTE:
+    return timestamp // _NANOSECONDS_PER_MINUTE
+
+  if bucket == BUCKET_HOUR:
+    return timestamp // _NANOSECONDS_PER_HOUR
+
+  if bucket == BUCKET_HOUR_OF_DAY:
+    return (timestamp // _NANOSECONDS_PER_HOUR) % 24
+
+  if bucket == BUCKET_DAY:
+    return timestamp // _NANOSECONDS_PER_DAY
+
+  # 1970-01-01 is a Thursday.
+  if bucket == BUCKET_WEEKDAY:
+    return ((timestamp // _NANOSECONDS_PER_DAY) + 3) % 7
+
+  if bucket == BUCKET_MONTH:
+    year, month, _ = _GetCivilDate(timestamp // _NANOSECONDS_PER_DAY)
+    return (year * 12) + month - 1
+
+  if bucket == BUCKET_YEAR:
+    year, _, _ = _GetCivilDate(timestamp // _NANOSECONDS_PER_DAY)
+    return year
+
+  return timestamp // bucket
+
+
+def _GetCivilDate(number_of_days):
+  """Determines the civil date from a number of days since 1970-01-01.
+
+  The civil date is determined in the proleptic Gregorian calendar using only
+  arithmetic operations, so that it can be applied to a NumPy array at once.
+
+  Args:
+    number_of_days (int or numpy.ndarray): number of days or days since
+        1970-01-01.
+
+  Returns:
+    tuple[int, int, int]: year, month and day of month or arrays of years,
+        months and days of month.
+  """
+  number_of_days = number_of_days + _DAYS_FROM_CIVIL_EPOCH
+  era = number_of_days // _DAYS_PER_ERA
+
+  day_of_era = number_of_days - (era * _DAYS_PER_ERA)
+  year_of_era = (
+      day_of_era - (day_of_era // 1460) + (day_of_era // 36524) -
+      (day_of_era // 146096)) // 365
+
+  # The day of year and month are relative to March 1.
+  day_of_year = day_of_era - (
+      (365 * year_of_era) + (year_of_era // 4) - (year_of_era // 100))
+  month_of_year = ((5 * day_of_year) + 2) // 153
+
+  day_of_month = day_of_year - (((153 * month_of_year) + 2) // 5) + 1
+  month = month_of_year + 3 - (12 * (month_of_year >= 10))
+  year = year_of_era + (era * 400) + (month <= 2)
+
+  return year, month, day_of_month
+
+
+def _GetLocalTimestamp(normalized_timestamp, time_zone):
+  """Determines the local time of a normalized timestamp.
+
+  Args:
+    normalized_timestamp (int): normalized timestamp in number of nanoseconds
+        since 1970-01-01 00:00:00 UTC.
+    time_zone (TimeZone): time zone.
+
+  Returns:
+    int: local time in number of nanoseconds since 1970-01-01 00:00:00 in
+        the time zone.
+  """
+  utc_offset = time_zone.GetUTCOffset(
+      normalized_timestamp // definitions.NANOSECONDS_PER_SECOND)
+  return normalized_timestamp + (
+      utc_offset * definitions.NANOSECONDS_PER_SECOND)
+
+
+def CountNormalizedTimestampsPerBucket(
+    normalized_timestamps, bucket, time_zone=None):
+  """Counts normalized timestamps per bucket.
+
+  The buckets of all timestamps are determined at once with NumPy.
+
+  Args:
+    normalized_timestamps (numpy.ndarray): normalized timestamps in number of
+        nanoseconds since 1970-01-01 00:00:00 UTC, as signed 64-bit integers,
+        where NaT represents a missing timestamp.
+    bucket (int or str): width of the bucket in number of nanoseconds or
+        calendar unit.
+    time_zone (Optional[TimeZone]): time zone of the buckets, where None
+        represents UTC.
+
+  Returns:
+    dict[int|tuple[int, ...], int]: number of timestamps per bucket.
+
+  Raises:
+    RuntimeError: if numpy is not available.
+    ValueError: if the bucket is not supported.
+  """
+  if not numpy:
+    raise RuntimeError('Missing optional dependency: numpy.')
+
+  _CheckBucket(bucket)
+
+  normalized_timestamps = numpy.asarray(
+      normalized_timestamps, dtype=numpy.int64)
+  normalized_timestamps = normalized_timestamps[normalized_timestamps != _NAT]
+  if not normalized_timestamps.size:
+    return {}
+
+  if time_zone:
+    timestamps = normalized_timestamps // definitions.NANOSECONDS_PER_SECOND
+    transition_times, utc_offsets = time_zone.GetTransitions(
+        int(timestamps.max()))
+
+    indexes = numpy.searchsorted(transition_times, timestamps, side='right')
+    utc_offsets = numpy.array(utc_offsets, dtype=numpy.int64)[indexes]
+
+    normalized_timestamps = normalized_timestamps + (
+        utc_offsets * definitions.NANOSECONDS_PER_SECOND)
+
+  keys, counts = numpy.unique(
+      _GetBucketKey(normalized_timestamps, bucket), return_counts=True)
+
+  return {
+      _GetBucket(key, bucket): count
+      for key, count in zip(keys.tolist(), counts.tolist())}
+
+
+def CountPerBucket(date_time_values_list, bucket, time_zone=None):
+  """Counts date and time values per bucket.
+
+  Args:
+    date_time_values_list (Iterable[DateTimeValues]): date and time values,
+        where date and time values without a timestamp are not counted.
+    bucket (int or str): width of the bucket in number of nanoseconds or
+        calendar unit.
+    time_zone (Optional[TimeZone]): time zone of the buckets, where None
+        represents UTC. Date and time values in local time are considered
+        to be in the time zone.
+
+  Returns:
+    dict[int|tuple[int, ...], int]: number of date and time values per
+        bucket.
+
+  Raises:
+    ValueError: if the bucket is not supported.
+  """
+  _CheckBucket(bucket)
+
+  counter = collections.Counter()
+  for date_time_values in date_time_values_list:
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())  # pylint: disable=protected-access
+    if normalized_timestamp is None:
+      continue
+
+    if time_zone and not date_time_values.is_local_time:
+      normalized_timestamp = _GetLocalTimestamp(
+          normalized_timestamp, time_zone)
+
+    counter[_GetBucketKey(normalized_timestamp, bucket)] += 1
+
+  return {
+      _GetBucket(key, bucket): count for key, count in counter.items()}
@@ -5,10 +5,18 @@ from __future__ import unicode_literals
 
 import abc
 import calendar
+import datetime
 import decimal
 
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
 from dfdatetime import decorators
 from dfdatetime import definitions
+from dfdatetime import duration
+from dfdatetime import serializer
 
 
 class DateTimeEpoch(object):
@@ -59,8 +67,16 @@ class DateTimeValues(object):
 
   # pylint: disable=redundant-returns-doc
 
+  _SUPPORTED_ROUNDING_MODES = frozenset([
+      decimal.ROUND_CEILING,
+      decimal.ROUND_DOWN,
+      decimal.ROUND_FLOOR,
+      decimal.ROUND_HALF_UP])
+
   _DAYS_PER_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
+  _DAYS_PER_400_YEARS = 146097
+
   _EPOCH_NORMALIZED_TIME = NormalizedTimeEpoch()
 
   _100NS_PER_SECOND = 10000000
@@ -75,14 +91,94 @@ class DateTimeValues(object):
   _UINT60_MAX = (1 << 60) - 1
   _UINT64_MAX = (1 << 64) - 1
 
+  # Groups of the sort key, where semantic time values such as "Not set" sort
+  # before date time values without a timestamp, which sort before date time
+  # values with a timestamp and "Never" sorts last.
+  _SORT_KEY_GROUP_SEMANTIC = 0
+  _SORT_KEY_GROUP_NOT_SET = 1
+  _SORT_KEY_GROUP_TIMESTAMP = 2
+  _SORT_KEY_GROUP_NEVER = 3
+
+  # True if _GetNormalizedTimestampInNanoseconds returns the exact normalized
+  # timestamp, which allows derived timestamps to be determined using only
+  # integer arithmetic.
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = False
+
+  # The definition of the integer timestamp, used for duration arithmetic and
+  # conversion, which consists of the number of nanoseconds per unit of the
+  # timestamp, the number of nanoseconds between the epoch of the timestamp
+  # and the POSIX epoch and the minimum and maximum supported timestamp, where
+  # None represents that the date and time values do not have an integer
+  # timestamp or that the timestamp is not bounded.
+  _TIMESTAMP_NANOSECONDS_PER_UNIT = None
+  _TIMESTAMP_EPOCH_OFFSET = 0
+  _TIMESTAMP_MINIMUM = None
+  _TIMESTAMP_MAXIMUM = None
+
+  # Names of the instance attributes that, together with the precision, time
+  # zone offset and local time flag, define the date and time value and are
+  # preserved by serialization. Cached values are not part of these.
+  _SERIALIZED_ATTRIBUTES = ()
+
+  # Names of the serialized attributes that contain a decimal.Decimal value.
+  _SERIALIZED_DECIMAL_ATTRIBUTES = frozenset()
+
+  # The maximum number of entries in the shared date values and date string
+  # caches, after which the caches are cleared.
+  _MAXIMUM_NUMBER_OF_CACHED_DATES = 16384
+
+  # Two digit representations of hours, minutes and seconds.
+  _TWO_DIGITS = tuple('{0:02d}'.format(value) for value in range(100))
+
+  # Date values and date strings shared by all date time values, where
+  # the date values are keyed by the epoch and number of days since the epoch
+  # and the date strings by year, month and day of month.
+  _cached_date_values = {}
+  _cached_date_strings = {}
+
+  # Dictionary fields shared by all date time values of the same type.
+  _cached_dict_fields = {}
+
+  # POSIX epoch as Python datetime object without time zone and in UTC.
+  _DATETIME_EPOCH = datetime.datetime(1970, 1, 1)
+  _DATETIME_EPOCH_UTC = datetime.datetime(
+      1970, 1, 1, tzinfo=datetime.timezone.utc)
+
   def __init__(self):
     """Initializes date time values."""
     super(DateTimeValues, self).__init__()
+    self._cached_date_time_string = None
+    self._cached_date_time_values = None
+    self._cached_date_time_string_iso8601 = None
+    self._cached_sort_key = None
+    self._is_frozen = False
+    self._is_local_time = False
     self._normalized_timestamp = None
     self._precision = None
     self._time_zone_offset = None
 
-    self.is_local_time = False
+  @property
+  def is_frozen(self):
+    """bool: True if the date and time values are frozen."""
+    return self._is_frozen
+
+  @property
+  def is_local_time(self):
+    """bool: True if the date and time value is in local time."""
+    return self._is_local_time
+
+  @is_local_time.setter
+  @decorators.not_frozen
+  def is_local_time(self, is_local_time):
+    """Sets if the date and time value is in local time.
+
+    Args:
+      is_local_time (bool): True if the date and time value is in local time.
+
+    Raises:
+      ValueError: if the date time values are frozen.
+    """
+    self._is_local_time = is_local_time
 
   @property
   def precision(self):
@@ -98,6 +194,27 @@ class DateTimeValues(object):
     """
     return self._time_zone_offset
 
+  def __add__(self, other):
+    """Adds a duration to the date time values.
+
+    Args:
+      other (Duration): duration to add.
+
+    Returns:
+      DateTimeValues: date time values of the same type, with the duration
+          added to the timestamp.
+
+    Raises:
+      ValueError: if other is not an instance of Duration, or the date time
+          values do not support duration arithmetic, or the timestamp is
+          missing, or the duration is not a multiple of the timestamp unit, or
+          the resulting timestamp is out of bounds.
+    """
+    if not isinstance(other, duration.Duration):
+      raise ValueError('Other not an instance of Duration')
+
+    return self._AddNanoseconds(other.nanoseconds)
+
   def __eq__(self, other):
     """Determines if the date time values are equal to other.
 
@@ -147,6 +264,46 @@ class DateTimeValues(object):
 
     return normalized_timestamp >= other_normalized_timestamp
 
+  def __hash__(self):
+    """Retrieves a hash of the date time values.
+
+    Returns:
+      int: hash of the date time values.
+
+    Raises:
+      TypeError: if the date time values are not frozen.
+    """
+    if not self._is_frozen:
+      raise TypeError(
+          'Unhashable date time values, only frozen values are hashable.')
+
+    sort_key_group, normalized_timestamp = self._cached_sort_key
+
+    # Date time values without a timestamp compare equal to each other, hence
+    # they share the same hash.
+    if sort_key_group != self._SORT_KEY_GROUP_TIMESTAMP:
+      return hash(None)
+
+    return hash(normalized_timestamp)
+
+  def __getstate__(self):
+    """Retrieves the state used for pickling.
+
+    The state only contains the values that define the date and time value,
+    cached values are determined again after unpickling.
+
+    Returns:
+      list[object]: precision, time zone offset, local time flag, frozen flag
+          and the values of the serialized attributes.
+    """
+    state = [
+        self._precision, self._time_zone_offset, self.is_local_time,
+        self._is_frozen]
+    for attribute_name in self._SERIALIZED_ATTRIBUTES:
+      state.append(getattr(self, attribute_name))
+
+    return state
+
   def __gt__(self, other):
     """Determines if the date time values are greater than other.
 
@@ -248,6 +405,91 @@ class DateTimeValues(object):
 
     return normalized_timestamp != other_normalized_timestamp
 
+  def __setstate__(self, state):
+    """Restores the state after unpickling.
+
+    Args:
+      state (list[object]): state as returned by __getstate__.
+
+    Raises:
+      ValueError: if the number of values in the state is not supported.
+    """
+    attribute_names = self._SERIALIZED_ATTRIBUTES
+    if len(state) != len(attribute_names) + 4:
+      raise ValueError('Unsupported number of values in state: {0:d}.'.format(
+          len(state)))
+
+    DateTimeValues.__init__(self)
+
+    self._precision, self._time_zone_offset, self.is_local_time, is_frozen = (
+        state[:4])
+
+    for attribute_name, value in zip(attribute_names, state[4:]):
+      setattr(self, attribute_name, value)
+
+    if is_frozen:
+      self.Freeze()
+
+  def __sub__(self, other):
+    """Subtracts a duration or date time values from the date time values.
+
+    Args:
+      other (DateTimeValues|Duration): date time values or duration to
+          subtract.
+
+    Returns:
+      DateTimeValues|Duration: duration between the date time values if other
+          is an instance of DateTimeValues, or date time values of the same
+          type, with the duration subtracted from the timestamp.
+
+    Raises:
+      ValueError: if other is not an instance of DateTimeValues or Duration,
+          or a timestamp is missing, or the date time values do not support
+          duration arithmetic, or the duration is not a multiple of
+          the timestamp unit, or the resulting timestamp is out of bounds.
+    """
+    if isinstance(other, duration.Duration):
+      return self._AddNanoseconds(-other.nanoseconds)
+
+    if not isinstance(other, DateTimeValues):
+      raise ValueError('Other not an instance of DateTimeValues or Duration')
+
+    normalized_timestamp = self._GetNormalizedTimestampInNanoseconds()
+    other_normalized_timestamp = other._GetNormalizedTimestampInNanoseconds()  # pylint: disable=protected-access
+
+    if normalized_timestamp is None or other_normalized_timestamp is None:
+      raise ValueError('Missing timestamp')
+
+    return duration.Duration(
+        nanoseconds=normalized_timestamp - other_normalized_timestamp)
+
+  def _AddNanoseconds(self, nanoseconds):
+    """Adds a number of nanoseconds to the date time values.
+
+    The number of nanoseconds is added to the normalized timestamp in
+    nanoseconds using only integer arithmetic, so that the result is exact.
+
+    Args:
+      nanoseconds (int): number of nanoseconds to add, which can be negative.
+
+    Returns:
+      DateTimeValues: date time values of the same type.
+
+    Raises:
+      ValueError: if the timestamp is missing, or the date time values do not
+          support duration arithmetic, or the resulting normalized timestamp
+          cannot be represented by the date time values.
+    """
+    normalized_timestamp = self._GetNormalizedTimestampInNanoseconds()
+    if normalized_timestamp is None:
+      raise ValueError('Missing timestamp')
+
+    date_time_values = self._CreateFromNormalizedTimestampInNanoseconds(
+        normalized_timestamp + nanoseconds)
+    date_time_values._time_zone_offset = self._time_zone_offset  # pylint: disable=protected-access
+    date_time_values.is_local_time = self.is_local_time
+    return date_time_values
+
   def _AdjustForTimeZoneOffset(
       self, year, month, day_of_month, hours, minutes, time_zone_offset):
     """Adjusts the date and time values for a time zone offset.
@@ -519,6 +761,176 @@ class DateTimeValues(object):
 
     return hours, minutes, seconds, microseconds, time_zone_offset
 
+  @abc.abstractmethod
+  def _CopyToDateTimeString(self):
+    """Copies the date time value to a date and time string.
+
+    Returns:
+      str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.######" or
+          None if the timestamp cannot be copied to a date and time string.
+    """
+
+  def _CopyToStatTimeTupleFromDecimal(self):
+    """Copies the date time value to a stat timestamp tuple.
+
+    The stat timestamp tuple is determined from the Decimal normalized
+    timestamp.
+
+    Returns:
+      tuple[int, int]: a POSIX timestamp in seconds and the remainder in
+          100 nano seconds or (None, None) on error.
+    """
+    normalized_timestamp = self._GetNormalizedTimestamp()
+    if normalized_timestamp is None:
+      return None, None
+
+    if self._precision in (
+        definitions.PRECISION_1_NANOSECOND,
+        definitions.PRECISION_100_NANOSECONDS,
+        definitions.PRECISION_1_MICROSECOND,
+        definitions.PRECISION_1_MILLISECOND,
+        definitions.PRECISION_100_MILLISECONDS):
+      remainder = int((normalized_timestamp % 1) * self._100NS_PER_SECOND)
+
+      return int(normalized_timestamp), remainder
+
+    return int(normalized_timestamp), None
+
+  def _CopyToStatTimeTupleFromNanoseconds(self):
+    """Copies the date time value to a stat timestamp tuple.
+
+    The stat timestamp tuple is determined from the normalized timestamp in
+    nanoseconds, where the POSIX timestamp and remainder are truncated towards
+    zero, the same as the Decimal normalized timestamp.
+
+    Returns:
+      tuple[int, int]: a POSIX timestamp in seconds and the remainder in
+          100 nano seconds or (None, None) on error.
+    """
+    normalized_timestamp = self._GetNormalizedTimestampInNanoseconds()
+    if normalized_timestamp is None:
+      return None, None
+
+    timestamp, remainder = divmod(
+        abs(normalized_timestamp), definitions.NANOSECONDS_PER_SECOND)
+    if normalized_timestamp < 0:
+      timestamp = -timestamp
+
+    if self._precision in (
+        definitions.PRECISION_1_NANOSECOND,
+        definitions.PRECISION_100_NANOSECONDS,
+        definitions.PRECISION_1_MICROSECOND,
+        definitions.PRECISION_1_MILLISECOND,
+        definitions.PRECISION_100_MILLISECONDS):
+      remainder //= definitions.NANOSECONDS_PER_100NS
+      if normalized_timestamp < 0:
+        remainder = -remainder
+
+      return timestamp, remainder
+
+    return timestamp, None
+
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates date time values of the same type from a normalized timestamp.
+
+    Subclasses that support duration arithmetic override this method.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      DateTimeValues: date time values of the same type.
+
+    Raises:
+      ValueError: if the date time values do not support duration arithmetic.
+    """
+    raise ValueError(
+        'Unsupported date time values type: {0:s} for duration '
+        'arithmetic.'.format(type(self).__name__))
+
+  def _FormatDateTimeString(
+      self, year, month, day_of_month, hours, minutes, seconds):
+    """Formats date and time values as a date and time string.
+
+    Args:
+      year (int): year.
+      month (int): month, where 1 represents January.
+      day_of_month (int): day of the month, where 1 represents the first day.
+      hours (int): hours.
+      minutes (int): minutes.
+      seconds (int): seconds.
+
+    Returns:
+      str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss".
+    """
+    date_key = (year, month, day_of_month)
+    date_string = self._cached_date_strings.get(date_key, None)
+    if date_string is None:
+      date_string = '{0:04d}-{1:02d}-{2:02d}'.format(year, month, day_of_month)
+
+      if len(self._cached_date_strings) >= self._MAXIMUM_NUMBER_OF_CACHED_DATES:
+        self._cached_date_strings.clear()
+      self._cached_date_strings[date_key] = date_string
+
+    two_digits = self._TWO_DIGITS
+    return ''.join([
+        date_string, ' ', two_digits[hours], ':', two_digits[minutes], ':',
+        two_digits[seconds]])
+
+  def _GetCachedDateTimeValues(self):
+    """Retrieves the cached date and time values.
+
+    The date and time values are determined once and cached until they are
+    changed by one of the CopyFrom methods. The date and time of day are
+    derived from these values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, object]: year, month, day of month,
+          hours, minutes, seconds and fraction of second or None if the date
+          and time values cannot be determined.
+
+    Raises:
+      ValueError: if the date values are out of bounds.
+    """
+    if self._cached_date_time_values is None:
+      self._cached_date_time_values = self._GetDateTimeValues()
+
+    return self._cached_date_time_values
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Subclasses can override this method to determine the date and time values
+    directly from their timestamp. The date and time values are in UTC, where
+    a negative fraction of second is floored, for example 1 millisecond before
+    1970-01-01 is 1969-12-31 23:59:59.999.
+
+    Returns:
+      tuple[int, int, int, int, int, int, decimal.Decimal]: year, month, day of
+          month, hours, minutes, seconds and fraction of second or None if the
+          normalized timestamp cannot be determined.
+
+    Raises:
+      ValueError: if the date values are out of bounds.
+    """
+    normalized_timestamp = self._GetNormalizedTimestamp()
+    if normalized_timestamp is None:
+      return None
+
+    number_of_seconds = normalized_timestamp.to_integral_value(
+        rounding=decimal.ROUND_FLOOR)
+    fraction_of_second = normalized_timestamp - number_of_seconds
+
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(
+        number_of_seconds)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH_NORMALIZED_TIME)
+
+    return (
+        year, month, day_of_month, hours, minutes, seconds, fraction_of_second)
+
   def _GetDateValues(
       self, number_of_days, epoch_year, epoch_month, epoch_day_of_month):
     """Determines date values.
@@ -551,98 +963,52 @@ class DateTimeValues(object):
       raise ValueError('Epoch day of month value: {0:d} out of bounds.'.format(
           epoch_day_of_month))
 
-    before_epoch = number_of_days < 0
-
+    # The proleptic Gregorian calendar repeats every 400 years, hence a date
+    # before the epoch is determined relative to an epoch that is a multiple
+    # of 400 years earlier.
+    number_of_cycles = 0
+    if number_of_days < 0:
+      number_of_cycles, _ = divmod(
+          -number_of_days - 1, self._DAYS_PER_400_YEARS)
+      number_of_cycles += 1
+      number_of_days += number_of_cycles * self._DAYS_PER_400_YEARS
+
+    # Align with the start of the year, where number_of_days is the zero-based
+    # day of the year.
     year = epoch_year
-    month = epoch_month
-    if before_epoch:
-      month -= 1
-      if month <= 0:
-        month = 12
-        year -= 1
-
-    number_of_days += epoch_day_of_month
-    if before_epoch:
-      number_of_days *= -1
-
-    # Align with the start of the year.
-    while month > 1:
-      days_per_month = self._GetDaysPerMonth(year, month)
-      if number_of_days < days_per_month:
-        break
-
-      if before_epoch:
-        month -= 1
-      else:
-        month += 1
-
-      if month > 12:
-        month = 1
-        year += 1
-
-      number_of_days -= days_per_month
+    number_of_days += self._GetDayOfYear(
+        epoch_year, epoch_month, epoch_day_of_month) - 1
 
     # Align with the start of the next century.
-    _, remainder = divmod(year, 100)
-    for _ in range(remainder, 100):
-      days_in_year = self._GetNumberOfDaysInYear(year)
-      if number_of_days < days_in_year:
-        break
-
-      if before_epoch:
-        year -= 1
-      else:
-        year += 1
-
+    days_in_year = self._GetNumberOfDaysInYear(year)
+    while year % 100 != 0 and number_of_days >= days_in_year:
+      year += 1
       number_of_days -= days_in_year
+      days_in_year = self._GetNumberOfDaysInYear(year)
 
-    days_in_century = self._GetNumberOfDaysInCentury(year)
-    while number_of_days > days_in_century:
-      if before_epoch:
-        year -= 100
-      else:
-        year += 100
-
-      number_of_days -= days_in_century
+    if year % 100 == 0:
       days_in_century = self._GetNumberOfDaysInCentury(year)
+      while number_of_days >= days_in_century:
+        year += 100
+        number_of_days -= days_in_century
+        days_in_century = self._GetNumberOfDaysInCentury(year)
 
     days_in_year = self._GetNumberOfDaysInYear(year)
-    while number_of_days > days_in_year:
-      if before_epoch:
-        year -= 1
-      else:
-        year += 1
-
+    while number_of_days >= days_in_year:
+      year += 1
       number_of_days -= days_in_year
       days_in_year = self._GetNumberOfDaysInYear(year)
 
+    month = 1
     days_per_month = self._GetDaysPerMonth(year, month)
-    while number_of_days > days_per_month:
-      if before_epoch:
-        month -= 1
-      else:
-        month += 1
-
-      if month <= 0:
-        month = 12
-        year -= 1
-      elif month > 12:
-        month = 1
-        year += 1
-
+    while number_of_days >= days_per_month:
+      month += 1
       number_of_days -= days_per_month
       days_per_month = self._GetDaysPerMonth(year, month)
 
-    if before_epoch:
-      days_per_month = self._GetDaysPerMonth(year, month)
-      number_of_days = days_per_month - number_of_days
-
-    elif number_of_days == 0:
-      number_of_days = 31
-      month = 12
-      year -= 1
+    year -= number_of_cycles * 400
 
-    return year, month, number_of_days
+    return year, month, number_of_days + 1
 
   def _GetDateValuesWithEpoch(self, number_of_days, date_time_epoch):
     """Determines date values.
@@ -653,10 +1019,26 @@ class DateTimeValues(object):
 
     Returns:
        tuple[int, int, int]: year, month, day of month.
+
+    Raises:
+      ValueError: if the epoch year, month or day of month values are out
+          of bounds.
     """
-    return self._GetDateValues(
-        number_of_days, date_time_epoch.year, date_time_epoch.month,
-        date_time_epoch.day_of_month)
+    date_key = (
+        date_time_epoch.year, date_time_epoch.month,
+        date_time_epoch.day_of_month, number_of_days)
+
+    date_values = self._cached_date_values.get(date_key, None)
+    if date_values is None:
+      date_values = self._GetDateValues(
+          number_of_days, date_time_epoch.year, date_time_epoch.month,
+          date_time_epoch.day_of_month)
+
+      if len(self._cached_date_values) >= self._MAXIMUM_NUMBER_OF_CACHED_DATES:
+        self._cached_date_values.clear()
+      self._cached_date_values[date_key] = date_values
+
+    return date_values
 
   def _GetDayOfYear(self, year, month, day_of_month):
     """Retrieves the day of the year for a specific day of a month in a year.
@@ -707,6 +1089,28 @@ class DateTimeValues(object):
 
     return days_per_month
 
+  def _GetDictFields(self):
+    """Retrieves the dictionary fields of the date and time values type.
+
+    The dictionary fields are determined once per date and time values type
+    and cached.
+
+    Returns:
+      tuple[tuple[str, str, bool]]: key, attribute name and True if the value
+          is a decimal.Decimal, per dictionary field.
+    """
+    date_time_values_type = type(self)
+
+    dict_fields = self._cached_dict_fields.get(date_time_values_type, None)
+    if dict_fields is None:
+      dict_fields = tuple(
+          (attribute_name.lstrip('_'), attribute_name,
+           attribute_name in self._SERIALIZED_DECIMAL_ATTRIBUTES)
+          for attribute_name in self._SERIALIZED_ATTRIBUTES)
+      self._cached_dict_fields[date_time_values_type] = dict_fields
+
+    return dict_fields
+
   @abc.abstractmethod
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
@@ -718,6 +1122,23 @@ class DateTimeValues(object):
           determined.
     """
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    normalized_timestamp = self._GetNormalizedTimestamp()
+    if normalized_timestamp is None:
+      return None
+
+    normalized_timestamp *= definitions.NANOSECONDS_PER_SECOND
+    normalized_timestamp = normalized_timestamp.to_integral_value(
+        rounding=decimal.ROUND_FLOOR)
+    return int(normalized_timestamp)
+
   def _GetNumberOfDaysInCentury(self, year):
     """Retrieves the number of days in a century.
 
@@ -811,6 +1232,143 @@ class DateTimeValues(object):
 
     return int(number_of_seconds)
 
+  def _GetPlasoTimestampFromDecimal(self):
+    """Retrieves a timestamp that is compatible with plaso.
+
+    The timestamp is determined from the Decimal normalized timestamp.
+
+    Returns:
+      int: a POSIX timestamp in microseconds or None if no timestamp is
+          available.
+    """
+    normalized_timestamp = self._GetNormalizedTimestamp()
+    if normalized_timestamp is None:
+      return None
+
+    normalized_timestamp *= definitions.MICROSECONDS_PER_SECOND
+    normalized_timestamp = normalized_timestamp.quantize(
+        1, rounding=decimal.ROUND_HALF_UP)
+    return int(normalized_timestamp)
+
+  def _GetPlasoTimestampFromNanoseconds(self):
+    """Retrieves a timestamp that is compatible with plaso.
+
+    The timestamp is determined from the normalized timestamp in nanoseconds,
+    where half a microsecond is rounded away from zero, the same as
+    decimal.ROUND_HALF_UP.
+
+    Returns:
+      int: a POSIX timestamp in microseconds or None if no timestamp is
+          available.
+    """
+    normalized_timestamp = self._GetNormalizedTimestampInNanoseconds()
+    if normalized_timestamp is None:
+      return None
+
+    timestamp, remainder = divmod(
+        abs(normalized_timestamp), definitions.NANOSECONDS_PER_MICROSECOND)
+    if remainder * 2 >= definitions.NANOSECONDS_PER_MICROSECOND:
+      timestamp += 1
+
+    if normalized_timestamp < 0:
+      return -timestamp
+    return timestamp
+
+  def _GetTimeElementsFromNumberOfSeconds(
+      self, number_of_seconds, time_zone_offset):
+    """Determines time elements from a number of seconds.
+
+    Args:
+      number_of_seconds (int): number of seconds since January 1, 1970
+          00:00:00 UTC.
+      time_zone_offset (int): time zone offset in number of minutes from UTC
+          or None if not set.
+
+    Returns:
+      tuple[int, int, int, int, int, int]: year, month, day of month, hours,
+          minutes and seconds in the time zone.
+    """
+    if time_zone_offset:
+      number_of_seconds += time_zone_offset * 60
+
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(
+        number_of_seconds)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH_NORMALIZED_TIME)
+
+    return year, month, day_of_month, hours, minutes, seconds
+
+  def _GetTimestampFromNormalizedTimestamp(self, normalized_timestamp):
+    """Determines the integer timestamp from a normalized timestamp.
+
+    The integer timestamp is determined using only integer arithmetic from
+    the integer timestamp definition of the date time values.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      int: integer timestamp.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the timestamp unit or the timestamp is out of bounds.
+    """
+    timestamp, remainder = divmod(
+        normalized_timestamp + self._TIMESTAMP_EPOCH_OFFSET,
+        self._TIMESTAMP_NANOSECONDS_PER_UNIT)
+    if remainder:
+      raise ValueError((
+          'Normalized timestamp: {0:d} ns is not a multiple of the timestamp '
+          'unit of {1:s}.').format(normalized_timestamp, type(self).__name__))
+
+    if ((self._TIMESTAMP_MINIMUM is not None and
+         timestamp < self._TIMESTAMP_MINIMUM) or
+        (self._TIMESTAMP_MAXIMUM is not None and
+         timestamp > self._TIMESTAMP_MAXIMUM)):
+      raise ValueError('Timestamp: {0:d} out of bounds of {1:s}.'.format(
+          timestamp, type(self).__name__))
+
+    return timestamp
+
+  def _GetTimestampInUnit(self, unit=None):
+    """Retrieves the timestamp in a specific unit.
+
+    Args:
+      unit (Optional[str]): timestamp unit, either "s", "ms", "us" or "ns",
+          where None represents the coarsest unit that preserves the precision
+          of the date time value.
+
+    Returns:
+      tuple[int, str]: number of units since the POSIX epoch, which is None if
+          the date time value does not have a timestamp, and the unit.
+
+    Raises:
+      ValueError: if the unit is not supported or the timestamp is out of
+          the range of a signed 64-bit integer in the unit.
+    """
+    if unit is None:
+      unit = definitions.TIMESTAMP_UNITS_PER_PRECISION.get(
+          self._precision, definitions.TIMESTAMP_UNIT_SECONDS)
+
+    nanoseconds_per_unit = definitions.NANOSECONDS_PER_TIMESTAMP_UNIT.get(
+        unit, None)
+    if not nanoseconds_per_unit:
+      raise ValueError('Unsupported unit: {0!s}.'.format(unit))
+
+    normalized_timestamp = self._GetNormalizedTimestampInNanoseconds()
+    if normalized_timestamp is None:
+      return None, unit
+
+    timestamp = normalized_timestamp // nanoseconds_per_unit
+    if timestamp < self._INT64_MIN or timestamp > self._INT64_MAX:
+      raise ValueError('Timestamp: {0:d} out of range of unit: {1:s}.'.format(
+          timestamp, unit))
+
+    return timestamp, unit
+
   def _GetTimeValues(self, number_of_seconds):
     """Determines time values.
 
@@ -838,6 +1396,81 @@ class DateTimeValues(object):
     # pylint: disable=consider-using-ternary
     return (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
 
+  def _ResetCachedValues(self):
+    """Resets the values that are cached until changed by a CopyFrom method."""
+    self._cached_date_time_string_iso8601 = None
+    self._cached_date_time_values = None
+    self._normalized_timestamp = None
+
+  def _RoundToPrecision(self, precision, rounding):
+    """Rounds the date time values to a precision.
+
+    The normalized timestamp in nanoseconds is rounded to a multiple of
+    the duration of the precision, using only integer arithmetic, and
+    the difference is added to the integer timestamp.
+
+    Args:
+      precision (str): precision to round to, for example
+          definitions.PRECISION_1_SECOND.
+      rounding (str): rounding mode, either decimal.ROUND_CEILING,
+          decimal.ROUND_DOWN (truncate), decimal.ROUND_FLOOR or
+          decimal.ROUND_HALF_UP.
+
+    Returns:
+      DateTimeValues: date time values of the same type.
+
+    Raises:
+      ValueError: if the precision or rounding mode is not supported, or
+          the date time values do not support duration arithmetic, or
+          the timestamp is missing, or the resulting timestamp is out of bounds.
+    """
+    nanoseconds_per_unit = definitions.NANOSECONDS_PER_PRECISION.get(
+        precision, None)
+    if not nanoseconds_per_unit:
+      raise ValueError('Unsupported precision: {0!s}.'.format(precision))
+
+    if rounding not in self._SUPPORTED_ROUNDING_MODES:
+      raise ValueError('Unsupported rounding mode: {0!s}.'.format(rounding))
+
+    normalized_timestamp = self._GetNormalizedTimestampInNanoseconds()
+    if normalized_timestamp is None:
+      raise ValueError('Missing timestamp')
+
+    remainder = normalized_timestamp % nanoseconds_per_unit
+
+    if not remainder or rounding == decimal.ROUND_FLOOR or (
+        rounding == decimal.ROUND_DOWN and normalized_timestamp >= 0):
+      nanoseconds = -remainder
+
+    elif rounding == decimal.ROUND_HALF_UP:
+      # Half-way values are rounded away from zero.
+      nanoseconds = nanoseconds_per_unit - remainder
+      if remainder * 2 < nanoseconds_per_unit or (
+          remainder * 2 == nanoseconds_per_unit and normalized_timestamp < 0):
+        nanoseconds = -remainder
+
+    else:
+      nanoseconds = nanoseconds_per_unit - remainder
+
+    return self._AddNanoseconds(nanoseconds)
+
+  def Ceil(self, precision):
+    """Rounds the date time values up to a precision.
+
+    Args:
+      precision (str): precision to round to, for example
+          definitions.PRECISION_1_SECOND.
+
+    Returns:
+      DateTimeValues: date time values of the same type.
+
+    Raises:
+      ValueError: if the precision is not supported, or the date time values
+          do not support duration arithmetic, or the timestamp is missing, or
+          the resulting timestamp is out of bounds.
+    """
+    return self._RoundToPrecision(precision, decimal.ROUND_CEILING)
+
   @decorators.deprecated
   def CopyFromString(self, time_string):
     """Copies a date time value from a date and time string.
@@ -873,6 +1506,80 @@ class DateTimeValues(object):
       ValueError: if the time string is invalid or not supported.
     """
 
+  @decorators.not_frozen
+  def CopyFromDict(self, date_time_values_dict):
+    """Copies date and time values from a dictionary.
+
+    Args:
+      date_time_values_dict (dict[str, object]): date and time values, as
+          created by CopyToDict.
+
+    Raises:
+      ValueError: if the dictionary is of another date and time values type or
+          contains an unsupported value.
+    """
+    class_name = date_time_values_dict.get('__class_name__', None)
+    if class_name and class_name != type(self).__name__:
+      raise ValueError('Unsupported date and time values type: {0:s}.'.format(
+          class_name))
+
+    precision = date_time_values_dict.get('precision', self._precision)
+    if precision is not None and precision not in definitions.PRECISION_VALUES:
+      raise ValueError('Unsupported precision: {0!s}.'.format(precision))
+
+    for key, attribute_name, is_decimal in self._GetDictFields():
+      value = date_time_values_dict.get(key, None)
+      if value is not None:
+        if is_decimal:
+          try:
+            value = decimal.Decimal(value)
+          except decimal.InvalidOperation:
+            raise ValueError('Unsupported {0:s} value: {1!s}.'.format(
+                key, value))
+
+        elif isinstance(value, list):
+          value = tuple(value)
+
+      setattr(self, attribute_name, value)
+
+    self._ResetCachedValues()
+    self._precision = precision
+    self._time_zone_offset = date_time_values_dict.get(
+        'time_zone_offset', None)
+    self.is_local_time = bool(date_time_values_dict.get('is_local_time', False))
+
+  def CopyToNumPyDatetime64(self, unit=None):
+    """Copies the date time value to a NumPy datetime64 value.
+
+    Args:
+      unit (Optional[str]): timestamp unit, either "s", "ms", "us" or "ns",
+          where None represents the coarsest unit that preserves the precision
+          of the date time value.
+
+    Returns:
+      numpy.datetime64: NumPy datetime64 value, in UTC unless the date time
+          value is in local time, or None if the date time value does not have
+          a timestamp.
+
+    Raises:
+      RuntimeError: if numpy is not available.
+      ValueError: if the unit is not supported or the timestamp is out of
+          the range of the unit.
+    """
+    if not numpy:
+      raise RuntimeError('Missing optional dependency: numpy.')
+
+    timestamp, unit = self._GetTimestampInUnit(unit=unit)
+    if timestamp is None:
+      return None
+
+    # The smallest signed 64-bit integer represents NaT.
+    if timestamp == self._INT64_MIN:
+      raise ValueError('Timestamp: {0:d} out of range of unit: {1:s}.'.format(
+          timestamp, unit))
+
+    return numpy.datetime64(timestamp, unit)
+
   def CopyToPosixTimestamp(self):
     """Copies the date time value to a POSIX timestamp.
 
@@ -893,23 +1600,11 @@ class DateTimeValues(object):
       tuple[int, int]: a POSIX timestamp in seconds and the remainder in
           100 nano seconds or (None, None) on error.
     """
-    normalized_timestamp = self._GetNormalizedTimestamp()
-    if normalized_timestamp is None:
-      return None, None
-
-    if self._precision in (
-        definitions.PRECISION_1_NANOSECOND,
-        definitions.PRECISION_100_NANOSECONDS,
-        definitions.PRECISION_1_MICROSECOND,
-        definitions.PRECISION_1_MILLISECOND,
-        definitions.PRECISION_100_MILLISECONDS):
-      remainder = int((normalized_timestamp % 1) * self._100NS_PER_SECOND)
+    if self._NANOSECONDS_TIMESTAMP_IS_EXACT:
+      return self._CopyToStatTimeTupleFromNanoseconds()
 
-      return int(normalized_timestamp), remainder
+    return self._CopyToStatTimeTupleFromDecimal()
 
-    return int(normalized_timestamp), None
-
-  @abc.abstractmethod
   def CopyToDateTimeString(self):
     """Copies the date time value to a date and time string.
 
@@ -917,6 +1612,10 @@ class DateTimeValues(object):
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.######" or
           None if the timestamp cannot be copied to a date and time string.
     """
+    if self._is_frozen:
+      return self._cached_date_time_string
+
+    return self._CopyToDateTimeString()
 
   def CopyToDateTimeStringISO8601(self):
     """Copies the date time value to an ISO 8601 date and time string.
@@ -925,12 +1624,122 @@ class DateTimeValues(object):
       str: date and time value formatted as an ISO 8601 date and time string or
           None if the timestamp cannot be copied to a date and time string.
     """
+    if self._is_frozen or self._cached_date_time_string_iso8601:
+      return self._cached_date_time_string_iso8601
+
     date_time_string = self.CopyToDateTimeString()
     if date_time_string:
       date_time_string = date_time_string.replace(' ', 'T')
       date_time_string = '{0:s}Z'.format(date_time_string)
+      self._cached_date_time_string_iso8601 = date_time_string
+
     return date_time_string
 
+  def CopyToDatetime(self):
+    """Copies the date time value to a Python datetime object.
+
+    The fraction of second is truncated to microseconds.
+
+    Returns:
+      datetime.datetime: Python datetime object, in UTC or, if the date time
+          value is in local time, without time zone, or None if the date time
+          value does not have a timestamp.
+
+    Raises:
+      ValueError: if the date time value is out of the range supported by
+          Python datetime objects.
+    """
+    normalized_timestamp = self._GetNormalizedTimestampInNanoseconds()
+    if normalized_timestamp is None:
+      return None
+
+    if self.is_local_time:
+      datetime_epoch = self._DATETIME_EPOCH
+    else:
+      datetime_epoch = self._DATETIME_EPOCH_UTC
+
+    microseconds = (
+        normalized_timestamp // definitions.NANOSECONDS_PER_MICROSECOND)
+
+    try:
+      return datetime_epoch + datetime.timedelta(microseconds=microseconds)
+    except OverflowError:
+      raise ValueError(
+          'Timestamp out of range of Python datetime: {0:d}.'.format(
+              normalized_timestamp))
+
+  def CopyToDict(self):
+    """Copies the date and time values to a dictionary.
+
+    The dictionary only contains JSON compatible values, where tuples are
+    stored as lists and decimal.Decimal values as strings. The local time flag
+    and time zone offset are only stored when set.
+
+    Returns:
+      dict[str, object]: date and time values, where "__class_name__" contains
+          the name of the date and time values type.
+    """
+    date_time_values_dict = {
+        '__class_name__': type(self).__name__,
+        'precision': self._precision}
+
+    if self.is_local_time:
+      date_time_values_dict['is_local_time'] = True
+
+    if self._time_zone_offset is not None:
+      date_time_values_dict['time_zone_offset'] = self._time_zone_offset
+
+    for key, attribute_name, is_decimal in self._GetDictFields():
+      value = getattr(self, attribute_name)
+      if value is not None:
+        if is_decimal:
+          value = str(value)
+        elif isinstance(value, tuple):
+          value = list(value)
+
+      date_time_values_dict[key] = value
+
+    return date_time_values_dict
+
+  def Floor(self, precision):
+    """Rounds the date time values down to a precision.
+
+    Args:
+      precision (str): precision to round to, for example
+          definitions.PRECISION_1_SECOND.
+
+    Returns:
+      DateTimeValues: date time values of the same type.
+
+    Raises:
+      ValueError: if the precision is not supported, or the date time values
+          do not support duration arithmetic, or the timestamp is missing, or
+          the resulting timestamp is out of bounds.
+    """
+    return self._RoundToPrecision(precision, decimal.ROUND_FLOOR)
+
+  def Freeze(self):
+    """Freezes the date time values.
+
+    Frozen date time values can no longer be changed, for example by
+    CopyFromDateTimeString or by setting is_local_time, which allows their
+    normalized timestamp, sort key, hash and date and time strings to be
+    determined once and cached. Frozen date time values are hashable.
+
+    Returns:
+      DateTimeValues: the frozen date time values, which allows the method to
+          be chained, for example: Filetime(timestamp=value).Freeze()
+    """
+    if not self._is_frozen:
+      self._GetNormalizedTimestamp()
+      self._cached_sort_key = self.GetSortKey()
+      self._cached_date_time_string = self.CopyToDateTimeString()
+      self._cached_date_time_string_iso8601 = (
+          self.CopyToDateTimeStringISO8601())
+      self._is_frozen = True
+
+    return self
+
   def GetDate(self):
     """Retrieves the date represented by the date and time values.
 
@@ -938,18 +1747,38 @@ class DateTimeValues(object):
        tuple[int, int, int]: year, month, day of month or (None, None, None)
            if the date and time values do not represent a date.
     """
-    normalized_timestamp = self._GetNormalizedTimestamp()
-    if normalized_timestamp is None:
+    try:
+      date_time_values = self._GetCachedDateTimeValues()
+    except ValueError:
+      date_time_values = None
+
+    if date_time_values is None:
       return None, None, None
 
-    number_of_days, _, _, _ = self._GetTimeValues(normalized_timestamp)
+    return date_time_values[:3]
 
-    try:
-      return self._GetDateValuesWithEpoch(
-          number_of_days, self._EPOCH_NORMALIZED_TIME)
+  def GetInterval(self):
+    """Retrieves the interval represented by the date and time values.
 
-    except ValueError:
-      return None, None, None
+    A date and time value represents an interval that starts at the normalized
+    timestamp and lasts the duration of its precision, for example a FAT date
+    time value represents a 2-second interval.
+
+    Returns:
+      tuple[int, int]: inclusive start and exclusive end of the interval in
+          number of nanoseconds since 1970-01-01 00:00:00 UTC or None if
+          the date and time values do not have a timestamp or precision.
+    """
+    normalized_timestamp = self._GetNormalizedTimestampInNanoseconds()
+    if normalized_timestamp is None:
+      return None
+
+    precision_duration = definitions.NANOSECONDS_PER_PRECISION.get(
+        self._precision, None)
+    if precision_duration is None:
+      return None
+
+    return normalized_timestamp, normalized_timestamp + precision_duration
 
   # TODO: remove this method when there is no more need for it in plaso.
   def GetPlasoTimestamp(self):
@@ -959,14 +1788,34 @@ class DateTimeValues(object):
       int: a POSIX timestamp in microseconds or None if no timestamp is
           available.
     """
-    normalized_timestamp = self._GetNormalizedTimestamp()
+    if self._NANOSECONDS_TIMESTAMP_IS_EXACT:
+      return self._GetPlasoTimestampFromNanoseconds()
+
+    return self._GetPlasoTimestampFromDecimal()
+
+  def GetSortKey(self):
+    """Retrieves a key to sort date time values.
+
+    Date time values with a timestamp are sorted by their normalized timestamp
+    in nanoseconds, consistent with the comparison functions. Date time values
+    without a timestamp are sorted by group, where semantic time values such as
+    "Not set" sort before date time values without a timestamp, which sort
+    before date time values with a timestamp, and "Never" sorts last. Note that
+    this order differs from the comparison functions, which for example
+    consider date time values with a timestamp greater than "Never".
+
+    Returns:
+      tuple[int, int]: sort key group and normalized timestamp in nanoseconds
+          or sort order within the group.
+    """
+    if self._is_frozen:
+      return self._cached_sort_key
+
+    normalized_timestamp = self._GetNormalizedTimestampInNanoseconds()
     if normalized_timestamp is None:
-      return None
+      return self._SORT_KEY_GROUP_NOT_SET, 0
 
-    normalized_timestamp *= definitions.MICROSECONDS_PER_SECOND
-    normalized_timestamp = normalized_timestamp.quantize(
-        1, rounding=decimal.ROUND_HALF_UP)
-    return int(normalized_timestamp)
+    return self._SORT_KEY_GROUP_TIMESTAMP, normalized_timestamp
 
   def GetTimeOfDay(self):
     """Retrieves the time of day represented by the date and time values.
@@ -975,9 +1824,44 @@ class DateTimeValues(object):
        tuple[int, int, int]: hours, minutes, seconds or (None, None, None)
            if the date and time values do not represent a time of day.
     """
-    normalized_timestamp = self._GetNormalizedTimestamp()
-    if normalized_timestamp is None:
+    try:
+      date_time_values = self._GetCachedDateTimeValues()
+    except ValueError:
+      date_time_values = None
+
+    if date_time_values is None:
       return None, None, None
 
-    _, hours, minutes, seconds = self._GetTimeValues(normalized_timestamp)
-    return hours, minutes, seconds
+    return date_time_values[3:6]
+
+  def Round(self, precision, rounding=None):
+    """Rounds the date time values to a precision.
+
+    Args:
+      precision (str): precision to round to, for example
+          definitions.PRECISION_1_MICROSECOND.
+      rounding (Optional[str]): rounding mode, either decimal.ROUND_CEILING,
+          decimal.ROUND_DOWN (truncate), decimal.ROUND_FLOOR or
+          decimal.ROUND_HALF_UP, where None represents decimal.ROUND_HALF_UP.
+
+    Returns:
+      DateTimeValues: date time values of the same type.
+
+    Raises:
+      ValueError: if the precision or rounding mode is not supported, or
+          the date time values do not support duration arithmetic, or
+          the timestamp is missing, or the resulting timestamp is out of bounds.
+    """
+    return self._RoundToPrecision(precision, rounding or decimal.ROUND_HALF_UP)
+
+  def Serialize(self):
+    """Serializes the date and time values to compact binary data.
+
+    Returns:
+      bytes: serialized date and time values, which can be deserialized with
+          serializer.Deserialize.
+
+    Raises:
+      ValueError: if the precision or a value is not supported.
+    """
+    return serializer.Serialize(self)
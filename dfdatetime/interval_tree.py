@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""Interval tree of date and time values.
+
+Every date and time value represents an interval, that starts at its
+normalized timestamp and lasts the duration of its precision, such as
+the 2-second interval of a FAT date time value. The interval tree answers
+which entries could have occurred at a specific time and which entries
+overlap an interval in O(log n + k), where k is the number of entries
+retrieved, which allows to correlate date and time values of sources with
+a different precision.
+
+The tree is a centered interval tree, that is built on the first query after
+entries were inserted.
+"""
+
+from __future__ import unicode_literals
+
+import operator
+
+
+class IntervalTreeNode(object):
+  """Interval tree node.
+
+  Attributes:
+    center (int): center of the node in number of nanoseconds since
+        1970-01-01 00:00:00 UTC.
+    intervals_by_end (list[tuple[int, int, int, tuple[DateTimeValues,
+        object]]]): intervals that contain the center, sorted by descending
+        end.
+    intervals_by_start (list[tuple[int, int, int, tuple[DateTimeValues,
+        object]]]): intervals that contain the center, sorted by ascending
+        start.
+    left (IntervalTreeNode): node with the intervals that end before or at
+        the center.
+    right (IntervalTreeNode): node with the intervals that start after
+        the center.
+  """
+
+  def __init__(self, center):
+    """Initializes an interval tree node.
+
+    Args:
+      center (int): center of the node in number of nanoseconds since
+          1970-01-01 00:00:00 UTC.
+    """
+    super(IntervalTreeNode, self).__init__()
+    self.center = center
+    self.intervals_by_end = []
+    self.intervals_by_start = []
+    self.left = None
+    self.right = None
+
+
+class IntervalTree(object):
+  """Interval tree of date and time values."""
+
+  def __init__(self, entries=None):
+    """Initializes an interval tree.
+
+    Args:
+      entries (Optional[Iterable[tuple[DateTimeValues, object]]]): entries,
+          pairs of date and time values and a payload.
+
+    Raises:
+      ValueError: if date and time values do not have a timestamp or
+          precision.
+    """
+    super(IntervalTree, self).__init__()
+    self._intervals = []
+    self._root_node = None
+
+    for date_time_values, payload in entries or []:
+      self.Insert(date_time_values, payload=payload)
+
+  def __len__(self):
+    """Retrieves the number of entries.
+
+    Returns:
+      int: number of entries.
+    """
+    return len(self._intervals)
+
+  def _BuildNode(self, intervals):
+    """Builds a node and its descendants.
+
+    Args:
+      intervals (list[tuple[int, int, int, tuple[DateTimeValues, object]]]):
+          intervals sorted by start, where an interval is a tuple of
+          the inclusive start, the exclusive end, the insertion order and
+          the entry.
+
+    Returns:
+      IntervalTreeNode: node or None if there are no intervals.
+    """
+    if not intervals:
+      return None
+
+    start, end, _, _ = intervals[len(intervals) // 2]
+    node = IntervalTreeNode(start + ((end - start) // 2))
+
+    left_intervals = []
+    right_intervals = []
+    for interval in intervals:
+      if interval[1] <= node.center:
+        left_intervals.append(interval)
+      elif interval[0] > node.center:
+        right_intervals.append(interval)
+      else:
+        node.intervals_by_start.append(interval)
+
+    node.intervals_by_end = sorted(
+        node.intervals_by_start, key=operator.itemgetter(1), reverse=True)
+
+    node.left = self._BuildNode(left_intervals)
+    node.right = self._BuildNode(right_intervals)
+    return node
+
+  def _GetInterval(self, date_time_values):
+    """Retrieves the interval of date and time values.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+
+    Returns:
+      tuple[int, int]: inclusive start and exclusive end of the interval in
+          number of nanoseconds since 1970-01-01 00:00:00 UTC.
+
+    Raises:
+      ValueError: if the date and time values do not have a timestamp or
+          precision.
+    """
+    interval = date_time_values.GetInterval()
+    if interval is None:
+      raise ValueError(
+          'Unsupported date and time values without timestamp or precision.')
+
+    return interval
+
+  def _GetOverlappingIntervals(self, start, end):
+    """Retrieves the intervals that overlap with an interval.
+
+    Args:
+      start (int): inclusive start of the interval in number of nanoseconds
+          since 1970-01-01 00:00:00 UTC.
+      end (int): exclusive end of the interval in number of nanoseconds
+          since 1970-01-01 00:00:00 UTC.
+
+    Returns:
+      list[tuple[DateTimeValues, object]]: entries that overlap, sorted by
+          start and insertion order.
+    """
+    if self._root_node is None and self._intervals:
+      self._root_node = self._BuildNode(
+          sorted(self._intervals, key=operator.itemgetter(0)))
+
+    intervals = []
+    nodes = [self._root_node]
+    while nodes:
+      node = nodes.pop()
+      if node is None:
+        continue
+
+      if end <= node.center:
+        # All intervals of the node end after the center and thus overlap if
+        # they start before the end.
+        for interval in node.intervals_by_start:
+          if interval[0] >= end:
+            break
+          intervals.append(interval)
+
+        nodes.append(node.left)
+
+      elif start > node.center:
+        # All intervals of the node start before or at the center and thus
+        # overlap if they end after the start.
+        for interval in node.intervals_by_end:
+          if interval[1] <= start:
+            break
+          intervals.append(interval)
+
+        nodes.append(node.right)
+
+      else:
+        intervals.extend(node.intervals_by_start)
+        nodes.append(node.left)
+        nodes.append(node.right)
+
+    intervals.sort(key=operator.itemgetter(0, 2))
+    return [interval[3] for interval in intervals]
+
+  def GetEntriesAt(self, date_time_values):
+    """Retrieves the entries that could have occurred at a specific time.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values, where only its
+          normalized timestamp is used.
+
+    Returns:
+      list[tuple[DateTimeValues, object]]: entries with an interval that
+          contains the normalized timestamp, sorted by start.
+
+    Raises:
+      ValueError: if the date and time values do not have a timestamp or
+          precision.
+    """
+    start, _ = self._GetInterval(date_time_values)
+    return self._GetOverlappingIntervals(start, start + 1)
+
+  def GetOverlappingEntries(self, date_time_values):
+    """Retrieves the entries that overlap with date and time values.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values, where its
+          interval is used.
+
+    Returns:
+      list[tuple[DateTimeValues, object]]: entries with an interval that
+          overlaps with the interval of the date and time values, sorted by
+          start.
+
+    Raises:
+      ValueError: if the date and time values do not have a timestamp or
+          precision.
+    """
+    start, end = self._GetInterval(date_time_values)
+    return self._GetOverlappingIntervals(start, end)
+
+  def Insert(self, date_time_values, payload=None):
+    """Inserts an entry.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+      payload (Optional[object]): payload.
+
+    Raises:
+      ValueError: if the date and time values do not have a timestamp or
+          precision.
+    """
+    start, end = self._GetInterval(date_time_values)
+
+    self._intervals.append(
+        (start, end, len(self._intervals), (date_time_values, payload)))
+    self._root_node = None
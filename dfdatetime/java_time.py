@@ -24,6 +24,23 @@ class JavaTime(posix_time.PosixTimeInMilliseconds):
     is_local_time (bool): True if the date and time value is in local time.
   """
 
+  _TIMESTAMP_MINIMUM = -(1 << 63)
+  _TIMESTAMP_MAXIMUM = (1 << 63) - 1
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and milliseconds or None if the timestamp is
+          missing or invalid.
+    """
+    if (self._timestamp is None or self._timestamp < self._INT64_MIN or
+        self._timestamp > self._INT64_MAX):
+      return None
+
+    return super(JavaTime, self)._GetDateTimeValues()
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -42,18 +59,19 @@ class JavaTime(posix_time.PosixTimeInMilliseconds):
 
     return self._normalized_timestamp
 
-  def CopyToDateTimeString(self):
-    """Copies the POSIX timestamp to a date and time string.
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
 
     Returns:
-      str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.######" or
-          None if the timestamp is missing.
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
     """
     if (self._timestamp is None or self._timestamp < self._INT64_MIN or
         self._timestamp > self._INT64_MAX):
       return None
 
-    return super(JavaTime, self).CopyToDateTimeString()
+    return self._timestamp * definitions.NANOSECONDS_PER_MILLISECOND
 
 
 factory.Factory.RegisterDateTimeValues(JavaTime)
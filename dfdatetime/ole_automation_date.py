@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -37,6 +38,8 @@ class OLEAutomationDate(interface.DateTimeValues):
   # The difference between December 30, 1899 and January 1, 1970 in days.
   _OLE_AUTOMATION_DATE_TO_POSIX_BASE = 25569
 
+  _SERIALIZED_ATTRIBUTES = ('_timestamp', )
+
   def __init__(self, timestamp=None):
     """Initializes an OLE Automation date.
 
@@ -52,6 +55,37 @@ class OLEAutomationDate(interface.DateTimeValues):
     """float: OLE Automation date timestamp or None if timestamp is not set."""
     return self._timestamp
 
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and microseconds or None if the timestamp is
+          missing.
+    """
+    if self._timestamp is None:
+      return None
+
+    # Note that divmod rounds down, which is needed for negative timestamps.
+    number_of_seconds, fraction_of_second = divmod(
+        self._timestamp * definitions.SECONDS_PER_DAY, 1)
+
+    # The date values are determined relative to the POSIX epoch, since
+    # determining date values before an epoch that does not start on January 1
+    # is not supported.
+    number_of_seconds = int(number_of_seconds) - (
+        self._OLE_AUTOMATION_DATE_TO_POSIX_BASE * definitions.SECONDS_PER_DAY)
+
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(
+        number_of_seconds)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH_NORMALIZED_TIME)
+
+    microseconds = int(fraction_of_second * definitions.MICROSECONDS_PER_SECOND)
+
+    return year, month, day_of_month, hours, minutes, seconds, microseconds
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -70,6 +104,7 @@ class OLEAutomationDate(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies an OLE Automation date from a date and time string.
 
@@ -106,32 +141,27 @@ class OLEAutomationDate(interface.DateTimeValues):
     timestamp /= definitions.SECONDS_PER_DAY
     timestamp += self._OLE_AUTOMATION_DATE_TO_POSIX_BASE
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._timestamp = timestamp
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the OLE Automation date to a date and time string.
 
     Returns:
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.######" or
           None if the timestamp is missing.
     """
-    if self._timestamp is None:
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    timestamp = self._timestamp * definitions.SECONDS_PER_DAY
-
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(
-        int(timestamp))
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
-
-    microseconds = int((timestamp % 1) * definitions.MICROSECONDS_PER_SECOND)
+    year, month, day_of_month, hours, minutes, seconds, microseconds = (
+        date_time_values)
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:06d}'.format(
-        year, month, day_of_month, hours, minutes, seconds, microseconds)
+    date_time_string = self._FormatDateTimeString(
+        year, month, day_of_month, hours, minutes, seconds)
+    return '{0:s}.{1:06d}'.format(date_time_string, microseconds)
 
 
 factory.Factory.RegisterDateTimeValues(OLEAutomationDate)
@@ -0,0 +1,868 @@
+# -*- coding: utf-8 -*-
+"""pandas extension array of date and time values.
+
+Date and time values are stored in 4 integer buffers:
+* a raw value buffer, with the timestamp of types that have an integer
+  timestamp, such as FILETIME, or an index into the objects of values that
+  cannot be reconstructed from their type and timestamp alone;
+* a normalized timestamp buffer, with the normalized timestamp in number of
+  nanoseconds since 1970-01-01 00:00:00 UTC, clamped to the range of a signed
+  64-bit integer, or NaT if the date and time values do not have a timestamp;
+* a precision buffer, with the index of the precision in PRECISIONS or -1 if
+  the date and time values do not have a precision;
+* a type code buffer, with the index of the encoding, a tuple of the date and
+  time values type and how the value is stored.
+
+Filtering and comparing are done on the normalized timestamp buffer, sorting
+and grouping on the normalized timestamp buffer and the sort key of the rows
+without a timestamp, such as "Never", while the original date and time values
+are materialized per row on demand. The frozen state of the date and time
+values is not preserved.
+"""
+
+from __future__ import unicode_literals
+
+import operator
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+try:
+  import pandas
+  from pandas.api import extensions as pandas_extensions
+except ImportError:
+  pandas = None
+  pandas_extensions = None
+
+from dfdatetime import conversion
+from dfdatetime import definitions
+from dfdatetime import interface
+from dfdatetime import semantic_time
+
+
+# pylint: disable=protected-access
+
+# The smallest signed 64-bit integer represents NaT.
+NAT = interface.DateTimeValues._INT64_MIN
+
+_INT64_MIN = interface.DateTimeValues._INT64_MIN + 1
+_INT64_MAX = interface.DateTimeValues._INT64_MAX
+
+# Precisions ordered from fine to coarse.
+PRECISIONS = (
+    definitions.PRECISION_1_NANOSECOND,
+    definitions.PRECISION_100_NANOSECONDS,
+    definitions.PRECISION_1_MICROSECOND,
+    definitions.PRECISION_1_MILLISECOND,
+    definitions.PRECISION_100_MILLISECONDS,
+    definitions.PRECISION_1_SECOND,
+    definitions.PRECISION_2_SECONDS,
+    definitions.PRECISION_1_MINUTE,
+    definitions.PRECISION_1_HOUR,
+    definitions.PRECISION_1_DAY)
+
+_PRECISION_CODES = {
+    precision: precision_code
+    for precision_code, precision in enumerate(PRECISIONS)}
+
+# The raw value is not set and the row is missing.
+ENCODING_MISSING = 0
+
+# The raw value is not set and the date and time values are created without
+# a timestamp.
+ENCODING_NO_TIMESTAMP = 1
+
+# The raw value is an index into the objects.
+ENCODING_OBJECT = 2
+
+# The raw value is the timestamp of the date and time values.
+ENCODING_TIMESTAMP = 3
+
+_ENCODING_MISSING = (None, ENCODING_MISSING)
+
+if pandas:
+  _ExtensionArray = pandas_extensions.ExtensionArray
+  _ExtensionDtype = pandas_extensions.ExtensionDtype
+else:
+  _ExtensionArray = object
+  _ExtensionDtype = object
+
+
+def _CheckPandas():
+  """Checks if pandas is available.
+
+  Raises:
+    RuntimeError: if pandas is not available.
+  """
+  if not pandas:
+    raise RuntimeError('Missing optional dependency: pandas.')
+
+
+def _GetEncoding(date_time_values):
+  """Determines how date and time values are stored.
+
+  Args:
+    date_time_values (DateTimeValues): date and time values or None if
+        the row is missing.
+
+  Returns:
+    tuple[type, int]: date and time values type and encoding.
+  """
+  if date_time_values is None:
+    return _ENCODING_MISSING
+
+  date_time_values_type = type(date_time_values)
+
+  if (not date_time_values.is_local_time and
+      date_time_values.time_zone_offset is None):
+    if conversion._HasIntegerTimestamp(date_time_values_type):
+      timestamp = date_time_values.timestamp
+      if timestamp is None:
+        return date_time_values_type, ENCODING_NO_TIMESTAMP
+
+      if _INT64_MIN <= timestamp <= _INT64_MAX:
+        return date_time_values_type, ENCODING_TIMESTAMP
+
+    # Subclasses of semantic time, such as Never, have a fixed string.
+    elif (date_time_values_type is not semantic_time.SemanticTime and
+          isinstance(date_time_values, semantic_time.SemanticTime)):
+      return date_time_values_type, ENCODING_NO_TIMESTAMP
+
+  return date_time_values_type, ENCODING_OBJECT
+
+
+def _GetFirstIndexes(values):
+  """Determines the index of the first occurrence of every unique value.
+
+  Args:
+    values (numpy.ndarray): values, where missing values are considered
+        a unique value as well.
+
+  Returns:
+    tuple[numpy.ndarray, numpy.ndarray]: unique values, in order of their first
+        occurrence, and the index of their first occurrence.
+  """
+  codes, uniques = pandas.factorize(values, use_na_sentinel=False)
+  _, first_indexes = numpy.unique(codes, return_index=True)
+  return uniques, first_indexes
+
+
+def _GetNormalizedTimestamp(date_time_values):
+  """Retrieves the normalized timestamp of date and time values.
+
+  Args:
+    date_time_values (DateTimeValues): date and time values or None if
+        the row is missing.
+
+  Returns:
+    int: normalized timestamp in number of nanoseconds since 1970-01-01
+        00:00:00 UTC, clamped to the range of a signed 64-bit integer, or NaT
+        if the date and time values do not have a timestamp.
+  """
+  if date_time_values is None:
+    return NAT
+
+  normalized_timestamp = date_time_values._GetNormalizedTimestampInNanoseconds()
+  if normalized_timestamp is None:
+    return NAT
+
+  return max(_INT64_MIN, min(normalized_timestamp, _INT64_MAX))
+
+
+def CopyFromColumns(raw_values, type_codes, encodings, objects):
+  """Copies date and time values from columns.
+
+  Args:
+    raw_values (Sequence[int]): raw values.
+    type_codes (Sequence[int]): indexes of the encodings.
+    encodings (Sequence[tuple[type, int]]): date and time values types and
+        encodings.
+    objects (Sequence[DateTimeValues]): date and time values that are not
+        stored as raw value.
+
+  Returns:
+    list[DateTimeValues]: date and time values, where None represents
+        a missing row.
+
+  Raises:
+    ValueError: if the number of values in the columns differ.
+  """
+  if len(raw_values) != len(type_codes):
+    raise ValueError('Number of values in columns differ.')
+
+  return [
+      GetDateTimeValues(raw_value, type_code, encodings, objects)
+      for raw_value, type_code in zip(raw_values, type_codes)]
+
+
+def CopyToColumns(date_time_values_list):
+  """Copies date and time values to columns.
+
+  Args:
+    date_time_values_list (Iterable[DateTimeValues]): date and time values,
+        where None represents a missing row.
+
+  Returns:
+    tuple[list[int], list[int], list[int], list[int], list[tuple[type, int]],
+        list[DateTimeValues]]: raw values, normalized timestamps, precision
+        codes, type codes, encodings and objects.
+
+  Raises:
+    ValueError: if a value is not a date and time values.
+  """
+  raw_values = []
+  normalized_timestamps = []
+  precision_codes = []
+  type_codes = []
+  encodings = []
+  objects = []
+
+  encoding_type_codes = {}
+
+  for date_time_values in date_time_values_list:
+    if (date_time_values is not None and
+        not isinstance(date_time_values, interface.DateTimeValues)):
+      raise ValueError('Unsupported date and time values: {0!s}.'.format(
+          date_time_values))
+
+    encoding = _GetEncoding(date_time_values)
+
+    type_code = encoding_type_codes.get(encoding, None)
+    if type_code is None:
+      type_code = len(encodings)
+      encoding_type_codes[encoding] = type_code
+      encodings.append(encoding)
+
+    raw_value = 0
+    if encoding[1] == ENCODING_TIMESTAMP:
+      raw_value = date_time_values.timestamp
+    elif encoding[1] == ENCODING_OBJECT:
+      raw_value = len(objects)
+      objects.append(date_time_values)
+
+    precision_code = -1
+    if date_time_values is not None:
+      precision_code = _PRECISION_CODES.get(date_time_values.precision, -1)
+
+    raw_values.append(raw_value)
+    normalized_timestamps.append(_GetNormalizedTimestamp(date_time_values))
+    precision_codes.append(precision_code)
+    type_codes.append(type_code)
+
+  return (
+      raw_values, normalized_timestamps, precision_codes, type_codes,
+      encodings, objects)
+
+
+def GetDateTimeValues(raw_value, type_code, encodings, objects):
+  """Retrieves date and time values from a raw value.
+
+  Args:
+    raw_value (int): raw value.
+    type_code (int): index of the encoding.
+    encodings (Sequence[tuple[type, int]]): date and time values types and
+        encodings.
+    objects (Sequence[DateTimeValues]): date and time values that are not
+        stored as raw value.
+
+  Returns:
+    DateTimeValues: date and time values or None if the row is missing.
+  """
+  date_time_values_type, encoding = encodings[type_code]
+
+  if encoding == ENCODING_TIMESTAMP:
+    return date_time_values_type(timestamp=int(raw_value))
+
+  if encoding == ENCODING_NO_TIMESTAMP:
+    return date_time_values_type()
+
+  if encoding == ENCODING_OBJECT:
+    return objects[raw_value]
+
+  return None
+
+
+class DateTimeValuesDtype(_ExtensionDtype):
+  """pandas extension dtype of date and time values."""
+
+  # The method names are defined by the pandas extension interface.
+  # pylint: disable=invalid-name
+
+  name = 'dfdatetime'
+  kind = 'O'
+  na_value = None
+  type = interface.DateTimeValues
+
+  @classmethod
+  def construct_array_type(cls):
+    """Retrieves the array type associated with the dtype.
+
+    Returns:
+      type: array type.
+    """
+    return DateTimeValuesArray
+
+
+class DateTimeValuesArray(_ExtensionArray):
+  """pandas extension array of date and time values."""
+
+  # The method names are defined by the pandas extension interface.
+  # pylint: disable=invalid-name,unused-argument
+
+  def __init__(
+      self, raw_values, normalized_timestamps, precision_codes, type_codes,
+      encodings, objects):
+    """Initializes a pandas extension array of date and time values.
+
+    Args:
+      raw_values (numpy.ndarray): raw values.
+      normalized_timestamps (numpy.ndarray): normalized timestamps in number
+          of nanoseconds since 1970-01-01 00:00:00 UTC, where NaT represents
+          date and time values without a timestamp.
+      precision_codes (numpy.ndarray): indexes of the precisions in
+          PRECISIONS, where -1 represents date and time values without
+          a precision.
+      type_codes (numpy.ndarray): indexes of the encodings.
+      encodings (tuple[tuple[type, int]]): date and time values types and
+          encodings.
+      objects (tuple[DateTimeValues]): date and time values that are not
+          stored as raw value.
+
+    Raises:
+      RuntimeError: if pandas is not available.
+      ValueError: if the number of values in the buffers differ.
+    """
+    _CheckPandas()
+
+    number_of_values = len(raw_values)
+    if (len(normalized_timestamps) != number_of_values or
+        len(precision_codes) != number_of_values or
+        len(type_codes) != number_of_values):
+      raise ValueError('Number of values in buffers differ.')
+
+    super(DateTimeValuesArray, self).__init__()
+    self._encodings = tuple(encodings)
+    self._normalized_timestamps = numpy.asarray(
+        normalized_timestamps, dtype=numpy.int64)
+    self._objects = tuple(objects)
+    self._precision_codes = numpy.asarray(precision_codes, dtype=numpy.int8)
+    self._raw_values = numpy.asarray(raw_values, dtype=numpy.int64)
+    self._type_codes = numpy.asarray(type_codes, dtype=numpy.int32)
+
+  @property
+  def dtype(self):
+    """DateTimeValuesDtype: dtype."""
+    return DateTimeValuesDtype()
+
+  @property
+  def nbytes(self):
+    """int: number of bytes of the buffers."""
+    return (
+        self._raw_values.nbytes + self._normalized_timestamps.nbytes +
+        self._precision_codes.nbytes + self._type_codes.nbytes)
+
+  def __eq__(self, other):
+    """Determines if the normalized timestamps are equal to other.
+
+    Args:
+      other (DateTimeValues|DateTimeValuesArray): date and time values
+          to compare against.
+
+    Returns:
+      numpy.ndarray: True for every row that is equal to other.
+    """
+    return self._Compare(other, operator.eq)
+
+  def __ge__(self, other):
+    """Determines if the normalized timestamps are greater or equal to other.
+
+    Args:
+      other (DateTimeValues|DateTimeValuesArray): date and time values
+          to compare against.
+
+    Returns:
+      numpy.ndarray: True for every row that is greater or equal to other.
+    """
+    return self._Compare(other, operator.ge)
+
+  def __getitem__(self, item):
+    """Retrieves date and time values or a subset of the array.
+
+    Args:
+      item (int|slice|numpy.ndarray): index, slice, boolean mask or indexes.
+
+    Returns:
+      DateTimeValues|DateTimeValuesArray: date and time values, where None
+          represents a missing row, or a subset of the array.
+    """
+    if pandas.api.types.is_integer(item):
+      return GetDateTimeValues(
+          self._raw_values[item], self._type_codes[item], self._encodings,
+          self._objects)
+
+    if not isinstance(item, slice):
+      item = pandas.api.indexers.check_array_indexer(self, item)
+
+    return DateTimeValuesArray(
+        self._raw_values[item], self._normalized_timestamps[item],
+        self._precision_codes[item], self._type_codes[item], self._encodings,
+        self._objects)
+
+  def __gt__(self, other):
+    """Determines if the normalized timestamps are greater than other.
+
+    Args:
+      other (DateTimeValues|DateTimeValuesArray): date and time values
+          to compare against.
+
+    Returns:
+      numpy.ndarray: True for every row that is greater than other.
+    """
+    return self._Compare(other, operator.gt)
+
+  def __le__(self, other):
+    """Determines if the normalized timestamps are less or equal to other.
+
+    Args:
+      other (DateTimeValues|DateTimeValuesArray): date and time values
+          to compare against.
+
+    Returns:
+      numpy.ndarray: True for every row that is less or equal to other.
+    """
+    return self._Compare(other, operator.le)
+
+  def __len__(self):
+    """Retrieves the number of rows.
+
+    Returns:
+      int: number of rows.
+    """
+    return len(self._raw_values)
+
+  def __lt__(self, other):
+    """Determines if the normalized timestamps are less than other.
+
+    Args:
+      other (DateTimeValues|DateTimeValuesArray): date and time values
+          to compare against.
+
+    Returns:
+      numpy.ndarray: True for every row that is less than other.
+    """
+    return self._Compare(other, operator.lt)
+
+  def __ne__(self, other):
+    """Determines if the normalized timestamps are not equal to other.
+
+    Args:
+      other (DateTimeValues|DateTimeValuesArray): date and time values
+          to compare against.
+
+    Returns:
+      numpy.ndarray: True for every row that is not equal to other.
+    """
+    result = self._Compare(other, operator.eq)
+    if result is NotImplemented:
+      return result
+
+    return ~result
+
+  def _Compare(self, other, comparison_function):
+    """Compares the normalized timestamps to other.
+
+    Rows without a timestamp are never equal, less or greater than other.
+
+    Args:
+      other (DateTimeValues|DateTimeValuesArray): date and time values
+          to compare against.
+      comparison_function (function): comparison function, such as
+          operator.lt.
+
+    Returns:
+      numpy.ndarray: result of the comparison per row or NotImplemented if
+          other is not supported.
+
+    Raises:
+      ValueError: if the number of rows of other differs.
+    """
+    if isinstance(other, DateTimeValuesArray):
+      if len(other) != len(self):
+        raise ValueError('Number of rows differ.')
+
+      other_timestamps = other._normalized_timestamps
+
+    elif isinstance(other, interface.DateTimeValues):
+      other_timestamps = _GetNormalizedTimestamp(other)
+
+    else:
+      return NotImplemented
+
+    result = comparison_function(self._normalized_timestamps, other_timestamps)
+    return (
+        result & (self._normalized_timestamps != NAT) &
+        (other_timestamps != NAT))
+
+  def _GetSortKeys(self):
+    """Retrieves the sort keys of the rows.
+
+    The sort keys are consistent with DateTimeValues.GetSortKey, for example
+    "Never" sorts after the rows with a timestamp.
+
+    Returns:
+      tuple[numpy.ndarray, numpy.ndarray]: sort key groups and normalized
+          timestamps or sort orders within the group, where -1 represents
+          the group of a missing row.
+    """
+    groups = numpy.full(
+        len(self), interface.DateTimeValues._SORT_KEY_GROUP_TIMESTAMP,
+        dtype=numpy.int8)
+    keys = self._normalized_timestamps.copy()
+
+    has_timestamp = keys != NAT
+    if has_timestamp.all():
+      return groups, keys
+
+    object_type_codes = []
+    for type_code, (date_time_values_type, encoding) in enumerate(
+        self._encodings):
+      if encoding == ENCODING_OBJECT:
+        object_type_codes.append(type_code)
+        continue
+
+      if encoding == ENCODING_MISSING:
+        sort_key = (-1, 0)
+      elif encoding == ENCODING_NO_TIMESTAMP:
+        sort_key = date_time_values_type().GetSortKey()
+      else:
+        continue
+
+      is_type_code = self._type_codes == type_code
+      groups[is_type_code], keys[is_type_code] = sort_key
+
+    # Date and time values that are stored as object, such as a semantic time
+    # with a custom string, are looked up per row.
+    is_object = ~has_timestamp & numpy.isin(self._type_codes, object_type_codes)
+    for index in numpy.flatnonzero(is_object):
+      date_time_values = self._objects[self._raw_values[index]]
+      groups[index], keys[index] = date_time_values.GetSortKey()
+
+    return groups, keys
+
+  @classmethod
+  def _concat_same_type(cls, to_concat):
+    """Concatenates multiple arrays.
+
+    Args:
+      to_concat (Sequence[DateTimeValuesArray]): arrays.
+
+    Returns:
+      DateTimeValuesArray: concatenated array.
+    """
+    encodings = []
+    objects = []
+    raw_values = []
+    type_codes = []
+
+    encoding_type_codes = {}
+
+    for array in to_concat:
+      remapped_type_codes = []
+      for encoding in array._encodings:
+        type_code = encoding_type_codes.get(encoding, None)
+        if type_code is None:
+          type_code = len(encodings)
+          encoding_type_codes[encoding] = type_code
+          encodings.append(encoding)
+
+        remapped_type_codes.append(type_code)
+
+      array_raw_values = array._raw_values
+      if array._objects:
+        object_type_codes = [
+            type_code for type_code, (_, encoding) in enumerate(
+                array._encodings) if encoding == ENCODING_OBJECT]
+        is_object = numpy.isin(array._type_codes, object_type_codes)
+
+        array_raw_values = array_raw_values.copy()
+        array_raw_values[is_object] += len(objects)
+        objects.extend(array._objects)
+
+      remapped_type_codes = numpy.array(
+          remapped_type_codes, dtype=numpy.int32)
+
+      raw_values.append(array_raw_values)
+      type_codes.append(remapped_type_codes[array._type_codes])
+
+    return cls(
+        numpy.concatenate(raw_values),
+        numpy.concatenate([
+            array._normalized_timestamps for array in to_concat]),
+        numpy.concatenate([array._precision_codes for array in to_concat]),
+        numpy.concatenate(type_codes), encodings, objects)
+
+  def _formatter(self, boxed=False):
+    """Retrieves the function to format date and time values.
+
+    Args:
+      boxed (Optional[bool]): True if the array is printed in a container,
+          such as a Series.
+
+    Returns:
+      function: function to format date and time values, where date and time
+          values without a timestamp are formatted as "Not set".
+    """
+    def _FormatDateTimeValues(date_time_values):
+      if date_time_values is None:
+        return 'None'
+
+      return date_time_values.CopyToDateTimeString() or 'Not set'
+
+    return _FormatDateTimeValues
+
+  @classmethod
+  def _from_factorized(cls, values, original):
+    """Creates an array from factorized values.
+
+    Args:
+      values (numpy.ndarray): unique normalized timestamps.
+      original (DateTimeValuesArray): array that was factorized.
+
+    Returns:
+      DateTimeValuesArray: array with the first date and time values of every
+          unique value.
+    """
+    original_values, _ = original._values_for_factorize()
+    uniques, first_indexes = _GetFirstIndexes(original_values)
+
+    positions = pandas.Index(uniques, tupleize_cols=False).get_indexer(values)
+    return original.take(first_indexes[positions])
+
+  @classmethod
+  def _from_sequence(cls, scalars, dtype=None, copy=False):
+    """Creates an array from date and time values.
+
+    Args:
+      scalars (Sequence[DateTimeValues]): date and time values, where None or
+          a pandas missing value represents a missing row.
+      dtype (Optional[DateTimeValuesDtype]): dtype.
+      copy (Optional[bool]): True if the data should be copied.
+
+    Returns:
+      DateTimeValuesArray: array.
+
+    Raises:
+      RuntimeError: if pandas is not available.
+      ValueError: if a value is not a date and time values.
+    """
+    _CheckPandas()
+
+    if isinstance(scalars, DateTimeValuesArray):
+      return scalars.copy() if copy else scalars
+
+    date_time_values_list = [
+        None if (not isinstance(scalar, interface.DateTimeValues) and
+                 pandas.isna(scalar)) else scalar
+        for scalar in scalars]
+
+    return cls(*CopyToColumns(date_time_values_list))
+
+  def _values_for_argsort(self):
+    """Retrieves the values used to sort the array.
+
+    Returns:
+      numpy.ndarray: normalized timestamps, if all rows have a timestamp, or
+          otherwise the rank of the sort key of every row.
+    """
+    groups, keys = self._GetSortKeys()
+    if (groups == interface.DateTimeValues._SORT_KEY_GROUP_TIMESTAMP).all():
+      return self._normalized_timestamps
+
+    sort_indexes = numpy.lexsort((keys, groups))
+    sorted_groups = groups[sort_indexes]
+    sorted_keys = keys[sort_indexes]
+
+    is_next_rank = numpy.ones(len(self), dtype=numpy.bool_)
+    is_next_rank[1:] = (
+        (sorted_groups[1:] != sorted_groups[:-1]) |
+        (sorted_keys[1:] != sorted_keys[:-1]))
+
+    ranks = numpy.empty(len(self), dtype=numpy.int64)
+    ranks[sort_indexes] = numpy.cumsum(is_next_rank)
+    return ranks
+
+  def _values_for_factorize(self):
+    """Retrieves the values used to factorize and group the array.
+
+    Rows without a timestamp are represented by their sort key, so that for
+    example "Never" and "Not set" form separate groups.
+
+    Returns:
+      tuple[numpy.ndarray, object]: normalized timestamps, if all rows that
+          are not missing have a timestamp, or otherwise the normalized
+          timestamps and sort keys as objects, and the value that represents
+          a missing row.
+    """
+    groups, keys = self._GetSortKeys()
+
+    has_sort_key = (
+        (groups != interface.DateTimeValues._SORT_KEY_GROUP_TIMESTAMP) &
+        (groups != -1))
+    if not has_sort_key.any():
+      return self._normalized_timestamps, NAT
+
+    values = self._normalized_timestamps.astype(object)
+    values[groups == -1] = None
+    for index in numpy.flatnonzero(has_sort_key):
+      values[index] = (int(groups[index]), int(keys[index]))
+
+    return values, None
+
+  def astype(self, dtype, copy=True):
+    """Casts the array to another dtype.
+
+    Casting to datetime64 uses the normalized timestamps, where date and time
+    values without a timestamp or with a clamped timestamp are NaT.
+
+    Args:
+      dtype (str or numpy.dtype or ExtensionDtype): dtype.
+      copy (Optional[bool]): True if the data should be copied.
+
+    Returns:
+      numpy.ndarray|ExtensionArray: array.
+    """
+    dtype = pandas.api.types.pandas_dtype(dtype)
+
+    if isinstance(dtype, DateTimeValuesDtype):
+      return self.copy() if copy else self
+
+    if dtype.kind == 'M':
+      is_clamped = (
+          (self._normalized_timestamps == _INT64_MIN) |
+          (self._normalized_timestamps == _INT64_MAX))
+      normalized_timestamps = numpy.where(
+          is_clamped, NAT, self._normalized_timestamps)
+      return normalized_timestamps.view('datetime64[ns]').astype(dtype)
+
+    # The base class is object when pandas is not available, in which case
+    # this method is not used.
+    # pylint: disable=no-member
+    return super(DateTimeValuesArray, self).astype(dtype, copy=copy)
+
+  def copy(self):
+    """Copies the array.
+
+    Returns:
+      DateTimeValuesArray: copy of the array.
+    """
+    return DateTimeValuesArray(
+        self._raw_values.copy(), self._normalized_timestamps.copy(),
+        self._precision_codes.copy(), self._type_codes.copy(),
+        self._encodings, self._objects)
+
+  def GetNormalizedTimestamps(self):
+    """Retrieves the normalized timestamps.
+
+    Returns:
+      numpy.ndarray: normalized timestamps in number of nanoseconds since
+          1970-01-01 00:00:00 UTC, clamped to the range of a signed 64-bit
+          integer, where NaT represents date and time values without
+          a timestamp.
+    """
+    normalized_timestamps = self._normalized_timestamps.view()
+    normalized_timestamps.flags.writeable = False
+    return normalized_timestamps
+
+  def GetPrecisions(self):
+    """Retrieves the precisions.
+
+    Returns:
+      pandas.Categorical: precisions, where a missing value represents date and
+          time values without a precision.
+    """
+    return pandas.Categorical.from_codes(
+        self._precision_codes, categories=PRECISIONS)
+
+  def GetTypeNames(self):
+    """Retrieves the names of the date and time values types.
+
+    Returns:
+      pandas.Categorical: names of the date and time values types, where
+          a missing value represents a missing row.
+    """
+    categories = []
+    codes = []
+    for date_time_values_type, _ in self._encodings:
+      if date_time_values_type is None:
+        codes.append(-1)
+        continue
+
+      type_name = date_time_values_type.__name__
+      if type_name not in categories:
+        categories.append(type_name)
+      codes.append(categories.index(type_name))
+
+    codes = numpy.array(codes, dtype=numpy.int32)
+    return pandas.Categorical.from_codes(
+        codes[self._type_codes], categories=categories)
+
+  def isna(self):
+    """Determines the missing rows.
+
+    Returns:
+      numpy.ndarray: True for every missing row.
+    """
+    missing_type_codes = [
+        type_code for type_code, encoding in enumerate(self._encodings)
+        if encoding == _ENCODING_MISSING]
+    return numpy.isin(self._type_codes, missing_type_codes)
+
+  def take(self, indices, allow_fill=False, fill_value=None):
+    """Takes rows from the array.
+
+    Args:
+      indices (Sequence[int]): indexes of the rows.
+      allow_fill (Optional[bool]): True if -1 in indices represents a row
+          with the fill value.
+      fill_value (Optional[DateTimeValues]): fill value, where None represents
+          a missing row.
+
+    Returns:
+      DateTimeValuesArray: array.
+
+    Raises:
+      ValueError: if allow_fill is set and indices contains a negative value
+          other than -1.
+    """
+    indices = numpy.asarray(indices, dtype=numpy.intp)
+    array = self
+
+    if allow_fill:
+      if (indices < -1).any():
+        raise ValueError('Unsupported negative index other than -1.')
+
+      fill_array = DateTimeValuesArray._from_sequence([fill_value])
+      array = DateTimeValuesArray._concat_same_type([self, fill_array])
+      indices = numpy.where(indices == -1, len(self), indices)
+
+    return DateTimeValuesArray(
+        array._raw_values[indices], array._normalized_timestamps[indices],
+        array._precision_codes[indices], array._type_codes[indices],
+        array._encodings, array._objects)
+
+  def unique(self):
+    """Retrieves the unique rows.
+
+    Returns:
+      DateTimeValuesArray: array with the first date and time values of every
+          unique value, in order of their first occurrence.
+    """
+    values, _ = self._values_for_factorize()
+    _, first_indexes = _GetFirstIndexes(values)
+    return self.take(first_indexes)
+
+
+if pandas:
+  pandas_extensions.register_extension_dtype(DateTimeValuesDtype)
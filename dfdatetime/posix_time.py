@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -34,6 +35,12 @@ class PosixTime(interface.DateTimeValues):
 
   _EPOCH = PosixTimeEpoch()
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
+  _TIMESTAMP_NANOSECONDS_PER_UNIT = definitions.NANOSECONDS_PER_SECOND
+
+  _SERIALIZED_ATTRIBUTES = ('_timestamp', )
+
   def __init__(self, timestamp=None):
     """Initializes a POSIX timestamp.
 
@@ -49,6 +56,42 @@ class PosixTime(interface.DateTimeValues):
     """int: POSIX timestamp or None if timestamp is not set."""
     return self._timestamp
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a POSIX timestamp from a normalized timestamp.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      PosixTime: POSIX timestamp.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the timestamp unit or the timestamp is out of bounds.
+    """
+    timestamp = self._GetTimestampFromNormalizedTimestamp(normalized_timestamp)
+    return type(self)(timestamp=timestamp)
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, None]: year, month, day of month,
+          hours, minutes and seconds, where the fraction of second is None, or
+          None if the timestamp is missing.
+    """
+    if self._timestamp is None:
+      return None
+
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(
+        self._timestamp)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH)
+
+    return year, month, day_of_month, hours, minutes, seconds, None
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -64,6 +107,20 @@ class PosixTime(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if self._timestamp is None:
+      return None
+
+    return self._timestamp * definitions.NANOSECONDS_PER_SECOND
+
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a POSIX timestamp from a date and time string.
 
@@ -86,27 +143,25 @@ class PosixTime(interface.DateTimeValues):
     seconds = date_time_values.get('seconds', 0)
     time_zone_offset = date_time_values.get('time_zone_offset', 0)
 
+    self._ResetCachedValues()
     self._timestamp = self._GetNumberOfSecondsFromElements(
         year, month, day_of_month, hours, minutes, seconds, time_zone_offset)
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the POSIX timestamp to a date and time string.
 
     Returns:
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss" or None
           if the timestamp is missing.
     """
-    if self._timestamp is None:
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(
-        self._timestamp)
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
+    year, month, day_of_month, hours, minutes, seconds, _ = date_time_values
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}'.format(
+    return self._FormatDateTimeString(
         year, month, day_of_month, hours, minutes, seconds)
 
 
@@ -121,6 +176,12 @@ class PosixTimeInMilliseconds(interface.DateTimeValues):
 
   _EPOCH = PosixTimeEpoch()
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
+  _TIMESTAMP_NANOSECONDS_PER_UNIT = definitions.NANOSECONDS_PER_MILLISECOND
+
+  _SERIALIZED_ATTRIBUTES = ('_timestamp', )
+
   def __init__(self, timestamp=None):
     """Initializes a POSIX timestamp in milliseconds.
 
@@ -136,6 +197,43 @@ class PosixTimeInMilliseconds(interface.DateTimeValues):
     """int: POSIX timestamp in milliseconds or None if timestamp is not set."""
     return self._timestamp
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a POSIX timestamp in milliseconds from a normalized timestamp.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      PosixTimeInMilliseconds: POSIX timestamp in milliseconds.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the timestamp unit or the timestamp is out of bounds.
+    """
+    timestamp = self._GetTimestampFromNormalizedTimestamp(normalized_timestamp)
+    return type(self)(timestamp=timestamp)
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and milliseconds or None if the timestamp is
+          missing.
+    """
+    if self._timestamp is None:
+      return None
+
+    timestamp, milliseconds = divmod(
+        self._timestamp, definitions.MILLISECONDS_PER_SECOND)
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH)
+
+    return year, month, day_of_month, hours, minutes, seconds, milliseconds
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -153,6 +251,20 @@ class PosixTimeInMilliseconds(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if self._timestamp is None:
+      return None
+
+    return self._timestamp * definitions.NANOSECONDS_PER_MILLISECOND
+
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a POSIX timestamp from a date and time string.
 
@@ -185,28 +297,27 @@ class PosixTimeInMilliseconds(interface.DateTimeValues):
           microseconds, definitions.MILLISECONDS_PER_SECOND)
       timestamp += milliseconds
 
+    self._ResetCachedValues()
     self._timestamp = timestamp
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the POSIX timestamp to a date and time string.
 
     Returns:
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.######" or
           None if the timestamp is missing.
     """
-    if self._timestamp is None:
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    timestamp, milliseconds = divmod(
-        self._timestamp, definitions.MILLISECONDS_PER_SECOND)
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
+    year, month, day_of_month, hours, minutes, seconds, milliseconds = (
+        date_time_values)
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:03d}'.format(
-        year, month, day_of_month, hours, minutes, seconds, milliseconds)
+    date_time_string = self._FormatDateTimeString(
+        year, month, day_of_month, hours, minutes, seconds)
+    return '{0:s}.{1:03d}'.format(date_time_string, milliseconds)
 
 
 class PosixTimeInMicroseconds(interface.DateTimeValues):
@@ -220,6 +331,12 @@ class PosixTimeInMicroseconds(interface.DateTimeValues):
 
   _EPOCH = PosixTimeEpoch()
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
+  _TIMESTAMP_NANOSECONDS_PER_UNIT = definitions.NANOSECONDS_PER_MICROSECOND
+
+  _SERIALIZED_ATTRIBUTES = ('_timestamp', )
+
   def __init__(self, timestamp=None):
     """Initializes a POSIX timestamp in microseconds.
 
@@ -235,6 +352,43 @@ class PosixTimeInMicroseconds(interface.DateTimeValues):
     """int: POSIX timestamp in microseconds or None if timestamp is not set."""
     return self._timestamp
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a POSIX timestamp in microseconds from a normalized timestamp.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      PosixTimeInMicroseconds: POSIX timestamp in microseconds.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the timestamp unit or the timestamp is out of bounds.
+    """
+    timestamp = self._GetTimestampFromNormalizedTimestamp(normalized_timestamp)
+    return type(self)(timestamp=timestamp)
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and microseconds or None if the timestamp is
+          missing.
+    """
+    if self._timestamp is None:
+      return None
+
+    timestamp, microseconds = divmod(
+        self._timestamp, definitions.MICROSECONDS_PER_SECOND)
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH)
+
+    return year, month, day_of_month, hours, minutes, seconds, microseconds
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -252,6 +406,20 @@ class PosixTimeInMicroseconds(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if self._timestamp is None:
+      return None
+
+    return self._timestamp * definitions.NANOSECONDS_PER_MICROSECOND
+
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a POSIX timestamp from a date and time string.
 
@@ -280,28 +448,27 @@ class PosixTimeInMicroseconds(interface.DateTimeValues):
     timestamp *= definitions.MICROSECONDS_PER_SECOND
     timestamp += microseconds
 
+    self._ResetCachedValues()
     self._timestamp = timestamp
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the POSIX timestamp to a date and time string.
 
     Returns:
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.######" or
           None if the timestamp is missing.
     """
-    if self._timestamp is None:
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    timestamp, microseconds = divmod(
-        self._timestamp, definitions.MICROSECONDS_PER_SECOND)
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
+    year, month, day_of_month, hours, minutes, seconds, microseconds = (
+        date_time_values)
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:06d}'.format(
-        year, month, day_of_month, hours, minutes, seconds, microseconds)
+    date_time_string = self._FormatDateTimeString(
+        year, month, day_of_month, hours, minutes, seconds)
+    return '{0:s}.{1:06d}'.format(date_time_string, microseconds)
 
 
 class PosixTimeInNanoseconds(interface.DateTimeValues):
@@ -315,6 +482,12 @@ class PosixTimeInNanoseconds(interface.DateTimeValues):
 
   _EPOCH = PosixTimeEpoch()
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
+  _TIMESTAMP_NANOSECONDS_PER_UNIT = 1
+
+  _SERIALIZED_ATTRIBUTES = ('_timestamp', )
+
   def __init__(self, timestamp=None):
     """Initializes a POSIX timestamp in nanoseconds.
 
@@ -330,6 +503,43 @@ class PosixTimeInNanoseconds(interface.DateTimeValues):
     """int: POSIX timestamp or None if timestamp is not set."""
     return self._timestamp
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a POSIX timestamp in nanoseconds from a normalized timestamp.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      PosixTimeInNanoseconds: POSIX timestamp in nanoseconds.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the timestamp unit or the timestamp is out of bounds.
+    """
+    timestamp = self._GetTimestampFromNormalizedTimestamp(normalized_timestamp)
+    return type(self)(timestamp=timestamp)
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and nanoseconds or None if the timestamp is
+          missing or invalid.
+    """
+    if self._timestamp is None:
+      return None
+
+    timestamp, nanoseconds = divmod(
+        self._timestamp, definitions.NANOSECONDS_PER_SECOND)
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH)
+
+    return year, month, day_of_month, hours, minutes, seconds, nanoseconds
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -347,6 +557,19 @@ class PosixTimeInNanoseconds(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if self._timestamp is None:
+      return None
+
+    return self._timestamp
+
   def _CopyFromDateTimeString(self, time_string):
     """Copies a POSIX timestamp from a date and time string.
 
@@ -378,10 +601,11 @@ class PosixTimeInNanoseconds(interface.DateTimeValues):
       nanoseconds = microseconds * definitions.MILLISECONDS_PER_SECOND
       timestamp += nanoseconds
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._timestamp = timestamp
     self._time_zone_offset = time_zone_offset
 
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a POSIX timestamp from a date and time string.
 
@@ -403,27 +627,16 @@ class PosixTimeInNanoseconds(interface.DateTimeValues):
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.#########" or
           None if the timestamp is missing or invalid.
     """
-    if self._timestamp is None:
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    timestamp, nanoseconds = divmod(
-        self._timestamp, definitions.NANOSECONDS_PER_SECOND)
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
-
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:09d}'.format(
-        year, month, day_of_month, hours, minutes, seconds, nanoseconds)
-
-  def CopyToDateTimeString(self):
-    """Copies the POSIX timestamp to a date and time string.
+    year, month, day_of_month, hours, minutes, seconds, nanoseconds = (
+        date_time_values)
 
-    Returns:
-      str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.#########" or
-          None if the timestamp is missing or invalid.
-    """
-    return self._CopyToDateTimeString()
+    date_time_string = self._FormatDateTimeString(
+        year, month, day_of_month, hours, minutes, seconds)
+    return '{0:s}.{1:09d}'.format(date_time_string, nanoseconds)
 
 
 factory.Factory.RegisterDateTimeValues(PosixTime)
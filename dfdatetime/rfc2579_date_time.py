@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -42,10 +43,16 @@ class RFC2579DateTime(interface.DateTimeValues):
     deciseconds (int): deciseconds, 0 through 9.
   """
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
   # TODO: make attributes read-only.
 
   # pylint: disable=missing-type-doc
 
+  _SERIALIZED_ATTRIBUTES = (
+      '_year', '_month', '_day_of_month', '_hours', '_minutes', '_seconds',
+      '_deciseconds', '_number_of_seconds')
+
   def __init__(self, rfc2579_date_time_tuple=None):
     """Initializes a RFC2579 date-time.
 
@@ -128,6 +135,45 @@ class RFC2579DateTime(interface.DateTimeValues):
           self._year, self._month, self._day_of_month, self._hours,
           self._minutes, self._seconds, self._time_zone_offset)
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a RFC2579 date-time from a normalized timestamp.
+
+    The RFC2579 date-time is determined in the time zone of the RFC2579
+    date-time.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      RFC2579DateTime: RFC2579 date-time.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the precision or the year is out of bounds.
+    """
+    number_of_seconds, nanoseconds = divmod(
+        normalized_timestamp, definitions.NANOSECONDS_PER_SECOND)
+
+    deciseconds, remainder = divmod(
+        nanoseconds, definitions.NANOSECONDS_PER_DECISECOND)
+    if remainder:
+      raise ValueError((
+          'Normalized timestamp: {0:d} ns is not a multiple of the precision '
+          'of {1:s}.').format(normalized_timestamp, type(self).__name__))
+
+    year, month, day_of_month, hours, minutes, seconds = (
+        self._GetTimeElementsFromNumberOfSeconds(
+            number_of_seconds, self._time_zone_offset))
+
+    time_zone_offset = self._time_zone_offset or 0
+    direction_from_utc = '+' if time_zone_offset >= 0 else '-'
+    hours_from_utc, minutes_from_utc = divmod(abs(time_zone_offset), 60)
+
+    return type(self)(rfc2579_date_time_tuple=(
+        year, month, day_of_month, hours, minutes, seconds, deciseconds,
+        direction_from_utc, hours_from_utc, minutes_from_utc))
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -146,6 +192,23 @@ class RFC2579DateTime(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if self._number_of_seconds is None:
+      return None
+
+    normalized_timestamp = (
+        self._number_of_seconds * definitions.NANOSECONDS_PER_SECOND)
+    normalized_timestamp += (
+        self._deciseconds * definitions.NANOSECONDS_PER_DECISECOND)
+    return normalized_timestamp
+
   @property
   def deciseconds(self):
     """int: number of deciseconds or None if not set."""
@@ -181,6 +244,7 @@ class RFC2579DateTime(interface.DateTimeValues):
     """int: year or None if not set."""
     return self._year
 
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a RFC2579 date-time from a date and time string.
 
@@ -213,7 +277,7 @@ class RFC2579DateTime(interface.DateTimeValues):
     if year < 0 or year > 65536:
       raise ValueError('Unsupported year value: {0:d}.'.format(year))
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._number_of_seconds = self._GetNumberOfSecondsFromElements(
         year, month, day_of_month, hours, minutes, seconds, time_zone_offset)
     self._time_zone_offset = time_zone_offset
@@ -226,7 +290,7 @@ class RFC2579DateTime(interface.DateTimeValues):
     self._seconds = seconds
     self._deciseconds = deciseconds
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the RFC2579 date-time to a date and time string.
 
     Returns:
@@ -236,9 +300,10 @@ class RFC2579DateTime(interface.DateTimeValues):
     if self._number_of_seconds is None:
       return None
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:01d}'.format(
+    date_time_string = self._FormatDateTimeString(
         self._year, self._month, self._day_of_month, self._hours, self._minutes,
-        self._seconds, self._deciseconds)
+        self._seconds)
+    return '{0:s}.{1:01d}'.format(date_time_string, self._deciseconds)
 
 
 factory.Factory.RegisterDateTimeValues(RFC2579DateTime)
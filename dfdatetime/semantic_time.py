@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+from dfdatetime import decorators
 from dfdatetime import factory
 from dfdatetime import interface
 
@@ -21,6 +22,8 @@ class SemanticTime(interface.DateTimeValues):
 
   _SORT_ORDER = 50
 
+  _SERIALIZED_ATTRIBUTES = ('_string', )
+
   def __init__(self, string=None):
     """Initializes a semantic time.
 
@@ -90,6 +93,17 @@ class SemanticTime(interface.DateTimeValues):
 
     return self._SORT_ORDER > other._SORT_ORDER  # pylint: disable=protected-access
 
+  def __hash__(self):
+    """Retrieves a hash of the date time values.
+
+    Returns:
+      int: hash of the date time values.
+
+    Raises:
+      TypeError: if the date time values are not frozen.
+    """
+    return super(SemanticTime, self).__hash__()
+
   def __le__(self, other):
     """Determines if the date time values are greater than or equal to other.
 
@@ -155,6 +169,7 @@ class SemanticTime(interface.DateTimeValues):
     """
     return None
 
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies semantic time from a date and time string.
 
@@ -167,7 +182,7 @@ class SemanticTime(interface.DateTimeValues):
     """
     self._string = time_string
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the date time value to a date and time string.
 
     Returns:
@@ -202,6 +217,14 @@ class SemanticTime(interface.DateTimeValues):
     """
     return 0
 
+  def GetSortKey(self):
+    """Retrieves a key to sort date time values.
+
+    Returns:
+      tuple[int, int]: sort key group and sort order within the group.
+    """
+    return self._SORT_KEY_GROUP_SEMANTIC, self._SORT_ORDER
+
 
 class InvalidTime(SemanticTime):
   """Semantic time that represents invalid."""
@@ -267,6 +290,17 @@ class Never(SemanticTime):
 
     return not isinstance(other, Never)
 
+  def __hash__(self):
+    """Retrieves a hash of the date time values.
+
+    Returns:
+      int: hash of the date time values.
+
+    Raises:
+      TypeError: if the date time values are not frozen.
+    """
+    return super(Never, self).__hash__()
+
   def __le__(self, other):
     """Determines if the date time values are less than or equal to other.
 
@@ -312,6 +346,14 @@ class Never(SemanticTime):
     """
     return not isinstance(other, Never)
 
+  def GetSortKey(self):
+    """Retrieves a key to sort date time values.
+
+    Returns:
+      tuple[int, int]: sort key group and sort order within the group.
+    """
+    return self._SORT_KEY_GROUP_NEVER, self._SORT_ORDER
+
 
 class NotSet(SemanticTime):
   """Semantic time that represents not set."""
@@ -0,0 +1,567 @@
+# -*- coding: utf-8 -*-
+"""Compact binary and dictionary serialization of date and time values.
+
+A serialized date and time value consists of the format version, 1 byte,
+followed by a record. Packed date and time values consist of the signature
+"dfdt", the format version, 1 byte, and a record per date and time value.
+
+A record consists of:
+* type reference, varint, where:
+  * an odd value contains the type code of the date and time values type,
+    as (type code << 1) | 1, which is 1 byte for the built-in types;
+  * 0 is followed by the type name, as a varint size and ASCII string, of
+    a date and time values type without a type code, as registered in
+    the factory;
+  * an even value larger than 0 refers to the type name of a previous record
+    in the same buffer, as index << 1, where 1 represents the first type name;
+* flags, 1 byte, where 0x01 indicates the date and time value is in local
+  time and 0x02 that the time zone offset is stored;
+* precision code, 1 byte, where 0 represents no precision;
+* time zone offset in number of minutes from UTC, zig-zag varint, only if
+  flag 0x02 is set;
+* number of values, varint, followed by the values of the serialized
+  attributes of the date and time values type.
+
+A value consists of a tag, 1 byte, followed by data that depends on the tag:
+* 0 (None): no data;
+* 1 (integer): zig-zag varint;
+* 2 (floating-point): 64-bit big-endian IEEE 754 value;
+* 3 (decimal.Decimal) and 4 (string): varint size and UTF-8 string;
+* 5 (tuple): varint number of values followed by the values.
+
+Since the raw values, such as the timestamp, are stored instead of a derived
+representation, deserialization preserves the exact original representation.
+"""
+
+from __future__ import unicode_literals
+
+import decimal
+import struct
+
+from dfdatetime import definitions
+from dfdatetime import factory
+
+
+_FORMAT_VERSION = 1
+
+_PACKED_SIGNATURE = b'dfdt'
+
+_FLAG_IS_LOCAL_TIME = 0x01
+_FLAG_HAS_TIME_ZONE_OFFSET = 0x02
+
+_PRECISION_CODES = {
+    definitions.PRECISION_1_DAY: 1,
+    definitions.PRECISION_1_HOUR: 2,
+    definitions.PRECISION_1_NANOSECOND: 3,
+    definitions.PRECISION_100_NANOSECONDS: 4,
+    definitions.PRECISION_1_MICROSECOND: 5,
+    definitions.PRECISION_1_MILLISECOND: 6,
+    definitions.PRECISION_100_MILLISECONDS: 7,
+    definitions.PRECISION_1_MINUTE: 8,
+    definitions.PRECISION_1_SECOND: 9,
+    definitions.PRECISION_2_SECONDS: 10}
+
+_PRECISIONS = {code: precision for precision, code in _PRECISION_CODES.items()}
+
+# The type codes are stored in the serialized data and therefore must not
+# change. A new date and time values type must be added with a new type code.
+_TYPE_CODES = {
+    'APFSTime': 1,
+    'CocoaTime': 2,
+    'DelphiDateTime': 3,
+    'FATDateTime': 4,
+    'Filetime': 5,
+    'HFSTime': 6,
+    'InvalidTime': 7,
+    'JavaTime': 8,
+    'Never': 9,
+    'NotSet': 10,
+    'OLEAutomationDate': 11,
+    'PosixTime': 12,
+    'PosixTimeInMicroseconds': 13,
+    'PosixTimeInMilliseconds': 14,
+    'PosixTimeInNanoseconds': 15,
+    'RFC2579DateTime': 16,
+    'SemanticTime': 17,
+    'Systemtime': 18,
+    'TimeElements': 19,
+    'TimeElementsInMicroseconds': 20,
+    'TimeElementsInMilliseconds': 21,
+    'UUIDTime': 22,
+    'WebKitTime': 23}
+
+_TYPE_NAMES = {code: type_name for type_name, code in _TYPE_CODES.items()}
+
+_VALUE_TAG_NONE = 0
+_VALUE_TAG_INTEGER = 1
+_VALUE_TAG_FLOAT = 2
+_VALUE_TAG_DECIMAL = 3
+_VALUE_TAG_STRING = 4
+_VALUE_TAG_TUPLE = 5
+
+_FLOAT_STRUCT = struct.Struct('>d')
+
+
+def _ReadRecord(data, offset, date_time_values_types):
+  """Reads a record.
+
+  Args:
+    data (bytes): data.
+    offset (int): offset of the record in the data.
+    date_time_values_types (list[type]): date and time values types, without
+        a type code, of previous records in the same buffer, to which the type
+        of the record is appended if its type name is stored in the record.
+
+  Returns:
+    tuple[DateTimeValues, int]: date and time values and offset after
+        the record.
+
+  Raises:
+    KeyError: if the date and time values type is not registered.
+    ValueError: if the data is truncated or invalid.
+  """
+  type_reference, offset = _ReadVarint(data, offset)
+  if type_reference & 1:
+    type_name = _TYPE_NAMES.get(type_reference >> 1, None)
+    if not type_name:
+      raise ValueError('Unsupported type code: {0:d}.'.format(
+          type_reference >> 1))
+
+    date_time_values_type = factory.Factory.GetDateTimeValuesType(type_name)
+
+  elif type_reference == 0:
+    type_name, offset = _ReadString(data, offset)
+    date_time_values_type = factory.Factory.GetDateTimeValuesType(type_name)
+    date_time_values_types.append(date_time_values_type)
+
+  elif (type_reference >> 1) <= len(date_time_values_types):
+    date_time_values_type = date_time_values_types[(type_reference >> 1) - 1]
+
+  else:
+    raise ValueError('Invalid type reference: {0:d}.'.format(type_reference))
+
+  if offset + 2 > len(data):
+    raise ValueError('Truncated record at offset: {0:d}.'.format(offset))
+
+  flags = data[offset]
+  precision_code = data[offset + 1]
+  offset += 2
+
+  if precision_code and precision_code not in _PRECISIONS:
+    raise ValueError('Unsupported precision code: {0:d}.'.format(
+        precision_code))
+
+  time_zone_offset = None
+  if flags & _FLAG_HAS_TIME_ZONE_OFFSET:
+    time_zone_offset, offset = _ReadVarint(data, offset)
+    if time_zone_offset & 1:
+      time_zone_offset = -((time_zone_offset + 1) >> 1)
+    else:
+      time_zone_offset >>= 1
+
+  number_of_values, offset = _ReadVarint(data, offset)
+
+  # pylint: disable=protected-access
+  attribute_names = date_time_values_type._SERIALIZED_ATTRIBUTES
+  if number_of_values != len(attribute_names):
+    raise ValueError(
+        'Unsupported number of values: {0:d} for type: {1:s}.'.format(
+            number_of_values, date_time_values_type.__name__))
+
+  date_time_values = date_time_values_type()
+  for attribute_name in attribute_names:
+    value, offset = _ReadValue(data, offset)
+    setattr(date_time_values, attribute_name, value)
+
+  date_time_values._precision = _PRECISIONS.get(precision_code, None)
+  date_time_values._time_zone_offset = time_zone_offset
+  date_time_values.is_local_time = bool(flags & _FLAG_IS_LOCAL_TIME)
+
+  return date_time_values, offset
+
+
+def _ReadString(data, offset):
+  """Reads a varint size prefixed UTF-8 string.
+
+  Args:
+    data (bytes): data.
+    offset (int): offset of the string in the data.
+
+  Returns:
+    tuple[str, int]: string and offset after the string.
+
+  Raises:
+    ValueError: if the data is truncated or invalid.
+  """
+  size, offset = _ReadVarint(data, offset)
+  end_offset = offset + size
+  if end_offset > len(data):
+    raise ValueError('Truncated string at offset: {0:d}.'.format(offset))
+
+  try:
+    string = bytes(data[offset:end_offset]).decode('utf-8')
+  except UnicodeDecodeError:
+    raise ValueError('Invalid string at offset: {0:d}.'.format(offset))
+
+  return string, end_offset
+
+
+def _ReadValue(data, offset):
+  """Reads a tagged value.
+
+  Args:
+    data (bytes): data.
+    offset (int): offset of the value in the data.
+
+  Returns:
+    tuple[object, int]: value and offset after the value.
+
+  Raises:
+    ValueError: if the data is truncated or invalid.
+  """
+  if offset >= len(data):
+    raise ValueError('Truncated value at offset: {0:d}.'.format(offset))
+
+  value_tag = data[offset]
+  offset += 1
+
+  if value_tag == _VALUE_TAG_NONE:
+    return None, offset
+
+  if value_tag == _VALUE_TAG_INTEGER:
+    value, offset = _ReadVarint(data, offset)
+    if value & 1:
+      return -((value + 1) >> 1), offset
+    return value >> 1, offset
+
+  if value_tag == _VALUE_TAG_FLOAT:
+    end_offset = offset + _FLOAT_STRUCT.size
+    if end_offset > len(data):
+      raise ValueError('Truncated value at offset: {0:d}.'.format(offset))
+
+    value = _FLOAT_STRUCT.unpack_from(data, offset)[0]
+    return value, end_offset
+
+  if value_tag in (_VALUE_TAG_DECIMAL, _VALUE_TAG_STRING):
+    string, offset = _ReadString(data, offset)
+    if value_tag == _VALUE_TAG_STRING:
+      return string, offset
+
+    try:
+      return decimal.Decimal(string), offset
+    except decimal.InvalidOperation:
+      raise ValueError('Invalid decimal value: {0:s}.'.format(string))
+
+  if value_tag == _VALUE_TAG_TUPLE:
+    number_of_values, offset = _ReadVarint(data, offset)
+
+    values = []
+    for _ in range(number_of_values):
+      value, offset = _ReadValue(data, offset)
+      values.append(value)
+
+    return tuple(values), offset
+
+  raise ValueError('Unsupported value tag: {0:d}.'.format(value_tag))
+
+
+def _ReadVarint(data, offset):
+  """Reads an unsigned variable-length integer.
+
+  Args:
+    data (bytes): data.
+    offset (int): offset of the varint in the data.
+
+  Returns:
+    tuple[int, int]: integer and offset after the varint.
+
+  Raises:
+    ValueError: if the data is truncated.
+  """
+  data_size = len(data)
+
+  value = 0
+  shift = 0
+  while offset < data_size:
+    byte_value = data[offset]
+    offset += 1
+
+    value |= (byte_value & 0x7f) << shift
+    if byte_value < 0x80:
+      return value, offset
+
+    shift += 7
+
+  raise ValueError('Truncated varint at offset: {0:d}.'.format(offset))
+
+
+def _WriteRecord(buffer, date_time_values, type_references):
+  """Writes a record.
+
+  Args:
+    buffer (bytearray): buffer to write to.
+    date_time_values (DateTimeValues): date and time values.
+    type_references (dict[type, int]): type references of the date and time
+        values types, without a type code, of previous records in the same
+        buffer, to which the type of the record is added if it is not yet
+        referenced.
+
+  Raises:
+    ValueError: if the precision or a value is not supported.
+  """
+  # pylint: disable=protected-access
+  date_time_values_type = type(date_time_values)
+
+  type_name = date_time_values_type.__name__
+
+  type_code = _TYPE_CODES.get(type_name, None)
+  if type_code:
+    _WriteVarint(buffer, (type_code << 1) | 1)
+
+  else:
+    type_reference = type_references.get(date_time_values_type, None)
+    if type_reference:
+      _WriteVarint(buffer, type_reference << 1)
+    else:
+      type_references[date_time_values_type] = len(type_references) + 1
+      buffer.append(0)
+      _WriteString(buffer, type_name)
+
+  precision = date_time_values._precision
+  precision_code = 0
+  if precision:
+    precision_code = _PRECISION_CODES.get(precision, None)
+    if not precision_code:
+      raise ValueError('Unsupported precision: {0!s}.'.format(precision))
+
+  time_zone_offset = date_time_values._time_zone_offset
+
+  flags = 0
+  if date_time_values.is_local_time:
+    flags |= _FLAG_IS_LOCAL_TIME
+  if time_zone_offset is not None:
+    flags |= _FLAG_HAS_TIME_ZONE_OFFSET
+
+  buffer.append(flags)
+  buffer.append(precision_code)
+
+  if time_zone_offset is not None:
+    if time_zone_offset < 0:
+      _WriteVarint(buffer, (-time_zone_offset << 1) - 1)
+    else:
+      _WriteVarint(buffer, time_zone_offset << 1)
+
+  attribute_names = date_time_values_type._SERIALIZED_ATTRIBUTES
+  _WriteVarint(buffer, len(attribute_names))
+  for attribute_name in attribute_names:
+    _WriteValue(buffer, getattr(date_time_values, attribute_name))
+
+
+def _WriteString(buffer, string):
+  """Writes a varint size prefixed UTF-8 string.
+
+  Args:
+    buffer (bytearray): buffer to write to.
+    string (str): string.
+  """
+  encoded_string = string.encode('utf-8')
+  _WriteVarint(buffer, len(encoded_string))
+  buffer.extend(encoded_string)
+
+
+def _WriteValue(buffer, value):
+  """Writes a tagged value.
+
+  Args:
+    buffer (bytearray): buffer to write to.
+    value (object): value, which must be None, an integer, a floating-point,
+        a decimal.Decimal, a string or a tuple of these.
+
+  Raises:
+    ValueError: if the value is not supported.
+  """
+  if value is None:
+    buffer.append(_VALUE_TAG_NONE)
+
+  elif isinstance(value, int) and not isinstance(value, bool):
+    buffer.append(_VALUE_TAG_INTEGER)
+    if value < 0:
+      _WriteVarint(buffer, (-value << 1) - 1)
+    else:
+      _WriteVarint(buffer, value << 1)
+
+  elif isinstance(value, float):
+    buffer.append(_VALUE_TAG_FLOAT)
+    buffer.extend(_FLOAT_STRUCT.pack(value))
+
+  elif isinstance(value, decimal.Decimal):
+    buffer.append(_VALUE_TAG_DECIMAL)
+    _WriteString(buffer, str(value))
+
+  elif isinstance(value, str):
+    buffer.append(_VALUE_TAG_STRING)
+    _WriteString(buffer, value)
+
+  elif isinstance(value, tuple):
+    buffer.append(_VALUE_TAG_TUPLE)
+    _WriteVarint(buffer, len(value))
+    for element in value:
+      _WriteValue(buffer, element)
+
+  else:
+    raise ValueError('Unsupported value type: {0:s}.'.format(
+        type(value).__name__))
+
+
+def _WriteVarint(buffer, value):
+  """Writes an unsigned variable-length integer.
+
+  Args:
+    buffer (bytearray): buffer to write to.
+    value (int): integer, which must be 0 or greater.
+  """
+  while value > 0x7f:
+    buffer.append((value & 0x7f) | 0x80)
+    value >>= 7
+
+  buffer.append(value)
+
+
+def CopyFromDicts(date_time_values_dicts):
+  """Creates date and time values from dictionaries.
+
+  Args:
+    date_time_values_dicts (Iterable[dict[str, object]]): date and time
+        values, as created by DateTimeValues.CopyToDict.
+
+  Returns:
+    list[DateTimeValues]: date and time values.
+
+  Raises:
+    KeyError: if a date and time values type is not registered.
+    ValueError: if a dictionary contains an unsupported value.
+  """
+  date_time_values_types = {}
+
+  date_time_values_list = []
+  for date_time_values_dict in date_time_values_dicts:
+    class_name = date_time_values_dict.get('__class_name__', None) or ''
+
+    date_time_values_type = date_time_values_types.get(class_name, None)
+    if not date_time_values_type:
+      date_time_values_type = factory.Factory.GetDateTimeValuesType(class_name)
+      date_time_values_types[class_name] = date_time_values_type
+
+    date_time_values = date_time_values_type()
+    date_time_values.CopyFromDict(date_time_values_dict)
+    date_time_values_list.append(date_time_values)
+
+  return date_time_values_list
+
+
+def CopyToDicts(date_time_values_list):
+  """Copies date and time values to dictionaries.
+
+  Args:
+    date_time_values_list (Iterable[DateTimeValues]): date and time values.
+
+  Returns:
+    list[dict[str, object]]: date and time values, as created by
+        DateTimeValues.CopyToDict.
+  """
+  return [
+      date_time_values.CopyToDict()
+      for date_time_values in date_time_values_list]
+
+
+def Deserialize(data):
+  """Deserializes date and time values.
+
+  Args:
+    data (bytes): serialized date and time values.
+
+  Returns:
+    DateTimeValues: date and time values.
+
+  Raises:
+    KeyError: if the date and time values type is not registered.
+    ValueError: if the data is truncated or not supported.
+  """
+  if not data or data[0] != _FORMAT_VERSION:
+    raise ValueError('Unsupported format version.')
+
+  date_time_values, offset = _ReadRecord(data, 1, [])
+  if offset != len(data):
+    raise ValueError('Trailing data at offset: {0:d}.'.format(offset))
+
+  return date_time_values
+
+
+def PackMany(date_time_values_list):
+  """Packs multiple date and time values.
+
+  The type name of a date and time values type without a type code is only
+  stored once.
+
+  Args:
+    date_time_values_list (Iterable[DateTimeValues]): date and time values.
+
+  Returns:
+    bytes: packed date and time values.
+
+  Raises:
+    ValueError: if the precision or a value is not supported.
+  """
+  buffer = bytearray(_PACKED_SIGNATURE)
+  buffer.append(_FORMAT_VERSION)
+
+  type_references = {}
+  for date_time_values in date_time_values_list:
+    _WriteRecord(buffer, date_time_values, type_references)
+
+  return bytes(buffer)
+
+
+def Serialize(date_time_values):
+  """Serializes date and time values.
+
+  Args:
+    date_time_values (DateTimeValues): date and time values.
+
+  Returns:
+    bytes: serialized date and time values.
+
+  Raises:
+    ValueError: if the precision or a value is not supported.
+  """
+  buffer = bytearray([_FORMAT_VERSION])
+  _WriteRecord(buffer, date_time_values, {})
+  return bytes(buffer)
+
+
+def UnpackMany(data):
+  """Unpacks multiple date and time values.
+
+  Args:
+    data (bytes): packed date and time values.
+
+  Yields:
+    DateTimeValues: date and time values.
+
+  Raises:
+    KeyError: if a date and time values type is not registered.
+    ValueError: if the data is truncated or not supported.
+  """
+  signature_size = len(_PACKED_SIGNATURE)
+  if (bytes(data[:signature_size]) != _PACKED_SIGNATURE or
+      len(data) <= signature_size or data[signature_size] != _FORMAT_VERSION):
+    raise ValueError('Unsupported packed data.')
+
+  data_size = len(data)
+  date_time_values_types = []
+
+  offset = signature_size + 1
+  while offset < data_size:
+    date_time_values, offset = _ReadRecord(
+        data, offset, date_time_values_types)
+    yield date_time_values
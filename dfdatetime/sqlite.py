@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""SQLite storage of date and time values.
+
+Date and time values are stored in 2 columns:
+* an INTEGER column with the normalized timestamp, in number of nanoseconds
+  since 1970-01-01 00:00:00 UTC, that is used for sorting and range scans
+  with a B-tree index, where the normalized timestamps outside the range of
+  a signed 64-bit integer share the minimum or maximum key;
+* a DFDATETIME column with the compact binary serialization of the date and
+  time values, which preserves the exact original representation.
+
+The DFDATETIME column is converted back into date and time values when
+the connection is created with detect_types=sqlite3.PARSE_DECLTYPES and
+RegisterAdaptersAndConverters was called.
+"""
+
+from __future__ import unicode_literals
+
+import operator
+import re
+import sqlite3
+
+from dfdatetime import factory
+from dfdatetime import interface
+from dfdatetime import serializer
+
+
+DECLARED_TYPE = 'DFDATETIME'
+
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][0-9A-Za-z_]*$')
+
+# pylint: disable=protected-access
+_INT64_MIN = interface.DateTimeValues._INT64_MIN
+_INT64_MAX = interface.DateTimeValues._INT64_MAX
+
+
+def _CheckIdentifier(identifier):
+  """Checks if an identifier, such as a table or column name, is supported.
+
+  Args:
+    identifier (str): identifier.
+
+  Raises:
+    ValueError: if the identifier is not supported.
+  """
+  if not _IDENTIFIER_RE.match(identifier or ''):
+    raise ValueError('Unsupported identifier: {0!s}.'.format(identifier))
+
+
+def _ReadDateTimeValues(cursor):
+  """Reads date and time values from the rows of a cursor.
+
+  Args:
+    cursor (sqlite3.Cursor): SQLite cursor, where the first column of every
+        row contains the serialized date and time values.
+
+  Yields:
+    DateTimeValues: date and time values.
+  """
+  for row in cursor:
+    date_time_values = row[0]
+    # The value is already converted if the connection was created with
+    # detect_types=sqlite3.PARSE_DECLTYPES.
+    if isinstance(date_time_values, bytes):
+      date_time_values = serializer.Deserialize(date_time_values)
+
+    yield date_time_values
+
+
+def _SelectClampedKey(
+    connection, table_name, key, start_timestamp, end_timestamp, key_column,
+    value_column):
+  """Selects date and time values with a clamped key in a range.
+
+  Since the key is shared by multiple normalized timestamps, the date and time
+  values are compared and sorted by their exact normalized timestamp.
+
+  Args:
+    connection (sqlite3.Connection): SQLite connection.
+    table_name (str): name of the table.
+    key (int): clamped key, which is the minimum or maximum of a signed 64-bit
+        integer.
+    start_timestamp (int): inclusive start of the range in number of
+        nanoseconds since 1970-01-01 00:00:00 UTC, where None represents no
+        start.
+    end_timestamp (int): exclusive end of the range in number of nanoseconds
+        since 1970-01-01 00:00:00 UTC, where None represents no end.
+    key_column (str): name of the column that contains the normalized
+        timestamp.
+    value_column (str): name of the column that contains the serialized date
+        and time values.
+
+  Returns:
+    list[DateTimeValues]: date and time values, sorted by normalized
+        timestamp.
+  """
+  cursor = connection.execute(
+      'SELECT {0:s} FROM {1:s} WHERE {2:s} = ?'.format(
+          value_column, table_name, key_column), (key, ))
+
+  matches = []
+  for date_time_values in _ReadDateTimeValues(cursor):
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())
+    if ((start_timestamp is None or normalized_timestamp >= start_timestamp) and
+        (end_timestamp is None or normalized_timestamp < end_timestamp)):
+      matches.append((normalized_timestamp, date_time_values))
+
+  matches.sort(key=operator.itemgetter(0))
+  return [date_time_values for _, date_time_values in matches]
+
+
+def AdaptDateTimeValues(date_time_values):
+  """Adapts date and time values to a SQLite value.
+
+  Args:
+    date_time_values (DateTimeValues): date and time values.
+
+  Returns:
+    bytes: compact binary serialization of the date and time values.
+  """
+  return serializer.Serialize(date_time_values)
+
+
+def ConvertDateTimeValues(data):
+  """Converts a SQLite value to date and time values.
+
+  Args:
+    data (bytes): compact binary serialization of date and time values.
+
+  Returns:
+    DateTimeValues: date and time values.
+
+  Raises:
+    KeyError: if the date and time values type is not registered.
+    ValueError: if the data is truncated or not supported.
+  """
+  return serializer.Deserialize(data)
+
+
+def CreateTable(connection, table_name, key_column='timestamp',
+                value_column='date_time_values'):
+  """Creates a table to store date and time values with an indexed key.
+
+  Args:
+    connection (sqlite3.Connection): SQLite connection.
+    table_name (str): name of the table.
+    key_column (Optional[str]): name of the column that contains
+        the normalized timestamp.
+    value_column (Optional[str]): name of the column that contains
+        the serialized date and time values.
+
+  Raises:
+    ValueError: if the table or a column name is not supported.
+  """
+  for identifier in (table_name, key_column, value_column):
+    _CheckIdentifier(identifier)
+
+  connection.execute(
+      'CREATE TABLE IF NOT EXISTS {0:s} ({1:s} INTEGER, {2:s} {3:s})'.format(
+          table_name, key_column, value_column, DECLARED_TYPE))
+  connection.execute(
+      'CREATE INDEX IF NOT EXISTS {0:s}_{1:s}_index ON {0:s} ({1:s})'.format(
+          table_name, key_column))
+
+
+def GetKey(date_time_values):
+  """Retrieves the key of date and time values.
+
+  The key is the normalized timestamp in number of nanoseconds since
+  1970-01-01 00:00:00 UTC, clamped to the range of a signed 64-bit integer,
+  approximately 1677-09-21 to 2262-04-11, so that it can be stored in
+  a SQLite INTEGER. SelectRange compares date and time values with a clamped
+  key by their exact normalized timestamp.
+
+  Args:
+    date_time_values (DateTimeValues): date and time values.
+
+  Returns:
+    int: key or None if the date and time values do not have a timestamp.
+  """
+  normalized_timestamp = date_time_values._GetNormalizedTimestampInNanoseconds()
+  if normalized_timestamp is None:
+    return None
+
+  return max(_INT64_MIN, min(normalized_timestamp, _INT64_MAX))
+
+
+def InsertMany(connection, table_name, date_time_values_list,
+               key_column='timestamp', value_column='date_time_values'):
+  """Inserts multiple date and time values.
+
+  The rows are generated while they are inserted, so that the date and time
+  values do not need to be stored in an intermediate list.
+
+  Args:
+    connection (sqlite3.Connection): SQLite connection.
+    table_name (str): name of the table.
+    date_time_values_list (Iterable[DateTimeValues]): date and time values.
+    key_column (Optional[str]): name of the column that contains
+        the normalized timestamp.
+    value_column (Optional[str]): name of the column that contains
+        the serialized date and time values.
+
+  Raises:
+    ValueError: if the table or a column name is not supported.
+  """
+  for identifier in (table_name, key_column, value_column):
+    _CheckIdentifier(identifier)
+
+  rows = (
+      (GetKey(date_time_values), serializer.Serialize(date_time_values))
+      for date_time_values in date_time_values_list)
+
+  connection.executemany(
+      'INSERT INTO {0:s} ({1:s}, {2:s}) VALUES (?, ?)'.format(
+          table_name, key_column, value_column), rows)
+
+
+def RegisterAdaptersAndConverters():
+  """Registers the SQLite adapters and converter.
+
+  An adapter is registered for every date and time values type that is
+  registered in the factory, since SQLite adapters do not apply to
+  subclasses.
+  """
+  for date_time_values_type in factory.Factory.GetDateTimeValuesTypes():
+    sqlite3.register_adapter(date_time_values_type, AdaptDateTimeValues)
+
+  sqlite3.register_converter(DECLARED_TYPE, ConvertDateTimeValues)
+
+
+def SelectRange(connection, table_name, start=None, end=None,
+                key_column='timestamp', value_column='date_time_values'):
+  """Selects date and time values in a range, sorted by normalized timestamp.
+
+  Args:
+    connection (sqlite3.Connection): SQLite connection.
+    table_name (str): name of the table.
+    start (Optional[DateTimeValues]): inclusive start of the range, where None
+        represents no start.
+    end (Optional[DateTimeValues]): exclusive end of the range, where None
+        represents no end.
+    key_column (Optional[str]): name of the column that contains
+        the normalized timestamp.
+    value_column (Optional[str]): name of the column that contains
+        the serialized date and time values.
+
+  Yields:
+    DateTimeValues: date and time values.
+
+  Raises:
+    ValueError: if the table or a column name is not supported or the start
+        or end does not have a timestamp.
+  """
+  for identifier in (table_name, key_column, value_column):
+    _CheckIdentifier(identifier)
+
+  start_timestamp = None
+  if start is not None:
+    start_timestamp = start._GetNormalizedTimestampInNanoseconds()
+    if start_timestamp is None:
+      raise ValueError('Unsupported range without timestamp.')
+
+  end_timestamp = None
+  if end is not None:
+    end_timestamp = end._GetNormalizedTimestampInNanoseconds()
+    if end_timestamp is None:
+      raise ValueError('Unsupported range without timestamp.')
+
+  if start_timestamp is None or start_timestamp <= _INT64_MIN:
+    yield from _SelectClampedKey(
+        connection, table_name, _INT64_MIN, start_timestamp, end_timestamp,
+        key_column, value_column)
+
+  # The keys that are not clamped are compared and sorted by the index.
+  conditions = ['{0:s} > ?'.format(key_column), '{0:s} < ?'.format(key_column)]
+  parameters = [_INT64_MIN, _INT64_MAX]
+
+  for normalized_timestamp, comparison in (
+      (start_timestamp, '>='), (end_timestamp, '<')):
+    if normalized_timestamp is not None:
+      conditions.append('{0:s} {1:s} ?'.format(key_column, comparison))
+      parameters.append(
+          max(_INT64_MIN, min(normalized_timestamp, _INT64_MAX)))
+
+  cursor = connection.execute(
+      'SELECT {0:s} FROM {1:s} WHERE {2:s} ORDER BY {3:s}'.format(
+          value_column, table_name, ' AND '.join(conditions), key_column),
+      parameters)
+
+  yield from _ReadDateTimeValues(cursor)
+
+  if end_timestamp is None or end_timestamp > _INT64_MAX:
+    yield from _SelectClampedKey(
+        connection, table_name, _INT64_MAX, start_timestamp, end_timestamp,
+        key_column, value_column)
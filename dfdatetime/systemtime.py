@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -37,8 +38,14 @@ class Systemtime(interface.DateTimeValues):
     milliseconds (int): milliseconds, 0 through 999.
   """
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
   # TODO: make attributes read-only.
 
+  _SERIALIZED_ATTRIBUTES = (
+      'year', 'month', 'day_of_week', 'day_of_month', 'hours', 'minutes',
+      'seconds', 'milliseconds', '_number_of_seconds')
+
   def __init__(self, system_time_tuple=None):
     """Initializes a SYSTEMTIME structure.
 
@@ -107,6 +114,53 @@ class Systemtime(interface.DateTimeValues):
           self.year, self.month, self.day_of_month, self.hours, self.minutes,
           self.seconds, self._time_zone_offset)
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a SYSTEMTIME structure from a normalized timestamp.
+
+    The SYSTEMTIME structure is determined in the time zone of the SYSTEMTIME
+    structure.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      Systemtime: SYSTEMTIME structure.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the precision or the year is out of bounds.
+    """
+    number_of_seconds, nanoseconds = divmod(
+        normalized_timestamp, definitions.NANOSECONDS_PER_SECOND)
+
+    milliseconds, remainder = divmod(
+        nanoseconds, definitions.NANOSECONDS_PER_MILLISECOND)
+    if remainder:
+      raise ValueError((
+          'Normalized timestamp: {0:d} ns is not a multiple of the precision '
+          'of {1:s}.').format(normalized_timestamp, type(self).__name__))
+
+    year, month, day_of_month, hours, minutes, seconds = (
+        self._GetTimeElementsFromNumberOfSeconds(
+            number_of_seconds, self._time_zone_offset))
+
+    # January 1, 1970 was a Thursday, where 0 represents Sunday.
+    number_of_days, _, _, _ = self._GetTimeValues(
+        number_of_seconds + ((self._time_zone_offset or 0) * 60))
+    day_of_week = (number_of_days + 4) % 7
+
+    systemtime = type(self)(system_time_tuple=(
+        year, month, day_of_week, day_of_month, hours, minutes, seconds,
+        milliseconds))
+
+    # The time elements are in the time zone, hence the number of seconds,
+    # which is in UTC, and the time zone offset are set separately.
+    systemtime._number_of_seconds = number_of_seconds  # pylint: disable=protected-access
+    systemtime._time_zone_offset = self._time_zone_offset  # pylint: disable=protected-access
+
+    return systemtime
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -125,6 +179,24 @@ class Systemtime(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if self._number_of_seconds is None:
+      return None
+
+    normalized_timestamp = (
+        self._number_of_seconds * definitions.NANOSECONDS_PER_SECOND)
+    normalized_timestamp += (
+        self.milliseconds * definitions.NANOSECONDS_PER_MILLISECOND)
+    return normalized_timestamp
+
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a SYSTEMTIME structure from a date and time string.
 
@@ -157,7 +229,7 @@ class Systemtime(interface.DateTimeValues):
     if year < 1601 or year > 30827:
       raise ValueError('Unsupported year value: {0:d}.'.format(year))
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._number_of_seconds = self._GetNumberOfSecondsFromElements(
         year, month, day_of_month, hours, minutes, seconds, time_zone_offset)
     self._time_zone_offset = time_zone_offset
@@ -172,7 +244,7 @@ class Systemtime(interface.DateTimeValues):
     self.seconds = seconds
     self.milliseconds = milliseconds
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the SYSTEMTIME structure to a date and time string.
 
     Returns:
@@ -182,9 +254,10 @@ class Systemtime(interface.DateTimeValues):
     if self._number_of_seconds is None:
       return None
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:03d}'.format(
+    date_time_string = self._FormatDateTimeString(
         self.year, self.month, self.day_of_month, self.hours, self.minutes,
-        self.seconds, self.milliseconds)
+        self.seconds)
+    return '{0:s}.{1:03d}'.format(date_time_string, self.milliseconds)
 
 
 factory.Factory.RegisterDateTimeValues(Systemtime)
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -76,6 +77,10 @@ class TimeElements(interface.DateTimeValues):
 
   _RFC_WEEKDAYS = frozenset(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
+  _SERIALIZED_ATTRIBUTES = ('_time_elements_tuple', '_number_of_seconds')
+
   def __init__(self, time_elements_tuple=None):
     """Initializes time elements.
 
@@ -119,6 +124,19 @@ class TimeElements(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if self._number_of_seconds is None:
+      return None
+
+    return self._number_of_seconds * definitions.NANOSECONDS_PER_SECOND
+
   def _CopyDateTimeFromStringISO8601(self, time_string):
     """Copies a date and time from an ISO 8601 date and time string.
 
@@ -351,7 +369,7 @@ class TimeElements(interface.DateTimeValues):
     seconds = date_time_values.get('seconds', 0)
     time_zone_offset = date_time_values.get('time_zone_offset', 0)
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._number_of_seconds = self._GetNumberOfSecondsFromElements(
         year, month, day_of_month, hours, minutes, seconds, time_zone_offset)
     self._time_elements_tuple = (
@@ -613,6 +631,50 @@ class TimeElements(interface.DateTimeValues):
 
     return hours, minutes, seconds, time_zone_offset
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates time elements of the same type from a normalized timestamp.
+
+    The time elements are determined in the time zone of the time elements.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      TimeElements: time elements of the same type.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the precision of the time elements.
+    """
+    nanoseconds_per_precision = definitions.NANOSECONDS_PER_PRECISION.get(
+        self._precision, None)
+    if (not nanoseconds_per_precision or
+        normalized_timestamp % nanoseconds_per_precision):
+      raise ValueError((
+          'Normalized timestamp: {0:d} ns is not a multiple of the precision '
+          'of {1:s}.').format(normalized_timestamp, type(self).__name__))
+
+    number_of_seconds, nanoseconds = divmod(
+        normalized_timestamp, definitions.NANOSECONDS_PER_SECOND)
+
+    year, month, day_of_month, hours, minutes, seconds = (
+        self._GetTimeElementsFromNumberOfSeconds(
+            number_of_seconds, self._time_zone_offset))
+
+    time_elements = type(self)()
+    time_elements._CopyFromDateTimeValues({  # pylint: disable=protected-access
+        'year': year,
+        'month': month,
+        'day_of_month': day_of_month,
+        'hours': hours,
+        'minutes': minutes,
+        'seconds': seconds,
+        'microseconds': nanoseconds // definitions.NANOSECONDS_PER_MICROSECOND,
+        'time_zone_offset': self._time_zone_offset})
+
+    return time_elements
+
   @property
   def day_of_month(self):
     """int: day of month or None if not set."""
@@ -655,6 +717,7 @@ class TimeElements(interface.DateTimeValues):
       return None
     return self._time_elements_tuple[0]
 
+  @decorators.not_frozen
   def CopyFromDatetime(self, datetime_object):
     """Copies time elements from a Python datetime object.
 
@@ -678,6 +741,7 @@ class TimeElements(interface.DateTimeValues):
 
     self.is_local_time = bool(datetime_object.tzinfo is None)
 
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies time elements from a date and time string.
 
@@ -694,6 +758,7 @@ class TimeElements(interface.DateTimeValues):
 
     self._CopyFromDateTimeValues(date_time_values)
 
+  @decorators.not_frozen
   def CopyFromStringISO8601(self, time_string):
     """Copies time elements from an ISO 8601 date and time string.
 
@@ -720,6 +785,7 @@ class TimeElements(interface.DateTimeValues):
 
     self._CopyFromDateTimeValues(date_time_values)
 
+  @decorators.not_frozen
   def CopyFromStringRFC822(self, time_string):
     """Copies time elements from a RFC 822 date and time string.
 
@@ -737,6 +803,7 @@ class TimeElements(interface.DateTimeValues):
 
     self._CopyFromDateTimeValues(date_time_values)
 
+  @decorators.not_frozen
   def CopyFromStringRFC1123(self, time_string):
     """Copies time elements from a RFC 1123 date and time string.
 
@@ -754,6 +821,7 @@ class TimeElements(interface.DateTimeValues):
 
     self._CopyFromDateTimeValues(date_time_values)
 
+  @decorators.not_frozen
   def CopyFromStringTuple(self, time_elements_tuple):
     """Copies time elements from string-based time elements tuple.
 
@@ -806,14 +874,14 @@ class TimeElements(interface.DateTimeValues):
       raise ValueError('Invalid seconds value: {0!s}'.format(
           time_elements_tuple[5]))
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._number_of_seconds = self._GetNumberOfSecondsFromElements(
         year, month, day_of_month, hours, minutes, seconds,
         self._time_zone_offset)
     self._time_elements_tuple = (
         year, month, day_of_month, hours, minutes, seconds)
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the time elements to a date and time string.
 
     Returns:
@@ -823,7 +891,7 @@ class TimeElements(interface.DateTimeValues):
     if self._number_of_seconds is None:
       return None
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}'.format(
+    return self._FormatDateTimeString(
         self._time_elements_tuple[0], self._time_elements_tuple[1],
         self._time_elements_tuple[2], self._time_elements_tuple[3],
         self._time_elements_tuple[4], self._time_elements_tuple[5])
@@ -838,6 +906,13 @@ class TimeElementsWithFractionOfSecond(TimeElements):
     is_local_time (bool): True if the date and time value is in local time.
   """
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = False
+
+  _SERIALIZED_ATTRIBUTES = (
+      '_time_elements_tuple', '_number_of_seconds', 'fraction_of_second')
+
+  _SERIALIZED_DECIMAL_ATTRIBUTES = frozenset(['fraction_of_second'])
+
   def __init__(self, fraction_of_second=None, time_elements_tuple=None):
     """Initializes time elements.
 
@@ -880,6 +955,25 @@ class TimeElementsWithFractionOfSecond(TimeElements):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if self._number_of_seconds is None or self.fraction_of_second is None:
+      return None
+
+    normalized_timestamp = self.fraction_of_second * (
+        definitions.NANOSECONDS_PER_SECOND)
+    normalized_timestamp = int(normalized_timestamp.to_integral_value(
+        rounding=decimal.ROUND_FLOOR))
+    normalized_timestamp += (
+        self._number_of_seconds * definitions.NANOSECONDS_PER_SECOND)
+    return normalized_timestamp
+
   def _CopyFromDateTimeValues(self, date_time_values):
     """Copies time elements from date and time values.
 
@@ -906,7 +1000,7 @@ class TimeElementsWithFractionOfSecond(TimeElements):
     fraction_of_second = precision_helper.CopyMicrosecondsToFractionOfSecond(
         microseconds)
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._number_of_seconds = self._GetNumberOfSecondsFromElements(
         year, month, day_of_month, hours, minutes, seconds, time_zone_offset)
     self._time_elements_tuple = (
@@ -915,6 +1009,7 @@ class TimeElementsWithFractionOfSecond(TimeElements):
 
     self.fraction_of_second = fraction_of_second
 
+  @decorators.not_frozen
   def CopyFromDatetime(self, datetime_object):
     """Copies time elements from a Python datetime object.
 
@@ -933,6 +1028,7 @@ class TimeElementsWithFractionOfSecond(TimeElements):
         datetime_object.microsecond)
     self.fraction_of_second = fraction_of_second
 
+  @decorators.not_frozen
   def CopyFromStringTuple(self, time_elements_tuple):
     """Copies time elements from string-based time elements tuple.
 
@@ -964,7 +1060,7 @@ class TimeElementsWithFractionOfSecond(TimeElements):
 
     self.fraction_of_second = fraction_of_second
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the time elements to a date and time string.
 
     Returns:
@@ -995,6 +1091,8 @@ class TimeElementsInMilliseconds(TimeElementsWithFractionOfSecond):
         represents 1 millisecond (PRECISION_1_MILLISECOND).
   """
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
   def __init__(self, time_elements_tuple=None):
     """Initializes time elements.
 
@@ -1033,6 +1131,7 @@ class TimeElementsInMilliseconds(TimeElementsWithFractionOfSecond):
     """int: number of milliseconds."""
     return int(self.fraction_of_second * definitions.MILLISECONDS_PER_SECOND)
 
+  @decorators.not_frozen
   def CopyFromStringTuple(self, time_elements_tuple):
     """Copies time elements from string-based time elements tuple.
 
@@ -1082,6 +1181,8 @@ class TimeElementsInMicroseconds(TimeElementsWithFractionOfSecond):
         represents 1 microsecond (PRECISION_1_MICROSECOND).
   """
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
   def __init__(self, time_elements_tuple=None):
     """Initializes time elements.
 
@@ -1120,6 +1221,7 @@ class TimeElementsInMicroseconds(TimeElementsWithFractionOfSecond):
     """int: number of microseconds."""
     return int(self.fraction_of_second * definitions.MICROSECONDS_PER_SECOND)
 
+  @decorators.not_frozen
   def CopyFromStringTuple(self, time_elements_tuple):
     """Copies time elements from string-based time elements tuple.
 
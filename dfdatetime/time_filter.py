@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+"""Compiled time filter expressions.
+
+A time filter expression, such as "after 2019-05-01 and before
+2019-06-01T12:00:00+02:00 or never", is parsed once into functions that are
+evaluated on the normalized timestamp in nanoseconds and a semantic code of
+date and time values, instead of comparing date and time values.
+
+The expression consists of:
+* "after" and "before" followed by a date and time literal, formatted as
+  "YYYY-MM-DD hh:mm:ss.######[+-]##:##" or as an ISO 8601 date and time string,
+  where "after" matches date and time values later than the literal and
+  "before" matches date and time values earlier than the literal;
+* the semantic time names "invalid", "never" and "not set";
+* "and", "or", "not" and parentheses, where "not" binds stronger than "and",
+  which binds stronger than "or".
+
+Date and time values without a timestamp that are not semantic time, such as
+a FILETIME without a timestamp, are considered "not set".
+"""
+
+from __future__ import unicode_literals
+
+import re
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+from dfdatetime import interface
+from dfdatetime import semantic_time
+from dfdatetime import time_elements
+
+
+SEMANTIC_CODE_NONE = 0
+SEMANTIC_CODE_INVALID = 1
+SEMANTIC_CODE_NEVER = 2
+SEMANTIC_CODE_NOT_SET = 3
+
+# The smallest signed 64-bit integer represents NaT.
+_NAT = interface.DateTimeValues._INT64_MIN  # pylint: disable=protected-access
+
+_INT64_MAX = interface.DateTimeValues._INT64_MAX  # pylint: disable=protected-access
+
+_SEMANTIC_CODES_PER_STRING = {
+    'Invalid': SEMANTIC_CODE_INVALID,
+    'Never': SEMANTIC_CODE_NEVER,
+    'Not set': SEMANTIC_CODE_NOT_SET}
+
+_TIME_OF_DAY_RE = re.compile(r'^[0-9]{2}:[0-9]{2}')
+
+_TOKEN_RE = re.compile(r'\(|\)|[^\s()]+')
+
+
+def _CreateAfterFunctions(literal_timestamp):
+  """Creates the functions that match values after a literal.
+
+  Args:
+    literal_timestamp (int): normalized timestamp of the literal in number of
+        nanoseconds.
+
+  Returns:
+    tuple[function, function]: match and mask functions.
+  """
+  # Timestamps that do not fit in a signed 64-bit integer are clamped.
+  clamped_timestamp = max(min(literal_timestamp, _INT64_MAX), _NAT)
+
+  def _Match(normalized_timestamp, unused_semantic_code):
+    return (normalized_timestamp is not None and
+            normalized_timestamp > literal_timestamp)
+
+  def _Mask(normalized_timestamps, unused_semantic_codes):
+    return normalized_timestamps > clamped_timestamp
+
+  return _Match, _Mask
+
+
+def _CreateBeforeFunctions(literal_timestamp):
+  """Creates the functions that match values before a literal.
+
+  Args:
+    literal_timestamp (int): normalized timestamp of the literal in number of
+        nanoseconds.
+
+  Returns:
+    tuple[function, function]: match and mask functions.
+  """
+  # Timestamps that do not fit in a signed 64-bit integer are clamped.
+  clamped_timestamp = max(min(literal_timestamp, _INT64_MAX), _NAT)
+
+  def _Match(normalized_timestamp, unused_semantic_code):
+    return (normalized_timestamp is not None and
+            normalized_timestamp < literal_timestamp)
+
+  def _Mask(normalized_timestamps, unused_semantic_codes):
+    return ((normalized_timestamps != _NAT) &
+            (normalized_timestamps < clamped_timestamp))
+
+  return _Match, _Mask
+
+
+def _CreateSemanticFunctions(semantic_code):
+  """Creates the functions that match values with a semantic code.
+
+  Args:
+    semantic_code (int): semantic code, such as SEMANTIC_CODE_NEVER.
+
+  Returns:
+    tuple[function, function]: match and mask functions.
+  """
+  def _Match(unused_normalized_timestamp, other_semantic_code):
+    return other_semantic_code == semantic_code
+
+  def _Mask(unused_normalized_timestamps, semantic_codes):
+    return semantic_codes == semantic_code
+
+  return _Match, _Mask
+
+
+def _GetSemanticCode(date_time_values, normalized_timestamp):
+  """Retrieves the semantic code of date and time values.
+
+  Args:
+    date_time_values (DateTimeValues): date and time values.
+    normalized_timestamp (int): normalized timestamp of the date and time
+        values in number of nanoseconds or None if not available.
+
+  Returns:
+    int: semantic code.
+  """
+  if isinstance(date_time_values, semantic_time.SemanticTime):
+    return _SEMANTIC_CODES_PER_STRING.get(
+        date_time_values.string, SEMANTIC_CODE_NONE)
+
+  if normalized_timestamp is None:
+    return SEMANTIC_CODE_NOT_SET
+
+  return SEMANTIC_CODE_NONE
+
+
+class TimeFilter(object):
+  """Compiled time filter expression.
+
+  Attributes:
+    expression (str): time filter expression.
+  """
+
+  def __init__(self, expression):
+    """Initializes a time filter.
+
+    Args:
+      expression (str): time filter expression, such as "after 2019-05-01 and
+          before 2019-06-01T12:00:00+02:00 or never".
+
+    Raises:
+      ValueError: if the expression is not supported.
+    """
+    super(TimeFilter, self).__init__()
+    self._token_index = 0
+    self._tokens = _TOKEN_RE.findall(expression)
+
+    if not self._tokens:
+      raise ValueError('Missing expression.')
+
+    self._match_function, self._mask_function = self._ParseOr()
+
+    if self._token_index < len(self._tokens):
+      raise ValueError('Unsupported token: {0:s} in expression.'.format(
+          self._tokens[self._token_index]))
+
+    self._tokens = None
+
+    self.expression = expression
+
+  def _GetNextToken(self):
+    """Retrieves the next token.
+
+    Returns:
+      str: next token.
+
+    Raises:
+      ValueError: if there is no next token.
+    """
+    if self._token_index >= len(self._tokens):
+      raise ValueError('Unexpected end of expression.')
+
+    token = self._tokens[self._token_index]
+    self._token_index += 1
+    return token
+
+  def _ParseAnd(self):
+    """Parses one or more terms combined with "and".
+
+    Returns:
+      tuple[function, function]: match and mask functions.
+
+    Raises:
+      ValueError: if the expression is not supported.
+    """
+    match_functions = []
+    mask_functions = []
+
+    while True:
+      match_function, mask_function = self._ParseNot()
+      match_functions.append(match_function)
+      mask_functions.append(mask_function)
+
+      if self._PeekToken() != 'and':
+        break
+
+      self._token_index += 1
+
+    if len(match_functions) == 1:
+      return match_functions[0], mask_functions[0]
+
+    def _Match(normalized_timestamp, semantic_code):
+      return all(
+          match_function(normalized_timestamp, semantic_code)
+          for match_function in match_functions)
+
+    def _Mask(normalized_timestamps, semantic_codes):
+      mask = mask_functions[0](normalized_timestamps, semantic_codes)
+      for mask_function in mask_functions[1:]:
+        mask &= mask_function(normalized_timestamps, semantic_codes)
+      return mask
+
+    return _Match, _Mask
+
+  def _ParseLiteral(self):
+    """Parses a date and time literal.
+
+    Returns:
+      int: normalized timestamp of the literal in number of nanoseconds.
+
+    Raises:
+      ValueError: if the literal is not supported.
+    """
+    literal = self._GetNextToken()
+
+    # A date and time literal formatted as "YYYY-MM-DD hh:mm:ss" consists of
+    # 2 tokens.
+    next_token = self._PeekToken()
+    if next_token and _TIME_OF_DAY_RE.match(next_token):
+      literal = ' '.join([literal, self._GetNextToken()])
+
+    date_time_values = time_elements.TimeElementsInMicroseconds()
+    try:
+      if len(literal) > 10 and literal[10] == ' ':
+        date_time_values.CopyFromDateTimeString(literal)
+      else:
+        date_time_values.CopyFromStringISO8601(literal)
+
+    except ValueError as exception:
+      raise ValueError('Unsupported date and time literal: {0:s} with error: '
+                       '{1!s}'.format(literal, exception))
+
+    return date_time_values._GetNormalizedTimestampInNanoseconds()  # pylint: disable=protected-access
+
+  def _ParseNot(self):
+    """Parses a term optionally preceded by "not".
+
+    Returns:
+      tuple[function, function]: match and mask functions.
+
+    Raises:
+      ValueError: if the expression is not supported.
+    """
+    if self._PeekToken() != 'not' or self._PeekToken(offset=1) == 'set':
+      return self._ParseTerm()
+
+    self._token_index += 1
+    match_function, mask_function = self._ParseNot()
+
+    def _Match(normalized_timestamp, semantic_code):
+      return not match_function(normalized_timestamp, semantic_code)
+
+    def _Mask(normalized_timestamps, semantic_codes):
+      return ~mask_function(normalized_timestamps, semantic_codes)
+
+    return _Match, _Mask
+
+  def _ParseOr(self):
+    """Parses one or more terms combined with "or".
+
+    Returns:
+      tuple[function, function]: match and mask functions.
+
+    Raises:
+      ValueError: if the expression is not supported.
+    """
+    match_functions = []
+    mask_functions = []
+
+    while True:
+      match_function, mask_function = self._ParseAnd()
+      match_functions.append(match_function)
+      mask_functions.append(mask_function)
+
+      if self._PeekToken() != 'or':
+        break
+
+      self._token_index += 1
+
+    if len(match_functions) == 1:
+      return match_functions[0], mask_functions[0]
+
+    def _Match(normalized_timestamp, semantic_code):
+      return any(
+          match_function(normalized_timestamp, semantic_code)
+          for match_function in match_functions)
+
+    def _Mask(normalized_timestamps, semantic_codes):
+      mask = mask_functions[0](normalized_timestamps, semantic_codes)
+      for mask_function in mask_functions[1:]:
+        mask |= mask_function(normalized_timestamps, semantic_codes)
+      return mask
+
+    return _Match, _Mask
+
+  def _ParseTerm(self):
+    """Parses a term.
+
+    Returns:
+      tuple[function, function]: match and mask functions.
+
+    Raises:
+      ValueError: if the expression is not supported.
+    """
+    token = self._GetNextToken().lower()
+
+    if token == '(':
+      functions = self._ParseOr()
+      if self._GetNextToken() != ')':
+        raise ValueError('Missing closing parenthesis in expression.')
+      return functions
+
+    if token == 'after':
+      return _CreateAfterFunctions(self._ParseLiteral())
+
+    if token == 'before':
+      return _CreateBeforeFunctions(self._ParseLiteral())
+
+    if token == 'not':
+      token = ' '.join([token, self._GetNextToken().lower()])
+
+    semantic_code = _SEMANTIC_CODES_PER_STRING.get(token.capitalize(), None)
+    if semantic_code is None:
+      raise ValueError('Unsupported token: {0:s} in expression.'.format(token))
+
+    return _CreateSemanticFunctions(semantic_code)
+
+  def _PeekToken(self, offset=0):
+    """Retrieves a token without consuming it.
+
+    Args:
+      offset (Optional[int]): offset of the token relative to the next token.
+
+    Returns:
+      str: token, in lower case, or None if there is no such token.
+    """
+    token_index = self._token_index + offset
+    if token_index >= len(self._tokens):
+      return None
+
+    return self._tokens[token_index].lower()
+
+  def GetMask(self, normalized_timestamps, semantic_codes):
+    """Evaluates the filter on arrays of normalized timestamps.
+
+    Args:
+      normalized_timestamps (numpy.ndarray): normalized timestamps in number
+          of nanoseconds since 1970-01-01 00:00:00 UTC, as signed 64-bit
+          integers, where NaT represents a missing timestamp.
+      semantic_codes (numpy.ndarray): semantic codes, such as
+          SEMANTIC_CODE_NEVER.
+
+    Returns:
+      numpy.ndarray: boolean mask of the values that match the filter.
+
+    Raises:
+      RuntimeError: if numpy is not available.
+    """
+    if not numpy:
+      raise RuntimeError('Missing optional dependency: numpy.')
+
+    normalized_timestamps = numpy.asarray(
+        normalized_timestamps, dtype=numpy.int64)
+    semantic_codes = numpy.asarray(semantic_codes, dtype=numpy.int8)
+
+    mask = self._mask_function(normalized_timestamps, semantic_codes)
+    return numpy.asarray(mask, dtype=numpy.bool_)
+
+  def Matches(self, date_time_values):
+    """Determines if date and time values match the filter.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+
+    Returns:
+      bool: True if the date and time values match the filter.
+    """
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())  # pylint: disable=protected-access
+    semantic_code = _GetSemanticCode(date_time_values, normalized_timestamp)
+
+    return self._match_function(normalized_timestamp, semantic_code)
+
+
+def CopyToColumns(date_time_values_list):
+  """Copies date and time values to arrays that can be filtered.
+
+  Args:
+    date_time_values_list (Iterable[DateTimeValues]): date and time values.
+
+  Returns:
+    tuple[numpy.ndarray, numpy.ndarray]: normalized timestamps in number of
+        nanoseconds since 1970-01-01 00:00:00 UTC, as signed 64-bit integers,
+        where NaT represents a missing timestamp, and semantic codes.
+
+  Raises:
+    RuntimeError: if numpy is not available.
+    ValueError: if a normalized timestamp does not fit in a signed 64-bit
+        integer.
+  """
+  if not numpy:
+    raise RuntimeError('Missing optional dependency: numpy.')
+
+  normalized_timestamps = []
+  semantic_codes = []
+  for date_time_values in date_time_values_list:
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())  # pylint: disable=protected-access
+    semantic_codes.append(
+        _GetSemanticCode(date_time_values, normalized_timestamp))
+
+    if normalized_timestamp is None:
+      normalized_timestamp = _NAT
+    elif not _NAT < normalized_timestamp <= _INT64_MAX:
+      raise ValueError(
+          'Normalized timestamp: {0:d} out of bounds of signed 64-bit '
+          'integer.'.format(normalized_timestamp))
+
+    normalized_timestamps.append(normalized_timestamp)
+
+  return (numpy.array(normalized_timestamps, dtype=numpy.int64),
+          numpy.array(semantic_codes, dtype=numpy.int8))
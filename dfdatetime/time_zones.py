@@ -0,0 +1,1058 @@
+# -*- coding: utf-8 -*-
+"""Time zones compiled from IANA time zone information (TZif) files.
+
+Also see:
+  https://tools.ietf.org/html/rfc8536
+"""
+
+from __future__ import unicode_literals
+
+import bisect
+import calendar
+import os
+import re
+import struct
+
+try:
+  import tzdata
+except ImportError:
+  tzdata = None
+
+from dfdatetime import conversion
+from dfdatetime import definitions
+from dfdatetime import posix_time
+
+
+class TimeZoneRule(object):
+  """Time zone rule defined by a POSIX TZ string.
+
+  The rule defines the time zone offsets after the last transition in
+  a time zone information file.
+  """
+
+  def __init__(
+      self, std_offset, dst_offset=None, dst_start_rule=None,
+      dst_end_rule=None):
+    """Initializes a time zone rule.
+
+    Args:
+      std_offset (int): standard time zone offset in seconds east of UTC.
+      dst_offset (Optional[int]): daylight saving time zone offset in seconds
+          east of UTC or None if the time zone does not observe daylight saving
+          time.
+      dst_start_rule (Optional[tuple[str, int, int, int, int]]): rule of
+          the start of daylight saving time.
+      dst_end_rule (Optional[tuple[str, int, int, int, int]]): rule of the end
+          of daylight saving time.
+    """
+    super(TimeZoneRule, self).__init__()
+    self._dst_end_rule = dst_end_rule
+    self._dst_start_rule = dst_start_rule
+
+    self.dst_offset = dst_offset
+    self.std_offset = std_offset
+
+  def _GetLocalTime(self, year, rule):
+    """Retrieves the local time of a transition rule in a specific year.
+
+    Args:
+      year (int): year.
+      rule (tuple[str, int, int, int, int]): type of rule, either "M", "J" or
+          "N", the month, week and weekday or day of year of the rule, and
+          the local time of day of the transition in seconds.
+
+    Returns:
+      int: local time timestamp, in seconds since January 1, 1970 00:00:00
+          local time.
+    """
+    rule_type, value, week, weekday, time_of_day = rule
+
+    if rule_type == 'M':
+      # calendar.weekday() returns 0 for Monday while the rule uses 0 for
+      # Sunday.
+      first_weekday = (calendar.weekday(year, value, 1) + 1) % 7
+      day_of_month = 1 + ((weekday - first_weekday) % 7) + ((week - 1) * 7)
+
+      _, days_per_month = calendar.monthrange(year, value)
+      while day_of_month > days_per_month:
+        day_of_month -= 7
+
+      timestamp = calendar.timegm((year, value, day_of_month, 0, 0, 0))
+
+    else:
+      timestamp = calendar.timegm((year, 1, 1, 0, 0, 0))
+
+      day_of_year = value
+      if rule_type == 'J':
+        # Julian day 1 through 365 ignores February 29.
+        day_of_year -= 1
+        if calendar.isleap(year) and day_of_year >= 59:
+          day_of_year += 1
+
+      timestamp += day_of_year * definitions.SECONDS_PER_DAY
+
+    return timestamp + time_of_day
+
+  def GetTransitions(self, year):
+    """Retrieves the transitions in a specific year.
+
+    Args:
+      year (int): year.
+
+    Returns:
+      list[tuple[int, int]]: POSIX timestamp, in seconds, of the transitions
+          and the time zone offset, in seconds east of UTC, after the
+          transition, sorted by time.
+    """
+    if self.dst_offset is None:
+      return []
+
+    # The start of daylight saving time is in standard time and the end in
+    # daylight saving time.
+    start_time = self._GetLocalTime(year, self._dst_start_rule)
+    end_time = self._GetLocalTime(year, self._dst_end_rule)
+
+    return sorted([
+        (start_time - self.std_offset, self.dst_offset),
+        (end_time - self.dst_offset, self.std_offset)])
+
+
+class TimeZone(object):
+  """Time zone with compiled transition tables.
+
+  The transition tables consist of the sorted POSIX timestamps, in seconds, of
+  the transitions and the time zone offset that applies in each of the
+  intervals between the transitions. Timestamps are resolved with a binary
+  search of the transition tables, where the interval of the last resolved
+  timestamp is cached so that consecutive timestamps in the same interval are
+  resolved without a search.
+
+  Transitions after the last transition in the time zone information file
+  are determined from the time zone rule when first needed.
+
+  Attributes:
+    name (str): name of the time zone, such as "Europe/Amsterdam".
+  """
+
+  # Maximum year up to which transitions are determined from the time zone
+  # rule.
+  _MAXIMUM_RULE_YEAR = 9999
+
+  # Average number of seconds in a Gregorian year.
+  _SECONDS_PER_YEAR = 31556952
+
+  def __init__(
+      self, name, transition_times, utc_offsets, time_zone_rule=None):
+    """Initializes a time zone.
+
+    Args:
+      name (str): name of the time zone, such as "Europe/Amsterdam".
+      transition_times (list[int]): sorted POSIX timestamps, in seconds, of
+          the transitions.
+      utc_offsets (list[int]): time zone offsets, in seconds east of UTC, of
+          the intervals between the transitions, where the first offset
+          applies before the first transition and the last offset after the
+          last transition.
+      time_zone_rule (Optional[TimeZoneRule]): time zone rule that defines
+          the transitions after the last transition.
+
+    Raises:
+      ValueError: if the number of transition times and time zone offsets
+          does not match.
+    """
+    if len(utc_offsets) != len(transition_times) + 1:
+      raise ValueError((
+          'Number of time zone offsets: {0:d} does not match number of '
+          'transitions: {1:d}.').format(
+              len(utc_offsets), len(transition_times)))
+
+    super(TimeZone, self).__init__()
+    self._last_local_interval = (0, 0, 0)
+    self._last_utc_interval = (0, 0, 0)
+    self._local_transition_times_earlier = []
+    self._local_transition_times_later = []
+    self._rule_end = float('inf')
+    self._rule_year = None
+    self._time_zone_rule = None
+    self._transition_times = []
+    self._utc_offsets = utc_offsets[:1]
+
+    self.name = name
+
+    for index, transition_time in enumerate(transition_times):
+      self._AppendTransition(transition_time, utc_offsets[index + 1])
+
+    if time_zone_rule:
+      if not transition_times and time_zone_rule.dst_offset is None:
+        self._utc_offsets[0] = time_zone_rule.std_offset
+
+      elif time_zone_rule.dst_offset is not None:
+        self._time_zone_rule = time_zone_rule
+        self._rule_end = float('-inf')
+
+  def _AppendRuleTransitions(self, timestamp):
+    """Appends the transitions defined by the time zone rule.
+
+    Args:
+      timestamp (int): POSIX timestamp, in seconds, up to which the transitions
+          are needed.
+    """
+    year = min(
+        (timestamp // self._SECONDS_PER_YEAR) + 1971, self._MAXIMUM_RULE_YEAR)
+
+    if self._rule_year is not None:
+      first_year = self._rule_year + 1
+    elif self._transition_times:
+      first_year = (
+          self._transition_times[-1] // self._SECONDS_PER_YEAR) + 1969
+    else:
+      first_year = 1970
+
+    for rule_year in range(first_year, year + 1):
+      for transition_time, utc_offset in self._time_zone_rule.GetTransitions(
+          rule_year):
+        if self._transition_times:
+          if transition_time <= self._transition_times[-1]:
+            continue
+
+        elif utc_offset == self._time_zone_rule.dst_offset:
+          self._utc_offsets[0] = self._time_zone_rule.std_offset
+
+        else:
+          self._utc_offsets[0] = self._time_zone_rule.dst_offset
+
+        self._AppendTransition(transition_time, utc_offset)
+
+    self._rule_year = max(year, first_year - 1)
+
+    if self._rule_year >= self._MAXIMUM_RULE_YEAR:
+      self._rule_end = float('inf')
+    else:
+      # Transitions of the next year can be up to a week before the start of
+      # that year, due to the time of day of the rule.
+      self._rule_end = calendar.timegm((self._rule_year + 1, 1, 1, 0, 0, 0))
+      self._rule_end -= 7 * definitions.SECONDS_PER_DAY
+
+    # The last intervals are no longer valid.
+    self._last_local_interval = (0, 0, 0)
+    self._last_utc_interval = (0, 0, 0)
+
+  def _AppendTransition(self, transition_time, utc_offset):
+    """Appends a transition to the transition tables.
+
+    Args:
+      transition_time (int): POSIX timestamp, in seconds, of the transition.
+      utc_offset (int): time zone offset, in seconds east of UTC, after the
+          transition.
+    """
+    utc_offset_before = self._utc_offsets[-1]
+
+    self._transition_times.append(transition_time)
+    self._utc_offsets.append(utc_offset)
+
+    # The local time transitions where the earlier interval ends and the later
+    # interval starts. The local times between these transitions are ambiguous
+    # when the time zone offset decreases and do not exist when it increases.
+    self._local_transition_times_earlier.append(
+        transition_time + max(utc_offset_before, utc_offset))
+    self._local_transition_times_later.append(
+        transition_time + min(utc_offset_before, utc_offset))
+
+  def _GetLocalTimeInterval(self, timestamp, fold=0):
+    """Retrieves the interval that contains a local time.
+
+    Args:
+      timestamp (int): local time timestamp, in seconds since January 1, 1970
+          00:00:00 local time.
+      fold (Optional[int]): 0 to resolve local times that are ambiguous or
+          do not exist to the interval before the transition or 1 to resolve
+          them to the interval after the transition.
+
+    Returns:
+      tuple[int, str]: index of the interval and status of the local time,
+          either LOCAL_TIME_AMBIGUOUS, LOCAL_TIME_NONEXISTENT or
+          LOCAL_TIME_VALID.
+    """
+    start, end, index = self._last_local_interval
+    if start <= timestamp < end:
+      return index, definitions.LOCAL_TIME_VALID
+
+    if timestamp >= self._rule_end:
+      self._AppendRuleTransitions(timestamp)
+
+    later_index = bisect.bisect_right(
+        self._local_transition_times_later, timestamp)
+    earlier_index = bisect.bisect_right(
+        self._local_transition_times_earlier, timestamp)
+
+    if later_index == earlier_index:
+      index = later_index
+      status = definitions.LOCAL_TIME_VALID
+
+      if index > 0:
+        start = self._local_transition_times_earlier[index - 1]
+      else:
+        start = float('-inf')
+
+      if index < len(self._transition_times):
+        end = self._local_transition_times_later[index]
+      else:
+        end = self._rule_end
+
+      self._last_local_interval = (start, end, index)
+
+    else:
+      # The local time is between the local time transitions of a transition.
+      if fold:
+        index = later_index
+      else:
+        index = earlier_index
+
+      if self._utc_offsets[later_index] < self._utc_offsets[earlier_index]:
+        status = definitions.LOCAL_TIME_AMBIGUOUS
+      else:
+        status = definitions.LOCAL_TIME_NONEXISTENT
+
+    return index, status
+
+  def _GetUTCIntervalIndex(self, timestamp):
+    """Retrieves the index of the interval that contains a UTC time.
+
+    Args:
+      timestamp (int): POSIX timestamp in seconds.
+
+    Returns:
+      int: index of the interval.
+    """
+    start, end, index = self._last_utc_interval
+    if start <= timestamp < end:
+      return index
+
+    if timestamp >= self._rule_end:
+      self._AppendRuleTransitions(timestamp)
+
+    index = bisect.bisect_right(self._transition_times, timestamp)
+
+    if index > 0:
+      start = self._transition_times[index - 1]
+    else:
+      start = float('-inf')
+
+    if index < len(self._transition_times):
+      end = self._transition_times[index]
+    else:
+      end = self._rule_end
+
+    self._last_utc_interval = (start, end, index)
+
+    return index
+
+  def CopyFromUTC(self, timestamp):
+    """Copies a UTC time to local time.
+
+    Args:
+      timestamp (int): POSIX timestamp in seconds.
+
+    Returns:
+      int: local time timestamp, in seconds since January 1, 1970 00:00:00
+          local time.
+    """
+    index = self._GetUTCIntervalIndex(timestamp)
+    return timestamp + self._utc_offsets[index]
+
+  def CopyLocalTimestampsToUTC(self, timestamps, units_per_second=1, fold=0):
+    """Copies an array of local time timestamps to UTC.
+
+    Consecutive timestamps in the same interval, such as in a sorted array,
+    are resolved without a search of the transition tables.
+
+    Args:
+      timestamps (Iterable[int]): local time timestamps, in units since
+          January 1, 1970 00:00:00 local time.
+      units_per_second (Optional[int]): number of timestamp units per second,
+          for example definitions.NANOSECONDS_PER_SECOND.
+      fold (Optional[int]): 0 to resolve local times that are ambiguous or
+          do not exist with the time zone offset before the transition or 1 to
+          resolve them with the time zone offset after the transition.
+
+    Returns:
+      tuple[list[int], list[str]]: POSIX timestamps, in units since January 1,
+          1970 00:00:00 UTC, and status of the local times, either
+          LOCAL_TIME_AMBIGUOUS, LOCAL_TIME_NONEXISTENT or LOCAL_TIME_VALID,
+          where both are None if the local time timestamp is missing.
+    """
+    utc_offsets = self._utc_offsets
+
+    utc_timestamps = []
+    statuses = []
+    for timestamp in timestamps:
+      if timestamp is None:
+        utc_timestamps.append(None)
+        statuses.append(None)
+        continue
+
+      index, status = self._GetLocalTimeInterval(
+          timestamp // units_per_second, fold=fold)
+
+      utc_timestamps.append(timestamp - (utc_offsets[index] * units_per_second))
+      statuses.append(status)
+
+    return utc_timestamps, statuses
+
+  def CopyToUTC(self, timestamp, fold=0):
+    """Copies a local time to UTC.
+
+    Args:
+      timestamp (int): local time timestamp, in seconds since January 1, 1970
+          00:00:00 local time.
+      fold (Optional[int]): 0 to resolve local times that are ambiguous or
+          do not exist with the time zone offset before the transition or 1 to
+          resolve them with the time zone offset after the transition.
+
+    Returns:
+      int: POSIX timestamp in seconds.
+    """
+    index, _ = self._GetLocalTimeInterval(timestamp, fold=fold)
+    return timestamp - self._utc_offsets[index]
+
+  def GetTransitions(self, timestamp):
+    """Retrieves the transitions up to a specific UTC time.
+
+    Args:
+      timestamp (int): POSIX timestamp, in seconds, up to which the transitions
+          are needed.
+
+    Returns:
+      tuple[list[int], list[int]]: sorted POSIX timestamps, in seconds, of
+          the transitions and time zone offsets, in seconds east of UTC, of
+          the intervals between the transitions, where the first offset
+          applies before the first transition and the last offset after
+          the last transition.
+    """
+    if timestamp >= self._rule_end:
+      self._AppendRuleTransitions(timestamp)
+
+    return list(self._transition_times), list(self._utc_offsets)
+
+  def GetUTCNormalizedTimestamp(self, date_time_values, fold=0):
+    """Retrieves the normalized timestamp of date time values in UTC.
+
+    Args:
+      date_time_values (DateTimeValues): date time values, where date time
+          values that are not in local time are considered to be in UTC.
+      fold (Optional[int]): 0 to resolve local times that are ambiguous or
+          do not exist with the time zone offset before the transition or 1 to
+          resolve them with the time zone offset after the transition.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00 UTC, or None if the normalized
+          timestamp cannot be determined.
+    """
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())  # pylint: disable=protected-access
+    if normalized_timestamp is None or not date_time_values.is_local_time:
+      return normalized_timestamp
+
+    timestamp, remainder = divmod(
+        normalized_timestamp, definitions.NANOSECONDS_PER_SECOND)
+    timestamp = self.CopyToUTC(timestamp, fold=fold)
+    return (timestamp * definitions.NANOSECONDS_PER_SECOND) + remainder
+
+  def GetUTCNormalizedTimestamps(self, date_time_values_list, fold=0):
+    """Retrieves the normalized timestamps of date time values in UTC.
+
+    The date time values are resolved using their normalized timestamp in
+    nanoseconds, which is exact for integer based date time values such as
+    FAT date time, HFS time and time elements.
+
+    Args:
+      date_time_values_list (Iterable[DateTimeValues]): date time values,
+          where date time values that are not in local time are considered to
+          be in UTC.
+      fold (Optional[int]): 0 to resolve local times that are ambiguous or
+          do not exist with the time zone offset before the transition or 1 to
+          resolve them with the time zone offset after the transition.
+
+    Returns:
+      tuple[list[int], list[str]]: normalized timestamps, which contain the
+          number of nanoseconds since January 1, 1970 00:00:00 UTC, and status
+          of the local times, either LOCAL_TIME_AMBIGUOUS,
+          LOCAL_TIME_NONEXISTENT or LOCAL_TIME_VALID, where both are None if
+          the normalized timestamp cannot be determined.
+    """
+    utc_offsets = self._utc_offsets
+
+    normalized_timestamps = []
+    statuses = []
+    for date_time_values in date_time_values_list:
+      normalized_timestamp = (
+          date_time_values._GetNormalizedTimestampInNanoseconds())  # pylint: disable=protected-access
+      if normalized_timestamp is None:
+        normalized_timestamps.append(None)
+        statuses.append(None)
+        continue
+
+      if date_time_values.is_local_time:
+        index, status = self._GetLocalTimeInterval(
+            normalized_timestamp // definitions.NANOSECONDS_PER_SECOND,
+            fold=fold)
+
+        normalized_timestamp -= (
+            utc_offsets[index] * definitions.NANOSECONDS_PER_SECOND)
+
+      else:
+        status = definitions.LOCAL_TIME_VALID
+
+      normalized_timestamps.append(normalized_timestamp)
+      statuses.append(status)
+
+    return normalized_timestamps, statuses
+
+  def GetUTCOffset(self, timestamp):
+    """Retrieves the time zone offset at a specific UTC time.
+
+    Args:
+      timestamp (int): POSIX timestamp in seconds.
+
+    Returns:
+      int: time zone offset in seconds east of UTC.
+    """
+    index = self._GetUTCIntervalIndex(timestamp)
+    return self._utc_offsets[index]
+
+
+class TimeZoneInformationFileParser(object):
+  """Time zone information (TZif) file parser."""
+
+  _FILE_HEADER = struct.Struct('>4sc15x6L')
+
+  _LOCAL_TIME_TYPE = struct.Struct('>lBB')
+
+  _POSIX_TIME_ZONE_STRING_RE = re.compile(
+      r'^(?P<std_name>[A-Za-z]{3,}|<[+\-0-9A-Za-z]+>)'
+      r'(?P<std_offset>[+\-]?[0-9]{1,3}(?::[0-9]{1,2}){0,2})'
+      r'(?:(?P<dst_name>[A-Za-z]{3,}|<[+\-0-9A-Za-z]+>)'
+      r'(?P<dst_offset>[+\-]?[0-9]{1,3}(?::[0-9]{1,2}){0,2})?'
+      r',(?P<start_rule>[^,]+),(?P<end_rule>[^,]+))?$')
+
+  _POSIX_TIME_ZONE_RULE_RE = re.compile(
+      r'^(?:M(?P<month>[0-9]{1,2})\.(?P<week>[1-5])\.(?P<weekday>[0-6])|'
+      r'J(?P<julian_day>[0-9]{1,3})|(?P<day>[0-9]{1,3}))'
+      r'(?:/(?P<time>[+\-]?[0-9]{1,3}(?::[0-9]{1,2}){0,2}))?$')
+
+  def _ParsePOSIXTime(self, time_string):
+    """Parses a time in a POSIX TZ string.
+
+    Args:
+      time_string (str): time formatted as: [+-]hh[:mm[:ss]].
+
+    Returns:
+      int: number of seconds.
+    """
+    sign = 1
+    if time_string[0] in ('+', '-'):
+      if time_string[0] == '-':
+        sign = -1
+      time_string = time_string[1:]
+
+    number_of_seconds = 0
+    for index, value in enumerate(time_string.split(':')):
+      number_of_seconds += int(value, 10) * (60 ** (2 - index))
+
+    return sign * number_of_seconds
+
+  def _ParsePOSIXTimeZoneRule(self, rule_string):
+    """Parses a transition rule in a POSIX TZ string.
+
+    Args:
+      rule_string (str): transition rule, such as "M3.5.0/2".
+
+    Returns:
+      tuple[str, int, int, int, int]: type of rule, either "M", "J" or "N",
+          the month, week and weekday or day of year of the rule, and the local
+          time of day of the transition in seconds.
+
+    Raises:
+      ValueError: if the rule is not supported.
+    """
+    match = self._POSIX_TIME_ZONE_RULE_RE.match(rule_string)
+    if not match:
+      raise ValueError('Unsupported POSIX TZ rule: {0:s}.'.format(rule_string))
+
+    time_string = match.group('time')
+    if time_string:
+      time_of_day = self._ParsePOSIXTime(time_string)
+    else:
+      time_of_day = 2 * 60 * 60
+
+    if match.group('month'):
+      month = int(match.group('month'), 10)
+      if month not in range(1, 13):
+        raise ValueError('Unsupported POSIX TZ rule: {0:s}.'.format(
+            rule_string))
+
+      return ('M', month, int(match.group('week'), 10),
+              int(match.group('weekday'), 10), time_of_day)
+
+    if match.group('julian_day'):
+      return ('J', int(match.group('julian_day'), 10), 0, 0, time_of_day)
+
+    return ('N', int(match.group('day'), 10), 0, 0, time_of_day)
+
+  def _ParsePOSIXTimeZoneString(self, time_zone_string):
+    """Parses a POSIX TZ string.
+
+    Args:
+      time_zone_string (str): POSIX TZ string, such as
+          "CET-1CEST,M3.5.0,M10.5.0/3".
+
+    Returns:
+      TimeZoneRule: time zone rule.
+
+    Raises:
+      ValueError: if the POSIX TZ string is not supported.
+    """
+    match = self._POSIX_TIME_ZONE_STRING_RE.match(time_zone_string)
+    if not match:
+      raise ValueError('Unsupported POSIX TZ string: {0:s}.'.format(
+          time_zone_string))
+
+    # Note that POSIX TZ string offsets are west of UTC.
+    std_offset = -self._ParsePOSIXTime(match.group('std_offset'))
+
+    if not match.group('dst_name'):
+      return TimeZoneRule(std_offset)
+
+    dst_offset_string = match.group('dst_offset')
+    if dst_offset_string:
+      dst_offset = -self._ParsePOSIXTime(dst_offset_string)
+    else:
+      dst_offset = std_offset + (60 * 60)
+
+    start_rule = self._ParsePOSIXTimeZoneRule(match.group('start_rule'))
+    end_rule = self._ParsePOSIXTimeZoneRule(match.group('end_rule'))
+
+    return TimeZoneRule(
+        std_offset, dst_offset=dst_offset, dst_start_rule=start_rule,
+        dst_end_rule=end_rule)
+
+  def _ReadDataBlock(self, data, data_offset, file_header, time_size):
+    """Reads a data block.
+
+    Args:
+      data (bytes): TZif file data.
+      data_offset (int): offset of the data block.
+      file_header (tuple[int, int, int, int, int, int]): number of UT/local
+          indicators, standard/wall indicators, leap second records,
+          transition times, local time type records and time zone designation
+          characters.
+      time_size (int): size of the transition times, either 4 or 8.
+
+    Returns:
+      tuple[list[int], list[int], int]: transition times, time zone offsets of
+          the intervals between the transitions and the offset of the end of
+          the data block.
+
+    Raises:
+      ValueError: if the data block cannot be read.
+    """
+    (number_of_utc_indicators, number_of_standard_indicators,
+     number_of_leap_seconds, number_of_transitions,
+     number_of_local_time_types, number_of_characters) = file_header
+
+    if number_of_local_time_types == 0:
+      raise ValueError('Missing local time types.')
+
+    if time_size == 8:
+      time_format = '>{0:d}q'.format(number_of_transitions)
+    else:
+      time_format = '>{0:d}l'.format(number_of_transitions)
+
+    data_size = (
+        (number_of_transitions * (time_size + 1)) +
+        (number_of_local_time_types * self._LOCAL_TIME_TYPE.size) +
+        number_of_characters +
+        (number_of_leap_seconds * (time_size + 4)) +
+        number_of_standard_indicators + number_of_utc_indicators)
+
+    if data_offset + data_size > len(data):
+      raise ValueError('Data block exceeds data size.')
+
+    transition_times = list(struct.unpack_from(time_format, data, data_offset))
+    data_offset += number_of_transitions * time_size
+
+    local_time_type_indexes = bytearray(
+        data[data_offset:data_offset + number_of_transitions])
+    data_offset += number_of_transitions
+
+    local_time_types_offsets = []
+    for _ in range(number_of_local_time_types):
+      utc_offset, _, _ = self._LOCAL_TIME_TYPE.unpack_from(data, data_offset)
+      local_time_types_offsets.append(utc_offset)
+      data_offset += self._LOCAL_TIME_TYPE.size
+
+    try:
+      utc_offsets = [local_time_types_offsets[0]] + [
+          local_time_types_offsets[index] for index in local_time_type_indexes]
+    except IndexError:
+      raise ValueError('Local time type index out of bounds.')
+
+    data_offset += data_size - (
+        (number_of_transitions * (time_size + 1)) +
+        (number_of_local_time_types * self._LOCAL_TIME_TYPE.size))
+
+    return transition_times, utc_offsets, data_offset
+
+  def _ReadFileHeader(self, data, data_offset):
+    """Reads a file header.
+
+    Args:
+      data (bytes): TZif file data.
+      data_offset (int): offset of the file header.
+
+    Returns:
+      tuple[int, tuple[int, int, int, int, int, int]]: format version and
+          number of UT/local indicators, standard/wall indicators, leap second
+          records, transition times, local time type records and time zone
+          designation characters.
+
+    Raises:
+      ValueError: if the file header is not supported.
+    """
+    if data_offset + self._FILE_HEADER.size > len(data):
+      raise ValueError('File header exceeds data size.')
+
+    file_header = self._FILE_HEADER.unpack_from(data, data_offset)
+    if file_header[0] != b'TZif':
+      raise ValueError('Unsupported file signature.')
+
+    format_version = file_header[1]
+    if format_version == b'\x00':
+      format_version = 1
+    elif format_version in (b'2', b'3', b'4'):
+      format_version = int(format_version, 10)
+    else:
+      raise ValueError('Unsupported format version.')
+
+    return format_version, file_header[2:]
+
+  def Parse(self, name, data):
+    """Parses a TZif file into a time zone.
+
+    Args:
+      name (str): name of the time zone, such as "Europe/Amsterdam".
+      data (bytes): TZif file data.
+
+    Returns:
+      TimeZone: time zone.
+
+    Raises:
+      ValueError: if the data cannot be parsed.
+    """
+    format_version, file_header = self._ReadFileHeader(data, 0)
+
+    transition_times, utc_offsets, data_offset = self._ReadDataBlock(
+        data, self._FILE_HEADER.size, file_header, 4)
+
+    if format_version == 1:
+      return TimeZone(name, transition_times, utc_offsets)
+
+    _, file_header = self._ReadFileHeader(data, data_offset)
+
+    transition_times, utc_offsets, data_offset = self._ReadDataBlock(
+        data, data_offset + self._FILE_HEADER.size, file_header, 8)
+
+    time_zone_rule = None
+
+    footer = data[data_offset:].strip(b'\n')
+    if footer:
+      try:
+        footer = footer.decode('ascii')
+      except UnicodeDecodeError:
+        raise ValueError('Unsupported footer.')
+
+      time_zone_rule = self._ParsePOSIXTimeZoneString(footer)
+
+    return TimeZone(
+        name, transition_times, utc_offsets, time_zone_rule=time_zone_rule)
+
+
+class TimeZoneFactory(object):
+  """Time zone factory."""
+
+  # Directories that contain time zone information (TZif) files, in order of
+  # preference.
+  ZONEINFO_PATHS = [
+      '/usr/share/zoneinfo',
+      '/usr/lib/zoneinfo',
+      '/usr/share/lib/zoneinfo',
+      '/etc/zoneinfo']
+
+  if tzdata:
+    ZONEINFO_PATHS.append(os.path.join(
+        os.path.dirname(tzdata.__file__), 'zoneinfo'))
+
+  _time_zones = {}
+
+  @classmethod
+  def _GetTimeZoneInformationFilePath(cls, name):
+    """Retrieves the path of the time zone information (TZif) file.
+
+    Args:
+      name (str): name of the time zone, such as "Europe/Amsterdam".
+
+    Returns:
+      str: path of the TZif file or None if not available.
+
+    Raises:
+      ValueError: if the time zone name is not supported.
+    """
+    path_segments = name.split('/')
+    if (not name or os.path.isabs(name) or '\\' in name or
+        '..' in path_segments or '' in path_segments):
+      raise ValueError('Unsupported time zone name: {0:s}.'.format(name))
+
+    for zoneinfo_path in cls.ZONEINFO_PATHS:
+      path = os.path.join(zoneinfo_path, *path_segments)
+      if os.path.isfile(path):
+        return path
+
+    return None
+
+  @classmethod
+  def GetTimeZone(cls, name):
+    """Retrieves a time zone.
+
+    Time zones are compiled from the time zone information (TZif) file once
+    and cached.
+
+    Args:
+      name (str): name of the time zone, such as "Europe/Amsterdam".
+
+    Returns:
+      TimeZone: time zone.
+
+    Raises:
+      KeyError: if the time zone is not available.
+      ValueError: if the time zone name is not supported or the time zone
+          information file cannot be parsed.
+    """
+    time_zone = cls._time_zones.get(name, None)
+    if time_zone:
+      return time_zone
+
+    path = cls._GetTimeZoneInformationFilePath(name)
+    if not path and name == 'UTC':
+      time_zone = TimeZone(name, [], [0])
+      cls._time_zones[name] = time_zone
+      return time_zone
+
+    if not path:
+      raise KeyError('Time zone: {0:s} not available.'.format(name))
+
+    with open(path, 'rb') as file_object:
+      data = file_object.read()
+
+    parser = TimeZoneInformationFileParser()
+    time_zone = parser.Parse(name, data)
+
+    cls._time_zones[name] = time_zone
+    return time_zone
+
+
+class TimeZonesRenderer(object):
+  """Renders date and time values in multiple time zones.
+
+  The normalized timestamp is decomposed once into the number of seconds and
+  the fraction of second, after which every time zone only adds its time zone
+  offset, which is determined from the cached interval of the time zone.
+
+  Attributes:
+    time_zones (list[TimeZone]): time zones to render in.
+  """
+
+  # Number of fraction of second digits per precision.
+  _FRACTION_OF_SECOND_DIGITS = {
+      definitions.PRECISION_1_NANOSECOND: 9,
+      definitions.PRECISION_100_NANOSECONDS: 7,
+      definitions.PRECISION_1_MICROSECOND: 6,
+      definitions.PRECISION_1_MILLISECOND: 3,
+      definitions.PRECISION_100_MILLISECONDS: 1,
+      definitions.PRECISION_1_SECOND: 0}
+
+  def __init__(self, time_zones, precision=definitions.PRECISION_1_MICROSECOND):
+    """Initializes a time zones renderer.
+
+    Args:
+      time_zones (list[str|TimeZone]): time zones or names of time zones to
+          render in, such as "UTC" or "Europe/Amsterdam".
+      precision (Optional[str]): precision of the fraction of second, for
+          example definitions.PRECISION_1_MICROSECOND.
+
+    Raises:
+      KeyError: if a time zone is not available.
+      ValueError: if the precision or a time zone name is not supported.
+    """
+    number_of_digits = self._FRACTION_OF_SECOND_DIGITS.get(precision, None)
+    if number_of_digits is None:
+      raise ValueError('Unsupported precision: {0!s}.'.format(precision))
+
+    super(TimeZonesRenderer, self).__init__()
+    self._date_time_values = posix_time.PosixTime()
+    self._fraction_of_second_divisor = 10 ** (9 - number_of_digits)
+    self._fraction_of_second_format = None
+    self._utc_offset_strings = {}
+
+    if number_of_digits:
+      self._fraction_of_second_format = '.{{0:0{0:d}d}}'.format(
+          number_of_digits)
+
+    self.time_zones = []
+    for time_zone in time_zones:
+      if not isinstance(time_zone, TimeZone):
+        time_zone = TimeZoneFactory.GetTimeZone(time_zone)
+      self.time_zones.append(time_zone)
+
+  def _CopyNormalizedTimestampToDateTimeStrings(self, normalized_timestamp):
+    """Copies a normalized timestamp to date and time strings.
+
+    Args:
+      normalized_timestamp (int): number of nanoseconds since the POSIX epoch
+          in UTC.
+
+    Returns:
+      list[str]: date and time strings in ISO 8601 format, with time zone
+          offset, per time zone.
+
+    Raises:
+      ValueError: if the date values are out of bounds.
+    """
+    # pylint: disable=protected-access
+    date_time_values = self._date_time_values
+
+    number_of_seconds, remainder = divmod(
+        normalized_timestamp, definitions.NANOSECONDS_PER_SECOND)
+
+    fraction_of_second_string = ''
+    if self._fraction_of_second_format:
+      fraction_of_second_string = self._fraction_of_second_format.format(
+          remainder // self._fraction_of_second_divisor)
+
+    date_time_strings = []
+    for time_zone in self.time_zones:
+      utc_offset = time_zone.GetUTCOffset(number_of_seconds)
+
+      number_of_days, hours, minutes, seconds = (
+          date_time_values._GetTimeValues(number_of_seconds + utc_offset))
+
+      year, month, day_of_month = date_time_values._GetDateValuesWithEpoch(
+          number_of_days, date_time_values._EPOCH_NORMALIZED_TIME)
+
+      date_time_string = date_time_values._FormatDateTimeString(
+          year, month, day_of_month, hours, minutes, seconds)
+
+      date_time_strings.append(''.join([
+          date_time_string.replace(' ', 'T'), fraction_of_second_string,
+          self._GetUTCOffsetString(utc_offset)]))
+
+    return date_time_strings
+
+  def _GetUTCOffsetString(self, utc_offset):
+    """Retrieves the string representation of a time zone offset.
+
+    Args:
+      utc_offset (int): time zone offset in seconds east of UTC.
+
+    Returns:
+      str: time zone offset formatted as "+hh:mm" or "+hh:mm:ss" if the time
+          zone offset contains seconds.
+    """
+    utc_offset_string = self._utc_offset_strings.get(utc_offset, None)
+    if utc_offset_string is None:
+      sign = '-' if utc_offset < 0 else '+'
+      minutes, seconds = divmod(abs(utc_offset), 60)
+      hours, minutes = divmod(minutes, 60)
+
+      utc_offset_string = '{0:s}{1:02d}:{2:02d}'.format(sign, hours, minutes)
+      if seconds:
+        utc_offset_string = '{0:s}:{1:02d}'.format(utc_offset_string, seconds)
+
+      self._utc_offset_strings[utc_offset] = utc_offset_string
+
+    return utc_offset_string
+
+  def CopyNormalizedTimestampsToDateTimeStrings(self, normalized_timestamps):
+    """Copies normalized timestamps to date and time strings.
+
+    Args:
+      normalized_timestamps (Iterable[int]): numbers of nanoseconds since
+          the POSIX epoch in UTC.
+
+    Returns:
+      list[list[str]]: date and time strings in ISO 8601 format, with time zone
+          offset, per time zone, per normalized timestamp, where the date and
+          time strings are None if the normalized timestamp is missing or out
+          of bounds.
+    """
+    none_date_time_strings = [None] * len(self.time_zones)
+
+    date_time_strings = []
+    for normalized_timestamp in normalized_timestamps:
+      date_time_strings_per_time_zone = none_date_time_strings
+      if normalized_timestamp is not None:
+        try:
+          date_time_strings_per_time_zone = (
+              self._CopyNormalizedTimestampToDateTimeStrings(
+                  normalized_timestamp))
+        except ValueError:
+          pass
+
+      date_time_strings.append(list(date_time_strings_per_time_zone))
+
+    return date_time_strings
+
+  def CopyTimestampsToDateTimeStrings(self, timestamps, date_time_values_type):
+    """Copies timestamps to date and time strings.
+
+    Args:
+      timestamps (Iterable[int]): timestamps of the date and time values type.
+      date_time_values_type (type): date and time values type of the
+          timestamps, for example filetime.Filetime.
+
+    Returns:
+      list[list[str]]: date and time strings in ISO 8601 format, with time zone
+          offset, per time zone, per timestamp, where the date and time strings
+          are None if the timestamp is missing or out of bounds.
+
+    Raises:
+      ValueError: if the date and time values type is not supported.
+    """
+    normalized_timestamps = conversion.ConvertTimestamps(
+        timestamps, date_time_values_type, posix_time.PosixTimeInNanoseconds)
+    return self.CopyNormalizedTimestampsToDateTimeStrings(normalized_timestamps)
+
+  def CopyToDateTimeStrings(self, date_time_values):
+    """Copies date and time values to date and time strings.
+
+    Date and time values without a time zone offset are considered to be
+    in UTC.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+
+    Returns:
+      list[str]: date and time strings in ISO 8601 format, with time zone
+          offset, per time zone, where the date and time strings are None if
+          the date and time values do not have a timestamp.
+
+    Raises:
+      ValueError: if the date values are out of bounds.
+    """
+    # pylint: disable=protected-access
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())
+    if normalized_timestamp is None:
+      return [None] * len(self.time_zones)
+
+    return self._CopyNormalizedTimestampToDateTimeStrings(normalized_timestamp)
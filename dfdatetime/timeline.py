@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+"""Sorted timeline index of date and time values.
+
+Entries, pairs of date and time values and a payload, are stored sorted by
+their normalized timestamp in number of nanoseconds since 1970-01-01 00:00:00
+UTC, so that range queries can be answered with a binary search instead of
+comparing every date and time values. Entries of date and time values without
+a timestamp, such as "Never", are stored separately by their semantic
+representation.
+
+Timelines that are already sorted, such as per artifact timelines, can be
+merged into a single sorted timeline with MergeSorted. Date and time values of
+2 timelines that are equal within a tolerance, such as the precision of
+the coarser of both values, can be matched with MatchWithin. Near-duplicate
+date and time values of a sorted timeline can be collapsed with Deduplicate.
+"""
+
+from __future__ import unicode_literals
+
+import bisect
+import heapq
+import operator
+
+from dfdatetime import definitions
+from dfdatetime import duration
+from dfdatetime import semantic_time
+
+
+class TimelineIndex(object):
+  """Sorted timeline index of date and time values."""
+
+  # The semantic representation of date and time values without a timestamp
+  # that are not semantic time.
+  _NOT_SET_STRING = 'Not set'
+
+  def __init__(self, entries=None):
+    """Initializes a timeline index.
+
+    Args:
+      entries (Optional[Iterable[tuple[DateTimeValues, object]]]): entries,
+          pairs of date and time values and a payload.
+    """
+    super(TimelineIndex, self).__init__()
+    self._entries = []
+    self._keys = []
+    self._semantic_entries = {}
+
+    if entries:
+      self.InsertMany(entries)
+
+  def __len__(self):
+    """Retrieves the number of entries.
+
+    Returns:
+      int: number of entries, including entries of date and time values
+          without a timestamp.
+    """
+    return len(self._entries) + sum(
+        len(entries) for entries in self._semantic_entries.values())
+
+  def _GetKey(self, date_time_values):
+    """Retrieves the key of date and time values.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+
+    Returns:
+      int: normalized timestamp in number of nanoseconds since 1970-01-01
+          00:00:00 UTC.
+
+    Raises:
+      ValueError: if the date and time values do not have a timestamp.
+    """
+    key = date_time_values._GetNormalizedTimestampInNanoseconds()  # pylint: disable=protected-access
+    if key is None:
+      raise ValueError('Unsupported date and time values without timestamp.')
+
+    return key
+
+  def _GetSemanticString(self, date_time_values):
+    """Retrieves the semantic representation of date and time values.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values without
+          a timestamp.
+
+    Returns:
+      str: semantic representation, such as "Never".
+    """
+    if isinstance(date_time_values, semantic_time.SemanticTime):
+      return date_time_values.string
+
+    return self._NOT_SET_STRING
+
+  def After(self, date_time_values):
+    """Retrieves the entries after date and time values.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+
+    Returns:
+      list[tuple[DateTimeValues, object]]: entries with a timestamp after
+          the date and time values, sorted by timestamp.
+
+    Raises:
+      ValueError: if the date and time values do not have a timestamp.
+    """
+    index = bisect.bisect_right(self._keys, self._GetKey(date_time_values))
+    return self._entries[index:]
+
+  def Before(self, date_time_values):
+    """Retrieves the entries before date and time values.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+
+    Returns:
+      list[tuple[DateTimeValues, object]]: entries with a timestamp before
+          the date and time values, sorted by timestamp.
+
+    Raises:
+      ValueError: if the date and time values do not have a timestamp.
+    """
+    index = bisect.bisect_left(self._keys, self._GetKey(date_time_values))
+    return self._entries[:index]
+
+  def GetEntries(self):
+    """Retrieves the entries with a timestamp.
+
+    Returns:
+      list[tuple[DateTimeValues, object]]: entries with a timestamp, sorted by
+          timestamp.
+    """
+    return list(self._entries)
+
+  def GetSemanticEntries(self, string=None):
+    """Retrieves the entries without a timestamp.
+
+    Args:
+      string (Optional[str]): semantic representation, such as "Never", where
+          None represents all entries without a timestamp.
+
+    Returns:
+      list[tuple[DateTimeValues, object]]: entries without a timestamp, in
+          insertion order per semantic representation.
+    """
+    if string is not None:
+      return list(self._semantic_entries.get(string, []))
+
+    return [
+        entry for string in sorted(self._semantic_entries)
+        for entry in self._semantic_entries[string]]
+
+  def Insert(self, date_time_values, payload=None):
+    """Inserts an entry.
+
+    The entry is inserted after entries with the same timestamp.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+      payload (Optional[object]): payload.
+    """
+    entry = (date_time_values, payload)
+
+    key = date_time_values._GetNormalizedTimestampInNanoseconds()  # pylint: disable=protected-access
+    if key is None:
+      string = self._GetSemanticString(date_time_values)
+      self._semantic_entries.setdefault(string, []).append(entry)
+      return
+
+    index = bisect.bisect_right(self._keys, key)
+    self._keys.insert(index, key)
+    self._entries.insert(index, entry)
+
+  def InsertMany(self, entries):
+    """Inserts multiple entries.
+
+    The entries are appended and sorted once, which is faster than inserting
+    them one by one, since sorting merges the already sorted runs.
+
+    Args:
+      entries (Iterable[tuple[DateTimeValues, object]]): entries, pairs of
+          date and time values and a payload.
+    """
+    keyed_entries = []
+    for date_time_values, payload in entries:
+      entry = (date_time_values, payload)
+
+      key = date_time_values._GetNormalizedTimestampInNanoseconds()  # pylint: disable=protected-access
+      if key is None:
+        string = self._GetSemanticString(date_time_values)
+        self._semantic_entries.setdefault(string, []).append(entry)
+      else:
+        keyed_entries.append((key, entry))
+
+    if not keyed_entries:
+      return
+
+    keyed_entries = list(zip(self._keys, self._entries)) + keyed_entries
+    keyed_entries.sort(key=operator.itemgetter(0))
+
+    self._keys = [key for key, _ in keyed_entries]
+    self._entries = [entry for _, entry in keyed_entries]
+
+  def Nearest(self, date_time_values, maximum_number_of_entries=1):
+    """Retrieves the entries nearest to date and time values.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+      maximum_number_of_entries (Optional[int]): maximum number of entries
+          to retrieve.
+
+    Returns:
+      list[tuple[DateTimeValues, object]]: entries with a timestamp, sorted by
+          distance to the date and time values, where the earlier entry is
+          retrieved first if entries have the same distance.
+
+    Raises:
+      ValueError: if the date and time values do not have a timestamp.
+    """
+    key = self._GetKey(date_time_values)
+
+    after_index = bisect.bisect_left(self._keys, key)
+    before_index = after_index - 1
+    number_of_keys = len(self._keys)
+
+    entries = []
+    while len(entries) < maximum_number_of_entries:
+      if before_index >= 0:
+        before_distance = key - self._keys[before_index]
+      else:
+        before_distance = None
+
+      if after_index < number_of_keys:
+        after_distance = self._keys[after_index] - key
+      else:
+        after_distance = None
+
+      if before_distance is None and after_distance is None:
+        break
+
+      if after_distance is None or (
+          before_distance is not None and before_distance <= after_distance):
+        entries.append(self._entries[before_index])
+        before_index -= 1
+      else:
+        entries.append(self._entries[after_index])
+        after_index += 1
+
+    return entries
+
+  def Range(self, start=None, end=None):
+    """Retrieves the entries in a range.
+
+    Args:
+      start (Optional[DateTimeValues]): inclusive start of the range, where
+          None represents no start.
+      end (Optional[DateTimeValues]): inclusive end of the range, where None
+          represents no end.
+
+    Returns:
+      list[tuple[DateTimeValues, object]]: entries with a timestamp in
+          the range, sorted by timestamp.
+
+    Raises:
+      ValueError: if the start or end does not have a timestamp.
+    """
+    start_index = 0
+    if start is not None:
+      start_index = bisect.bisect_left(self._keys, self._GetKey(start))
+
+    end_index = len(self._keys)
+    if end is not None:
+      end_index = bisect.bisect_right(self._keys, self._GetKey(end))
+
+    return self._entries[start_index:end_index]
+
+
+def _Deduplicate(items, window, get_date_time_values):
+  """Collapses items of which the date and time values are within a window.
+
+  Args:
+    items (Iterable[object]): items sorted by the sort key of their date and
+        time values.
+    window (Duration): window of the date and time values, where None
+        represents the precision of the coarser of both date and time values.
+    get_date_time_values (function): function that retrieves the date and time
+        values of an item, where None represents that the items are date and
+        time values.
+
+  Yields:
+    tuple[object, int]: item and number of items that were collapsed into it.
+
+  Raises:
+    ValueError: if the items are not sorted.
+  """
+  # pylint: disable=protected-access
+  kept_item = None
+  kept_normalized_timestamp = None
+  kept_precision = None
+  number_of_collapsed_items = 0
+  last_normalized_timestamp = None
+
+  for item in items:
+    date_time_values = item
+    if get_date_time_values is not None:
+      date_time_values = get_date_time_values(item)
+
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())
+
+    if normalized_timestamp is not None:
+      if (last_normalized_timestamp is not None and
+          normalized_timestamp < last_normalized_timestamp):
+        raise ValueError('Unsupported unsorted items.')
+
+      last_normalized_timestamp = normalized_timestamp
+
+      precision = definitions.NANOSECONDS_PER_PRECISION.get(
+          date_time_values.precision, 0)
+
+      if kept_item is not None:
+        if window is not None:
+          maximum_difference = window.nanoseconds
+        else:
+          maximum_difference = max(kept_precision, precision)
+
+        if normalized_timestamp - kept_normalized_timestamp < (
+            maximum_difference):
+          number_of_collapsed_items += 1
+          continue
+
+    if kept_item is not None:
+      yield kept_item, number_of_collapsed_items
+
+    kept_item = None
+    number_of_collapsed_items = 0
+
+    if normalized_timestamp is None:
+      # Date and time values without a timestamp are not collapsed.
+      yield item, 0
+    else:
+      kept_item = item
+      kept_normalized_timestamp = normalized_timestamp
+      kept_precision = precision
+
+  if kept_item is not None:
+    yield kept_item, number_of_collapsed_items
+
+
+def _GetSortedItems(items, get_date_time_values):
+  """Retrieves items sorted by the normalized timestamp of their values.
+
+  Args:
+    items (Iterable[object]): items.
+    get_date_time_values (function): function that retrieves the date and time
+        values of an item, where None represents that the items are date and
+        time values.
+
+  Returns:
+    list[tuple[int, int, object]]: normalized timestamp in number of
+        nanoseconds, precision in number of nanoseconds and item, sorted by
+        normalized timestamp, where items of date and time values without
+        a timestamp are ignored.
+  """
+  sorted_items = []
+  for item in items:
+    date_time_values = item
+    if get_date_time_values is not None:
+      date_time_values = get_date_time_values(item)
+
+    normalized_timestamp = (
+        date_time_values._GetNormalizedTimestampInNanoseconds())  # pylint: disable=protected-access
+    if normalized_timestamp is None:
+      continue
+
+    precision = definitions.NANOSECONDS_PER_PRECISION.get(
+        date_time_values.precision, 0)
+    sorted_items.append((normalized_timestamp, precision, item))
+
+  sorted_items.sort(key=operator.itemgetter(0))
+  return sorted_items
+
+
+def _MatchWithin(items, other_items, tolerance, get_date_time_values):
+  """Matches items of which the date and time values are within a tolerance.
+
+  Args:
+    items (Iterable[object]): items.
+    other_items (Iterable[object]): other items.
+    tolerance (Duration): maximum absolute difference between matching date and
+        time values, where None represents the precision of the coarser of
+        both date and time values.
+    get_date_time_values (function): function that retrieves the date and time
+        values of an item, where None represents that the items are date and
+        time values.
+
+  Yields:
+    tuple[object, object, Duration]: item, other item and difference between
+        the date and time values of the other item and those of the item.
+  """
+  sorted_items = _GetSortedItems(items, get_date_time_values)
+  other_sorted_items = _GetSortedItems(other_items, get_date_time_values)
+
+  if tolerance is not None:
+    maximum_tolerance = tolerance.nanoseconds
+  else:
+    precisions = [
+        precision for _, precision, _ in sorted_items + other_sorted_items]
+    maximum_tolerance = max(precisions, default=0)
+
+  number_of_other_items = len(other_sorted_items)
+  start_index = 0
+
+  for normalized_timestamp, precision, item in sorted_items:
+    # Both sides are sorted, so other items before the window of the current
+    # item are also before the window of the next items.
+    while (start_index < number_of_other_items and
+           other_sorted_items[start_index][0] < (
+               normalized_timestamp - maximum_tolerance)):
+      start_index += 1
+
+    index = start_index
+    while (index < number_of_other_items and
+           other_sorted_items[index][0] <= (
+               normalized_timestamp + maximum_tolerance)):
+      other_normalized_timestamp, other_precision, other_item = (
+          other_sorted_items[index])
+      index += 1
+
+      difference = other_normalized_timestamp - normalized_timestamp
+      if tolerance is None and abs(difference) > max(
+          precision, other_precision):
+        continue
+
+      yield item, other_item, duration.Duration(nanoseconds=difference)
+
+
+def Deduplicate(items, window=None, get_date_time_values=None):
+  """Collapses near-duplicate items of a sorted stream.
+
+  An item is collapsed into the last kept item if the difference between
+  the normalized timestamps of their date and time values is less than
+  the window, so that items that differ only below the precision of their
+  source are retrieved once. Only the last kept item is kept in memory.
+  Items of date and time values without a timestamp are not collapsed.
+
+  Args:
+    items (Iterable[object]): items sorted by the sort key of their date and
+        time values, such as the output of MergeSorted.
+    window (Optional[Duration]): window of the date and time values, where
+        None represents the precision of the coarser of the date and time
+        values of the item and the last kept item.
+    get_date_time_values (Optional[function]): function that retrieves
+        the date and time values of an item, where None represents that
+        the items are date and time values.
+
+  Returns:
+    generator[tuple[object, int]]: kept item and number of items that were
+        collapsed into it. The generator raises ValueError if the items are
+        not sorted.
+
+  Raises:
+    ValueError: if the window is negative.
+  """
+  if window is not None and window.nanoseconds < 0:
+    raise ValueError('Unsupported negative window: {0:d} ns.'.format(
+        window.nanoseconds))
+
+  return _Deduplicate(items, window, get_date_time_values)
+
+
+def MatchWithin(
+    items, other_items, tolerance=None, get_date_time_values=None):
+  """Matches items of which the date and time values are within a tolerance.
+
+  Both sides are sorted by normalized timestamp and swept once, so that
+  the cost is proportional to the number of items and matches instead of
+  the product of the number of items. Items of date and time values without
+  a timestamp are not matched.
+
+  Args:
+    items (Iterable[object]): items, such as date and time values of
+        a timeline of one source.
+    other_items (Iterable[object]): other items, such as date and time values
+        of a timeline of another source.
+    tolerance (Optional[Duration]): maximum absolute difference between
+        matching date and time values, where None represents the precision of
+        the coarser of both date and time values, for example 1 second when
+        matching FILETIME with time elements.
+    get_date_time_values (Optional[function]): function that retrieves
+        the date and time values of an item, where None represents that
+        the items are date and time values.
+
+  Returns:
+    generator[tuple[object, object, Duration]]: item, other item and
+        difference between the date and time values of the other item and
+        those of the item, sorted by the date and time values of the item and
+        the other item.
+
+  Raises:
+    ValueError: if the tolerance is negative.
+  """
+  if tolerance is not None and tolerance.nanoseconds < 0:
+    raise ValueError('Unsupported negative tolerance: {0:d} ns.'.format(
+        tolerance.nanoseconds))
+
+  return _MatchWithin(items, other_items, tolerance, get_date_time_values)
+
+
+def MergeSorted(iterables, get_date_time_values=None):
+  """Merges sorted streams into a single sorted stream.
+
+  The sort key of every item is determined once, when the item is consumed
+  from its stream, and only 1 item per stream is kept in memory, so that
+  hundreds of streams, such as per artifact timelines, can be merged without
+  comparing date and time values. Items with the same sort key are retrieved
+  in the order of their streams.
+
+  Args:
+    iterables (Iterable[Iterable[object]]): streams of items, where every
+        stream is sorted by the sort key of the date and time values of its
+        items.
+    get_date_time_values (Optional[function]): function that retrieves
+        the date and time values of an item, where None represents that
+        the items are date and time values.
+
+  Yields:
+    object: items sorted by the sort key of their date and time values.
+  """
+  if get_date_time_values is None:
+    key_function = operator.methodcaller('GetSortKey')
+  else:
+    def _GetSortKey(item):
+      return get_date_time_values(item).GetSortKey()
+
+    key_function = _GetSortKey
+
+  yield from heapq.merge(*iterables, key=key_function)
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -35,6 +36,16 @@ class UUIDTime(interface.DateTimeValues):
   # The difference between October 15, 1582 and January 1, 1970 in seconds.
   _UUID_TO_POSIX_BASE = 12219292800
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
+  _TIMESTAMP_NANOSECONDS_PER_UNIT = definitions.NANOSECONDS_PER_100NS
+  _TIMESTAMP_EPOCH_OFFSET = (
+      _UUID_TO_POSIX_BASE * definitions.NANOSECONDS_PER_SECOND)
+  _TIMESTAMP_MINIMUM = 0
+  _TIMESTAMP_MAXIMUM = (1 << 60) - 1
+
+  _SERIALIZED_ATTRIBUTES = ('_timestamp', )
+
   def __init__(self, timestamp=None):
     """Initializes an UUID version 1 timestamp.
 
@@ -56,6 +67,43 @@ class UUIDTime(interface.DateTimeValues):
     """int: UUID timestamp or None if timestamp is not set."""
     return self._timestamp
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a UUID version 1 timestamp from a normalized timestamp.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      UUIDTime: UUID version 1 timestamp.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the timestamp unit or the timestamp is out of bounds.
+    """
+    timestamp = self._GetTimestampFromNormalizedTimestamp(normalized_timestamp)
+    return type(self)(timestamp=timestamp)
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and fraction of second in 100 nanoseconds or
+          None if the timestamp is missing or invalid.
+    """
+    if (self._timestamp is None or self._timestamp < 0 or
+        self._timestamp > self._UINT60_MAX):
+      return None
+
+    timestamp, remainder = divmod(self._timestamp, self._100NS_PER_SECOND)
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH)
+
+    return year, month, day_of_month, hours, minutes, seconds, remainder
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -74,6 +122,23 @@ class UUIDTime(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if (self._timestamp is None or self._timestamp < 0 or
+        self._timestamp > self._UINT60_MAX):
+      return None
+
+    timestamp = self._timestamp - (
+        self._UUID_TO_POSIX_BASE * self._100NS_PER_SECOND)
+    return timestamp * definitions.NANOSECONDS_PER_100NS
+
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies an UUID timestamp from a date and time string.
 
@@ -109,29 +174,27 @@ class UUIDTime(interface.DateTimeValues):
     timestamp += date_time_values.get('microseconds', 0)
     timestamp *= self._100NS_PER_MICROSECOND
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._timestamp = timestamp
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the UUID timestamp to a date and time string.
 
     Returns:
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.#######" or
           None if the timestamp is missing or invalid.
     """
-    if (self._timestamp is None or self._timestamp < 0 or
-        self._timestamp > self._UINT60_MAX):
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    timestamp, remainder = divmod(self._timestamp, self._100NS_PER_SECOND)
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
+    year, month, day_of_month, hours, minutes, seconds, remainder = (
+        date_time_values)
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:07d}'.format(
-        year, month, day_of_month, hours, minutes, seconds, remainder)
+    date_time_string = self._FormatDateTimeString(
+        year, month, day_of_month, hours, minutes, seconds)
+    return '{0:s}.{1:07d}'.format(date_time_string, remainder)
 
 
 factory.Factory.RegisterDateTimeValues(UUIDTime)
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import decimal
 
+from dfdatetime import decorators
 from dfdatetime import definitions
 from dfdatetime import factory
 from dfdatetime import interface
@@ -33,6 +34,16 @@ class WebKitTime(interface.DateTimeValues):
   # The difference between January 1, 1601 and January 1, 1970 in seconds.
   _WEBKIT_TO_POSIX_BASE = 11644473600
 
+  _NANOSECONDS_TIMESTAMP_IS_EXACT = True
+
+  _TIMESTAMP_NANOSECONDS_PER_UNIT = definitions.NANOSECONDS_PER_MICROSECOND
+  _TIMESTAMP_EPOCH_OFFSET = (
+      _WEBKIT_TO_POSIX_BASE * definitions.NANOSECONDS_PER_SECOND)
+  _TIMESTAMP_MINIMUM = -(1 << 63)
+  _TIMESTAMP_MAXIMUM = (1 << 63) - 1
+
+  _SERIALIZED_ATTRIBUTES = ('_timestamp', )
+
   def __init__(self, timestamp=None):
     """Initializes a WebKit timestamp.
 
@@ -48,6 +59,44 @@ class WebKitTime(interface.DateTimeValues):
     """decimal.Decimal: WebKit timestamp or None if timestamp is not set."""
     return self._timestamp
 
+  def _CreateFromNormalizedTimestampInNanoseconds(self, normalized_timestamp):
+    """Creates a WebKit timestamp from a normalized timestamp.
+
+    Args:
+      normalized_timestamp (int): normalized timestamp, which contains
+          the number of nanoseconds since January 1, 1970 00:00:00.
+
+    Returns:
+      WebKitTime: WebKit timestamp.
+
+    Raises:
+      ValueError: if the normalized timestamp is not a multiple of
+          the timestamp unit or the timestamp is out of bounds.
+    """
+    timestamp = self._GetTimestampFromNormalizedTimestamp(normalized_timestamp)
+    return type(self)(timestamp=timestamp)
+
+  def _GetDateTimeValues(self):
+    """Determines the date and time values.
+
+    Returns:
+      tuple[int, int, int, int, int, int, int]: year, month, day of month,
+          hours, minutes, seconds and microseconds or None if the timestamp is
+          missing or invalid.
+    """
+    if (self._timestamp is None or self._timestamp < self._INT64_MIN or
+        self._timestamp > self._INT64_MAX):
+      return None
+
+    timestamp, microseconds = divmod(
+        self._timestamp, definitions.MICROSECONDS_PER_SECOND)
+    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
+
+    year, month, day_of_month = self._GetDateValuesWithEpoch(
+        number_of_days, self._EPOCH)
+
+    return year, month, day_of_month, hours, minutes, seconds, microseconds
+
   def _GetNormalizedTimestamp(self):
     """Retrieves the normalized timestamp.
 
@@ -66,6 +115,23 @@ class WebKitTime(interface.DateTimeValues):
 
     return self._normalized_timestamp
 
+  def _GetNormalizedTimestampInNanoseconds(self):
+    """Retrieves the normalized timestamp in nanoseconds.
+
+    Returns:
+      int: normalized timestamp, which contains the number of nanoseconds
+          since January 1, 1970 00:00:00, or None if the normalized timestamp
+          cannot be determined.
+    """
+    if (self._timestamp is None or self._timestamp < self._INT64_MIN or
+        self._timestamp > self._INT64_MAX):
+      return None
+
+    timestamp = self._timestamp - (
+        self._WEBKIT_TO_POSIX_BASE * definitions.MICROSECONDS_PER_SECOND)
+    return timestamp * definitions.NANOSECONDS_PER_MICROSECOND
+
+  @decorators.not_frozen
   def CopyFromDateTimeString(self, time_string):
     """Copies a WebKit timestamp from a date and time string.
 
@@ -97,30 +163,27 @@ class WebKitTime(interface.DateTimeValues):
     timestamp *= definitions.MICROSECONDS_PER_SECOND
     timestamp += date_time_values.get('microseconds', 0)
 
-    self._normalized_timestamp = None
+    self._ResetCachedValues()
     self._timestamp = timestamp
     self._time_zone_offset = time_zone_offset
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the WebKit timestamp to a date and time string.
 
     Returns:
       str: date and time value formatted as: "YYYY-MM-DD hh:mm:ss.######" or
           None if the timestamp is missing or invalid.
     """
-    if (self._timestamp is None or self._timestamp < self._INT64_MIN or
-        self._timestamp > self._INT64_MAX):
+    date_time_values = self._GetCachedDateTimeValues()
+    if date_time_values is None:
       return None
 
-    timestamp, microseconds = divmod(
-        self._timestamp, definitions.MICROSECONDS_PER_SECOND)
-    number_of_days, hours, minutes, seconds = self._GetTimeValues(timestamp)
-
-    year, month, day_of_month = self._GetDateValuesWithEpoch(
-        number_of_days, self._EPOCH)
+    year, month, day_of_month, hours, minutes, seconds, microseconds = (
+        date_time_values)
 
-    return '{0:04d}-{1:02d}-{2:02d} {3:02d}:{4:02d}:{5:02d}.{6:06d}'.format(
-        year, month, day_of_month, hours, minutes, seconds, microseconds)
+    date_time_string = self._FormatDateTimeString(
+        year, month, day_of_month, hours, minutes, seconds)
+    return '{0:s}.{1:06d}'.format(date_time_string, microseconds)
 
 
 factory.Factory.RegisterDateTimeValues(WebKitTime)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the Apache Arrow columns of date and time values."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfdatetime import arrow
+from dfdatetime import cocoa_time
+from dfdatetime import filetime
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+
+
+class ArrowTest(unittest.TestCase):
+  """Tests for the Apache Arrow columns of date and time values."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestValues(self):
+    """Creates date and time values for testing.
+
+    Returns:
+      list[DateTimeValues]: date and time values.
+    """
+    return [
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce),
+        posix_time.PosixTime(timestamp=1281643591),
+        semantic_time.Never(),
+        semantic_time.SemanticTime(string='Unknown'),
+        filetime.Filetime(),
+        filetime.Filetime(timestamp=0),
+        cocoa_time.CocoaTime(timestamp=395011845.5)]
+
+  def testCheckUnit(self):
+    """Tests the _CheckUnit function."""
+    arrow._CheckUnit('us')
+
+    with self.assertRaises(ValueError):
+      arrow._CheckUnit('D')
+
+  def testCopyFromColumns(self):
+    """Tests the CopyFromColumns function."""
+    timestamps, unit, type_names, statuses = arrow.CopyToColumns(
+        self._CreateTestValues())
+
+    date_time_values_list = arrow.CopyFromColumns(
+        timestamps, unit, type_names, statuses)
+    self.assertEqual(len(date_time_values_list), 7)
+
+    self.assertIsInstance(date_time_values_list[0], filetime.Filetime)
+    self.assertEqual(date_time_values_list[0].timestamp, 0x01cb3a623d0a17ce)
+
+    self.assertIsInstance(date_time_values_list[1], posix_time.PosixTime)
+    self.assertEqual(date_time_values_list[1].timestamp, 1281643591)
+
+    self.assertIsInstance(date_time_values_list[2], semantic_time.Never)
+
+    self.assertIsInstance(
+        date_time_values_list[3], semantic_time.SemanticTime)
+    self.assertEqual(date_time_values_list[3].string, 'Unknown')
+
+    self.assertIsInstance(date_time_values_list[4], filetime.Filetime)
+    self.assertIsNone(date_time_values_list[4].timestamp)
+
+    self.assertIsInstance(date_time_values_list[5], filetime.Filetime)
+    self.assertIsNone(date_time_values_list[5].timestamp)
+
+    self.assertIsInstance(
+        date_time_values_list[6], posix_time.PosixTimeInNanoseconds)
+    self.assertEqual(
+        date_time_values_list[6].CopyToDateTimeString(),
+        '2013-07-08 21:30:45.500000000')
+
+    with self.assertRaises(ValueError):
+      arrow.CopyFromColumns([0], 'us', [], [])
+
+    with self.assertRaises(KeyError):
+      arrow.CopyFromColumns([0], 'us', ['Bogus'], [None])
+
+  def testCopyToColumns(self):
+    """Tests the CopyToColumns function."""
+    timestamps, unit, type_names, statuses = arrow.CopyToColumns(
+        self._CreateTestValues())
+
+    self.assertEqual(unit, 'ns')
+    self.assertEqual(timestamps, [
+        1281647191546875000, 1281643591000000000, None, None, None, None,
+        1373319045500000000])
+    self.assertEqual(type_names, [
+        'Filetime', 'PosixTime', 'Never', 'SemanticTime', 'Filetime',
+        'Filetime', 'CocoaTime'])
+    self.assertEqual(statuses, [
+        None, None, 'Never', 'Unknown', 'Not set', 'Out of range', None])
+
+    timestamps, unit, _, _ = arrow.CopyToColumns(
+        [filetime.Filetime(timestamp=0x01cb3a623d0a17ce)], unit='ms')
+    self.assertEqual(unit, 'ms')
+    self.assertEqual(timestamps, [1281647191546])
+
+    with self.assertRaises(ValueError):
+      arrow.CopyToColumns([], unit='D')
+
+  @unittest.skipUnless(arrow.pyarrow, 'missing pyarrow')
+  def testCopyToTable(self):
+    """Tests the CopyToTable and CopyFromTable functions."""
+    test_values = self._CreateTestValues()
+
+    table = arrow.CopyToTable(test_values, name='mtime')
+    self.assertEqual(table.num_rows, len(test_values))
+    self.assertEqual(table.column('mtime').type.unit, 'ns')
+
+    date_time_values_list = arrow.CopyFromTable(table, name='mtime')
+    self.assertEqual(len(date_time_values_list), len(test_values))
+    self.assertEqual(date_time_values_list[0].timestamp, 0x01cb3a623d0a17ce)
+    self.assertIsInstance(date_time_values_list[2], semantic_time.Never)
+
+  @unittest.skipIf(arrow.pyarrow, 'pyarrow available')
+  def testCopyToTableWithoutPyArrow(self):
+    """Tests the CopyToTable function without pyarrow."""
+    with self.assertRaises(RuntimeError):
+      arrow.CopyToTable([])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -79,13 +79,17 @@ class CocoaTimeTest(unittest.TestCase):
     date_time_string = cocoa_time_object.CopyToDateTimeString()
     self.assertEqual(date_time_string, '2013-07-08 21:30:45.546875')
 
+    cocoa_time_object = cocoa_time.CocoaTime(timestamp=395011845.546875)
+
     epoch_year = cocoa_time_object._EPOCH.year
     cocoa_time_object._EPOCH.year = -1
 
-    with self.assertRaises(ValueError):
-      cocoa_time_object.CopyToDateTimeString()
+    try:
+      with self.assertRaises(ValueError):
+        cocoa_time_object.CopyToDateTimeString()
 
-    cocoa_time_object._EPOCH.year = epoch_year
+    finally:
+      cocoa_time_object._EPOCH.year = epoch_year
 
     cocoa_time_object = cocoa_time.CocoaTime()
 
@@ -106,6 +110,11 @@ class CocoaTimeTest(unittest.TestCase):
     date_tuple = cocoa_time_object.GetDate()
     self.assertEqual(date_tuple, (2013, 7, 8))
 
+    cocoa_time_object = cocoa_time.CocoaTime(timestamp=-978307200.5)
+
+    date_tuple = cocoa_time_object.GetDate()
+    self.assertEqual(date_tuple, (1969, 12, 31))
+
     cocoa_time_object = cocoa_time.CocoaTime()
 
     date_tuple = cocoa_time_object.GetDate()
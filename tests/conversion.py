@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the date and time values conversion functions."""
+
+from __future__ import unicode_literals
+
+import decimal
+import random
+import unittest
+
+from dfdatetime import conversion
+from dfdatetime import cocoa_time
+from dfdatetime import definitions
+from dfdatetime import duration
+from dfdatetime import fat_date_time
+from dfdatetime import filetime
+from dfdatetime import hfs_time
+from dfdatetime import posix_time
+from dfdatetime import rfc2579_date_time
+from dfdatetime import semantic_time
+from dfdatetime import systemtime
+from dfdatetime import time_elements
+from dfdatetime import uuid_time
+from dfdatetime import webkit_time
+
+
+class ConversionTest(unittest.TestCase):
+  """Tests for the date and time values conversion functions."""
+
+  # pylint: disable=protected-access
+
+  def testCheckRounding(self):
+    """Tests the _CheckRounding function."""
+    conversion._CheckRounding(decimal.ROUND_HALF_UP)
+
+    with self.assertRaises(ValueError):
+      conversion._CheckRounding(decimal.ROUND_HALF_EVEN)
+
+  def testDivide(self):
+    """Tests the _Divide function."""
+    test_values = [
+        (decimal.ROUND_CEILING, 15, 2),
+        (decimal.ROUND_CEILING, -15, -1),
+        (decimal.ROUND_DOWN, 15, 1),
+        (decimal.ROUND_DOWN, -15, -1),
+        (decimal.ROUND_FLOOR, 15, 1),
+        (decimal.ROUND_FLOOR, -15, -2),
+        (decimal.ROUND_HALF_UP, 15, 2),
+        (decimal.ROUND_HALF_UP, -15, -2),
+        (decimal.ROUND_HALF_UP, 14, 1),
+        (decimal.ROUND_HALF_UP, -14, -1)]
+
+    for rounding, numerator, expected_quotient in test_values:
+      quotient = conversion._Divide(numerator, 10, rounding)
+      self.assertEqual(quotient, expected_quotient)
+
+      expected_quotient = decimal.Decimal(numerator).scaleb(-1).quantize(
+          1, rounding=rounding)
+      self.assertEqual(quotient, expected_quotient)
+
+  def testAddDurationToTimestamps(self):
+    """Tests the AddDurationToTimestamps function."""
+    timestamps = conversion.AddDurationToTimestamps(
+        [0x01cb3a623d0a17ce, None, 0, 0xffffffffffffffff], filetime.Filetime,
+        duration.Duration(microseconds=1))
+    self.assertEqual(timestamps, [0x01cb3a623d0a17d8, None, 10, None])
+
+    timestamps = conversion.AddDurationToTimestamps(
+        [1281643591, 0], posix_time.PosixTime, duration.Duration(days=-1))
+    self.assertEqual(timestamps, [1281557191, -86400])
+
+    with self.assertRaises(ValueError):
+      conversion.AddDurationToTimestamps(
+          [1281643591], posix_time.PosixTime,
+          duration.Duration(milliseconds=1))
+
+    with self.assertRaises(ValueError):
+      conversion.AddDurationToTimestamps(
+          [0], cocoa_time.CocoaTime, duration.Duration(seconds=1))
+
+  def testConvert(self):
+    """Tests the Convert function."""
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+
+    date_time_values = conversion.Convert(
+        filetime_object, posix_time.PosixTimeInMicroseconds)
+    self.assertIsInstance(date_time_values, posix_time.PosixTimeInMicroseconds)
+    self.assertEqual(date_time_values.timestamp, 1281647191546875)
+
+    date_time_values = conversion.Convert(
+        filetime_object, webkit_time.WebKitTime)
+    self.assertEqual(date_time_values.timestamp, 12926120791546875)
+    self.assertEqual(
+        date_time_values.CopyToDateTimeString(), '2010-08-12 21:06:31.546875')
+
+    date_time_values = conversion.Convert(
+        filetime_object, uuid_time.UUIDTime)
+    self.assertEqual(date_time_values.timestamp, 0x1dfa6557b4cd7ce)
+    self.assertEqual(date_time_values, filetime_object)
+
+    date_time_values = conversion.Convert(filetime_object, hfs_time.HFSTime)
+    self.assertEqual(date_time_values.timestamp, 3364491991)
+
+    date_time_values = conversion.Convert(
+        filetime_object, posix_time.PosixTime,
+        rounding=decimal.ROUND_HALF_UP)
+    self.assertEqual(date_time_values.timestamp, 1281647192)
+
+    cocoa_time_object = cocoa_time.CocoaTime(timestamp=395011845.546875)
+    date_time_values = conversion.Convert(
+        cocoa_time_object, posix_time.PosixTimeInMicroseconds)
+    self.assertEqual(date_time_values.timestamp, 1373319045546875)
+
+    date_time_values = conversion.Convert(
+        semantic_time.NotSet(), posix_time.PosixTime)
+    self.assertIsNone(date_time_values)
+
+    posix_time_object = posix_time.PosixTime(timestamp=-20000000000)
+    with self.assertRaises(ValueError):
+      conversion.Convert(posix_time_object, filetime.Filetime)
+
+    with self.assertRaises(ValueError):
+      conversion.Convert(filetime_object, cocoa_time.CocoaTime)
+
+    with self.assertRaises(ValueError):
+      conversion.Convert(
+          filetime_object, posix_time.PosixTime,
+          rounding=decimal.ROUND_HALF_EVEN)
+
+  def testConvertTimestamps(self):
+    """Tests the ConvertTimestamps function."""
+    timestamps = conversion.ConvertTimestamps(
+        [0x01cb3a623d0a17ce, None, -1, 0], filetime.Filetime,
+        posix_time.PosixTimeInMicroseconds)
+    self.assertEqual(timestamps, [
+        1281647191546875, None, None, -11644473600000000])
+
+    timestamps = conversion.ConvertTimestamps(
+        [1281647191546875, -11644473600000001],
+        posix_time.PosixTimeInMicroseconds, filetime.Filetime)
+    self.assertEqual(timestamps, [0x01cb3a623d0a17ce, None])
+
+    timestamps = conversion.ConvertTimestamps(
+        [1281647191546875, -1500000], posix_time.PosixTimeInMicroseconds,
+        posix_time.PosixTime, rounding=decimal.ROUND_DOWN)
+    self.assertEqual(timestamps, [1281647191, -1])
+
+    with self.assertRaises(ValueError):
+      conversion.ConvertTimestamps(
+          [0], cocoa_time.CocoaTime, posix_time.PosixTime)
+
+  def testGetNormalizedTimestampInNanoseconds(self):
+    """Tests that the integer and Decimal normalized timestamps match."""
+    test_values = [
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce),
+        hfs_time.HFSTime(timestamp=3458215528),
+        posix_time.PosixTime(timestamp=-1281643591),
+        posix_time.PosixTimeInMilliseconds(timestamp=-1281647191546),
+        posix_time.PosixTimeInMicroseconds(timestamp=-1281647191546875),
+        posix_time.PosixTimeInNanoseconds(timestamp=1281647191546875322),
+        uuid_time.UUIDTime(timestamp=0x1dfa6557b4cd7ce),
+        webkit_time.WebKitTime(timestamp=-12926120791546875)]
+
+    for date_time_values in test_values:
+      normalized_timestamp = date_time_values._GetNormalizedTimestamp()
+      expected_normalized_timestamp = int(normalized_timestamp * 1000000000)
+
+      normalized_timestamp = (
+          date_time_values._GetNormalizedTimestampInNanoseconds())
+      self.assertEqual(normalized_timestamp, expected_normalized_timestamp)
+
+  def testGetPlasoTimestamps(self):
+    """Tests the GetPlasoTimestamps function."""
+    timestamps = conversion.GetPlasoTimestamps(
+        [0x01cb3a623d0a17ce, 0x01cb3a623d0a17c9, 0x01cb3a623d0a17c8, None],
+        filetime.Filetime)
+    self.assertEqual(timestamps, [
+        1281647191546875, 1281647191546875, 1281647191546874, None])
+
+    timestamps = conversion.GetPlasoTimestamps(
+        [-1281647191546875322, -500, -499], posix_time.PosixTimeInNanoseconds)
+    self.assertEqual(timestamps, [-1281647191546875, -1, 0])
+
+  def testGetTimestampUnit(self):
+    """Tests the GetTimestampUnit function."""
+    unit = conversion.GetTimestampUnit([])
+    self.assertEqual(unit, 's')
+
+    unit = conversion.GetTimestampUnit([
+        fat_date_time.FATDateTime(fat_date_time=0xa8d03d0c),
+        semantic_time.Never()])
+    self.assertEqual(unit, 's')
+
+    unit = conversion.GetTimestampUnit([
+        posix_time.PosixTime(timestamp=0),
+        posix_time.PosixTimeInMilliseconds(timestamp=0)])
+    self.assertEqual(unit, 'ms')
+
+    unit = conversion.GetTimestampUnit([
+        posix_time.PosixTimeInMicroseconds(timestamp=0),
+        filetime.Filetime(timestamp=0)])
+    self.assertEqual(unit, 'ns')
+
+
+  def testRoundTimestamps(self):
+    """Tests the RoundTimestamps function."""
+    timestamps = conversion.RoundTimestamps(
+        [0x01cb3a623d0a17ce, None, -1, 0], filetime.Filetime,
+        definitions.PRECISION_1_MINUTE)
+    self.assertEqual(timestamps, [0x01cb3a622a3c6c00, None, None, 0])
+
+    timestamps = conversion.RoundTimestamps(
+        [129261207915468745, 129261207915468744], filetime.Filetime,
+        definitions.PRECISION_1_MICROSECOND, rounding=decimal.ROUND_HALF_UP)
+    self.assertEqual(timestamps, [129261207915468750, 129261207915468740])
+
+    timestamps = conversion.RoundTimestamps(
+        [-90, 90, 0xffffffff], posix_time.PosixTime,
+        definitions.PRECISION_1_MINUTE, rounding=decimal.ROUND_CEILING)
+    self.assertEqual(timestamps, [-60, 120, 4294967340])
+
+    timestamps = conversion.RoundTimestamps(
+        [0xffffffff], hfs_time.HFSTime, definitions.PRECISION_1_DAY,
+        rounding=decimal.ROUND_CEILING)
+    self.assertEqual(timestamps, [None])
+
+    with self.assertRaises(ValueError):
+      conversion.RoundTimestamps(
+          [0], posix_time.PosixTime, definitions.PRECISION_1_SECOND,
+          rounding=decimal.ROUND_HALF_EVEN)
+
+    with self.assertRaises(ValueError):
+      conversion.RoundTimestamps([0], posix_time.PosixTime, 'bogus')
+
+class IntegerDerivedTimestampsTest(unittest.TestCase):
+  """Tests the integer against the Decimal derived timestamps."""
+
+  # pylint: disable=protected-access
+
+  _NUMBER_OF_TEST_VALUES = 500
+
+  def _CreateTestValues(self, random_generator):
+    """Creates date time values for testing.
+
+    Args:
+      random_generator (random.Random): random number generator.
+
+    Yields:
+      DateTimeValues: date time values.
+    """
+    for _ in range(self._NUMBER_OF_TEST_VALUES):
+      fat_date = (
+          (random_generator.randint(0, 127) << 9) |
+          (random_generator.randint(1, 12) << 5) |
+          random_generator.randint(1, 28))
+      fat_time = (
+          (random_generator.randint(0, 23) << 11) |
+          (random_generator.randint(0, 59) << 5) |
+          random_generator.randint(0, 29))
+      yield fat_date_time.FATDateTime(
+          fat_date_time=fat_date | (fat_time << 16))
+      yield filetime.Filetime(
+          timestamp=random_generator.randint(0, (1 << 64) - 1))
+      yield hfs_time.HFSTime(
+          timestamp=random_generator.randint(0, (1 << 32) - 1))
+      yield posix_time.PosixTime(
+          timestamp=random_generator.randint(-(1 << 40), 1 << 40))
+      yield posix_time.PosixTimeInMilliseconds(
+          timestamp=random_generator.randint(-(1 << 50), 1 << 50))
+      yield posix_time.PosixTimeInMicroseconds(
+          timestamp=random_generator.randint(-(1 << 60), 1 << 60))
+      yield posix_time.PosixTimeInNanoseconds(
+          timestamp=random_generator.randint(-(1 << 63), (1 << 63) - 1))
+      yield uuid_time.UUIDTime(
+          timestamp=random_generator.randint(0, (1 << 60) - 1))
+      yield webkit_time.WebKitTime(
+          timestamp=random_generator.randint(-(1 << 63), (1 << 63) - 1))
+
+      time_elements_tuple = (
+          random_generator.randint(1601, 9999),
+          random_generator.randint(1, 12), random_generator.randint(1, 28),
+          random_generator.randint(0, 23), random_generator.randint(0, 59),
+          random_generator.randint(0, 59))
+      milliseconds = random_generator.randint(0, 999)
+
+      yield systemtime.Systemtime(
+          system_time_tuple=time_elements_tuple[:2] + (0, ) +
+          time_elements_tuple[2:] + (milliseconds, ))
+      yield rfc2579_date_time.RFC2579DateTime(
+          rfc2579_date_time_tuple=time_elements_tuple + (
+              milliseconds // 100, '+', 0, 0))
+      yield time_elements.TimeElements(time_elements_tuple=time_elements_tuple)
+      yield time_elements.TimeElementsInMilliseconds(
+          time_elements_tuple=time_elements_tuple + (milliseconds, ))
+      yield time_elements.TimeElementsInMicroseconds(
+          time_elements_tuple=time_elements_tuple + (
+              random_generator.randint(0, 999999), ))
+
+  def testDerivedTimestamps(self):
+    """Tests GetPlasoTimestamp and CopyToStatTimeTuple."""
+    random_generator = random.Random(0x5eed)
+
+    for date_time_values in self._CreateTestValues(random_generator):
+      self.assertTrue(date_time_values._NANOSECONDS_TIMESTAMP_IS_EXACT)
+
+      plaso_timestamp = date_time_values._GetPlasoTimestampFromNanoseconds()
+      expected_plaso_timestamp = (
+          date_time_values._GetPlasoTimestampFromDecimal())
+      self.assertEqual(plaso_timestamp, expected_plaso_timestamp)
+
+      stat_time_tuple = date_time_values._CopyToStatTimeTupleFromNanoseconds()
+      expected_stat_time_tuple = (
+          date_time_values._CopyToStatTimeTupleFromDecimal())
+      self.assertEqual(stat_time_tuple, expected_stat_time_tuple)
+
+      self.assertEqual(date_time_values.GetPlasoTimestamp(), plaso_timestamp)
+      self.assertEqual(
+          date_time_values.CopyToStatTimeTuple(), stat_time_tuple)
+
+
+if __name__ == '__main__':
+  unittest.main()
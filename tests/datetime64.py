@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the NumPy datetime64 arrays of date and time values."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfdatetime import cocoa_time
+from dfdatetime import datetime64
+from dfdatetime import filetime
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+
+
+class DateTime64Test(unittest.TestCase):
+  """Tests for the NumPy datetime64 arrays of date and time values."""
+
+  def _CreateTestValues(self):
+    """Creates date and time values for testing.
+
+    Returns:
+      list[DateTimeValues]: date and time values.
+    """
+    return [
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce),
+        posix_time.PosixTimeInMicroseconds(timestamp=1281643591546875),
+        semantic_time.Never(),
+        filetime.Filetime(timestamp=0)]
+
+  def testCopyFromTimestamps(self):
+    """Tests the CopyFromTimestamps function."""
+    date_time_values_list = datetime64.CopyFromTimestamps(
+        [1281647191546875000, datetime64.NAT, None], 'ns',
+        filetime.Filetime)
+    self.assertEqual(len(date_time_values_list), 3)
+    self.assertIsInstance(date_time_values_list[0], filetime.Filetime)
+    self.assertEqual(date_time_values_list[0].timestamp, 0x01cb3a623d0a17ce)
+    self.assertIsNone(date_time_values_list[1].timestamp)
+    self.assertIsNone(date_time_values_list[2].timestamp)
+
+    date_time_values_list = datetime64.CopyFromTimestamps(
+        [1281643591], 's', posix_time.PosixTime)
+    self.assertEqual(date_time_values_list[0].timestamp, 1281643591)
+
+    with self.assertRaises(ValueError):
+      datetime64.CopyFromTimestamps([0], 'D', filetime.Filetime)
+
+    with self.assertRaises(ValueError):
+      datetime64.CopyFromTimestamps([0], 's', cocoa_time.CocoaTime)
+
+  def testCopyToTimestamps(self):
+    """Tests the CopyToTimestamps function."""
+    timestamps, unit = datetime64.CopyToTimestamps(self._CreateTestValues())
+    self.assertEqual(unit, 'ns')
+    self.assertEqual(timestamps, [
+        1281647191546875000, 1281643591546875000, datetime64.NAT,
+        datetime64.NAT])
+
+    timestamps, unit = datetime64.CopyToTimestamps(
+        self._CreateTestValues(), unit='us')
+    self.assertEqual(unit, 'us')
+    self.assertEqual(timestamps, [
+        1281647191546875, 1281643591546875, datetime64.NAT,
+        -11644473600000000])
+
+    with self.assertRaises(ValueError):
+      datetime64.CopyToTimestamps([], unit='D')
+
+  @unittest.skipUnless(datetime64.numpy, 'missing numpy')
+  def testToDatetime64Array(self):
+    """Tests the ToDatetime64Array and FromDatetime64Array functions."""
+    array = datetime64.ToDatetime64Array(self._CreateTestValues())
+    self.assertEqual(str(array.dtype), 'datetime64[ns]')
+    self.assertEqual(
+        str(array[0]), '2010-08-12T21:06:31.546875000')
+    self.assertTrue(datetime64.numpy.isnat(array[2]))
+
+    date_time_values_list = datetime64.FromDatetime64Array(
+        array, filetime.Filetime)
+    self.assertEqual(date_time_values_list[0].timestamp, 0x01cb3a623d0a17ce)
+    self.assertIsNone(date_time_values_list[2].timestamp)
+
+    array = datetime64.numpy.array(['2010-08-12'], dtype='datetime64[D]')
+    date_time_values_list = datetime64.FromDatetime64Array(
+        array, posix_time.PosixTime)
+    self.assertEqual(date_time_values_list[0].timestamp, 1281571200)
+
+    with self.assertRaises(ValueError):
+      datetime64.FromDatetime64Array(
+          datetime64.numpy.array([1]), posix_time.PosixTime)
+
+  @unittest.skipIf(datetime64.numpy, 'numpy available')
+  def testToDatetime64ArrayWithoutNumPy(self):
+    """Tests the ToDatetime64Array function without numpy."""
+    with self.assertRaises(RuntimeError):
+      datetime64.ToDatetime64Array([])
+
+
+if __name__ == '__main__':
+  unittest.main()
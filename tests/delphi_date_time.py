@@ -122,6 +122,11 @@ class DelphiDateTimeTest(unittest.TestCase):
     date_time_string = delphi_date_time_object.CopyToDateTimeString()
     self.assertEqual(date_time_string, '2013-06-18 19:50:00.553919')
 
+    delphi_date_time_object = delphi_date_time.DelphiDateTime(timestamp=-1.25)
+
+    date_time_string = delphi_date_time_object.CopyToDateTimeString()
+    self.assertEqual(date_time_string, '1899-12-28 18:00:00.000000')
+
     delphi_date_time_object = delphi_date_time.DelphiDateTime()
 
     date_time_string = delphi_date_time_object.CopyToDateTimeString()
@@ -143,6 +148,11 @@ class DelphiDateTimeTest(unittest.TestCase):
     date_tuple = delphi_date_time_object.GetDate()
     self.assertEqual(date_tuple, (2013, 6, 18))
 
+    delphi_date_time_object = delphi_date_time.DelphiDateTime(timestamp=-1.25)
+
+    date_tuple = delphi_date_time_object.GetDate()
+    self.assertEqual(date_tuple, (1899, 12, 28))
+
     delphi_date_time_object = delphi_date_time.DelphiDateTime()
 
     date_tuple = delphi_date_time_object.GetDate()
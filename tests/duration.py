@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the duration implementation."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfdatetime import duration
+
+
+class DurationTest(unittest.TestCase):
+  """Tests for the duration."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    duration_object = duration.Duration()
+    self.assertEqual(duration_object.nanoseconds, 0)
+
+    duration_object = duration.Duration(
+        days=1, hours=2, minutes=3, seconds=4, milliseconds=5, microseconds=6,
+        nanoseconds=7)
+    self.assertEqual(duration_object.nanoseconds, 93784005006007)
+
+    duration_object = duration.Duration(seconds=-1, nanoseconds=1)
+    self.assertEqual(duration_object.nanoseconds, -999999999)
+
+    with self.assertRaises(ValueError):
+      duration.Duration(seconds=1.5)
+
+    with self.assertRaises(ValueError):
+      duration.Duration(seconds=True)
+
+  def testArithmetic(self):
+    """Tests the __abs__, __add__, __neg__ and __sub__ functions."""
+    duration_object = duration.Duration(seconds=1)
+
+    result_duration = duration_object + duration.Duration(nanoseconds=1)
+    self.assertEqual(result_duration.nanoseconds, 1000000001)
+
+    result_duration = duration_object - duration.Duration(seconds=2)
+    self.assertEqual(result_duration.nanoseconds, -1000000000)
+
+    self.assertEqual(abs(result_duration), duration_object)
+    self.assertEqual(-duration_object, result_duration)
+
+    with self.assertRaises(ValueError):
+      _ = duration_object + 1
+
+  def testComparison(self):
+    """Tests the comparison functions."""
+    duration_object1 = duration.Duration(seconds=1)
+    duration_object2 = duration.Duration(milliseconds=1000)
+    duration_object3 = duration.Duration(nanoseconds=1)
+
+    self.assertTrue(duration_object1 == duration_object2)
+    self.assertFalse(duration_object1 == duration_object3)
+    self.assertFalse(duration_object1 == 1000000000)
+
+    self.assertTrue(duration_object1 >= duration_object2)
+    self.assertTrue(duration_object1 > duration_object3)
+    self.assertTrue(duration_object3 <= duration_object1)
+    self.assertTrue(duration_object3 < duration_object1)
+
+    self.assertTrue(duration_object1 != duration_object3)
+    self.assertTrue(duration_object1 != 1000000000)
+
+    self.assertEqual(hash(duration_object1), hash(duration_object2))
+
+    with self.assertRaises(ValueError):
+      _ = duration_object1 < 1
+
+  def testCopyToNumPyTimedelta64(self):
+    """Tests the CopyToNumPyTimedelta64 function."""
+    duration_object = duration.Duration(seconds=1, nanoseconds=1)
+
+    if not duration.numpy:
+      with self.assertRaises(RuntimeError):
+        duration_object.CopyToNumPyTimedelta64()
+      return
+
+    timedelta64_value = duration_object.CopyToNumPyTimedelta64()
+    self.assertEqual(
+        timedelta64_value, duration.numpy.timedelta64(1000000001, 'ns'))
+
+    duration_object = duration.Duration(nanoseconds=-(1 << 63))
+    with self.assertRaises(ValueError):
+      duration_object.CopyToNumPyTimedelta64()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the external merge sort of date and time values."""
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from dfdatetime import external_sort
+from dfdatetime import filetime
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+
+
+class ExternalSortTest(unittest.TestCase):
+  """Tests for the external merge sort of date and time values."""
+
+  # pylint: disable=protected-access
+
+  def setUp(self):
+    """Makes preparations before running an individual test."""
+    self._temporary_directory = tempfile.mkdtemp()
+
+  def tearDown(self):
+    """Cleans up after running an individual test."""
+    shutil.rmtree(self._temporary_directory, ignore_errors=True)
+
+  def _CreateTestEntries(self):
+    """Creates entries for testing.
+
+    Returns:
+      list[tuple[DateTimeValues, bytes]]: entries.
+    """
+    return [
+        (posix_time.PosixTime(timestamp=1281643594), b'd'),
+        (semantic_time.Never(), b'never'),
+        (filetime.Filetime(timestamp=0x01cb3a623d0a17ce), None),
+        (posix_time.PosixTime(timestamp=1281643591), b'a'),
+        (semantic_time.NotSet(), b''),
+        (posix_time.PosixTime(timestamp=1281643593), b'c1'),
+        (posix_time.PosixTimeInMilliseconds(timestamp=1281643592000), b'b'),
+        (posix_time.PosixTime(timestamp=1281643593), b'c2')]
+
+  def _GetPayloads(self, entries):
+    """Retrieves the payloads of entries.
+
+    Args:
+      entries (Iterable[tuple[DateTimeValues, bytes]]): entries.
+
+    Returns:
+      list[bytes]: payloads.
+    """
+    return [payload for _, payload in entries]
+
+  def testReadRun(self):
+    """Tests the _ReadRun and _WriteRun functions."""
+    test_entries = self._CreateTestEntries()
+
+    path = external_sort._WriteRun(test_entries, self._temporary_directory)
+
+    entries = list(external_sort._ReadRun(path))
+    self.assertEqual(len(entries), 8)
+    self.assertEqual(
+        self._GetPayloads(entries), self._GetPayloads(test_entries))
+    self.assertIsInstance(entries[2][0], filetime.Filetime)
+    self.assertEqual(entries[2][0].timestamp, 0x01cb3a623d0a17ce)
+
+    with open(path, 'ab') as file_object:
+      file_object.write(b'\x00\x00')
+
+    with self.assertRaises(ValueError):
+      list(external_sort._ReadRun(path))
+
+    with self.assertRaises(ValueError):
+      external_sort._WriteRun(
+          [(semantic_time.Never(), 'never')], self._temporary_directory)
+
+  def testSortEntries(self):
+    """Tests the SortEntries function."""
+    expected_payloads = [
+        b'', b'a', b'b', b'c1', b'c2', b'd', None, b'never']
+
+    entries = external_sort.SortEntries(self._CreateTestEntries())
+    self.assertEqual(self._GetPayloads(entries), expected_payloads)
+
+    entries = external_sort.SortEntries(
+        self._CreateTestEntries(), maximum_number_of_entries=3,
+        temporary_directory=self._temporary_directory)
+    self.assertEqual(self._GetPayloads(entries), expected_payloads)
+    self.assertEqual(os.listdir(self._temporary_directory), [])
+
+    entries = external_sort.SortEntries([], maximum_number_of_entries=1)
+    self.assertEqual(list(entries), [])
+
+    with self.assertRaises(ValueError):
+      external_sort.SortEntries([], maximum_number_of_entries=0)
+
+    with self.assertRaises(ValueError):
+      external_sort.SortEntries([], number_of_processes=0)
+
+  def testSortEntriesWithMultipleMergePasses(self):
+    """Tests the SortEntries function with multiple merge passes."""
+    maximum_number_of_runs_per_merge = (
+        external_sort._MAXIMUM_NUMBER_OF_RUNS_PER_MERGE)
+    external_sort._MAXIMUM_NUMBER_OF_RUNS_PER_MERGE = 2
+
+    try:
+      entries = external_sort.SortEntries(
+          self._CreateTestEntries(), maximum_number_of_entries=1,
+          temporary_directory=self._temporary_directory)
+      self.assertEqual(self._GetPayloads(entries), [
+          b'', b'a', b'b', b'c1', b'c2', b'd', None, b'never'])
+
+    finally:
+      external_sort._MAXIMUM_NUMBER_OF_RUNS_PER_MERGE = (
+          maximum_number_of_runs_per_merge)
+
+    self.assertEqual(os.listdir(self._temporary_directory), [])
+
+  def testSortEntriesInParallel(self):
+    """Tests the SortEntries function with multiple processes."""
+    entries = external_sort.SortEntries(
+        self._CreateTestEntries(), maximum_number_of_entries=2,
+        number_of_processes=2, temporary_directory=self._temporary_directory)
+    self.assertEqual(self._GetPayloads(entries), [
+        b'', b'a', b'b', b'c1', b'c2', b'd', None, b'never'])
+    self.assertEqual(os.listdir(self._temporary_directory), [])
+
+
+if __name__ == '__main__':
+  unittest.main()
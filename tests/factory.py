@@ -43,7 +43,7 @@ class TestDateTimeValues(interface.DateTimeValues):
     """
     return
 
-  def CopyToDateTimeString(self):
+  def _CopyToDateTimeString(self):
     """Copies the date time value to a date and time string.
 
     Returns:
@@ -75,6 +75,14 @@ class FactoryTest(unittest.TestCase):
         len(factory.Factory._date_time_values_types),
         number_of_date_time_values_types)
 
+  def testGetDateTimeValuesType(self):
+    """Tests the GetDateTimeValuesType function."""
+    date_time_values_type = factory.Factory.GetDateTimeValuesType('Filetime')
+    self.assertEqual(date_time_values_type.__name__, 'Filetime')
+
+    with self.assertRaises(KeyError):
+      factory.Factory.GetDateTimeValuesType('Bogus')
+
   def testNewDateTimeValues(self):
     """Tests the NewDateTimeValues function."""
     test_date_time_values = factory.Factory.NewDateTimeValues(
@@ -82,6 +90,19 @@ class FactoryTest(unittest.TestCase):
 
     self.assertIsNotNone(test_date_time_values)
 
+  def testNewDateTimeValuesFromDict(self):
+    """Tests the NewDateTimeValuesFromDict function."""
+    test_date_time_values = factory.Factory.NewDateTimeValuesFromDict({
+        '__class_name__': 'Filetime', 'timestamp': 0x01cb3a623d0a17ce})
+
+    self.assertIsNotNone(test_date_time_values)
+    self.assertEqual(
+        test_date_time_values.CopyToDateTimeString(),
+        '2010-08-12 21:06:31.5468750')
+
+    with self.assertRaises(KeyError):
+      factory.Factory.NewDateTimeValuesFromDict({'timestamp': 0})
+
 
 if __name__ == '__main__':
   unittest.main()
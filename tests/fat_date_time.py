@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import decimal
 import unittest
 
+from dfdatetime import duration
 from dfdatetime import fat_date_time
 
 
@@ -36,6 +37,25 @@ class FATDateTime(unittest.TestCase):
     normalized_timestamp = fat_date_time_object._GetNormalizedTimestamp()
     self.assertIsNone(normalized_timestamp)
 
+  def testArithmetic(self):
+    """Tests the __add__ and __sub__ functions."""
+    fat_date_time_object = fat_date_time.FATDateTime(fat_date_time=0xa8d03d0c)
+
+    result_object = fat_date_time_object + duration.Duration(
+        days=1, seconds=2)
+    self.assertIsInstance(result_object, fat_date_time.FATDateTime)
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-13 21:06:34')
+
+    result_duration = fat_date_time_object - result_object
+    self.assertEqual(result_duration, -duration.Duration(days=1, seconds=2))
+
+    with self.assertRaises(ValueError):
+      _ = fat_date_time_object + duration.Duration(seconds=1)
+
+    with self.assertRaises(ValueError):
+      _ = fat_date_time_object - duration.Duration(days=365 * 31)
+
   def testCopyFromDateTimeString(self):
     """Tests the CopyFromDateTimeString function."""
     fat_date_time_object = fat_date_time.FATDateTime()
@@ -137,6 +157,18 @@ class FATDateTime(unittest.TestCase):
     date_tuple = fat_date_time_object.GetDate()
     self.assertEqual(date_tuple, (None, None, None))
 
+  def testGetInterval(self):
+    """Tests the GetInterval function."""
+    fat_date_time_object = fat_date_time.FATDateTime(fat_date_time=0xa8d03d0c)
+
+    interval = fat_date_time_object.GetInterval()
+    self.assertEqual(interval, (1281647192000000000, 1281647194000000000))
+
+    fat_date_time_object = fat_date_time.FATDateTime()
+
+    interval = fat_date_time_object.GetInterval()
+    self.assertIsNone(interval)
+
   def testGetTimeOfDay(self):
     """Tests the GetTimeOfDay function."""
     fat_date_time_object = fat_date_time.FATDateTime(fat_date_time=0xa8d03d0c)
@@ -4,10 +4,17 @@
 
 from __future__ import unicode_literals
 
+import datetime
 import decimal
+import pickle
 import unittest
 
+from dfdatetime import definitions
+from dfdatetime import duration
 from dfdatetime import filetime
+from dfdatetime import interface
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
 
 
 class FiletimeEpochTest(unittest.TestCase):
@@ -99,6 +106,87 @@ class FiletimeTest(unittest.TestCase):
     date_time_string = filetime_object.CopyToDateTimeStringISO8601()
     self.assertEqual(date_time_string, '2010-08-12T21:06:31.5468750Z')
 
+  def testCopyToDatetime(self):
+    """Tests the CopyToDatetime function."""
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+
+    datetime_object = filetime_object.CopyToDatetime()
+    self.assertEqual(datetime_object, datetime.datetime(
+        2010, 8, 12, 21, 6, 31, 546875, tzinfo=datetime.timezone.utc))
+
+    filetime_object.is_local_time = True
+
+    datetime_object = filetime_object.CopyToDatetime()
+    self.assertEqual(
+        datetime_object, datetime.datetime(2010, 8, 12, 21, 6, 31, 546875))
+
+    filetime_object = filetime.Filetime(timestamp=0xffffffffffffffff)
+
+    with self.assertRaises(ValueError):
+      filetime_object.CopyToDatetime()
+
+    filetime_object = filetime.Filetime()
+
+    datetime_object = filetime_object.CopyToDatetime()
+    self.assertIsNone(datetime_object)
+
+  def testCopyToNumPyDatetime64(self):
+    """Tests the CopyToNumPyDatetime64 function."""
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+
+    if not interface.numpy:
+      with self.assertRaises(RuntimeError):
+        filetime_object.CopyToNumPyDatetime64()
+      return
+
+    datetime64_object = filetime_object.CopyToNumPyDatetime64()
+    self.assertEqual(str(datetime64_object), '2010-08-12T21:06:31.546875000')
+
+    datetime64_object = filetime_object.CopyToNumPyDatetime64(unit='s')
+    self.assertEqual(str(datetime64_object), '2010-08-12T21:06:31')
+
+    filetime_object = filetime.Filetime(timestamp=0)
+
+    with self.assertRaises(ValueError):
+      filetime_object.CopyToNumPyDatetime64()
+
+    filetime_object = filetime.Filetime()
+
+    datetime64_object = filetime_object.CopyToNumPyDatetime64()
+    self.assertIsNone(datetime64_object)
+
+  def testFreeze(self):
+    """Tests the Freeze function."""
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+    self.assertFalse(filetime_object.is_frozen)
+
+    with self.assertRaises(TypeError):
+      hash(filetime_object)
+
+    frozen_filetime_object = filetime_object.Freeze()
+    self.assertIs(frozen_filetime_object, filetime_object)
+    self.assertTrue(filetime_object.is_frozen)
+
+    date_time_string = filetime_object.CopyToDateTimeString()
+    self.assertEqual(date_time_string, '2010-08-12 21:06:31.5468750')
+
+    date_time_string = filetime_object.CopyToDateTimeStringISO8601()
+    self.assertEqual(date_time_string, '2010-08-12T21:06:31.5468750Z')
+
+    other_filetime_object = filetime.Filetime(
+        timestamp=0x01cb3a623d0a17ce).Freeze()
+    self.assertEqual(hash(filetime_object), hash(other_filetime_object))
+    self.assertEqual(len(set([filetime_object, other_filetime_object])), 1)
+
+    with self.assertRaises(ValueError):
+      filetime_object.CopyFromDateTimeString('2010-08-12')
+
+    with self.assertRaises(ValueError):
+      filetime_object.is_local_time = True
+
+    self.assertEqual(filetime_object.timestamp, 0x01cb3a623d0a17ce)
+    self.assertFalse(filetime_object.is_local_time)
+
   def testGetDate(self):
     """Tests the GetDate function."""
     filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
@@ -111,6 +199,132 @@ class FiletimeTest(unittest.TestCase):
     date_tuple = filetime_object.GetDate()
     self.assertEqual(date_tuple, (None, None, None))
 
+  def testArithmetic(self):
+    """Tests the __add__ and __sub__ functions."""
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+    filetime_object.is_local_time = True
+
+    result_object = filetime_object + duration.Duration(
+        seconds=1, microseconds=1)
+    self.assertIsInstance(result_object, filetime.Filetime)
+    self.assertEqual(result_object.timestamp, 0x01cb3a623da2ae58)
+    self.assertTrue(result_object.is_local_time)
+
+    result_object = filetime_object - duration.Duration(nanoseconds=100)
+    self.assertEqual(result_object.timestamp, 0x01cb3a623d0a17cd)
+
+    result_duration = result_object - filetime_object
+    self.assertEqual(result_duration, duration.Duration(nanoseconds=-100))
+
+    posix_time_object = posix_time.PosixTime(timestamp=1281647191)
+    result_duration = filetime_object - posix_time_object
+    self.assertEqual(result_duration.nanoseconds, 546875000)
+
+    with self.assertRaises(ValueError):
+      _ = filetime_object + duration.Duration(nanoseconds=1)
+
+    with self.assertRaises(ValueError):
+      _ = filetime.Filetime(timestamp=0) - duration.Duration(nanoseconds=100)
+
+    with self.assertRaises(ValueError):
+      _ = filetime.Filetime() + duration.Duration(seconds=1)
+
+    with self.assertRaises(ValueError):
+      _ = filetime_object - semantic_time.Never()
+
+    with self.assertRaises(ValueError):
+      _ = filetime_object + 1
+
+  def testRound(self):
+    """Tests the Ceil, Floor and Round functions."""
+    # 2010-08-12 21:06:31.5468750
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+
+    result_object = filetime_object.Floor(definitions.PRECISION_1_MINUTE)
+    self.assertIsInstance(result_object, filetime.Filetime)
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-12 21:06:00.0000000')
+
+    result_object = filetime_object.Ceil(definitions.PRECISION_1_SECOND)
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-12 21:06:32.0000000')
+
+    result_object = filetime_object.Round(definitions.PRECISION_1_MILLISECOND)
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-12 21:06:31.5470000')
+
+    result_object = filetime_object.Round(
+        definitions.PRECISION_1_MILLISECOND, rounding=decimal.ROUND_DOWN)
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-12 21:06:31.5460000')
+
+    result_object = filetime_object.Floor(definitions.PRECISION_1_NANOSECOND)
+    self.assertEqual(result_object.timestamp, 0x01cb3a623d0a17ce)
+
+    with self.assertRaises(ValueError):
+      filetime_object.Round(
+          definitions.PRECISION_1_SECOND, rounding=decimal.ROUND_HALF_EVEN)
+
+    with self.assertRaises(ValueError):
+      filetime_object.Floor('bogus')
+
+    with self.assertRaises(ValueError):
+      filetime.Filetime().Floor(definitions.PRECISION_1_SECOND)
+
+    with self.assertRaises(ValueError):
+      filetime.Filetime(timestamp=0xffffffffffffffff).Ceil(
+          definitions.PRECISION_1_DAY)
+
+  def testGetInterval(self):
+    """Tests the GetInterval function."""
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+
+    interval = filetime_object.GetInterval()
+    self.assertEqual(interval, (1281647191546875000, 1281647191546875100))
+
+    filetime_object = filetime.Filetime()
+
+    interval = filetime_object.GetInterval()
+    self.assertIsNone(interval)
+
+  def testPickle(self):
+    """Tests pickling and unpickling."""
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+    filetime_object.is_local_time = True
+    filetime_object.CopyToDateTimeString()
+
+    state = filetime_object.__getstate__()
+    self.assertEqual(state, ['100ns', None, True, False, 0x01cb3a623d0a17ce])
+
+    unpickled_object = pickle.loads(pickle.dumps(filetime_object))
+    self.assertEqual(unpickled_object.timestamp, 0x01cb3a623d0a17ce)
+    self.assertTrue(unpickled_object.is_local_time)
+    self.assertFalse(unpickled_object.is_frozen)
+    self.assertIsNone(unpickled_object._cached_date_time_values)
+    self.assertIsNone(unpickled_object._normalized_timestamp)
+    self.assertEqual(
+        unpickled_object.CopyToDateTimeString(), '2010-08-12 21:06:31.5468750')
+
+    filetime_object.Freeze()
+    unpickled_object = pickle.loads(pickle.dumps(filetime_object))
+    self.assertTrue(unpickled_object.is_frozen)
+    self.assertEqual(hash(unpickled_object), hash(filetime_object))
+
+    with self.assertRaises(ValueError):
+      unpickled_object.__setstate__(state[:4])
+
+  def testGetSortKey(self):
+    """Tests the GetSortKey function."""
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+
+    sort_key = filetime_object.GetSortKey()
+    self.assertEqual(sort_key, (2, 1281647191546875000))
+
+    filetime_object = filetime.Filetime()
+
+    sort_key = filetime_object.GetSortKey()
+    self.assertEqual(sort_key, (1, 0))
+
   def testGetTimeOfDay(self):
     """Tests the GetTimeOfDay function."""
     filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the counts of date and time values per time bucket."""
+
+from __future__ import unicode_literals
+
+import calendar
+import datetime
+import unittest
+
+from dfdatetime import filetime
+from dfdatetime import histogram
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+from dfdatetime import time_zones
+
+
+class HistogramTest(unittest.TestCase):
+  """Tests for the counts of date and time values per time bucket."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestValues(self):
+    """Creates date and time values for testing.
+
+    Returns:
+      list[DateTimeValues]: date and time values.
+    """
+    return [
+        # 2010-08-12 21:06:31.546875 (Thursday)
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce),
+        # 2010-08-12 21:59:59
+        posix_time.PosixTime(timestamp=1281650399),
+        # 2010-08-12 22:00:00
+        posix_time.PosixTime(timestamp=1281650400),
+        # 2010-09-01 00:00:00 (Wednesday)
+        posix_time.PosixTime(timestamp=1283299200),
+        semantic_time.Never()]
+
+  def testCheckBucket(self):
+    """Tests the _CheckBucket function."""
+    histogram._CheckBucket('hour')
+    histogram._CheckBucket(1000)
+
+    with self.assertRaises(ValueError):
+      histogram._CheckBucket('bogus')
+
+    with self.assertRaises(ValueError):
+      histogram._CheckBucket(0)
+
+    with self.assertRaises(ValueError):
+      histogram._CheckBucket(True)
+
+  def testGetCivilDate(self):
+    """Tests the _GetCivilDate function."""
+    date_tuple = histogram._GetCivilDate(0)
+    self.assertEqual(date_tuple, (1970, 1, 1))
+
+    date_tuple = histogram._GetCivilDate(-1)
+    self.assertEqual(date_tuple, (1969, 12, 31))
+
+    date_tuple = histogram._GetCivilDate(11016)
+    self.assertEqual(date_tuple, (2000, 2, 29))
+
+    epoch = datetime.date(1970, 1, 1)
+    for number_of_days in range(-719162, 2932897, 9973):
+      date = epoch + datetime.timedelta(days=number_of_days)
+
+      date_tuple = histogram._GetCivilDate(number_of_days)
+      self.assertEqual(date_tuple, (date.year, date.month, date.day))
+
+  def testCountNormalizedTimestampsPerBucket(self):
+    """Tests the CountNormalizedTimestampsPerBucket function."""
+    normalized_timestamps = [
+        date_time_values._GetNormalizedTimestampInNanoseconds()
+        for date_time_values in self._CreateTestValues()[:4]]
+    normalized_timestamps.append(histogram._NAT)
+
+    if not histogram.numpy:
+      with self.assertRaises(RuntimeError):
+        histogram.CountNormalizedTimestampsPerBucket(
+            normalized_timestamps, 'day')
+      return
+
+    counts = histogram.CountNormalizedTimestampsPerBucket(
+        normalized_timestamps, 'month')
+    self.assertEqual(counts, {(2010, 8): 3, (2010, 9): 1})
+
+    counts = histogram.CountNormalizedTimestampsPerBucket(
+        histogram.numpy.array(normalized_timestamps), 'hour')
+    self.assertEqual(counts, {
+        (2010, 8, 12, 21): 2, (2010, 8, 12, 22): 1, (2010, 9, 1, 0): 1})
+
+  def testCountPerBucket(self):
+    """Tests the CountPerBucket function."""
+    test_values = self._CreateTestValues()
+
+    counts = histogram.CountPerBucket(test_values, 'minute')
+    self.assertEqual(counts, {
+        (2010, 8, 12, 21, 6): 1, (2010, 8, 12, 21, 59): 1,
+        (2010, 8, 12, 22, 0): 1, (2010, 9, 1, 0, 0): 1})
+
+    counts = histogram.CountPerBucket(test_values, 'hour')
+    self.assertEqual(counts, {
+        (2010, 8, 12, 21): 2, (2010, 8, 12, 22): 1, (2010, 9, 1, 0): 1})
+
+    counts = histogram.CountPerBucket(test_values, 'day')
+    self.assertEqual(counts, {(2010, 8, 12): 3, (2010, 9, 1): 1})
+
+    counts = histogram.CountPerBucket(test_values, 'month')
+    self.assertEqual(counts, {(2010, 8): 3, (2010, 9): 1})
+
+    counts = histogram.CountPerBucket(test_values, 'year')
+    self.assertEqual(counts, {2010: 4})
+
+    counts = histogram.CountPerBucket(test_values, 'hour_of_day')
+    self.assertEqual(counts, {21: 2, 22: 1, 0: 1})
+
+    counts = histogram.CountPerBucket(test_values, 'weekday')
+    self.assertEqual(counts, {3: 3, 2: 1})
+
+    counts = histogram.CountPerBucket(test_values, 3600 * 1000000000)
+    self.assertEqual(counts, {
+        1281646800000000000: 2, 1281650400000000000: 1,
+        1283299200000000000: 1})
+
+    with self.assertRaises(ValueError):
+      histogram.CountPerBucket(test_values, 'bogus')
+
+  def testCountPerBucketWithTimeZone(self):
+    """Tests the CountPerBucket function with a time zone."""
+    time_zone = time_zones.TimeZone(
+        'Test/Zone', [calendar.timegm((2010, 8, 20, 0, 0, 0))], [7200, -3600])
+
+    date_time_values = posix_time.PosixTime(timestamp=1281650399)
+    date_time_values.is_local_time = True
+
+    test_values = self._CreateTestValues() + [date_time_values]
+
+    counts = histogram.CountPerBucket(test_values, 'hour', time_zone=time_zone)
+    self.assertEqual(counts, {
+        (2010, 8, 12, 21): 1, (2010, 8, 12, 23): 2, (2010, 8, 13, 0): 1,
+        (2010, 8, 31, 23): 1})
+
+
+if __name__ == '__main__':
+  unittest.main()
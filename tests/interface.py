@@ -331,6 +331,20 @@ class DateTimeValuesTest(unittest.TestCase):
     with self.assertRaises(ValueError):
       date_time_values._CopyTimeFromString('12:00:00+01:60')
 
+  def testFormatDateTimeString(self):
+    """Tests the _FormatDateTimeString function."""
+    date_time_values = interface.DateTimeValues()
+
+    date_time_string = date_time_values._FormatDateTimeString(
+        2010, 8, 12, 21, 6, 31)
+    self.assertEqual(date_time_string, '2010-08-12 21:06:31')
+    self.assertEqual(
+        date_time_values._cached_date_strings[(2010, 8, 12)], '2010-08-12')
+
+    date_time_string = date_time_values._FormatDateTimeString(
+        10, 1, 2, 3, 4, 5)
+    self.assertEqual(date_time_string, '0010-01-02 03:04:05')
+
   def testGetDateValues(self):
     """Tests the _GetDateValues function."""
     date_time_values = interface.DateTimeValues()
@@ -453,6 +467,30 @@ class DateTimeValuesTest(unittest.TestCase):
     self.assertEqual(month, 12)
     self.assertEqual(day_of_month, 31)
 
+    year, month, day_of_month = date_time_values._GetDateValues(
+        -366, 1970, 1, 1)
+    self.assertEqual(year, 1968)
+    self.assertEqual(month, 12)
+    self.assertEqual(day_of_month, 31)
+
+    year, month, day_of_month = date_time_values._GetDateValues(
+        -146098, 1970, 1, 1)
+    self.assertEqual(year, 1569)
+    self.assertEqual(month, 12)
+    self.assertEqual(day_of_month, 31)
+
+    year, month, day_of_month = date_time_values._GetDateValues(
+        -1, 1899, 12, 30)
+    self.assertEqual(year, 1899)
+    self.assertEqual(month, 12)
+    self.assertEqual(day_of_month, 29)
+
+    year, month, day_of_month = date_time_values._GetDateValues(
+        16, 1582, 10, 15)
+    self.assertEqual(year, 1582)
+    self.assertEqual(month, 10)
+    self.assertEqual(day_of_month, 31)
+
   def testGetDateValuesWithEpoch(self):
     """Tests the _GetDateValuesWithEpoch function."""
     date_time_epoch = interface.DateTimeEpoch(2000, 1, 1)
@@ -464,6 +502,14 @@ class DateTimeValuesTest(unittest.TestCase):
     self.assertEqual(month, 1)
     self.assertEqual(day_of_month, 1)
 
+    date_key = (2000, 1, 1, 0)
+    self.assertEqual(
+        date_time_values._cached_date_values[date_key], (2000, 1, 1))
+
+    date_time_epoch.year = -1
+    with self.assertRaises(ValueError):
+      date_time_values._GetDateValuesWithEpoch(0, date_time_epoch)
+
   def testGetDayOfYear(self):
     """Tests the _GetDayOfYear function."""
     date_time_values = interface.DateTimeValues()
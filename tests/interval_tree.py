@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the interval tree of date and time values."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfdatetime import fat_date_time
+from dfdatetime import filetime
+from dfdatetime import interval_tree
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+from dfdatetime import time_elements
+
+
+class IntervalTreeTest(unittest.TestCase):
+  """Tests for the interval tree of date and time values."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestIntervalTree(self):
+    """Creates an interval tree for testing.
+
+    Returns:
+      IntervalTree: interval tree.
+    """
+    return interval_tree.IntervalTree([
+        # 2010-08-12 21:06:32 - 21:06:34
+        (fat_date_time.FATDateTime(fat_date_time=0xa8d03d0c), 'fat'),
+        # 2010-08-12 21:06:31.546875
+        (filetime.Filetime(timestamp=0x01cb3a623d0a17ce), 'filetime'),
+        # 2010-08-12 21:06:32 - 21:06:33
+        (posix_time.PosixTime(timestamp=1281647192), 'posix'),
+        # 2010-08-12 21:06:31 - 21:06:32
+        (time_elements.TimeElements(
+            time_elements_tuple=(2010, 8, 12, 21, 6, 31)), 'elements'),
+        # 2010-08-12 21:06:33.500
+        (posix_time.PosixTimeInMilliseconds(timestamp=1281647193500),
+         'milliseconds')])
+
+  def _GetPayloads(self, entries):
+    """Retrieves the payloads of entries.
+
+    Args:
+      entries (list[tuple[DateTimeValues, object]]): entries.
+
+    Returns:
+      list[object]: payloads.
+    """
+    return [payload for _, payload in entries]
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    tree = interval_tree.IntervalTree()
+    self.assertEqual(len(tree), 0)
+
+    tree = self._CreateTestIntervalTree()
+    self.assertEqual(len(tree), 5)
+
+    with self.assertRaises(ValueError):
+      interval_tree.IntervalTree([(semantic_time.Never(), None)])
+
+  def testBuildNode(self):
+    """Tests the _BuildNode function."""
+    tree = interval_tree.IntervalTree()
+
+    node = tree._BuildNode([])
+    self.assertIsNone(node)
+
+    intervals = [(0, 10, 0, None), (2, 4, 1, None), (20, 30, 2, None)]
+    node = tree._BuildNode(intervals)
+    self.assertEqual(node.center, 3)
+    self.assertEqual(node.intervals_by_start, intervals[:2])
+    self.assertEqual(node.intervals_by_end, intervals[:2])
+    self.assertIsNone(node.left)
+    self.assertEqual(node.right.center, 25)
+
+  def testGetEntriesAt(self):
+    """Tests the GetEntriesAt function."""
+    tree = self._CreateTestIntervalTree()
+
+    entries = tree.GetEntriesAt(
+        posix_time.PosixTimeInMilliseconds(timestamp=1281647192500))
+    self.assertEqual(self._GetPayloads(entries), ['fat', 'posix'])
+
+    entries = tree.GetEntriesAt(
+        posix_time.PosixTimeInMilliseconds(timestamp=1281647193500))
+    self.assertEqual(self._GetPayloads(entries), ['fat', 'milliseconds'])
+
+    entries = tree.GetEntriesAt(posix_time.PosixTime(timestamp=1281657600))
+    self.assertEqual(self._GetPayloads(entries), [])
+
+    with self.assertRaises(ValueError):
+      tree.GetEntriesAt(semantic_time.Never())
+
+  def testGetOverlappingEntries(self):
+    """Tests the GetOverlappingEntries function."""
+    tree = self._CreateTestIntervalTree()
+
+    entries = tree.GetOverlappingEntries(
+        posix_time.PosixTime(timestamp=1281647191))
+    self.assertEqual(self._GetPayloads(entries), ['elements', 'filetime'])
+
+    entries = tree.GetOverlappingEntries(
+        fat_date_time.FATDateTime(fat_date_time=0xa8d03d0c))
+    self.assertEqual(
+        self._GetPayloads(entries), ['fat', 'posix', 'milliseconds'])
+
+    entries = tree.GetOverlappingEntries(
+        posix_time.PosixTime(timestamp=1281657600))
+    self.assertEqual(self._GetPayloads(entries), [])
+
+  def testInsert(self):
+    """Tests the Insert function."""
+    tree = self._CreateTestIntervalTree()
+
+    entries = tree.GetEntriesAt(posix_time.PosixTime(timestamp=1281647192))
+    self.assertEqual(len(entries), 2)
+
+    tree.Insert(posix_time.PosixTime(timestamp=1281647192), payload='new')
+    self.assertEqual(len(tree), 6)
+
+    entries = tree.GetEntriesAt(posix_time.PosixTime(timestamp=1281647192))
+    self.assertEqual(self._GetPayloads(entries), ['fat', 'posix', 'new'])
+
+
+if __name__ == '__main__':
+  unittest.main()
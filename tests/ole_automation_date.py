@@ -87,6 +87,12 @@ class OLEAutomationDateTest(unittest.TestCase):
     date_time_string = ole_automation_date_object.CopyToDateTimeString()
     self.assertEqual(date_time_string, '2017-11-05 11:32:00.038400')
 
+    ole_automation_date_object = ole_automation_date.OLEAutomationDate(
+        timestamp=-1.25)
+
+    date_time_string = ole_automation_date_object.CopyToDateTimeString()
+    self.assertEqual(date_time_string, '1899-12-28 18:00:00.000000')
+
     ole_automation_date_object = ole_automation_date.OLEAutomationDate()
 
     date_time_string = ole_automation_date_object.CopyToDateTimeString()
@@ -108,6 +114,12 @@ class OLEAutomationDateTest(unittest.TestCase):
     date_tuple = ole_automation_date_object.GetDate()
     self.assertEqual(date_tuple, (2017, 11, 5))
 
+    ole_automation_date_object = ole_automation_date.OLEAutomationDate(
+        timestamp=-1.25)
+
+    date_tuple = ole_automation_date_object.GetDate()
+    self.assertEqual(date_tuple, (1899, 12, 28))
+
     ole_automation_date_object = ole_automation_date.OLEAutomationDate()
 
     date_tuple = ole_automation_date_object.GetDate()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the pandas extension array of date and time values."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfdatetime import cocoa_time
+from dfdatetime import filetime
+from dfdatetime import pandas_array
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+
+
+class PandasArrayTest(unittest.TestCase):
+  """Tests for the pandas extension array of date and time values."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestValues(self):
+    """Creates date and time values for testing.
+
+    Returns:
+      list[DateTimeValues]: date and time values.
+    """
+    return [
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce),
+        posix_time.PosixTime(timestamp=1281643591),
+        semantic_time.Never(),
+        semantic_time.SemanticTime(string='Unknown'),
+        None,
+        filetime.Filetime(),
+        filetime.Filetime(timestamp=0),
+        cocoa_time.CocoaTime(timestamp=395011845.5)]
+
+  def testGetEncoding(self):
+    """Tests the _GetEncoding function."""
+    encoding = pandas_array._GetEncoding(
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce))
+    self.assertEqual(
+        encoding, (filetime.Filetime, pandas_array.ENCODING_TIMESTAMP))
+
+    encoding = pandas_array._GetEncoding(filetime.Filetime())
+    self.assertEqual(
+        encoding, (filetime.Filetime, pandas_array.ENCODING_NO_TIMESTAMP))
+
+    encoding = pandas_array._GetEncoding(
+        filetime.Filetime(timestamp=0xffffffffffffffff))
+    self.assertEqual(
+        encoding, (filetime.Filetime, pandas_array.ENCODING_OBJECT))
+
+    date_time_values = posix_time.PosixTime(timestamp=1281643591)
+    date_time_values.is_local_time = True
+
+    encoding = pandas_array._GetEncoding(date_time_values)
+    self.assertEqual(
+        encoding, (posix_time.PosixTime, pandas_array.ENCODING_OBJECT))
+
+    encoding = pandas_array._GetEncoding(semantic_time.Never())
+    self.assertEqual(
+        encoding, (semantic_time.Never, pandas_array.ENCODING_NO_TIMESTAMP))
+
+    encoding = pandas_array._GetEncoding(
+        semantic_time.SemanticTime(string='Unknown'))
+    self.assertEqual(
+        encoding, (semantic_time.SemanticTime, pandas_array.ENCODING_OBJECT))
+
+    encoding = pandas_array._GetEncoding(
+        cocoa_time.CocoaTime(timestamp=395011845.5))
+    self.assertEqual(
+        encoding, (cocoa_time.CocoaTime, pandas_array.ENCODING_OBJECT))
+
+    encoding = pandas_array._GetEncoding(None)
+    self.assertEqual(encoding, (None, pandas_array.ENCODING_MISSING))
+
+  def testGetNormalizedTimestamp(self):
+    """Tests the _GetNormalizedTimestamp function."""
+    normalized_timestamp = pandas_array._GetNormalizedTimestamp(
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce))
+    self.assertEqual(normalized_timestamp, 1281647191546875000)
+
+    normalized_timestamp = pandas_array._GetNormalizedTimestamp(
+        filetime.Filetime(timestamp=0))
+    self.assertEqual(normalized_timestamp, pandas_array.NAT + 1)
+
+    normalized_timestamp = pandas_array._GetNormalizedTimestamp(
+        semantic_time.Never())
+    self.assertEqual(normalized_timestamp, pandas_array.NAT)
+
+    normalized_timestamp = pandas_array._GetNormalizedTimestamp(None)
+    self.assertEqual(normalized_timestamp, pandas_array.NAT)
+
+  def testCopyFromColumns(self):
+    """Tests the CopyFromColumns function."""
+    test_values = self._CreateTestValues()
+
+    raw_values, _, _, type_codes, encodings, objects = (
+        pandas_array.CopyToColumns(test_values))
+
+    date_time_values_list = pandas_array.CopyFromColumns(
+        raw_values, type_codes, encodings, objects)
+    self.assertEqual(len(date_time_values_list), 8)
+
+    for date_time_values, expected_date_time_values in zip(
+        date_time_values_list, test_values):
+      if expected_date_time_values is None:
+        self.assertIsNone(date_time_values)
+        continue
+
+      self.assertIsInstance(date_time_values, type(expected_date_time_values))
+      self.assertEqual(
+          date_time_values.CopyToDateTimeString(),
+          expected_date_time_values.CopyToDateTimeString())
+
+    self.assertIs(date_time_values_list[3], test_values[3])
+
+    with self.assertRaises(ValueError):
+      pandas_array.CopyFromColumns(raw_values, [], encodings, objects)
+
+  def testCopyToColumns(self):
+    """Tests the CopyToColumns function."""
+    test_values = self._CreateTestValues()
+
+    (raw_values, normalized_timestamps, precision_codes, type_codes,
+     encodings, objects) = pandas_array.CopyToColumns(test_values)
+
+    self.assertEqual(raw_values, [
+        0x01cb3a623d0a17ce, 1281643591, 0, 0, 0, 0, 0, 1])
+    self.assertEqual(normalized_timestamps, [
+        1281647191546875000, 1281643591000000000, pandas_array.NAT,
+        pandas_array.NAT, pandas_array.NAT, pandas_array.NAT,
+        pandas_array.NAT + 1, 1373319045500000000])
+    self.assertEqual(precision_codes, [1, 5, -1, -1, -1, 1, 1, 5])
+    self.assertEqual(type_codes, [0, 1, 2, 3, 4, 5, 0, 6])
+    self.assertEqual(encodings, [
+        (filetime.Filetime, pandas_array.ENCODING_TIMESTAMP),
+        (posix_time.PosixTime, pandas_array.ENCODING_TIMESTAMP),
+        (semantic_time.Never, pandas_array.ENCODING_NO_TIMESTAMP),
+        (semantic_time.SemanticTime, pandas_array.ENCODING_OBJECT),
+        (None, pandas_array.ENCODING_MISSING),
+        (filetime.Filetime, pandas_array.ENCODING_NO_TIMESTAMP),
+        (cocoa_time.CocoaTime, pandas_array.ENCODING_OBJECT)])
+    self.assertEqual(objects, [test_values[3], test_values[7]])
+
+    with self.assertRaises(ValueError):
+      pandas_array.CopyToColumns([1281643591])
+
+  @unittest.skipUnless(pandas_array.pandas, 'missing pandas')
+  def testDateTimeValuesArray(self):
+    """Tests the DateTimeValuesArray class."""
+    pandas = pandas_array.pandas
+
+    test_values = self._CreateTestValues()
+
+    series = pandas.Series(test_values, dtype='dfdatetime')
+    self.assertIsInstance(series.array, pandas_array.DateTimeValuesArray)
+    self.assertEqual(len(series), 8)
+    self.assertEqual(series.isna().tolist(), [
+        False, False, False, False, True, False, False, False])
+
+    date_time_values = series[0]
+    self.assertIsInstance(date_time_values, filetime.Filetime)
+    self.assertEqual(date_time_values.timestamp, 0x01cb3a623d0a17ce)
+
+    self.assertIs(series[3], test_values[3])
+    self.assertIsNone(series[4])
+
+    start = posix_time.PosixTime(timestamp=1281643591)
+    result = series[series.array >= start]
+    self.assertEqual(len(result), 3)
+
+    result = series.sort_values()
+    self.assertEqual(list(result.index), [3, 5, 6, 1, 0, 7, 2, 4])
+
+    sort_keys = [test_values[index].GetSortKey() for index in result.index[:-1]]
+    self.assertEqual(sort_keys, sorted(sort_keys))
+
+    array = pandas_array.DateTimeValuesArray._concat_same_type([
+        series.array, series.array[:4]])
+    self.assertEqual(len(array), 12)
+    self.assertIs(array[11], test_values[3])
+
+    array = series.array.take([3, -1], allow_fill=True)
+    self.assertIs(array[0], test_values[3])
+    self.assertIsNone(array[1])
+
+    self.assertEqual(
+        series.array.GetPrecisions()[0], '100ns')
+    self.assertEqual(
+        series.array.GetTypeNames()[6], 'Filetime')
+
+    datetime64_array = series.array.astype('datetime64[ns]')
+    self.assertEqual(
+        str(datetime64_array[0]), '2010-08-12T21:06:31.546875000')
+
+  @unittest.skipUnless(pandas_array.pandas, 'missing pandas')
+  def testDateTimeValuesArrayGroupBy(self):
+    """Tests grouping the DateTimeValuesArray class."""
+    pandas = pandas_array.pandas
+
+    test_values = self._CreateTestValues()
+    test_values.extend([
+        semantic_time.Never(), semantic_time.NotSet(), semantic_time.NotSet()])
+
+    data_frame = pandas.DataFrame({
+        'date_time': pandas.Series(test_values, dtype='dfdatetime'),
+        'count': [1] * 11})
+
+    result = data_frame.groupby('date_time')['count'].sum()
+    self.assertEqual(len(result), 8)
+    self.assertEqual(
+        [date_time_values.CopyToDateTimeString()
+         for date_time_values in result.index],
+        ['Not set', 'Unknown', None, '1601-01-01 00:00:00.0000000',
+         '2010-08-12 20:06:31', '2010-08-12 21:06:31.5468750',
+         '2013-07-08 21:30:45.500000', 'Never'])
+    self.assertEqual(result.tolist(), [2, 1, 1, 1, 1, 1, 1, 2])
+
+  @unittest.skipUnless(pandas_array.pandas, 'missing pandas')
+  def testDateTimeValuesArrayUnique(self):
+    """Tests the unique function of the DateTimeValuesArray class."""
+    pandas = pandas_array.pandas
+
+    test_values = self._CreateTestValues()
+    series = pandas.Series(test_values + test_values, dtype='dfdatetime')
+
+    array = series.unique()
+    self.assertIsInstance(array, pandas_array.DateTimeValuesArray)
+    self.assertEqual(len(array), 8)
+    self.assertIs(array[3], test_values[3])
+    self.assertIsNone(array[4])
+    self.assertEqual(array[6].timestamp, 0)
+
+    series = pandas.Series(test_values[:2], dtype='dfdatetime')
+    self.assertEqual(len(series.unique()), 2)
+
+  @unittest.skipIf(pandas_array.pandas, 'pandas available')
+  def testDateTimeValuesArrayWithoutPandas(self):
+    """Tests the DateTimeValuesArray class without pandas."""
+    with self.assertRaises(RuntimeError):
+      pandas_array.DateTimeValuesArray([], [], [], [], [], [])
+
+
+if __name__ == '__main__':
+  unittest.main()
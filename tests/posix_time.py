@@ -7,6 +7,8 @@ from __future__ import unicode_literals
 import decimal
 import unittest
 
+from dfdatetime import definitions
+from dfdatetime import duration
 from dfdatetime import posix_time
 
 
@@ -32,6 +34,78 @@ class PosixTimeTest(unittest.TestCase):
     posix_time_object = posix_time.PosixTime()
     self.assertIsNone(posix_time_object.timestamp)
 
+  def testArithmetic(self):
+    """Tests the __add__ and __sub__ functions."""
+    posix_time_object = posix_time.PosixTime(timestamp=1281643591)
+
+    result_object = posix_time_object + duration.Duration(days=1, seconds=-1)
+    self.assertIsInstance(result_object, posix_time.PosixTime)
+    self.assertEqual(result_object.timestamp, 1281729990)
+
+    result_object = posix_time.PosixTime(timestamp=0) - duration.Duration(
+        seconds=1)
+    self.assertEqual(result_object.timestamp, -1)
+
+    result_duration = posix_time_object - result_object
+    self.assertEqual(result_duration, duration.Duration(seconds=1281643592))
+
+    with self.assertRaises(ValueError):
+      _ = posix_time_object + duration.Duration(milliseconds=1)
+
+  def testGetDateTimeValues(self):
+    """Tests the _GetDateTimeValues function."""
+    posix_time_object = posix_time.PosixTime(timestamp=1281643591)
+
+    date_time_values = posix_time_object._GetDateTimeValues()
+    self.assertEqual(date_time_values, (2010, 8, 12, 20, 6, 31, None))
+
+    posix_time_object = posix_time.PosixTime()
+
+    date_time_values = posix_time_object._GetDateTimeValues()
+    self.assertIsNone(date_time_values)
+
+  def testRound(self):
+    """Tests the Ceil, Floor and Round functions."""
+    posix_time_object = posix_time.PosixTime(timestamp=-90)
+
+    result_object = posix_time_object.Floor(definitions.PRECISION_1_MINUTE)
+    self.assertEqual(result_object.timestamp, -120)
+
+    result_object = posix_time_object.Ceil(definitions.PRECISION_1_MINUTE)
+    self.assertEqual(result_object.timestamp, -60)
+
+    result_object = posix_time_object.Round(definitions.PRECISION_1_MINUTE)
+    self.assertEqual(result_object.timestamp, -120)
+
+    result_object = posix_time_object.Round(
+        definitions.PRECISION_1_MINUTE, rounding=decimal.ROUND_DOWN)
+    self.assertEqual(result_object.timestamp, -60)
+
+    posix_time_object = posix_time.PosixTime(timestamp=90)
+
+    result_object = posix_time_object.Round(definitions.PRECISION_1_MINUTE)
+    self.assertEqual(result_object.timestamp, 120)
+
+    result_object = posix_time_object.Round(definitions.PRECISION_1_HOUR)
+    self.assertEqual(result_object.timestamp, 0)
+
+  def testGetCachedDateTimeValues(self):
+    """Tests the _GetCachedDateTimeValues function."""
+    posix_time_object = posix_time.PosixTime(timestamp=1281643591)
+
+    date_time_values = posix_time_object._GetCachedDateTimeValues()
+    self.assertEqual(date_time_values, (2010, 8, 12, 20, 6, 31, None))
+    self.assertIs(
+        posix_time_object._GetCachedDateTimeValues(), date_time_values)
+
+    posix_time_object.CopyFromDateTimeString('2010-08-13 21:06:31')
+
+    date_time_values = posix_time_object._GetCachedDateTimeValues()
+    self.assertEqual(date_time_values, (2010, 8, 13, 21, 6, 31, None))
+
+    date_time_string = posix_time_object.CopyToDateTimeString()
+    self.assertEqual(date_time_string, '2010-08-13 21:06:31')
+
   def testGetNormalizedTimestamp(self):
     """Tests the _GetNormalizedTimestamp function."""
     posix_time_object = posix_time.PosixTime(timestamp=1281643591)
@@ -207,6 +281,11 @@ class PosixTimeInMillisecondsTest(unittest.TestCase):
     date_time_string = posix_time_object.CopyToDateTimeStringISO8601()
     self.assertEqual(date_time_string, '2010-08-12T20:06:31.546Z')
 
+    posix_time_object.CopyFromDateTimeString('2013-07-08 21:30:45.546')
+
+    date_time_string = posix_time_object.CopyToDateTimeStringISO8601()
+    self.assertEqual(date_time_string, '2013-07-08T21:30:45.546Z')
+
   # TODO: remove this method when there is no more need for it in dfvfs.
   def testCopyToStatTimeTuple(self):
     """Tests the CopyToStatTimeTuple function."""
@@ -229,6 +308,11 @@ class PosixTimeInMillisecondsTest(unittest.TestCase):
     date_tuple = posix_time_object.GetDate()
     self.assertEqual(date_tuple, (2010, 8, 12))
 
+    posix_time_object = posix_time.PosixTimeInMilliseconds(timestamp=-1)
+
+    date_tuple = posix_time_object.GetDate()
+    self.assertEqual(date_tuple, (1969, 12, 31))
+
     posix_time_object = posix_time.PosixTimeInMilliseconds()
 
     date_tuple = posix_time_object.GetDate()
@@ -242,6 +326,11 @@ class PosixTimeInMillisecondsTest(unittest.TestCase):
     time_of_day_tuple = posix_time_object.GetTimeOfDay()
     self.assertEqual(time_of_day_tuple, (20, 6, 31))
 
+    posix_time_object = posix_time.PosixTimeInMilliseconds(timestamp=-1)
+
+    time_of_day_tuple = posix_time_object.GetTimeOfDay()
+    self.assertEqual(time_of_day_tuple, (23, 59, 59))
+
     posix_time_object = posix_time.PosixTimeInMilliseconds()
 
     time_of_day_tuple = posix_time_object.GetTimeOfDay()
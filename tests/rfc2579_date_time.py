@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import decimal
 import unittest
 
+from dfdatetime import duration
 from dfdatetime import rfc2579_date_time
 
 
@@ -120,6 +121,25 @@ class RFC2579DateTimeTest(unittest.TestCase):
     normalized_timestamp = rfc2579_date_time_object._GetNormalizedTimestamp()
     self.assertIsNone(normalized_timestamp)
 
+  def testArithmetic(self):
+    """Tests the __add__ and __sub__ functions."""
+    rfc2579_date_time_object = rfc2579_date_time.RFC2579DateTime(
+        rfc2579_date_time_tuple=(2010, 8, 12, 20, 6, 31, 6, '-', 5, 30))
+
+    result_object = rfc2579_date_time_object + duration.Duration(
+        hours=4, milliseconds=400)
+    self.assertIsInstance(result_object, rfc2579_date_time.RFC2579DateTime)
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-13 00:06:32.0')
+    self.assertEqual(result_object.time_zone_offset, -330)
+
+    result_duration = result_object - rfc2579_date_time_object
+    self.assertEqual(
+        result_duration, duration.Duration(hours=4, milliseconds=400))
+
+    with self.assertRaises(ValueError):
+      _ = rfc2579_date_time_object + duration.Duration(milliseconds=1)
+
   def testCopyFromDateTimeString(self):
     """Tests the CopyFromDateTimeString function."""
     rfc2579_date_time_object = rfc2579_date_time.RFC2579DateTime()
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfdatetime import filetime
 from dfdatetime import semantic_time
 
 from tests import interface
@@ -101,6 +102,20 @@ class SemanticTimeTest(unittest.TestCase):
     date_tuple = semantic_time_object.GetDate()
     self.assertEqual(date_tuple, (None, None, None))
 
+  def testGetInterval(self):
+    """Tests the GetInterval function."""
+    semantic_time_object = semantic_time.SemanticTime()
+
+    interval = semantic_time_object.GetInterval()
+    self.assertIsNone(interval)
+
+  def testGetSortKey(self):
+    """Tests the GetSortKey function."""
+    semantic_time_object = semantic_time.SemanticTime()
+
+    sort_key = semantic_time_object.GetSortKey()
+    self.assertEqual(sort_key, (0, 50))
+
   def testGetTimeOfDay(self):
     """Tests the GetTimeOfDay function."""
     semantic_time_object = semantic_time.SemanticTime()
@@ -183,6 +198,30 @@ class NeverTest(unittest.TestCase):
 
     self.assertTrue(never_time_object1 != 0.0)
 
+  def testGetSortKey(self):
+    """Tests the GetSortKey function."""
+    never_time_object = semantic_time.Never()
+
+    sort_key = never_time_object.GetSortKey()
+    self.assertEqual(sort_key, (3, 99))
+
+  def testHash(self):
+    """Tests the __hash__ function."""
+    never_time_object = semantic_time.Never()
+
+    with self.assertRaises(TypeError):
+      hash(never_time_object)
+
+    never_time_object.Freeze()
+    self.assertEqual(hash(never_time_object), hash(None))
+
+    # Date time values without a timestamp compare equal and hence must have
+    # the same hash.
+    filetime_object = filetime.Filetime().Freeze()
+    not_set_time_object = semantic_time.NotSet().Freeze()
+    self.assertEqual(filetime_object, not_set_time_object)
+    self.assertEqual(hash(filetime_object), hash(not_set_time_object))
+
 
 class NotSetTest(unittest.TestCase):
   """Tests for semantic time that represents not set."""
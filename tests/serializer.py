@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the compact binary serialization of date and time values."""
+
+from __future__ import unicode_literals
+
+import decimal
+import json
+import unittest
+
+from dfdatetime import cocoa_time
+from dfdatetime import factory
+from dfdatetime import fat_date_time
+from dfdatetime import filetime
+from dfdatetime import posix_time
+from dfdatetime import rfc2579_date_time
+from dfdatetime import semantic_time
+from dfdatetime import serializer
+from dfdatetime import systemtime
+from dfdatetime import time_elements
+
+
+class TestPosixTime(posix_time.PosixTime):
+  """POSIX timestamp without a type code for testing."""
+
+
+class SerializerTest(unittest.TestCase):
+  """Tests for the compact binary serialization of date and time values."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestValues(self):
+    """Creates date and time values for testing.
+
+    Returns:
+      list[DateTimeValues]: date and time values.
+    """
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+    filetime_object.is_local_time = True
+
+    time_elements_object = time_elements.TimeElements()
+    time_elements_object.CopyFromDateTimeString('2010-08-12 21:06:31+01:00')
+
+    return [
+        filetime_object,
+        filetime.Filetime(timestamp=0x01cb3a623d0a17cf),
+        cocoa_time.CocoaTime(timestamp=395011845.546875),
+        fat_date_time.FATDateTime(fat_date_time=0xa8d03d0c),
+        posix_time.PosixTime(),
+        posix_time.PosixTimeInNanoseconds(timestamp=-1281647191546875322),
+        rfc2579_date_time.RFC2579DateTime(
+            rfc2579_date_time_tuple=(2010, 8, 12, 20, 6, 31, 6, '-', 3, 30)),
+        semantic_time.Never(),
+        semantic_time.SemanticTime(string='Unknown'),
+        systemtime.Systemtime(
+            system_time_tuple=(2010, 8, 4, 12, 20, 6, 31, 142)),
+        time_elements_object,
+        time_elements.TimeElementsInMicroseconds(
+            time_elements_tuple=(2010, 8, 12, 20, 6, 31, 546875))]
+
+  def _AssertEqualDateTimeValues(self, date_time_values, expected_values):
+    """Asserts that date and time values are equal, including representation.
+
+    Args:
+      date_time_values (DateTimeValues): date and time values.
+      expected_values (DateTimeValues): expected date and time values.
+    """
+    self.assertIs(type(date_time_values), type(expected_values))
+    self.assertEqual(
+        date_time_values.is_local_time, expected_values.is_local_time)
+    self.assertEqual(date_time_values.precision, expected_values.precision)
+    self.assertEqual(
+        date_time_values.time_zone_offset, expected_values.time_zone_offset)
+    self.assertEqual(
+        date_time_values.CopyToDateTimeString(),
+        expected_values.CopyToDateTimeString())
+
+    for attribute_name in expected_values._SERIALIZED_ATTRIBUTES:
+      value = getattr(date_time_values, attribute_name)
+      expected_value = getattr(expected_values, attribute_name)
+      self.assertIs(type(value), type(expected_value))
+      self.assertEqual(value, expected_value)
+
+  def testReadVarint(self):
+    """Tests the _ReadVarint function."""
+    value, offset = serializer._ReadVarint(b'\x00\xac\x02', 1)
+    self.assertEqual(value, 300)
+    self.assertEqual(offset, 3)
+
+    with self.assertRaises(ValueError):
+      serializer._ReadVarint(b'\xac', 0)
+
+  def testWriteValue(self):
+    """Tests the _WriteValue function."""
+    test_values = [
+        None, 0, -1, 1 << 64, -(1 << 70), 1.5, decimal.Decimal('0.546875'),
+        'Not set', (2010, -8, (None, ))]
+
+    for test_value in test_values:
+      buffer = bytearray()
+      serializer._WriteValue(buffer, test_value)
+
+      value, offset = serializer._ReadValue(bytes(buffer), 0)
+      self.assertIs(type(value), type(test_value))
+      self.assertEqual(value, test_value)
+      self.assertEqual(offset, len(buffer))
+
+    with self.assertRaises(ValueError):
+      serializer._WriteValue(bytearray(), [1])
+
+  def testCopyFromDicts(self):
+    """Tests the CopyFromDicts and CopyToDicts functions."""
+    test_values = self._CreateTestValues()
+
+    date_time_values_dicts = serializer.CopyToDicts(test_values)
+    self.assertEqual(len(date_time_values_dicts), len(test_values))
+
+    date_time_values_dicts = json.loads(json.dumps(date_time_values_dicts))
+
+    date_time_values_list = serializer.CopyFromDicts(date_time_values_dicts)
+    self.assertEqual(len(date_time_values_list), len(test_values))
+
+    for date_time_values, expected_values in zip(
+        date_time_values_list, test_values):
+      self._AssertEqualDateTimeValues(date_time_values, expected_values)
+
+    with self.assertRaises(KeyError):
+      serializer.CopyFromDicts([{'__class_name__': 'Bogus'}])
+
+  def testDeserialize(self):
+    """Tests the Deserialize function."""
+    for date_time_values in self._CreateTestValues():
+      data = date_time_values.Serialize()
+      deserialized_values = serializer.Deserialize(data)
+      self._AssertEqualDateTimeValues(deserialized_values, date_time_values)
+
+    with self.assertRaises(ValueError):
+      serializer.Deserialize(b'')
+
+    data = serializer.Serialize(filetime.Filetime(timestamp=0))
+    with self.assertRaises(ValueError):
+      serializer.Deserialize(data[:-1])
+
+    with self.assertRaises(ValueError):
+      serializer.Deserialize(data + b'\x00')
+
+    with self.assertRaises(ValueError):
+      serializer.Deserialize(b'\x01\x7f' + data[2:])
+
+    factory.Factory.RegisterDateTimeValues(TestPosixTime)
+    try:
+      data = serializer.Serialize(TestPosixTime(timestamp=1281643591))
+      deserialized_values = serializer.Deserialize(data)
+      self.assertIsInstance(deserialized_values, TestPosixTime)
+      self.assertEqual(deserialized_values.timestamp, 1281643591)
+
+    finally:
+      factory.Factory.DeregisterDateTimeValues(TestPosixTime)
+
+    with self.assertRaises(KeyError):
+      serializer.Deserialize(data)
+
+  def testSerialize(self):
+    """Tests the Serialize function."""
+    data = serializer.Serialize(filetime.Filetime(timestamp=0x01cb3a623d0a17ce))
+    self.assertEqual(
+        data, b'\x01\x0b\x00\x04\x01\x01\x9c\xdf\xd0\xd0\xc7\x98\x9d\xcb\x03')
+
+    data = serializer.Serialize(TestPosixTime(timestamp=1))
+    self.assertEqual(data, b'\x01\x00\x0dTestPosixTime\x00\x09\x01\x01\x02')
+
+  def testTypeCodes(self):
+    """Tests the type codes."""
+    type_codes = list(serializer._TYPE_CODES.values())
+    self.assertEqual(len(set(type_codes)), len(type_codes))
+
+    for date_time_values_type in factory.Factory.GetDateTimeValuesTypes():
+      self.assertIn(date_time_values_type.__name__, serializer._TYPE_CODES)
+
+  def testPackMany(self):
+    """Tests the PackMany and UnpackMany functions."""
+    test_values = self._CreateTestValues()
+
+    data = serializer.PackMany(test_values * 2)
+    self.assertEqual(data[:5], b'dfdt\x01')
+
+    serialized_size = sum(
+        len(date_time_values.Serialize()) for date_time_values in test_values)
+    self.assertLess(len(data), serialized_size * 2)
+
+    unpacked_values = list(serializer.UnpackMany(data))
+    self.assertEqual(len(unpacked_values), len(test_values) * 2)
+
+    for index, date_time_values in enumerate(unpacked_values):
+      self._AssertEqualDateTimeValues(
+          date_time_values, test_values[index % len(test_values)])
+
+    unpacked_values = list(serializer.UnpackMany(serializer.PackMany([])))
+    self.assertEqual(unpacked_values, [])
+
+    factory.Factory.RegisterDateTimeValues(TestPosixTime)
+    try:
+      data = serializer.PackMany([
+          TestPosixTime(timestamp=1), posix_time.PosixTime(timestamp=2),
+          TestPosixTime(timestamp=3)])
+      self.assertEqual(data.count(b'TestPosixTime'), 1)
+
+      unpacked_values = list(serializer.UnpackMany(data))
+      self.assertEqual(
+          [type(date_time_values) for date_time_values in unpacked_values],
+          [TestPosixTime, posix_time.PosixTime, TestPosixTime])
+
+    finally:
+      factory.Factory.DeregisterDateTimeValues(TestPosixTime)
+
+    with self.assertRaises(ValueError):
+      list(serializer.UnpackMany(b'bogus'))
+
+    with self.assertRaises(ValueError):
+      list(serializer.UnpackMany(b'dfdt\x01\x05'))
+
+
+if __name__ == '__main__':
+  unittest.main()
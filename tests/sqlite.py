@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the SQLite storage of date and time values."""
+
+from __future__ import unicode_literals
+
+import sqlite3
+import unittest
+
+from dfdatetime import filetime
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+from dfdatetime import sqlite
+from dfdatetime import time_elements
+
+
+class SQLiteTest(unittest.TestCase):
+  """Tests for the SQLite storage of date and time values."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestValues(self):
+    """Creates date and time values for testing.
+
+    Returns:
+      list[DateTimeValues]: date and time values.
+    """
+    return [
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce),
+        posix_time.PosixTime(timestamp=1281643591),
+        semantic_time.NotSet(),
+        time_elements.TimeElementsInMicroseconds(
+            time_elements_tuple=(2010, 8, 12, 20, 6, 31, 546875)),
+        posix_time.PosixTimeInNanoseconds(timestamp=-1),
+        filetime.Filetime(timestamp=0)]
+
+  def testCheckIdentifier(self):
+    """Tests the _CheckIdentifier function."""
+    sqlite._CheckIdentifier('timeline_2')
+
+    with self.assertRaises(ValueError):
+      sqlite._CheckIdentifier('timeline; DROP TABLE timeline')
+
+    with self.assertRaises(ValueError):
+      sqlite._CheckIdentifier(None)
+
+  def testAdaptDateTimeValues(self):
+    """Tests the AdaptDateTimeValues and ConvertDateTimeValues functions."""
+    filetime_object = filetime.Filetime(timestamp=0x01cb3a623d0a17ce)
+
+    data = sqlite.AdaptDateTimeValues(filetime_object)
+    self.assertIsInstance(data, bytes)
+
+    date_time_values = sqlite.ConvertDateTimeValues(data)
+    self.assertIsInstance(date_time_values, filetime.Filetime)
+    self.assertEqual(date_time_values.timestamp, 0x01cb3a623d0a17ce)
+
+  def testGetKey(self):
+    """Tests the GetKey function."""
+    key = sqlite.GetKey(filetime.Filetime(timestamp=0x01cb3a623d0a17ce))
+    self.assertEqual(key, 1281647191546875000)
+
+    key = sqlite.GetKey(filetime.Filetime(timestamp=0))
+    self.assertEqual(key, -(1 << 63))
+
+    key = sqlite.GetKey(semantic_time.NotSet())
+    self.assertIsNone(key)
+
+  def testSelectRange(self):
+    """Tests the CreateTable, InsertMany and SelectRange functions."""
+    connection = sqlite3.connect(':memory:')
+    sqlite.CreateTable(connection, 'timeline')
+    sqlite.InsertMany(connection, 'timeline', iter(self._CreateTestValues()))
+
+    date_time_values_list = list(sqlite.SelectRange(connection, 'timeline'))
+    self.assertEqual(len(date_time_values_list), 5)
+    self.assertIsInstance(date_time_values_list[0], filetime.Filetime)
+    self.assertEqual(date_time_values_list[0].timestamp, 0)
+
+    date_time_values_list = list(sqlite.SelectRange(
+        connection, 'timeline', start=posix_time.PosixTime(timestamp=0),
+        end=posix_time.PosixTime(timestamp=1281647191)))
+    self.assertEqual(len(date_time_values_list), 2)
+    self.assertIsInstance(date_time_values_list[0], posix_time.PosixTime)
+    self.assertIsInstance(
+        date_time_values_list[1], time_elements.TimeElementsInMicroseconds)
+
+    query_plan = connection.execute(
+        'EXPLAIN QUERY PLAN SELECT date_time_values FROM timeline '
+        'WHERE timestamp >= ? ORDER BY timestamp', (0, )).fetchall()
+    self.assertIn('timeline_timestamp_index', str(query_plan))
+
+    with self.assertRaises(ValueError):
+      list(sqlite.SelectRange(
+          connection, 'timeline', start=semantic_time.NotSet()))
+
+    with self.assertRaises(ValueError):
+      list(sqlite.SelectRange(
+          connection, 'timeline', end=semantic_time.NotSet()))
+
+    with self.assertRaises(ValueError):
+      sqlite.InsertMany(connection, 'timeline;', [])
+
+  def testSelectRangeWithClampedKeys(self):
+    """Tests the SelectRange function with keys outside the 64-bit range."""
+    connection = sqlite3.connect(':memory:')
+    sqlite.CreateTable(connection, 'timeline')
+
+    # 1601-01-01 00:00:00, 1650-01-01 00:00:00, 2010-08-12 21:06:31.546875
+    # and 2300-01-01 00:00:00
+    test_values = [
+        filetime.Filetime(timestamp=0x0036ef861affc000),
+        filetime.Filetime(timestamp=0),
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce),
+        posix_time.PosixTime(timestamp=10413792000)]
+    sqlite.InsertMany(connection, 'timeline', test_values)
+
+    self.assertEqual(sqlite.GetKey(test_values[0]), -(1 << 63))
+    self.assertEqual(sqlite.GetKey(test_values[1]), -(1 << 63))
+
+    date_time_values_list = list(sqlite.SelectRange(connection, 'timeline'))
+    self.assertEqual(
+        [date_time_values.CopyToDateTimeString()
+         for date_time_values in date_time_values_list],
+        ['1601-01-01 00:00:00.0000000', '1650-01-01 00:00:00.0000000',
+         '2010-08-12 21:06:31.5468750', '2300-01-01 00:00:00'])
+
+    # 1620-01-01 00:00:00
+    start = filetime.Filetime(timestamp=0x00154cb0a0674000)
+    date_time_values_list = list(sqlite.SelectRange(
+        connection, 'timeline', start=start,
+        end=posix_time.PosixTime(timestamp=0)))
+    self.assertEqual(len(date_time_values_list), 1)
+    self.assertEqual(date_time_values_list[0].timestamp, 0x0036ef861affc000)
+
+    date_time_values_list = list(sqlite.SelectRange(
+        connection, 'timeline', end=start))
+    self.assertEqual(len(date_time_values_list), 1)
+    self.assertEqual(date_time_values_list[0].timestamp, 0)
+
+    date_time_values_list = list(sqlite.SelectRange(
+        connection, 'timeline', start=posix_time.PosixTime(timestamp=0)))
+    self.assertEqual(len(date_time_values_list), 2)
+    self.assertIsInstance(date_time_values_list[1], posix_time.PosixTime)
+
+    date_time_values_list = list(sqlite.SelectRange(
+        connection, 'timeline', start=posix_time.PosixTime(timestamp=0),
+        end=posix_time.PosixTime(timestamp=10413792000)))
+    self.assertEqual(len(date_time_values_list), 1)
+
+  def testRegisterAdaptersAndConverters(self):
+    """Tests the RegisterAdaptersAndConverters function."""
+    sqlite.RegisterAdaptersAndConverters()
+
+    connection = sqlite3.connect(
+        ':memory:', detect_types=sqlite3.PARSE_DECLTYPES)
+    sqlite.CreateTable(connection, 'timeline')
+
+    test_values = self._CreateTestValues()
+    connection.executemany(
+        'INSERT INTO timeline (timestamp, date_time_values) VALUES (?, ?)',
+        ((sqlite.GetKey(date_time_values), date_time_values)
+         for date_time_values in test_values))
+
+    rows = connection.execute(
+        'SELECT date_time_values FROM timeline').fetchall()
+    self.assertEqual(len(rows), len(test_values))
+    self.assertIsInstance(rows[0][0], filetime.Filetime)
+    self.assertEqual(rows[0][0].timestamp, 0x01cb3a623d0a17ce)
+    self.assertIsInstance(rows[2][0], semantic_time.NotSet)
+
+    date_time_values_list = list(sqlite.SelectRange(
+        connection, 'timeline', start=posix_time.PosixTime(timestamp=0)))
+    self.assertEqual(len(date_time_values_list), 3)
+
+
+if __name__ == '__main__':
+  unittest.main()
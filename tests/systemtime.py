@@ -7,6 +7,7 @@ from __future__ import unicode_literals
 import decimal
 import unittest
 
+from dfdatetime import duration
 from dfdatetime import systemtime
 
 
@@ -80,6 +81,40 @@ class SystemtimeTest(unittest.TestCase):
     normalized_timestamp = systemtime_object._GetNormalizedTimestamp()
     self.assertIsNone(normalized_timestamp)
 
+  def testArithmetic(self):
+    """Tests the __add__ and __sub__ functions."""
+    systemtime_object = systemtime.Systemtime(
+        system_time_tuple=(2010, 8, 4, 12, 20, 6, 31, 142))
+
+    result_object = systemtime_object + duration.Duration(
+        days=1, milliseconds=900)
+    self.assertIsInstance(result_object, systemtime.Systemtime)
+    self.assertEqual(result_object.year, 2010)
+    self.assertEqual(result_object.month, 8)
+    self.assertEqual(result_object.day_of_month, 13)
+    self.assertEqual(result_object.hours, 20)
+    self.assertEqual(result_object.minutes, 6)
+    self.assertEqual(result_object.seconds, 32)
+    self.assertEqual(result_object.milliseconds, 42)
+    self.assertEqual(result_object.day_of_week, 5)
+
+    result_duration = result_object - systemtime_object
+    self.assertEqual(
+        result_duration, duration.Duration(days=1, milliseconds=900))
+
+    systemtime_object = systemtime.Systemtime()
+    systemtime_object.CopyFromDateTimeString('2010-08-12 23:30:45.500+02:00')
+
+    result_object = systemtime_object + duration.Duration(hours=1)
+    self.assertEqual(result_object.day_of_month, 13)
+    self.assertEqual(result_object.hours, 0)
+    self.assertEqual(result_object.time_zone_offset, 120)
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-13 00:30:45.500')
+
+    with self.assertRaises(ValueError):
+      _ = systemtime_object + duration.Duration(microseconds=1)
+
   def testCopyFromDateTimeString(self):
     """Tests the CopyFromDateTimeString function."""
     systemtime_object = systemtime.Systemtime()
@@ -6,8 +6,11 @@ from __future__ import unicode_literals
 
 import datetime
 import decimal
+import pickle
 import unittest
 
+from dfdatetime import definitions
+from dfdatetime import duration
 from dfdatetime import time_elements
 
 
@@ -55,6 +58,35 @@ class TimeElementsTest(unittest.TestCase):
     normalized_timestamp = time_elements_object._GetNormalizedTimestamp()
     self.assertIsNone(normalized_timestamp)
 
+  def testArithmetic(self):
+    """Tests the __add__ and __sub__ functions."""
+    time_elements_object = time_elements.TimeElements(
+        time_elements_tuple=(2010, 8, 12, 23, 59, 59))
+    time_elements_object.is_local_time = True
+
+    result_object = time_elements_object + duration.Duration(seconds=2)
+    self.assertIsInstance(result_object, time_elements.TimeElements)
+    self.assertEqual(
+        result_object._time_elements_tuple, (2010, 8, 13, 0, 0, 1))
+    self.assertTrue(result_object.is_local_time)
+
+    result_duration = result_object - time_elements_object
+    self.assertEqual(result_duration, duration.Duration(seconds=2))
+
+    time_elements_object = time_elements.TimeElements()
+    time_elements_object.CopyFromDateTimeString('2010-08-12 21:06:31+02:00')
+
+    result_object = time_elements_object - duration.Duration(hours=22)
+    self.assertEqual(
+        result_object._time_elements_tuple, (2010, 8, 11, 23, 6, 31))
+    self.assertEqual(result_object.time_zone_offset, 120)
+
+    with self.assertRaises(ValueError):
+      _ = time_elements_object + duration.Duration(milliseconds=1)
+
+    with self.assertRaises(ValueError):
+      _ = time_elements.TimeElements() + duration.Duration(seconds=1)
+
   def testCopyDateTimeFromStringISO8601(self):
     """Tests the _CopyDateTimeFromStringISO8601 function."""
     time_elements_object = time_elements.TimeElements()
@@ -744,6 +776,46 @@ class TimeElementsInMillisecondsTest(unittest.TestCase):
 
   # TODO: add tests for _CopyFromDateTimeValues
 
+  def testArithmetic(self):
+    """Tests the __add__ and __sub__ functions."""
+    time_elements_object = time_elements.TimeElementsInMilliseconds()
+    time_elements_object.CopyFromDateTimeString(
+        '2010-08-12 23:59:59.999+02:00')
+
+    result_object = time_elements_object + duration.Duration(milliseconds=2)
+    self.assertIsInstance(
+        result_object, time_elements.TimeElementsInMilliseconds)
+    self.assertEqual(
+        result_object._time_elements_tuple, (2010, 8, 13, 0, 0, 0))
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-13 00:00:00.001')
+    self.assertEqual(result_object.time_zone_offset, 120)
+
+    result_duration = time_elements_object - result_object
+    self.assertEqual(result_duration, duration.Duration(milliseconds=-2))
+
+    with self.assertRaises(ValueError):
+      _ = time_elements_object + duration.Duration(microseconds=1)
+
+  def testRound(self):
+    """Tests the Floor and Round functions."""
+    time_elements_object = time_elements.TimeElementsInMilliseconds(
+        time_elements_tuple=(2010, 8, 12, 20, 6, 31, 546))
+
+    result_object = time_elements_object.Floor(
+        definitions.PRECISION_1_SECOND)
+    self.assertEqual(
+        result_object._time_elements_tuple, (2010, 8, 12, 20, 6, 31))
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-12 20:06:31.000')
+
+    result_object = time_elements_object.Round(
+        definitions.PRECISION_1_SECOND)
+    self.assertEqual(
+        result_object._time_elements_tuple, (2010, 8, 12, 20, 6, 32))
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-12 20:06:32.000')
+
   def testCopyFromDatetime(self):
     """Tests the CopyFromDatetime function."""
     time_elements_object = time_elements.TimeElementsInMilliseconds()
@@ -1053,6 +1125,25 @@ class TimeElementsInMicrosecondsTest(unittest.TestCase):
 
   # TODO: add tests for _CopyFromDateTimeValues
 
+  def testArithmetic(self):
+    """Tests the __add__ and __sub__ functions."""
+    time_elements_object = time_elements.TimeElementsInMicroseconds(
+        time_elements_tuple=(2010, 8, 12, 20, 6, 31, 999999))
+
+    result_object = time_elements_object + duration.Duration(microseconds=2)
+    self.assertIsInstance(
+        result_object, time_elements.TimeElementsInMicroseconds)
+    self.assertEqual(
+        result_object._time_elements_tuple, (2010, 8, 12, 20, 6, 32))
+    self.assertEqual(
+        result_object.CopyToDateTimeString(), '2010-08-12 20:06:32.000001')
+
+    result_duration = result_object - time_elements_object
+    self.assertEqual(result_duration, duration.Duration(microseconds=2))
+
+    with self.assertRaises(ValueError):
+      _ = time_elements_object + duration.Duration(nanoseconds=1)
+
   def testCopyFromDatetime(self):
     """Tests the CopyFromDatetime function."""
     time_elements_object = time_elements.TimeElementsInMicroseconds()
@@ -1273,6 +1364,61 @@ class TimeElementsInMicrosecondsTest(unittest.TestCase):
       time_elements_object.CopyFromStringTuple(
           time_elements_tuple=('2010', '8', '12', '20', '6', '31', '9S'))
 
+  def testCopyFromDict(self):
+    """Tests the CopyFromDict function."""
+    time_elements_object = time_elements.TimeElementsInMicroseconds()
+    time_elements_object.CopyFromDict({
+        '__class_name__': 'TimeElementsInMicroseconds',
+        'fraction_of_second': '0.429876',
+        'number_of_seconds': 1281643591,
+        'precision': '1us',
+        'time_elements_tuple': [2010, 8, 12, 20, 6, 31],
+        'time_zone_offset': 60})
+
+    self.assertEqual(
+        time_elements_object.fraction_of_second, decimal.Decimal('0.429876'))
+    self.assertEqual(
+        time_elements_object._time_elements_tuple, (2010, 8, 12, 20, 6, 31))
+    self.assertEqual(time_elements_object.time_zone_offset, 60)
+    self.assertFalse(time_elements_object.is_local_time)
+
+    date_time_string = time_elements_object.CopyToDateTimeString()
+    self.assertEqual(date_time_string, '2010-08-12 20:06:31.429876')
+
+    with self.assertRaises(ValueError):
+      time_elements_object.CopyFromDict({'__class_name__': 'TimeElements'})
+
+    with self.assertRaises(ValueError):
+      time_elements_object.CopyFromDict({'precision': 'bogus'})
+
+    with self.assertRaises(ValueError):
+      time_elements_object.CopyFromDict({'fraction_of_second': 'bogus'})
+
+  def testCopyToDict(self):
+    """Tests the CopyToDict function."""
+    time_elements_object = time_elements.TimeElementsInMicroseconds(
+        time_elements_tuple=(2010, 8, 12, 20, 6, 31, 429876))
+    time_elements_object.is_local_time = True
+
+    date_time_values_dict = time_elements_object.CopyToDict()
+    self.assertEqual(date_time_values_dict, {
+        '__class_name__': 'TimeElementsInMicroseconds',
+        'fraction_of_second': '0.429876',
+        'is_local_time': True,
+        'number_of_seconds': 1281643591,
+        'precision': '1us',
+        'time_elements_tuple': [2010, 8, 12, 20, 6, 31]})
+
+    time_elements_object = time_elements.TimeElementsInMicroseconds()
+
+    date_time_values_dict = time_elements_object.CopyToDict()
+    self.assertEqual(date_time_values_dict, {
+        '__class_name__': 'TimeElementsInMicroseconds',
+        'fraction_of_second': None,
+        'number_of_seconds': None,
+        'precision': '1us',
+        'time_elements_tuple': None})
+
   def testCopyToDateTimeString(self):
     """Tests the CopyToDateTimeString function."""
     time_elements_object = time_elements.TimeElementsInMicroseconds(
@@ -1294,6 +1440,20 @@ class TimeElementsInMicrosecondsTest(unittest.TestCase):
     date_time_string = time_elements_object.CopyToDateTimeStringISO8601()
     self.assertEqual(date_time_string, '2010-08-12T20:06:31.429876Z')
 
+  def testPickle(self):
+    """Tests pickling and unpickling."""
+    time_elements_object = time_elements.TimeElementsInMicroseconds(
+        time_elements_tuple=(2010, 8, 12, 20, 6, 31, 429876))
+
+    unpickled_object = pickle.loads(pickle.dumps(time_elements_object))
+    self.assertEqual(
+        unpickled_object.fraction_of_second, decimal.Decimal('0.429876'))
+    self.assertEqual(
+        unpickled_object._time_elements_tuple, (2010, 8, 12, 20, 6, 31))
+    self.assertEqual(unpickled_object.precision, '1us')
+    self.assertEqual(
+        unpickled_object.CopyToDateTimeString(), '2010-08-12 20:06:31.429876')
+
   def testGetDate(self):
     """Tests the GetDate function."""
     time_elements_object = time_elements.TimeElementsInMicroseconds(
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the compiled time filter expressions."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfdatetime import filetime
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+from dfdatetime import time_filter
+
+
+class TimeFilterTest(unittest.TestCase):
+  """Tests for the compiled time filter expression."""
+
+  def _CreateTestValues(self):
+    """Creates date and time values for testing.
+
+    Returns:
+      list[DateTimeValues]: date and time values.
+    """
+    return [
+        # 2019-04-30 23:59:59
+        posix_time.PosixTime(timestamp=1556668799),
+        # 2019-05-01 00:00:01
+        posix_time.PosixTime(timestamp=1556668801),
+        # 2019-06-01 10:00:00.5
+        posix_time.PosixTimeInMilliseconds(timestamp=1559383200500),
+        # 2019-06-01 09:59:59
+        posix_time.PosixTime(timestamp=1559383199),
+        semantic_time.Never(),
+        semantic_time.NotSet(),
+        filetime.Filetime(),
+        semantic_time.InvalidTime()]
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    test_filter = time_filter.TimeFilter('never')
+    self.assertEqual(test_filter.expression, 'never')
+
+    for expression in (
+        '', 'after', 'after bogus', 'bogus', 'never never', '(never',
+        'never and', 'after 2019-05-01 )', 'not'):
+      with self.assertRaises(ValueError):
+        time_filter.TimeFilter(expression)
+
+  def testMatches(self):
+    """Tests the Matches function."""
+    test_values = self._CreateTestValues()
+
+    test_filter = time_filter.TimeFilter(
+        'after 2019-05-01 and before 2019-06-01T12:00:00+02:00 or never')
+    results = [test_filter.Matches(value) for value in test_values]
+    self.assertEqual(
+        results, [False, True, False, True, True, False, False, False])
+
+    test_filter = time_filter.TimeFilter(
+        'AFTER 2019-05-01 and (before 2019-06-01 10:00:00 or not set)')
+    results = [test_filter.Matches(value) for value in test_values]
+    self.assertEqual(
+        results, [False, True, False, True, False, False, False, False])
+
+    test_filter = time_filter.TimeFilter('not set or invalid')
+    results = [test_filter.Matches(value) for value in test_values]
+    self.assertEqual(
+        results, [False, False, False, False, False, True, True, True])
+
+    test_filter = time_filter.TimeFilter('not before 2019-05-01')
+    results = [test_filter.Matches(value) for value in test_values]
+    self.assertEqual(
+        results, [False, True, True, True, True, True, True, True])
+
+  def testGetMask(self):
+    """Tests the CopyToColumns and GetMask functions."""
+    test_values = self._CreateTestValues()
+
+    test_filter = time_filter.TimeFilter(
+        'after 2019-05-01 and before 2019-06-01T12:00:00+02:00 or never')
+
+    if not time_filter.numpy:
+      with self.assertRaises(RuntimeError):
+        time_filter.CopyToColumns(test_values)
+
+      with self.assertRaises(RuntimeError):
+        test_filter.GetMask([], [])
+      return
+
+    normalized_timestamps, semantic_codes = time_filter.CopyToColumns(
+        test_values)
+    self.assertEqual(semantic_codes.tolist(), [
+        time_filter.SEMANTIC_CODE_NONE, time_filter.SEMANTIC_CODE_NONE,
+        time_filter.SEMANTIC_CODE_NONE, time_filter.SEMANTIC_CODE_NONE,
+        time_filter.SEMANTIC_CODE_NEVER, time_filter.SEMANTIC_CODE_NOT_SET,
+        time_filter.SEMANTIC_CODE_NOT_SET, time_filter.SEMANTIC_CODE_INVALID])
+
+    for expression in (
+        'after 2019-05-01 and before 2019-06-01T12:00:00+02:00 or never',
+        'not before 2019-05-01', 'not set or invalid', 'before 9999-12-31'):
+      test_filter = time_filter.TimeFilter(expression)
+
+      mask = test_filter.GetMask(normalized_timestamps, semantic_codes)
+      self.assertEqual(
+          mask.tolist(), [test_filter.Matches(value) for value in test_values])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,450 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the time zones."""
+
+from __future__ import unicode_literals
+
+import calendar
+import os
+import struct
+import unittest
+
+from dfdatetime import definitions
+from dfdatetime import fat_date_time
+from dfdatetime import filetime
+from dfdatetime import hfs_time
+from dfdatetime import posix_time
+from dfdatetime import time_elements
+from dfdatetime import time_zones
+
+
+def _CreateTimeZoneInformationFileData(
+    transition_times, utc_offsets, type_indexes, footer):
+  """Creates version 2 time zone information (TZif) file data for testing.
+
+  Args:
+    transition_times (list[int]): transition times.
+    utc_offsets (list[int]): time zone offsets of the local time types.
+    type_indexes (list[int]): local time type indexes of the transitions.
+    footer (str): POSIX TZ string.
+
+  Returns:
+    bytes: TZif file data.
+  """
+  abbreviations = b'TST\x00'
+
+  def _CreateBlock(time_format):
+    data = struct.pack(
+        '>4sc15x6L', b'TZif', b'2', 0, 0, 0, len(transition_times),
+        len(utc_offsets), len(abbreviations))
+    data += struct.pack(
+        '>{0:d}{1:s}'.format(len(transition_times), time_format),
+        *transition_times)
+    data += bytes(bytearray(type_indexes))
+    for utc_offset in utc_offsets:
+      data += struct.pack('>lBB', utc_offset, 0, 0)
+    return data + abbreviations
+
+  return b''.join([
+      _CreateBlock('l'), _CreateBlock('q'), b'\n',
+      footer.encode('ascii'), b'\n'])
+
+
+class TimeZoneRuleTest(unittest.TestCase):
+  """Tests for the time zone rule."""
+
+  def testGetTransitions(self):
+    """Tests the GetTransitions function."""
+    parser = time_zones.TimeZoneInformationFileParser()
+
+    time_zone_rule = parser._ParsePOSIXTimeZoneString(  # pylint: disable=protected-access
+        'CET-1CEST,M3.5.0,M10.5.0/3')
+
+    transitions = time_zone_rule.GetTransitions(2020)
+    self.assertEqual(transitions, [
+        (calendar.timegm((2020, 3, 29, 1, 0, 0)), 7200),
+        (calendar.timegm((2020, 10, 25, 1, 0, 0)), 3600)])
+
+    time_zone_rule = parser._ParsePOSIXTimeZoneString(  # pylint: disable=protected-access
+        'AEST-10AEDT,M10.1.0,M4.1.0/3')
+
+    transitions = time_zone_rule.GetTransitions(2020)
+    self.assertEqual(transitions, [
+        (calendar.timegm((2020, 4, 4, 16, 0, 0)), 36000),
+        (calendar.timegm((2020, 10, 3, 16, 0, 0)), 39600)])
+
+    time_zone_rule = parser._ParsePOSIXTimeZoneString('<+0530>-5:30')  # pylint: disable=protected-access
+
+    transitions = time_zone_rule.GetTransitions(2020)
+    self.assertEqual(transitions, [])
+    self.assertEqual(time_zone_rule.std_offset, 19800)
+
+
+class TimeZoneTest(unittest.TestCase):
+  """Tests for the time zone."""
+
+  def _CreateTimeZone(self):
+    """Creates a time zone for testing.
+
+    Returns:
+      TimeZone: time zone with transitions in 2020, where daylight saving time
+          after 2020 is defined by a time zone rule.
+    """
+    data = _CreateTimeZoneInformationFileData(
+        [calendar.timegm((2020, 3, 29, 1, 0, 0)),
+         calendar.timegm((2020, 10, 25, 1, 0, 0))],
+        [3600, 7200], [1, 0], 'CET-1CEST,M3.5.0,M10.5.0/3')
+
+    parser = time_zones.TimeZoneInformationFileParser()
+    return parser.Parse('Test/Zone', data)
+
+  def testCopyFromUTC(self):
+    """Tests the CopyFromUTC function."""
+    time_zone = self._CreateTimeZone()
+
+    timestamp = calendar.timegm((2020, 7, 1, 12, 0, 0))
+    local_timestamp = time_zone.CopyFromUTC(timestamp)
+    self.assertEqual(local_timestamp, timestamp + 7200)
+
+    timestamp = calendar.timegm((2020, 12, 1, 12, 0, 0))
+    local_timestamp = time_zone.CopyFromUTC(timestamp)
+    self.assertEqual(local_timestamp, timestamp + 3600)
+
+    timestamp = calendar.timegm((2019, 7, 1, 12, 0, 0))
+    local_timestamp = time_zone.CopyFromUTC(timestamp)
+    self.assertEqual(local_timestamp, timestamp + 3600)
+
+    # Transitions after 2020 are determined from the time zone rule.
+    timestamp = calendar.timegm((2051, 7, 1, 12, 0, 0))
+    local_timestamp = time_zone.CopyFromUTC(timestamp)
+    self.assertEqual(local_timestamp, timestamp + 7200)
+
+    timestamp = calendar.timegm((2051, 12, 1, 12, 0, 0))
+    local_timestamp = time_zone.CopyFromUTC(timestamp)
+    self.assertEqual(local_timestamp, timestamp + 3600)
+
+  def testCopyLocalTimestampsToUTC(self):
+    """Tests the CopyLocalTimestampsToUTC function."""
+    time_zone = self._CreateTimeZone()
+
+    local_timestamps = [
+        calendar.timegm((2020, 7, 1, 12, 0, 0)),
+        calendar.timegm((2020, 3, 29, 2, 30, 0)),
+        calendar.timegm((2020, 10, 25, 2, 30, 0)),
+        None]
+
+    timestamps, statuses = time_zone.CopyLocalTimestampsToUTC(
+        local_timestamps)
+    self.assertEqual(timestamps, [
+        local_timestamps[0] - 7200, local_timestamps[1] - 3600,
+        local_timestamps[2] - 7200, None])
+    self.assertEqual(statuses, [
+        definitions.LOCAL_TIME_VALID, definitions.LOCAL_TIME_NONEXISTENT,
+        definitions.LOCAL_TIME_AMBIGUOUS, None])
+
+    timestamps, statuses = time_zone.CopyLocalTimestampsToUTC(
+        [(local_timestamps[2] * 1000) + 999], units_per_second=1000, fold=1)
+    self.assertEqual(timestamps, [((local_timestamps[2] - 3600) * 1000) + 999])
+    self.assertEqual(statuses, [definitions.LOCAL_TIME_AMBIGUOUS])
+
+  def testCopyToUTC(self):
+    """Tests the CopyToUTC function."""
+    time_zone = self._CreateTimeZone()
+
+    local_timestamp = calendar.timegm((2020, 7, 1, 12, 0, 0))
+    timestamp = time_zone.CopyToUTC(local_timestamp)
+    self.assertEqual(timestamp, local_timestamp - 7200)
+
+    # 02:30 on 2020-03-29 does not exist.
+    local_timestamp = calendar.timegm((2020, 3, 29, 2, 30, 0))
+    timestamp = time_zone.CopyToUTC(local_timestamp, fold=0)
+    self.assertEqual(timestamp, local_timestamp - 3600)
+
+    timestamp = time_zone.CopyToUTC(local_timestamp, fold=1)
+    self.assertEqual(timestamp, local_timestamp - 7200)
+
+    # 02:30 on 2020-10-25 is ambiguous.
+    local_timestamp = calendar.timegm((2020, 10, 25, 2, 30, 0))
+    timestamp = time_zone.CopyToUTC(local_timestamp, fold=0)
+    self.assertEqual(timestamp, local_timestamp - 7200)
+
+    timestamp = time_zone.CopyToUTC(local_timestamp, fold=1)
+    self.assertEqual(timestamp, local_timestamp - 3600)
+
+    local_timestamp = calendar.timegm((2051, 10, 29, 2, 30, 0))
+    timestamp = time_zone.CopyToUTC(local_timestamp, fold=1)
+    self.assertEqual(timestamp, local_timestamp - 3600)
+
+  def testGetTransitions(self):
+    """Tests the GetTransitions function."""
+    time_zone = self._CreateTimeZone()
+
+    transition_times, utc_offsets = time_zone.GetTransitions(
+        calendar.timegm((2020, 7, 1, 12, 0, 0)))
+    self.assertEqual(transition_times[:2], [
+        calendar.timegm((2020, 3, 29, 1, 0, 0)),
+        calendar.timegm((2020, 10, 25, 1, 0, 0))])
+    self.assertEqual(utc_offsets[:3], [3600, 7200, 3600])
+
+    transition_times, utc_offsets = time_zone.GetTransitions(
+        calendar.timegm((2021, 7, 1, 12, 0, 0)))
+    self.assertEqual(transition_times[2:4], [
+        calendar.timegm((2021, 3, 28, 1, 0, 0)),
+        calendar.timegm((2021, 10, 31, 1, 0, 0))])
+    self.assertEqual(len(utc_offsets), len(transition_times) + 1)
+
+  def testGetUTCNormalizedTimestamp(self):
+    """Tests the GetUTCNormalizedTimestamp function."""
+    time_zone = self._CreateTimeZone()
+
+    local_timestamp = calendar.timegm((2020, 7, 1, 12, 0, 0))
+    date_time_values = posix_time.PosixTimeInMicroseconds(
+        timestamp=(local_timestamp * 1000000) + 123456)
+
+    normalized_timestamp = time_zone.GetUTCNormalizedTimestamp(
+        date_time_values)
+    self.assertEqual(
+        normalized_timestamp, (local_timestamp * 1000000000) + 123456000)
+
+    date_time_values.is_local_time = True
+
+    normalized_timestamp = time_zone.GetUTCNormalizedTimestamp(
+        date_time_values)
+    self.assertEqual(
+        normalized_timestamp,
+        ((local_timestamp - 7200) * 1000000000) + 123456000)
+
+    date_time_values = posix_time.PosixTime()
+    date_time_values.is_local_time = True
+
+    normalized_timestamp = time_zone.GetUTCNormalizedTimestamp(
+        date_time_values)
+    self.assertIsNone(normalized_timestamp)
+
+  def testGetUTCNormalizedTimestamps(self):
+    """Tests the GetUTCNormalizedTimestamps function."""
+    time_zone = self._CreateTimeZone()
+
+    fat_date_time_object = fat_date_time.FATDateTime()
+    fat_date_time_object.CopyFromDateTimeString('2020-10-25 02:30:00')
+    fat_date_time_object.is_local_time = True
+
+    hfs_time_object = hfs_time.HFSTime()
+    hfs_time_object.CopyFromDateTimeString('2020-07-01 12:00:00')
+    hfs_time_object.is_local_time = True
+
+    time_elements_object = time_elements.TimeElements(
+        time_elements_tuple=(2020, 7, 1, 12, 0, 0))
+
+    normalized_timestamps, statuses = time_zone.GetUTCNormalizedTimestamps([
+        fat_date_time_object, hfs_time_object, time_elements_object,
+        time_elements.TimeElements()])
+
+    timestamp = calendar.timegm((2020, 7, 1, 12, 0, 0))
+    self.assertEqual(normalized_timestamps, [
+        (calendar.timegm((2020, 10, 25, 0, 30, 0))) * 1000000000,
+        (timestamp - 7200) * 1000000000, timestamp * 1000000000, None])
+    self.assertEqual(statuses, [
+        definitions.LOCAL_TIME_AMBIGUOUS, definitions.LOCAL_TIME_VALID,
+        definitions.LOCAL_TIME_VALID, None])
+
+  def testGetUTCOffset(self):
+    """Tests the GetUTCOffset function."""
+    time_zone = self._CreateTimeZone()
+
+    utc_offset = time_zone.GetUTCOffset(
+        calendar.timegm((2020, 3, 29, 0, 59, 59)))
+    self.assertEqual(utc_offset, 3600)
+
+    utc_offset = time_zone.GetUTCOffset(
+        calendar.timegm((2020, 3, 29, 1, 0, 0)))
+    self.assertEqual(utc_offset, 7200)
+
+    utc_offset = time_zone.GetUTCOffset(
+        calendar.timegm((2020, 3, 29, 1, 0, 1)))
+    self.assertEqual(utc_offset, 7200)
+
+
+class TimeZoneInformationFileParserTest(unittest.TestCase):
+  """Tests for the time zone information (TZif) file parser."""
+
+  def testParse(self):
+    """Tests the Parse function."""
+    parser = time_zones.TimeZoneInformationFileParser()
+
+    data = _CreateTimeZoneInformationFileData([], [3600], [], 'CET-1')
+    time_zone = parser.Parse('Test/Zone', data)
+    self.assertEqual(time_zone.name, 'Test/Zone')
+    self.assertEqual(time_zone.GetUTCOffset(0), 3600)
+
+    data = _CreateTimeZoneInformationFileData(
+        [], [0], [], 'CET-1CEST,M3.5.0,M10.5.0/3')
+    time_zone = parser.Parse('Test/Zone', data)
+    self.assertEqual(time_zone.GetUTCOffset(0), 3600)
+    self.assertEqual(time_zone.GetUTCOffset(
+        calendar.timegm((1970, 7, 1, 0, 0, 0))), 7200)
+
+    with self.assertRaises(ValueError):
+      parser.Parse('Test/Zone', b'TZxf')
+
+    with self.assertRaises(ValueError):
+      parser.Parse('Test/Zone', data[:64])
+
+    data = _CreateTimeZoneInformationFileData([0], [3600], [1], 'CET-1')
+    with self.assertRaises(ValueError):
+      parser.Parse('Test/Zone', data)
+
+    data = _CreateTimeZoneInformationFileData([], [3600], [], 'bogus')
+    with self.assertRaises(ValueError):
+      parser.Parse('Test/Zone', data)
+
+
+class TimeZoneFactoryTest(unittest.TestCase):
+  """Tests for the time zone factory."""
+
+  # pylint: disable=protected-access
+
+  def testGetTimeZoneInformationFilePath(self):
+    """Tests the _GetTimeZoneInformationFilePath function."""
+    with self.assertRaises(ValueError):
+      time_zones.TimeZoneFactory._GetTimeZoneInformationFilePath(
+          '../etc/passwd')
+
+    with self.assertRaises(ValueError):
+      time_zones.TimeZoneFactory._GetTimeZoneInformationFilePath(
+          '/etc/passwd')
+
+    path = time_zones.TimeZoneFactory._GetTimeZoneInformationFilePath(
+        'Bogus/Zone')
+    self.assertIsNone(path)
+
+  @unittest.skipUnless(
+      os.path.isfile('/usr/share/zoneinfo/Europe/Amsterdam'),
+      'missing time zone information file')
+  def testGetTimeZone(self):
+    """Tests the GetTimeZone function."""
+    time_zone = time_zones.TimeZoneFactory.GetTimeZone('Europe/Amsterdam')
+    self.assertIsNotNone(time_zone)
+    self.assertIs(
+        time_zones.TimeZoneFactory.GetTimeZone('Europe/Amsterdam'), time_zone)
+
+    utc_offset = time_zone.GetUTCOffset(
+        calendar.timegm((2010, 8, 12, 21, 6, 31)))
+    self.assertEqual(utc_offset, 7200)
+
+    with self.assertRaises(KeyError):
+      time_zones.TimeZoneFactory.GetTimeZone('Bogus/Zone')
+
+  def testGetTimeZoneUTC(self):
+    """Tests the GetTimeZone function with UTC."""
+    time_zone = time_zones.TimeZoneFactory.GetTimeZone('UTC')
+    self.assertIsNotNone(time_zone)
+    self.assertEqual(time_zone.GetUTCOffset(0), 0)
+
+
+class TimeZonesRendererTest(unittest.TestCase):
+  """Tests for the time zones renderer."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTimeZonesRenderer(self, precision=None):
+    """Creates a time zones renderer for testing.
+
+    Args:
+      precision (Optional[str]): precision of the fraction of second.
+
+    Returns:
+      TimeZonesRenderer: time zones renderer that renders in UTC, a time zone
+          with daylight saving time and a time zone with a negative time zone
+          offset.
+    """
+    data = _CreateTimeZoneInformationFileData(
+        [calendar.timegm((2020, 3, 29, 1, 0, 0)),
+         calendar.timegm((2020, 10, 25, 1, 0, 0))],
+        [3600, 7200], [1, 0], 'CET-1CEST,M3.5.0,M10.5.0/3')
+
+    parser = time_zones.TimeZoneInformationFileParser()
+    time_zone = parser.Parse('Test/Zone', data)
+
+    negative_time_zone = time_zones.TimeZone('Test/Negative', [], [-12600])
+
+    if not precision:
+      precision = definitions.PRECISION_1_MICROSECOND
+
+    return time_zones.TimeZonesRenderer(
+        ['UTC', time_zone, negative_time_zone], precision=precision)
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    renderer = self._CreateTimeZonesRenderer()
+    self.assertEqual(len(renderer.time_zones), 3)
+
+    with self.assertRaises(ValueError):
+      time_zones.TimeZonesRenderer(
+          ['UTC'], precision=definitions.PRECISION_1_DAY)
+
+    with self.assertRaises(KeyError):
+      time_zones.TimeZonesRenderer(['Bogus/Zone'])
+
+  def testGetUTCOffsetString(self):
+    """Tests the _GetUTCOffsetString function."""
+    renderer = self._CreateTimeZonesRenderer()
+
+    self.assertEqual(renderer._GetUTCOffsetString(0), '+00:00')
+    self.assertEqual(renderer._GetUTCOffsetString(7200), '+02:00')
+    self.assertEqual(renderer._GetUTCOffsetString(-12600), '-03:30')
+    self.assertEqual(renderer._GetUTCOffsetString(1172), '+00:19:32')
+
+  def testCopyNormalizedTimestampsToDateTimeStrings(self):
+    """Tests the CopyNormalizedTimestampsToDateTimeStrings function."""
+    renderer = self._CreateTimeZonesRenderer()
+
+    date_time_strings = renderer.CopyNormalizedTimestampsToDateTimeStrings([
+        1281647191546875322, None, -1])
+    self.assertEqual(date_time_strings, [
+        ['2010-08-12T21:06:31.546875+00:00',
+         '2010-08-12T22:06:31.546875+01:00',
+         '2010-08-12T17:36:31.546875-03:30'],
+        [None, None, None],
+        ['1969-12-31T23:59:59.999999+00:00',
+         '1970-01-01T00:59:59.999999+01:00',
+         '1969-12-31T20:29:59.999999-03:30']])
+
+  def testCopyTimestampsToDateTimeStrings(self):
+    """Tests the CopyTimestampsToDateTimeStrings function."""
+    renderer = self._CreateTimeZonesRenderer(
+        precision=definitions.PRECISION_100_NANOSECONDS)
+
+    date_time_strings = renderer.CopyTimestampsToDateTimeStrings(
+        [0x01cb3a623d0a17ce, -1], filetime.Filetime)
+    self.assertEqual(date_time_strings, [
+        ['2010-08-12T21:06:31.5468750+00:00',
+         '2010-08-12T22:06:31.5468750+01:00',
+         '2010-08-12T17:36:31.5468750-03:30'],
+        [None, None, None]])
+
+  def testCopyToDateTimeStrings(self):
+    """Tests the CopyToDateTimeStrings function."""
+    renderer = self._CreateTimeZonesRenderer(
+        precision=definitions.PRECISION_1_SECOND)
+
+    posix_time_object = posix_time.PosixTime(
+        timestamp=calendar.timegm((2020, 3, 29, 1, 0, 0)))
+    date_time_strings = renderer.CopyToDateTimeStrings(posix_time_object)
+    self.assertEqual(date_time_strings, [
+        '2020-03-29T01:00:00+00:00', '2020-03-29T03:00:00+02:00',
+        '2020-03-28T21:30:00-03:30'])
+
+    posix_time_object = posix_time.PosixTime(
+        timestamp=calendar.timegm((2021, 12, 1, 0, 0, 0)))
+    date_time_strings = renderer.CopyToDateTimeStrings(posix_time_object)
+    self.assertEqual(date_time_strings, [
+        '2021-12-01T00:00:00+00:00', '2021-12-01T01:00:00+01:00',
+        '2021-11-30T20:30:00-03:30'])
+
+    date_time_strings = renderer.CopyToDateTimeStrings(posix_time.PosixTime())
+    self.assertEqual(date_time_strings, [None, None, None])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the sorted timeline index of date and time values."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfdatetime import duration
+from dfdatetime import filetime
+from dfdatetime import posix_time
+from dfdatetime import semantic_time
+from dfdatetime import time_elements
+from dfdatetime import timeline
+from dfdatetime import webkit_time
+
+
+class TimelineIndexTest(unittest.TestCase):
+  """Tests for the sorted timeline index of date and time values."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestTimelineIndex(self):
+    """Creates a timeline index for testing.
+
+    Returns:
+      TimelineIndex: timeline index.
+    """
+    return timeline.TimelineIndex([
+        (posix_time.PosixTime(timestamp=1281643594), 'd'),
+        (filetime.Filetime(timestamp=0x01cb3a623d0a17ce), 'z'),
+        (posix_time.PosixTime(timestamp=1281643591), 'a'),
+        (semantic_time.Never(), 'never'),
+        (posix_time.PosixTime(timestamp=1281643593), 'c'),
+        (filetime.Filetime(), 'not set'),
+        (posix_time.PosixTimeInMilliseconds(timestamp=1281643592000), 'b')])
+
+  def _GetPayloads(self, entries):
+    """Retrieves the payloads of entries.
+
+    Args:
+      entries (list[tuple[DateTimeValues, object]]): entries.
+
+    Returns:
+      list[object]: payloads.
+    """
+    return [payload for _, payload in entries]
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    timeline_index = timeline.TimelineIndex()
+    self.assertEqual(len(timeline_index), 0)
+
+    timeline_index = self._CreateTestTimelineIndex()
+    self.assertEqual(len(timeline_index), 7)
+
+  def testGetKey(self):
+    """Tests the _GetKey function."""
+    timeline_index = timeline.TimelineIndex()
+
+    key = timeline_index._GetKey(posix_time.PosixTime(timestamp=1281643591))
+    self.assertEqual(key, 1281643591000000000)
+
+    with self.assertRaises(ValueError):
+      timeline_index._GetKey(semantic_time.Never())
+
+  def testAfter(self):
+    """Tests the After function."""
+    timeline_index = self._CreateTestTimelineIndex()
+
+    entries = timeline_index.After(posix_time.PosixTime(timestamp=1281643593))
+    self.assertEqual(self._GetPayloads(entries), ['d', 'z'])
+
+    with self.assertRaises(ValueError):
+      timeline_index.After(semantic_time.Never())
+
+  def testBefore(self):
+    """Tests the Before function."""
+    timeline_index = self._CreateTestTimelineIndex()
+
+    entries = timeline_index.Before(posix_time.PosixTime(timestamp=1281643593))
+    self.assertEqual(self._GetPayloads(entries), ['a', 'b'])
+
+  def testGetEntries(self):
+    """Tests the GetEntries function."""
+    timeline_index = self._CreateTestTimelineIndex()
+
+    entries = timeline_index.GetEntries()
+    self.assertEqual(self._GetPayloads(entries), ['a', 'b', 'c', 'd', 'z'])
+
+  def testGetSemanticEntries(self):
+    """Tests the GetSemanticEntries function."""
+    timeline_index = self._CreateTestTimelineIndex()
+
+    entries = timeline_index.GetSemanticEntries()
+    self.assertEqual(self._GetPayloads(entries), ['never', 'not set'])
+
+    entries = timeline_index.GetSemanticEntries(string='Never')
+    self.assertEqual(self._GetPayloads(entries), ['never'])
+
+    entries = timeline_index.GetSemanticEntries(string='Bogus')
+    self.assertEqual(entries, [])
+
+  def testInsert(self):
+    """Tests the Insert function."""
+    timeline_index = self._CreateTestTimelineIndex()
+
+    timeline_index.Insert(posix_time.PosixTime(timestamp=1281643592), 'b2')
+    timeline_index.Insert(semantic_time.Never(), 'never2')
+    self.assertEqual(len(timeline_index), 9)
+
+    entries = timeline_index.GetEntries()
+    self.assertEqual(
+        self._GetPayloads(entries), ['a', 'b', 'b2', 'c', 'd', 'z'])
+
+    entries = timeline_index.GetSemanticEntries(string='Never')
+    self.assertEqual(self._GetPayloads(entries), ['never', 'never2'])
+
+  def testInsertMany(self):
+    """Tests the InsertMany function."""
+    timeline_index = self._CreateTestTimelineIndex()
+
+    timeline_index.InsertMany([
+        (posix_time.PosixTime(timestamp=1281643595), 'e'),
+        (posix_time.PosixTime(timestamp=1281643592), 'b2')])
+    self.assertEqual(len(timeline_index), 9)
+
+    entries = timeline_index.GetEntries()
+    self.assertEqual(
+        self._GetPayloads(entries), ['a', 'b', 'b2', 'c', 'd', 'e', 'z'])
+
+  def testNearest(self):
+    """Tests the Nearest function."""
+    timeline_index = self._CreateTestTimelineIndex()
+
+    date_time_values = posix_time.PosixTimeInMilliseconds(
+        timestamp=1281643592600)
+
+    entries = timeline_index.Nearest(date_time_values)
+    self.assertEqual(self._GetPayloads(entries), ['c'])
+
+    entries = timeline_index.Nearest(
+        date_time_values, maximum_number_of_entries=3)
+    self.assertEqual(self._GetPayloads(entries), ['c', 'b', 'd'])
+
+    date_time_values = posix_time.PosixTimeInMilliseconds(
+        timestamp=1281643592500)
+
+    entries = timeline_index.Nearest(
+        date_time_values, maximum_number_of_entries=2)
+    self.assertEqual(self._GetPayloads(entries), ['b', 'c'])
+
+    entries = timeline_index.Nearest(
+        date_time_values, maximum_number_of_entries=10)
+    self.assertEqual(
+        self._GetPayloads(entries), ['b', 'c', 'a', 'd', 'z'])
+
+    timeline_index = timeline.TimelineIndex()
+
+    entries = timeline_index.Nearest(date_time_values)
+    self.assertEqual(entries, [])
+
+  def testRange(self):
+    """Tests the Range function."""
+    timeline_index = self._CreateTestTimelineIndex()
+
+    entries = timeline_index.Range(
+        start=posix_time.PosixTime(timestamp=1281643592),
+        end=posix_time.PosixTime(timestamp=1281643594))
+    self.assertEqual(self._GetPayloads(entries), ['b', 'c', 'd'])
+
+    entries = timeline_index.Range(
+        start=posix_time.PosixTime(timestamp=1281643594))
+    self.assertEqual(self._GetPayloads(entries), ['d', 'z'])
+
+    entries = timeline_index.Range(
+        end=posix_time.PosixTime(timestamp=1281643591))
+    self.assertEqual(self._GetPayloads(entries), ['a'])
+
+    entries = timeline_index.Range()
+    self.assertEqual(len(entries), 5)
+
+    with self.assertRaises(ValueError):
+      timeline_index.Range(start=semantic_time.Never())
+
+
+class DeduplicateTest(unittest.TestCase):
+  """Tests for the Deduplicate function."""
+
+  def testDeduplicate(self):
+    """Tests the Deduplicate function."""
+    date_time_values_list = [
+        semantic_time.NotSet(),
+        posix_time.PosixTime(timestamp=1281643591),
+        posix_time.PosixTimeInMicroseconds(timestamp=1281643591546875),
+        posix_time.PosixTimeInMilliseconds(timestamp=1281643591999),
+        posix_time.PosixTime(timestamp=1281643592),
+        posix_time.PosixTimeInMilliseconds(timestamp=1281643592001),
+        posix_time.PosixTimeInMilliseconds(timestamp=1281643592002),
+        semantic_time.Never()]
+
+    results = list(timeline.Deduplicate(date_time_values_list))
+    self.assertEqual(len(results), 4)
+
+    expected_results = [
+        (date_time_values_list[0], 0), (date_time_values_list[1], 2),
+        (date_time_values_list[4], 2), (date_time_values_list[7], 0)]
+    for (date_time_values, number_of_collapsed_items), (
+        expected_date_time_values, expected_number_of_collapsed_items) in zip(
+            results, expected_results):
+      self.assertIs(date_time_values, expected_date_time_values)
+      self.assertEqual(
+          number_of_collapsed_items, expected_number_of_collapsed_items)
+
+    results = list(timeline.Deduplicate(
+        date_time_values_list, window=duration.Duration(milliseconds=2)))
+    number_of_collapsed_items = [number for _, number in results]
+    self.assertEqual(number_of_collapsed_items, [0, 0, 0, 1, 1, 0])
+
+    results = list(timeline.Deduplicate(
+        date_time_values_list, window=duration.Duration()))
+    self.assertEqual(len(results), 8)
+
+    with self.assertRaises(ValueError):
+      timeline.Deduplicate([], window=duration.Duration(seconds=-1))
+
+    generator = timeline.Deduplicate(list(reversed(date_time_values_list)))
+    with self.assertRaises(ValueError):
+      list(generator)
+
+  def testDeduplicateWithGetDateTimeValues(self):
+    """Tests the Deduplicate function with get_date_time_values."""
+    entries = [
+        (posix_time.PosixTime(timestamp=1281643591), 'a'),
+        (posix_time.PosixTimeInMicroseconds(timestamp=1281643591000001), 'b'),
+        (posix_time.PosixTime(timestamp=1281643593), 'c')]
+
+    results = list(timeline.Deduplicate(
+        entries, get_date_time_values=lambda entry: entry[0]))
+    self.assertEqual(
+        [(entry[1], number) for entry, number in results], [('a', 1), ('c', 0)])
+
+
+class MatchWithinTest(unittest.TestCase):
+  """Tests for the MatchWithin function."""
+
+  def testMatchWithin(self):
+    """Tests the MatchWithin function."""
+    filetime_values = [
+        # 2010-08-12 21:06:32.0000001
+        filetime.Filetime(timestamp=0x01cb3a623d4f3c01),
+        # 2010-08-12 21:06:31.5468750
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce),
+        semantic_time.Never(),
+        # 2010-08-12 21:06:35.0000000
+        filetime.Filetime(timestamp=0x01cb3a623f18ff80)]
+    time_elements_values = [
+        time_elements.TimeElements(time_elements_tuple=(
+            2010, 8, 12, 21, 6, 33)),
+        time_elements.TimeElements(time_elements_tuple=(
+            2010, 8, 12, 21, 6, 31))]
+
+    matches = list(timeline.MatchWithin(filetime_values, time_elements_values))
+    self.assertEqual(len(matches), 2)
+
+    filetime_object, time_elements_object, difference = matches[0]
+    self.assertIs(filetime_object, filetime_values[1])
+    self.assertIs(time_elements_object, time_elements_values[1])
+    self.assertEqual(difference, duration.Duration(nanoseconds=-546875000))
+
+    filetime_object, time_elements_object, difference = matches[1]
+    self.assertIs(filetime_object, filetime_values[0])
+    self.assertIs(time_elements_object, time_elements_values[0])
+    self.assertEqual(difference, duration.Duration(nanoseconds=999999900))
+
+    matches = list(timeline.MatchWithin(
+        filetime_values, time_elements_values,
+        tolerance=duration.Duration(seconds=2)))
+    self.assertEqual(len(matches), 5)
+
+    matches = list(timeline.MatchWithin(
+        filetime_values, time_elements_values,
+        tolerance=duration.Duration(seconds=0)))
+    self.assertEqual(matches, [])
+
+    matches = list(timeline.MatchWithin([], time_elements_values))
+    self.assertEqual(matches, [])
+
+    with self.assertRaises(ValueError):
+      timeline.MatchWithin(
+          filetime_values, time_elements_values,
+          tolerance=duration.Duration(seconds=-1))
+
+  def testMatchWithinWithGetDateTimeValues(self):
+    """Tests the MatchWithin function with get_date_time_values."""
+    entries = [
+        (posix_time.PosixTime(timestamp=1281643591), 'a'),
+        (posix_time.PosixTime(timestamp=1281643593), 'c')]
+    other_entries = [
+        (posix_time.PosixTimeInMilliseconds(timestamp=1281643593500), 'b')]
+
+    matches = list(timeline.MatchWithin(
+        entries, other_entries, get_date_time_values=lambda entry: entry[0]))
+    self.assertEqual(len(matches), 1)
+
+    entry, other_entry, difference = matches[0]
+    self.assertEqual(entry[1], 'c')
+    self.assertEqual(other_entry[1], 'b')
+    self.assertEqual(difference, duration.Duration(milliseconds=500))
+
+
+class MergeSortedTest(unittest.TestCase):
+  """Tests for the MergeSorted function."""
+
+  def testMergeSorted(self):
+    """Tests the MergeSorted function."""
+    filetime_stream = [
+        filetime.Filetime(timestamp=0x01cb3a623d0a17ce),
+        semantic_time.Never()]
+    posix_time_stream = [
+        semantic_time.NotSet(),
+        posix_time.PosixTimeInMicroseconds(timestamp=1281643591546875),
+        posix_time.PosixTimeInMicroseconds(timestamp=1281647191546875)]
+    webkit_time_stream = [webkit_time.WebKitTime(timestamp=12926120791546875)]
+
+    date_time_values_list = list(timeline.MergeSorted([
+        filetime_stream, posix_time_stream, webkit_time_stream]))
+
+    # Values with the same sort key are retrieved in the order of their streams.
+    expected_date_time_values_list = [
+        posix_time_stream[0], posix_time_stream[1], filetime_stream[0],
+        posix_time_stream[2], webkit_time_stream[0], filetime_stream[1]]
+    self.assertEqual(len(date_time_values_list), 6)
+    for date_time_values, expected_date_time_values in zip(
+        date_time_values_list, expected_date_time_values_list):
+      self.assertIs(date_time_values, expected_date_time_values)
+
+    date_time_values_list = list(timeline.MergeSorted([]))
+    self.assertEqual(date_time_values_list, [])
+
+  def testMergeSortedWithGetDateTimeValues(self):
+    """Tests the MergeSorted function with get_date_time_values."""
+    consumed_payloads = []
+
+    def _GenerateEntries(entries):
+      """Generates entries and records which entries were consumed.
+
+      Args:
+        entries (list[tuple[DateTimeValues, str]]): entries.
+
+      Yields:
+        tuple[DateTimeValues, str]: entry.
+      """
+      for entry in entries:
+        consumed_payloads.append(entry[1])
+        yield entry
+
+    streams = [
+        _GenerateEntries([
+            (posix_time.PosixTime(timestamp=1281643591), 'a'),
+            (posix_time.PosixTime(timestamp=1281643593), 'c')]),
+        _GenerateEntries([
+            (posix_time.PosixTime(timestamp=1281643592), 'b'),
+            (posix_time.PosixTime(timestamp=1281643594), 'd')])]
+
+    generator = timeline.MergeSorted(
+        streams, get_date_time_values=lambda entry: entry[0])
+
+    _, payload = next(generator)
+    self.assertEqual(payload, 'a')
+    self.assertEqual(consumed_payloads, ['a', 'b'])
+
+    payloads = [payload for _, payload in generator]
+    self.assertEqual(payloads, ['b', 'c', 'd'])
+
+
+if __name__ == '__main__':
+  unittest.main()